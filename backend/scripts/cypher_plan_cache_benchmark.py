@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Cypher plan-cache benchmark for the prepared-query registry.
+
+Neo4j caches execution plans keyed by query text. This replays a workload
+of call-chain, seed-expansion, traversal and keyword-search lookups with
+varying names and depths, building each query two ways:
+
+- interpolated: literals spliced into the text, as the code did before
+  the registry existed
+- prepared: registry text plus parameters
+
+and feeds the query texts through an LRU cache sized like Neo4j's default
+query cache (``server.db.query_cache_size`` = 1000) to count plan hits.
+
+With ``--neo4j`` the prepared workload is also run against a live database
+(NEO4J_URI / NEO4J_USER / NEO4J_PASSWORD / NEO4J_DATABASE) and the median
+``result_available_after`` of first and repeated executions is reported.
+
+Usage:
+    python scripts/cypher_plan_cache_benchmark.py
+    python scripts/cypher_plan_cache_benchmark.py --calls 5000 --names 2000 --neo4j
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from brd_generator.queries import flow_queries, graph_queries  # noqa: E402
+from brd_generator.queries.registry import get_query  # noqa: E402
+
+
+class PlanCache:
+    """LRU cache keyed by query text, counting hits and misses."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.plans: OrderedDict[str, None] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, text: str) -> None:
+        if text in self.plans:
+            self.plans.move_to_end(text)
+            self.hits += 1
+            return
+        self.misses += 1
+        self.plans[text] = None
+        if len(self.plans) > self.size:
+            self.plans.popitem(last=False)
+
+
+def interpolated(kind: str, names: list[str], depth: int) -> str:
+    """Query text built the pre-registry way (literals in the text)."""
+    if kind == "call_chain":
+        return flow_queries.GET_METHOD_CALL_CHAIN.replace("$maxDepth", str(depth))
+    if kind == "expand":
+        seed_filter = " OR ".join(f"seed.name = '{name}'" for name in names)
+        return graph_queries.EXPAND_FROM_SEEDS.replace(
+            "seed.name IN $seedNames", seed_filter
+        ).replace("$maxDepth", str(depth))
+    if kind == "traverse":
+        entry_filter = " OR ".join(f"start.name = '{name}'" for name in names)
+        return graph_queries.TRAVERSE_DIRECT.replace("start.name IN $entryNames", entry_filter)
+    keyword_filter = " OR ".join(f"toLower(n.name) CONTAINS '{name.lower()}'" for name in names)
+    return graph_queries.SEARCH_COMPONENTS_BY_KEYWORDS.replace(
+        "ANY(kw IN $keywords WHERE toLower(n.name) CONTAINS kw)", f"({keyword_filter})"
+    )
+
+
+def prepared(kind: str, names: list[str], depth: int) -> tuple[str, dict]:
+    """Registry text and parameters for the same lookup."""
+    if kind == "call_chain":
+        return get_query("GET_METHOD_CALL_CHAIN", depth=depth).bind(methodId=names[0])
+    if kind == "expand":
+        return get_query("EXPAND_FROM_SEEDS", depth=depth).bind(
+            seedNames=names, minPagerank=0.1
+        )
+    if kind == "traverse":
+        return get_query("TRAVERSE_DIRECT").bind(entryNames=names)
+    return get_query("SEARCH_COMPONENTS_BY_KEYWORDS").bind(
+        keywords=[name.lower() for name in names]
+    )
+
+
+def build_workload(calls: int, name_count: int, seed: int) -> list[tuple[str, list[str], int]]:
+    """Random lookups drawn from a fixed pool of component names."""
+    rng = random.Random(seed)
+    pool = [f"Component{i}" for i in range(name_count)]
+    kinds = ["call_chain", "expand", "traverse", "search"]
+    return [
+        (rng.choice(kinds), rng.sample(pool, rng.randint(1, 5)), rng.randint(1, 6))
+        for _ in range(calls)
+    ]
+
+
+def simulate(workload, cache_size: int) -> None:
+    print(f"{'mode':<14}{'calls':>8}{'texts':>8}{'hits':>8}{'misses':>8}{'hit rate':>10}")
+    for mode, build in (
+        ("interpolated", lambda k, n, d: interpolated(k, n, d)),
+        ("prepared", lambda k, n, d: prepared(k, n, d)[0]),
+    ):
+        cache = PlanCache(cache_size)
+        texts = set()
+        for kind, names, depth in workload:
+            text = build(kind, names, depth)
+            texts.add(text)
+            cache.lookup(text)
+        rate = cache.hits / len(workload)
+        print(
+            f"{mode:<14}{len(workload):>8}{len(texts):>8}"
+            f"{cache.hits:>8}{cache.misses:>8}{rate:>10.1%}"
+        )
+
+
+async def measure_live(workload) -> None:
+    """Median time-to-first-record for first vs repeated query texts."""
+    from neo4j import AsyncGraphDatabase
+
+    driver = AsyncGraphDatabase.driver(
+        os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        auth=(os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD", "password")),
+    )
+    seen: set[str] = set()
+    first: list[int] = []
+    repeat: list[int] = []
+    try:
+        async with driver.session(database=os.getenv("NEO4J_DATABASE", "neo4j")) as session:
+            for kind, names, depth in workload:
+                text, params = prepared(kind, names, depth)
+                result = await session.run(text, params)
+                summary = await result.consume()
+                (repeat if text in seen else first).append(summary.result_available_after)
+                seen.add(text)
+    finally:
+        await driver.close()
+
+    print()
+    print(f"live Neo4j: {len(first)} first executions, {len(repeat)} cached")
+    if first:
+        print(f"  first  median result_available_after: {statistics.median(first)} ms")
+    if repeat:
+        print(f"  repeat median result_available_after: {statistics.median(repeat)} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--names", type=int, default=500, help="Distinct component names")
+    parser.add_argument("--cache-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--neo4j", action="store_true", help="Also run against a live Neo4j")
+    args = parser.parse_args()
+
+    workload = build_workload(args.calls, args.names, args.seed)
+    simulate(workload, args.cache_size)
+    if args.neo4j:
+        asyncio.run(measure_live(workload[:200]))
+
+
+if __name__ == "__main__":
+    main()
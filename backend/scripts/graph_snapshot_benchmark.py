@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Graph snapshot benchmark: load cost, memory and local traversal latency.
+
+Builds a synthetic code graph shaped like an analyzed Java repository
+(classes owning methods, methods calling methods across classes, class
+dependencies) and reports:
+
+- snapshot build time and accounted size (``GraphSnapshot.nbytes``)
+- median / p95 latency of the local equivalents of GET_CALLERS_OF,
+  GET_METHOD_CALL_CHAIN, GET_UPSTREAM_CALL_CHAIN and EXPAND_FROM_SEEDS
+
+With ``--neo4j`` the snapshot is loaded from the live database
+(NEO4J_URI / NEO4J_USER / NEO4J_PASSWORD / NEO4J_DATABASE) and the same
+traversals are timed as Cypher against it, for method ids sampled from
+the graph.
+
+Usage:
+    python scripts/graph_snapshot_benchmark.py
+    python scripts/graph_snapshot_benchmark.py --classes 20000 --queries 50 --neo4j
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from brd_generator.mcp_clients.graph_snapshot import (  # noqa: E402
+    SNAPSHOT_QUERIES,
+    GraphSnapshotBuilder,
+)
+from brd_generator.queries.registry import get_query  # noqa: E402
+
+SUFFIXES = ["Action", "Service", "ServiceImpl", "Dao", "Validator", "Builder", "Vo", "Util"]
+
+# (query name, depth) pairs timed per sampled method
+WORKLOAD = [
+    ("GET_CALLERS_OF", 2),
+    ("GET_METHOD_CALL_CHAIN", 5),
+    ("GET_UPSTREAM_CALL_CHAIN", 5),
+    ("EXPAND_FROM_SEEDS", 2),
+]
+
+
+def build_graph(classes: int, seed: int) -> tuple[list[dict], list[tuple[str, str, str]]]:
+    """Synthetic nodes and relationships shaped like GRAPH_SNAPSHOT_* rows."""
+    rng = random.Random(seed)
+    nodes, relationships = [], []
+    methods = []
+    for c in range(classes):
+        class_id = f"c{c}"
+        nodes.append({
+            "id": class_id, "entityId": class_id,
+            "name": f"Domain{c}{rng.choice(SUFFIXES)}",
+            "labels": ["JavaClass"], "path": f"src/Domain{c}.java",
+            "pageRank": rng.random(),
+        })
+        for m in range(rng.randint(2, 8)):
+            method_id = f"m{c}_{m}"
+            methods.append(method_id)
+            nodes.append({
+                "id": method_id, "entityId": method_id, "name": f"method{m}",
+                "labels": ["JavaMethod"], "path": f"src/Domain{c}.java",
+                "startLine": 10 * m, "endLine": 10 * m + 8, "signature": f"void method{m}()",
+            })
+            relationships.append((class_id, method_id, "HAS_METHOD"))
+        for _ in range(rng.randint(1, 4)):
+            relationships.append((class_id, f"c{rng.randrange(classes)}", "DEPENDS_ON"))
+    for method_id in methods:
+        for _ in range(rng.randint(0, 3)):
+            relationships.append((method_id, rng.choice(methods), "CALLS"))
+    return nodes, relationships
+
+
+def report(label: str, durations: list[float]) -> None:
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<32}{statistics.median(durations):>12.3f}{p95:>12.3f}")
+
+
+def parameters_for(query_name: str, snapshot, method: int, owner: int) -> dict:
+    """Call chains start at a method; name-based queries at its (uniquely named) class."""
+    if query_name == "GET_CALLERS_OF":
+        return {"name": snapshot.names[owner]}
+    if query_name == "EXPAND_FROM_SEEDS":
+        return {"seedNames": [snapshot.names[owner]], "minPagerank": 0.5}
+    return {"methodId": snapshot.entity_ids[method]}
+
+
+def sample_methods(snapshot, queries: int, seed: int) -> list[tuple[int, int]]:
+    """(method, owning class) pairs."""
+    rng = random.Random(seed + 1)
+    methods = [n for n, labels in enumerate(snapshot.labels) if "JavaMethod" in labels]
+    sample = rng.sample(methods, min(queries, len(methods)))
+    return [(m, snapshot.neighbors(m, ["HAS_METHOD"], "in")[0]) for m in sample]
+
+
+def time_local(snapshot, sample: list[tuple[int, int]]) -> None:
+    print(f"{'local traversal':<32}{'median ms':>12}{'p95 ms':>12}")
+    for query_name, depth in WORKLOAD:
+        durations = []
+        for method, owner in sample:
+            params = parameters_for(query_name, snapshot, method, owner)
+            started = time.perf_counter()
+            SNAPSHOT_QUERIES[query_name](snapshot, depth, params)
+            durations.append((time.perf_counter() - started) * 1000)
+        report(f"{query_name} (depth {depth})", durations)
+
+
+def simulate(classes: int, queries: int, seed: int) -> None:
+    nodes, relationships = build_graph(classes, seed)
+    started = time.perf_counter()
+    builder = GraphSnapshotBuilder()
+    for node in nodes:
+        builder.add_node(node)
+    for source, target, rel_type in relationships:
+        builder.add_relationship(source, target, rel_type)
+    snapshot = builder.build("synthetic")
+    build_ms = (time.perf_counter() - started) * 1000
+    print(
+        f"{len(snapshot)} nodes, {snapshot.relationship_count} relationships, "
+        f"{snapshot.nbytes / 1e6:.1f}MB, built in {build_ms:.0f} ms"
+    )
+    time_local(snapshot, sample_methods(snapshot, queries, seed))
+
+
+async def measure_live(queries: int, seed: int) -> None:
+    """Load a snapshot from a live graph and time Cypher against local traversals."""
+    from neo4j import AsyncGraphDatabase
+
+    driver = AsyncGraphDatabase.driver(
+        os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        auth=(os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD", "password")),
+    )
+    try:
+        async with driver.session(database=os.getenv("NEO4J_DATABASE", "neo4j")) as session:
+            started = time.perf_counter()
+            builder = GraphSnapshotBuilder()
+            result = await session.run(get_query("GRAPH_SNAPSHOT_NODES").text)
+            async for record in result:
+                builder.add_node(record.data())
+            result = await session.run(get_query("GRAPH_SNAPSHOT_RELATIONSHIPS").text)
+            async for record in result:
+                builder.add_relationship(record["source"], record["target"], record["type"])
+            snapshot = builder.build("live")
+            print()
+            print(
+                f"live Neo4j: {len(snapshot)} nodes, {snapshot.relationship_count} relationships, "
+                f"{snapshot.nbytes / 1e6:.1f}MB, loaded in {(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+
+            sample = sample_methods(snapshot, queries, seed)
+            print(f"{'cypher':<32}{'median ms':>12}{'p95 ms':>12}")
+            for query_name, depth in WORKLOAD:
+                query = get_query(query_name, depth=depth)
+                durations = []
+                for method, owner in sample:
+                    started = time.perf_counter()
+                    result = await session.run(
+                        *query.bind(**parameters_for(query_name, snapshot, method, owner))
+                    )
+                    await result.consume()
+                    durations.append((time.perf_counter() - started) * 1000)
+                report(f"{query_name} (depth {depth})", durations)
+            time_local(snapshot, sample)
+    finally:
+        await driver.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--classes", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=100, help="Sampled methods per traversal")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--neo4j", action="store_true", help="Also run against a live Neo4j")
+    args = parser.parse_args()
+
+    simulate(args.classes, args.queries, args.seed)
+    if args.neo4j:
+        asyncio.run(measure_live(args.queries, args.seed))
+
+
+if __name__ == "__main__":
+    main()
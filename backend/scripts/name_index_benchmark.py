@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Name-search benchmark: CONTAINS scan vs the in-process name index.
+
+Builds a synthetic code graph of camel-cased component names (500k nodes by
+default) and answers a workload of entry-point style searches two ways:
+
+- scan: lowercase every candidate name and test ``term in name``, which is
+  what ``toLower(n.name) CONTAINS $term`` does inside Neo4j without an index
+- index: ``NameIndex.search`` (trigram lookup, then verification), capped
+  at the client's ``DEFAULT_NAME_SEARCH_LIMIT`` like the real callers
+
+Without a cap both must return the same nodes. Compound-term searches
+("legalentity") and broad keyword searches are reported separately, with
+build time and the median / p95 latency per search.
+
+With ``--neo4j`` the scan and by-id forms of SEARCH_COMPONENTS_FALLBACK are
+also timed against the live database (NEO4J_URI / NEO4J_USER /
+NEO4J_PASSWORD / NEO4J_DATABASE), with the index built from that graph.
+
+Usage:
+    python scripts/name_index_benchmark.py
+    python scripts/name_index_benchmark.py --nodes 100000 --queries 50 --neo4j
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from brd_generator.mcp_clients.name_index import NameIndex  # noqa: E402
+from brd_generator.mcp_clients.neo4j_client import DEFAULT_NAME_SEARCH_LIMIT  # noqa: E402
+from brd_generator.queries.registry import get_query  # noqa: E402
+
+DOMAIN_WORDS = [
+    "Legal", "Entity", "Point", "Account", "Order", "Customer", "Invoice", "Payment",
+    "Ledger", "Branch", "Product", "Rate", "Limit", "Collateral", "Facility", "Party",
+    "Address", "Document", "Approval", "Schedule", "Fee", "Tax", "Currency", "Region",
+]
+SUFFIXES = [
+    "Action", "Controller", "Service", "ServiceImpl", "Dao", "Repository", "Validator",
+    "Builder", "Vo", "Dto", "Form", "Helper", "Util", "", "", "",
+]
+LABELS = [
+    "JavaClass", "JavaMethod", "JavaField", "SpringService", "JSPPage",
+    "WebFlowDefinition", "FlowState", "SQLTable", "SQLColumn",
+]
+
+
+def build_graph(nodes: int, seed: int) -> list[dict]:
+    """Synthetic named nodes shaped like NAME_INDEX_NODES rows."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(nodes):
+        name = "".join(rng.sample(DOMAIN_WORDS, rng.randint(1, 3))) + rng.choice(SUFFIXES)
+        if rng.random() < 0.4:
+            name = name[0].lower() + name[1:] + str(i % 97)
+        package = DOMAIN_WORDS[i // 25 % len(DOMAIN_WORDS)].lower()
+        records.append({
+            "id": f"4:graph:{i}",
+            "name": name,
+            "labels": [rng.choice(LABELS)],
+            "path": f"src/main/java/com/acme/{package}/File{i // 25}.java",
+            "pageRank": rng.random(),
+        })
+    return records
+
+
+def build_workload(queries: int, seed: int) -> dict[str, list[list[str]]]:
+    """Compound terms ("legalentity") and keyword lists, like entry-point discovery."""
+    rng = random.Random(seed + 1)
+    return {
+        "compound": [
+            ["".join(rng.sample(DOMAIN_WORDS, 2)).lower()] for _ in range(queries)
+        ],
+        "keywords": [
+            [w.lower() for w in rng.sample(DOMAIN_WORDS, 3)] for _ in range(queries)
+        ],
+    }
+
+
+def scan(records: list[dict], terms: list[str]) -> set[str]:
+    """Full scan with per-node lowercasing, as the CONTAINS queries do."""
+    return {
+        r["id"] for r in records
+        if any(term in r["name"].lower() for term in terms)
+    }
+
+
+def timed(fn, workload) -> tuple[list[float], list]:
+    durations, results = [], []
+    for terms in workload:
+        started = time.perf_counter()
+        results.append(fn(terms))
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations, results
+
+
+def report(label: str, durations: list[float]) -> None:
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<20}{statistics.median(durations):>12.2f}{p95:>12.2f}{sum(durations):>12.0f}")
+
+
+def simulate(records: list[dict], workload: dict[str, list[list[str]]]) -> None:
+    started = time.perf_counter()
+    index = NameIndex(records)
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"{len(index)} names, {index.path_count} files, index built in {build_ms:.0f} ms")
+    print(f"{'mode':<20}{'median ms':>12}{'p95 ms':>12}{'total ms':>12}")
+
+    for kind, searches in workload.items():
+        scan_ms, scan_results = timed(lambda terms: scan(records, terms), searches)
+        index_results = [set(index.search(terms)) for terms in searches]
+        assert scan_results == index_results, f"index and scan disagree on {kind} searches"
+        index_ms, _ = timed(
+            lambda terms: index.search(terms, limit=DEFAULT_NAME_SEARCH_LIMIT), searches
+        )
+
+        matches = statistics.median(len(r) for r in scan_results)
+        speedup = statistics.median(scan_ms) / max(statistics.median(index_ms), 1e-6)
+        print(f"-- {kind}: median {matches:.0f} matches, {speedup:.0f}x faster")
+        report(f"{kind} scan", scan_ms)
+        report(f"{kind} index", index_ms)
+
+
+async def measure_live(workload: dict[str, list[list[str]]]) -> None:
+    """Time the scan and by-id forms of the component search on a live graph."""
+    from neo4j import AsyncGraphDatabase
+
+    driver = AsyncGraphDatabase.driver(
+        os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        auth=(os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD", "password")),
+    )
+    labels = ["JavaClass", "JavaInterface", "SpringService", "SpringController", "JSPPage"]
+    scan_query = get_query("SEARCH_COMPONENTS_FALLBACK")
+    by_id_query = get_query("SEARCH_COMPONENTS_FALLBACK_BY_ID")
+    scan_ms: list[float] = []
+    by_id_ms: list[float] = []
+    try:
+        async with driver.session(database=os.getenv("NEO4J_DATABASE", "neo4j")) as session:
+            result = await session.run(get_query("NAME_INDEX_NODES").text)
+            index = NameIndex(await result.data())
+            print()
+            print(f"live Neo4j: {len(index)} named nodes")
+            for terms in (t for searches in workload.values() for t in searches):
+                started = time.perf_counter()
+                result = await session.run(*scan_query.bind(terms=terms, labels=labels, limit=50))
+                await result.consume()
+                scan_ms.append((time.perf_counter() - started) * 1000)
+
+                started = time.perf_counter()
+                ids = index.search(terms, labels=labels, limit=50)
+                result = await session.run(*by_id_query.bind(ids=ids))
+                await result.consume()
+                by_id_ms.append((time.perf_counter() - started) * 1000)
+    finally:
+        await driver.close()
+
+    print(f"{'mode':<20}{'median ms':>12}{'p95 ms':>12}{'total ms':>12}")
+    report("scan", scan_ms)
+    report("index + by id", by_id_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=500_000)
+    parser.add_argument("--queries", type=int, default=20, help="Searches of each kind")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--neo4j", action="store_true", help="Also run against a live Neo4j")
+    args = parser.parse_args()
+
+    workload = build_workload(args.queries, args.seed)
+    simulate(build_graph(args.nodes, args.seed), workload)
+    if args.neo4j:
+        asyncio.run(measure_live(workload))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Wiki page generation benchmark with a mock LLM.
+
+Measures wall-clock time of WikiService page generation for a range of page
+counts, comparing sequential generation (concurrency 1) with the bounded
+Copilot session pool. The mock session sleeps for a fixed latency per call,
+so no SDK, database or Neo4j is needed.
+
+Usage:
+    python scripts/wiki_generation_benchmark.py
+    python scripts/wiki_generation_benchmark.py --pages 5 10 20 40 --concurrency 8 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from brd_generator.database.models import WikiPageType  # noqa: E402
+from brd_generator.services.wiki_service import WikiService  # noqa: E402
+
+
+class MockLLMSession:
+    """Copilot session stand-in that answers every prompt after a fixed delay."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.busy = False
+
+    async def send_and_wait(self, message_options: dict, timeout: float = 120):
+        # A real session handles one turn at a time; catch pool misuse
+        assert not self.busy, "session used concurrently"
+        self.busy = True
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.busy = False
+        return SimpleNamespace(data=SimpleNamespace(content="# Page\n\nGenerated content."))
+
+    async def destroy(self):
+        pass
+
+
+class MockDBSession:
+    """AsyncSession stand-in that records added pages."""
+
+    def __init__(self):
+        self.added = []
+
+    async def execute(self, statement):
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+
+    def add(self, obj):
+        self.added.append(obj)
+
+
+async def run_once(page_count: int, concurrency: int, latency: float) -> float:
+    """Generate ``page_count`` pages and return the elapsed seconds."""
+
+    async def session_factory():
+        return MockLLMSession(latency)
+
+    service = WikiService(
+        copilot_session=MockLLMSession(latency),
+        session_factory=session_factory,
+        max_concurrency=concurrency,
+    )
+    repository = SimpleNamespace(name="benchmark", description=None, language="Python")
+    pages = [
+        {"slug": f"page-{i}", "title": f"Page {i}", "type": WikiPageType.OVERVIEW}
+        for i in range(page_count)
+    ]
+    db_session = MockDBSession()
+
+    start = time.perf_counter()
+    generated = await service._generate_pages(db_session, "wiki", pages, {}, repository)
+    elapsed = time.perf_counter() - start
+
+    assert len(generated) == page_count == len(db_session.added)
+    await service.close()
+    return elapsed
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[5, 10, 20, 40], help="Page counts to benchmark")
+    parser.add_argument("--concurrency", type=int, default=4, help="Session pool size")
+    parser.add_argument("--latency", type=float, default=0.1, help="Mock LLM latency per call (seconds)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'pages':>6} {'sequential':>12} {'pooled':>10} {'speedup':>8}")
+    for page_count in args.pages:
+        sequential = await run_once(page_count, 1, args.latency)
+        pooled = await run_once(page_count, args.concurrency, args.latency)
+        print(f"{page_count:>6} {sequential:>11.2f}s {pooled:>9.2f}s {sequential / pooled:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
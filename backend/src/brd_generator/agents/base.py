@@ -16,6 +16,7 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from ..core.llm_gateway import llm_gateway
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -323,7 +324,7 @@ class BaseAgent(ABC):
 
     async def _send_to_sdk(self, prompt: str, timeout: float) -> str:
         """
-        Send prompt to Copilot SDK.
+        Send prompt to Copilot SDK through the shared LLM gateway.
 
         The SDK handles:
         - Tool calling when LLM requests it (via mcp_servers)
@@ -339,97 +340,19 @@ class BaseAgent(ABC):
         logger.debug(f"[{self.role.value.upper()}] Prompt preview: {prompt_preview}")
         logger.debug(f"[{self.role.value.upper()}] Timeout: {timeout}s")
 
-        message_options = {"prompt": prompt}
-
-        if hasattr(self.session, 'send_and_wait'):
-            logger.debug(f"[{self.role.value.upper()}] Using send_and_wait method")
-            event = await asyncio.wait_for(
-                self.session.send_and_wait(message_options, timeout=timeout),
-                timeout=timeout
-            )
-            elapsed = time.time() - start_time
-            if event:
-                response = self._extract_from_event(event)
-                response_preview = response[:100] + "..." if len(response) > 100 else response
-                logger.info(f"[{self.role.value.upper()}] Response received ({len(response)} chars, {elapsed:.2f}s)")
-                logger.debug(f"[{self.role.value.upper()}] Response preview: {response_preview}")
-                return response
-            else:
-                logger.warning(f"[{self.role.value.upper()}] No event returned from SDK ({elapsed:.2f}s)")
-
-        if hasattr(self.session, 'send'):
-            logger.debug(f"[{self.role.value.upper()}] Using send method (polling for response)")
-            await self.session.send(message_options)
-            response = await self._wait_for_response(timeout)
-            elapsed = time.time() - start_time
-            logger.info(f"[{self.role.value.upper()}] Response received via polling ({len(response)} chars, {elapsed:.2f}s)")
+        response = await llm_gateway.send(
+            self.session, prompt, caller=f"agent.{self.role.value}", timeout=timeout
+        )
+        elapsed = time.time() - start_time
+        if response:
+            response_preview = response[:100] + "..." if len(response) > 100 else response
+            logger.info(f"[{self.role.value.upper()}] Response received ({len(response)} chars, {elapsed:.2f}s)")
+            logger.debug(f"[{self.role.value.upper()}] Response preview: {response_preview}")
             return response
 
-        logger.warning(f"[{self.role.value.upper()}] Session has no send methods, using mock response")
+        logger.warning(f"[{self.role.value.upper()}] No response from SDK ({elapsed:.2f}s), using mock response")
         return self._generate_mock_response(prompt)
 
-    def _extract_from_event(self, event: Any) -> str:
-        """Extract text content from a Copilot event."""
-        try:
-            logger.debug(f"[{self.role.value.upper()}] Extracting from event type: {type(event).__name__}")
-
-            if hasattr(event, 'data'):
-                data = event.data
-                logger.debug(f"[{self.role.value.upper()}] Event has data attribute, type: {type(data).__name__}")
-
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    logger.debug(f"[{self.role.value.upper()}] Extracted from data.message.content")
-                    return str(data.message.content)
-                if hasattr(data, 'content'):
-                    logger.debug(f"[{self.role.value.upper()}] Extracted from data.content")
-                    return str(data.content)
-                if hasattr(data, 'text'):
-                    logger.debug(f"[{self.role.value.upper()}] Extracted from data.text")
-                    return str(data.text)
-
-            if hasattr(event, 'content'):
-                logger.debug(f"[{self.role.value.upper()}] Extracted from event.content")
-                return str(event.content)
-            if hasattr(event, 'text'):
-                logger.debug(f"[{self.role.value.upper()}] Extracted from event.text")
-                return str(event.text)
-
-            logger.debug(f"[{self.role.value.upper()}] Using str(event) as fallback")
-            return str(event)
-        except Exception as e:
-            logger.error(f"[{self.role.value.upper()}] Error extracting from event: {e}", exc_info=True)
-            return ""
-
-    async def _wait_for_response(self, timeout: float) -> str:
-        """Wait for LLM response by polling messages."""
-        start_time = asyncio.get_event_loop().time()
-        poll_interval = 1.0
-        poll_count = 0
-
-        logger.debug(f"[{self.role.value.upper()}] Waiting for response (timeout: {timeout}s)")
-
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
-                logger.warning(f"[{self.role.value.upper()}] Polling timeout after {elapsed:.1f}s ({poll_count} polls)")
-                return ""
-
-            try:
-                poll_count += 1
-                messages = self.session.get_messages()
-                logger.debug(f"[{self.role.value.upper()}] Poll {poll_count}: {len(messages)} messages")
-
-                for msg in reversed(messages):
-                    if hasattr(msg, 'data'):
-                        data = msg.data
-                        if hasattr(data, 'role') and data.role == 'assistant':
-                            logger.debug(f"[{self.role.value.upper()}] Found assistant response after {poll_count} polls")
-                            return self._extract_from_event(msg)
-            except Exception as e:
-                logger.debug(f"[{self.role.value.upper()}] Poll error: {e}")
-
-            await asyncio.sleep(poll_interval)
-
     def _generate_mock_response(self, prompt: str) -> str:
         """Generate a mock response for testing without LLM."""
         # Subclasses can override for role-specific mock responses
@@ -10,6 +10,7 @@ This agent:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from datetime import datetime
@@ -26,6 +27,7 @@ from ..models.verification import (
     ConfidenceLevel,
 )
 from ..models.epic import Epic
+from ..core.llm_gateway import llm_gateway
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -622,73 +624,20 @@ class EpicVerifierAgent:
         return suggestions
 
     async def _send_to_llm(self, prompt: str) -> str:
-        """Send prompt to LLM via Copilot SDK."""
+        """Send prompt to LLM through the shared LLM gateway."""
         if not self.session:
             logger.warning("No Copilot session, returning empty response")
             return "{}"
 
         try:
-            import asyncio
-
-            message_options = {"prompt": prompt}
-
-            if hasattr(self.session, 'send_and_wait'):
-                event = await asyncio.wait_for(
-                    self.session.send_and_wait(message_options, timeout=120),
-                    timeout=120
-                )
-                if event:
-                    return self._extract_from_event(event)
-
-            if hasattr(self.session, 'send'):
-                await self.session.send(message_options)
-                return await self._wait_for_response(120)
-
+            response = await llm_gateway.send(
+                self.session, prompt, caller="epic_verifier", timeout=120
+            )
+            if response:
+                return response
+        except asyncio.TimeoutError:
+            logger.error("LLM request timed out after 120 seconds")
         except Exception as e:
-            logger.error(f"LLM error: {e}")
+            logger.error(f"LLM error: {type(e).__name__}: {str(e) or 'No error message'}")
 
         return "{}"
-
-    def _extract_from_event(self, event: Any) -> str:
-        """Extract text content from a Copilot event."""
-        try:
-            if hasattr(event, 'data'):
-                data = event.data
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    return str(data.message.content)
-                if hasattr(data, 'content'):
-                    return str(data.content)
-                if hasattr(data, 'text'):
-                    return str(data.text)
-
-            if hasattr(event, 'content'):
-                return str(event.content)
-            if hasattr(event, 'text'):
-                return str(event.text)
-
-            return str(event)
-        except Exception as e:
-            logger.error(f"Error extracting from event: {e}")
-            return ""
-
-    async def _wait_for_response(self, timeout: float) -> str:
-        """Wait for LLM response by polling."""
-        import asyncio
-        start_time = asyncio.get_event_loop().time()
-
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
-                return ""
-
-            try:
-                messages = self.session.get_messages()
-                for msg in reversed(messages):
-                    if hasattr(msg, 'data'):
-                        data = msg.data
-                        if hasattr(data, 'role') and data.role == 'assistant':
-                            return self._extract_from_event(msg)
-            except Exception:
-                pass
-
-            await asyncio.sleep(1.0)
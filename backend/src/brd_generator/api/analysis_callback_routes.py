@@ -6,6 +6,7 @@ analysis progress, logs, and completion status back to the backend.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Optional, List
 from uuid import uuid4
@@ -24,12 +25,19 @@ from ..database.models import (
     LogLevel,
     RepositoryDB,
 )
+from ..mcp_clients.neo4j_client import DEFAULT_GRAPH_SNAPSHOT_ENABLED
+from ..services.progress_bus import progress_bus
+from .context_routes import get_neo4j_client
+from .flow_routes import get_flow_service
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/analysis/callback", tags=["Analysis Callbacks"])
 
+# Post-analysis background jobs, referenced until they finish
+_post_analysis_tasks: set[asyncio.Task] = set()
+
 
 # =============================================================================
 # Request Models
@@ -128,6 +136,12 @@ async def notify_start(
 
         logger.info(f"Analysis started: {analysis_run_id}, codegraph job: {request.codegraph_job_id}")
 
+    progress_bus.publish(analysis_run_id, {
+        "type": "progress",
+        "phase": AnalysisJobPhase.PENDING.value,
+        "status": AnalysisStatus.RUNNING.value,
+    })
+
     return CallbackResponse(message="Start notification recorded")
 
 
@@ -197,6 +211,18 @@ async def update_progress(
 
         await session.commit()
 
+    progress_bus.publish(analysis_run_id, {
+        "type": "progress",
+        "phase": checkpoint.current_phase.value,
+        "progress_pct": request.progress_pct,
+        "processed_files": request.processed_files,
+        "total_files": request.total_files,
+        "nodes_created": request.nodes_created,
+        "relationships_created": request.relationships_created,
+        "message": request.message,
+        "status": run.status.value if run else AnalysisStatus.RUNNING.value,
+    })
+
     return CallbackResponse(message="Progress updated")
 
 
@@ -329,9 +355,26 @@ async def notify_complete(
             if checkpoint:
                 checkpoint.current_phase = AnalysisJobPhase.COMPLETED
                 checkpoint.phase_progress_pct = 100
+            event = {
+                "type": "complete",
+                "phase": "completed",
+                "progress_pct": 100,
+                "processed_files": checkpoint.processed_files if checkpoint else 0,
+                "total_files": checkpoint.total_files if checkpoint else 0,
+                "nodes_created": checkpoint.nodes_created if checkpoint else 0,
+                "relationships_created": checkpoint.relationships_created if checkpoint else 0,
+                "status": "completed",
+                "message": "Analysis completed successfully",
+            }
         else:
             run.mark_failed(message=request.error or "Analysis failed")
             final_status = AnalysisStatus.FAILED
+            event = {
+                "type": "error",
+                "phase": AnalysisJobPhase.FAILED.value,
+                "status": "failed",
+                "error": run.status_message,
+            }
 
         # Update repository status
         repo_result = await session.execute(
@@ -348,4 +391,41 @@ async def notify_complete(
 
         logger.info(f"Analysis completed: {analysis_run_id}, success={request.success}")
 
+    progress_bus.publish(analysis_run_id, event)
+
+    if request.success:
+        await _warm_graph_snapshot()
+        _start_flow_materialization()
+
     return CallbackResponse(message="Completion recorded")
+
+
+async def _warm_graph_snapshot() -> None:
+    """Start loading the code graph snapshot for the newly analyzed commit."""
+    if not DEFAULT_GRAPH_SNAPSHOT_ENABLED:
+        return
+    try:
+        client = await get_neo4j_client()
+        client.warm_graph_snapshot()
+    except Exception as e:
+        logger.warning(f"Graph snapshot warm-up failed: {e}")
+
+
+def _start_flow_materialization() -> None:
+    """Trace and store feature flows for the newly analyzed graph in the background."""
+    try:
+        service = get_flow_service()
+    except HTTPException:
+        return
+    if not service.flow_store.available:
+        return
+    task = asyncio.create_task(_materialize_feature_flows(service))
+    _post_analysis_tasks.add(task)
+    task.add_done_callback(_post_analysis_tasks.discard)
+
+
+async def _materialize_feature_flows(service) -> None:
+    try:
+        await service.materialize_feature_flows()
+    except Exception as e:
+        logger.warning(f"Feature flow materialization failed: {e}")
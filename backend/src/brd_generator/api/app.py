@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from .routes import router
 from .repository_routes import router as repository_router
@@ -19,11 +20,16 @@ from .context_routes import router as context_router
 from .flow_routes import router as flow_router, set_flow_service
 from .blueprint_routes import router as blueprint_router
 from ..core.generator import BRDGenerator
+from ..core.llm_cache import llm_response_cache
+from ..core.llm_gateway import llm_gateway
 from ..core.feature_flow import FeatureFlowService
 from ..services.blueprint_service import BlueprintService, set_blueprint_service
 from ..database.config import init_db, close_db
+from ..mcp_clients.graph_snapshot import graph_snapshots
+from ..mcp_clients.query_metrics import query_metrics
 from ..services.repository_service import RepositoryService
 from ..utils.logger import get_logger, setup_logging
+from ..utils.token_counter import get_tokenizer
 
 logger = get_logger(__name__)
 
@@ -91,6 +97,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Initializing database...")
     await init_db()
 
+    # Create the tokenizer off the event loop: tiktoken may download its BPE
+    # file on first use, which must not stall a request
+    logger.info("Loading tokenizer...")
+    await asyncio.to_thread(get_tokenizer)
+
     # Initialize generator
     from .routes import _generator
     import brd_generator.api.routes as routes_module
@@ -112,6 +123,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         neo4j_client=generator.neo4j_client,
         filesystem_client=generator.filesystem_client,  # For reading actual source code
         copilot_session=generator._copilot_session,
+        session_factory=generator.create_copilot_session,  # Extra sessions for concurrent pages
     )
     if generator._copilot_session:
         logger.info("Wiki service initialized with Copilot SDK for LLM-powered generation")
@@ -143,12 +155,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Shutting down BRD Generator API...")
+    # Destroy the wiki service's extra sessions before the Copilot client stops
+    await get_wiki_service().close()
     if routes_module._generator:
         await routes_module._generator.cleanup()
     if repo_routes_module._repository_service:
         await repo_routes_module._repository_service.close()
 
-    # Reset wiki service (Copilot session is cleaned up with generator)
+    # Reset wiki service (base Copilot session is cleaned up with generator)
     reset_wiki_service()
 
     # Close database connections
@@ -208,9 +222,32 @@ def create_app() -> FastAPI:
                 "blueprint_features": "/api/v1/blueprint/repositories/{repo_id}/features",
                 "generate_blueprint": "/api/v1/blueprint/repositories/{repo_id}/generate",
                 "blueprint_stream": "/api/v1/blueprint/repositories/{repo_id}/generate/stream",
+                "metrics": "/metrics",
             },
         }
 
+    # Code graph query metrics
+    @app.get("/metrics", tags=["Root"])
+    async def metrics(format: str = Query("prometheus", pattern="^(prometheus|json)$")):
+        """Per-query latency histograms, row and error counts, and the slow-query log.
+
+        Served in Prometheus text format by default; ``?format=json`` also
+        includes the slow-query log with captured PROFILE plans, the graph
+        snapshot cache usage, the LLM response cache hit rates and the LLM
+        gateway's per-caller latency and token counts.
+        """
+        if format == "json":
+            return {
+                **query_metrics.snapshot(),
+                "graph_snapshots": graph_snapshots.stats(),
+                "llm_response_cache": llm_response_cache.stats(),
+                "llm_gateway": llm_gateway.metrics(),
+            }
+        return PlainTextResponse(
+            query_metrics.render_prometheus(),
+            media_type="text/plain; version=0.0.4",
+        )
+
     # Exception handlers
     @app.exception_handler(Exception)
     async def generic_exception_handler(request, exc):
@@ -786,15 +786,15 @@ async def traverse_dependencies(
 
         for query, label in queries_to_run:
             try:
-                result = await neo4j_client.query_code_structure(query)
-                nodes = result.get("nodes", [])
-                logger.info(f"[TRAVERSE-{label}] Found {len(nodes)} nodes")
-
-                for node in nodes:
+                # Stream records so only de-duplicated nodes are held in memory
+                found = 0
+                async for node in neo4j_client.stream_query(query):
+                    found += 1
                     name = node.get("name")
                     if name and name not in seen_names:
                         all_nodes.append(node)
                         seen_names.add(name)
+                logger.info(f"[TRAVERSE-{label}] Found {found} nodes")
             except Exception as e:
                 logger.warning(f"[TRAVERSE-{label}] Query failed: {e}")
 
@@ -1421,8 +1421,6 @@ async def get_flow_graph(
             LIMIT 500
         """
 
-        result = await neo4j_client.query_code_structure(query)
-
         # Build nodes and edges
         nodes_map: dict[str, FlowGraphNode] = {}
         edges: list[FlowGraphEdge] = []
@@ -1446,7 +1444,8 @@ async def get_flow_graph(
                 )
                 graph_entry_points.add(node_id)
 
-        for record in result.get("nodes", []):
+        # Stream path records straight into the graph instead of buffering them
+        async for record in neo4j_client.stream_query(query):
             source_name = record.get("source_name")
             source_type = record.get("source_type", "")
             source_path = record.get("source_path", "")
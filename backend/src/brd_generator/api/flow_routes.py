@@ -7,9 +7,11 @@ This module provides endpoints for:
 - Generating sequence diagrams
 """
 
+import json
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ..core.feature_flow import FeatureFlowService
@@ -380,38 +382,14 @@ async def get_brd_sections(
     }
 
 
-@router.post("/brd-sections/batch")
-async def get_brd_sections_batch(
-    request: ImplementationMappingRequest,
-    format: str = Query(default="comprehensive", description="Output format: comprehensive or compact"),
-    service: FeatureFlowService = Depends(get_flow_service),
+def _batch_brd_sections(
+    entry_points: list[str],
+    flows: dict[str, FeatureFlow],
+    errors: list[dict],
+    format: str,
 ) -> dict:
-    """Get BRD sections for multiple entry points.
-
-    Combines flows from multiple entry points into unified BRD sections.
-    Useful for features that span multiple entry points.
-    """
-    logger.info(f"Generating batch BRD sections for {len(request.entry_points)} entry points")
-
-    from ..models.flow_context import TechnicalArchitectureView, ImplementationMapping, FeatureFlow
-
-    all_flows: list[FeatureFlow] = []
-    errors = []
-
-    for entry_point in request.entry_points:
-        response = await service.extract_feature_flow(
-            entry_point=entry_point,
-            entry_point_type="auto",
-            include_sql=True,
-            include_data_mappings=True,
-            max_depth=10,
-        )
-
-        if response.success and response.feature_flow:
-            all_flows.append(response.feature_flow)
-        else:
-            errors.append({"entry_point": entry_point, "error": response.error})
-
+    """Combine the flows of a batch into unified BRD sections, in request order."""
+    all_flows = [flows[ep] for ep in dict.fromkeys(entry_points) if ep in flows]
     if not all_flows:
         return {
             "success": False,
@@ -445,6 +423,85 @@ async def get_brd_sections_batch(
     }
 
 
+@router.post("/brd-sections/batch")
+async def get_brd_sections_batch(
+    request: ImplementationMappingRequest,
+    format: str = Query(default="comprehensive", description="Output format: comprehensive or compact"),
+    service: FeatureFlowService = Depends(get_flow_service),
+) -> dict:
+    """Get BRD sections for multiple entry points.
+
+    Combines flows from multiple entry points into unified BRD sections.
+    Useful for features that span multiple entry points. Entry points are
+    traced concurrently; see ``/brd-sections/batch/stream`` for results
+    per entry point as they complete.
+    """
+    logger.info(f"Generating batch BRD sections for {len(request.entry_points)} entry points")
+
+    flows: dict[str, FeatureFlow] = {}
+    errors = []
+
+    async for entry_point, response in service.extract_feature_flows(request.entry_points):
+        if response.success and response.feature_flow:
+            flows[entry_point] = response.feature_flow
+        else:
+            errors.append({"entry_point": entry_point, "error": response.error})
+
+    return _batch_brd_sections(request.entry_points, flows, errors, format)
+
+
+@router.post("/brd-sections/batch/stream")
+async def stream_brd_sections_batch(
+    request: ImplementationMappingRequest,
+    format: str = Query(default="comprehensive", description="Output format: comprehensive or compact"),
+    service: FeatureFlowService = Depends(get_flow_service),
+) -> StreamingResponse:
+    """Stream BRD sections for multiple entry points as Server-Sent Events.
+
+    Emits one ``flow`` (or ``error``) event per entry point as its trace
+    completes, carrying that entry point's technical architecture and
+    implementation mapping, then a ``complete`` event with the combined
+    sections returned by ``/brd-sections/batch``.
+    """
+    logger.info(f"Streaming batch BRD sections for {len(request.entry_points)} entry points")
+
+    async def event_stream():
+        flows: dict[str, FeatureFlow] = {}
+        errors = []
+        async for entry_point, response in service.extract_feature_flows(request.entry_points):
+            if response.success and response.feature_flow:
+                flow = flows[entry_point] = response.feature_flow
+                view = TechnicalArchitectureView.from_feature_flow(flow)
+                mapping = ImplementationMapping.from_feature_flows([flow])
+                event = {
+                    "type": "flow",
+                    "entry_point": entry_point,
+                    "technical_architecture": (
+                        view.to_compact_markdown() if format == "compact" else view.to_markdown()
+                    ),
+                    "implementation_mapping": (
+                        mapping.to_compact_table() if format == "compact" else mapping.to_markdown_table()
+                    ),
+                }
+            else:
+                errors.append({"entry_point": entry_point, "error": response.error})
+                event = {"type": "error", "entry_point": entry_point, "error": response.error}
+            yield f"data: {json.dumps(event)}\n\n"
+
+        result = _batch_brd_sections(request.entry_points, flows, errors, format)
+        yield f"data: {json.dumps({'type': 'complete', **result})}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 # Health check endpoint
 
 
@@ -454,4 +511,5 @@ async def health_check() -> dict:
     return {
         "status": "healthy" if _flow_service is not None else "not initialized",
         "service": "FeatureFlowService",
+        "materialized_flows": _flow_service.flow_store.stats() if _flow_service else None,
     }
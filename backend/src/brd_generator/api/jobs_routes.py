@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+from collections import deque
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -32,11 +34,16 @@ from ..database.models import (
     AnalysisJobPhase,
     LogLevel,
 )
+from ..services.progress_bus import TERMINAL_EVENT_TYPES, progress_bus
 from ..services.task_manager import task_manager, CheckpointedTask
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# SSE progress stream limits
+PROGRESS_STREAM_MAX_SECONDS = int(os.getenv("PROGRESS_STREAM_MAX_SECONDS", "3600"))
+PROGRESS_STREAM_HEARTBEAT_SECONDS = float(os.getenv("PROGRESS_STREAM_HEARTBEAT_SECONDS", "15"))
+
 # UUID regex pattern
 UUID_PATTERN = re.compile(
     r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
@@ -414,10 +421,118 @@ async def get_job_detail(job_id: str) -> JobDetailResponse:
         return JobDetailResponse(job=job_detail)
 
 
+async def _resolve_run_id(job_id: str) -> Optional[str]:
+    """Map a job ID (analysis run UUID or codegraph job ID) to the analysis run ID.
+
+    Returns:
+        The analysis run ID, or None if no run has that codegraph job ID.
+    """
+    if is_uuid(job_id):
+        return job_id
+    async with get_async_session() as session:
+        result = await session.execute(
+            select(AnalysisRunDB.id).where(AnalysisRunDB.codegraph_job_id == job_id)
+        )
+        return result.scalar_one_or_none()
+
+
+def _covered_by_snapshot(event: Dict[str, Any], snapshot: Dict[str, Any]) -> bool:
+    """Whether a buffered event is no newer than the database snapshot.
+
+    Progress events are cumulative, so a non-terminal event in the
+    snapshot's phase at or below its progress adds nothing.
+    """
+    return (
+        event["type"] not in TERMINAL_EVENT_TYPES
+        and event.get("phase") == snapshot.get("phase")
+        and event.get("progress_pct", 0) <= snapshot.get("progress_pct", 0)
+    )
+
+
+async def _load_progress_snapshot(job_id: str) -> tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Read a job's current progress from the database.
+
+    Used for the initial SSE snapshot (which also serves as reconnect
+    catch-up) and as a fallback when no events arrive on the progress bus.
+
+    Args:
+        job_id: The analysis run ID or codegraph job ID.
+
+    Returns:
+        Tuple of (analysis run ID, progress event fields), or (None, None)
+        if the job does not exist.
+    """
+    async with get_async_session() as session:
+        # Get analysis run - look up by UUID id or by codegraph_job_id
+        if is_uuid(job_id):
+            result = await session.execute(
+                select(AnalysisRunDB).where(AnalysisRunDB.id == job_id)
+            )
+        else:
+            # job_id is a codegraph job ID format
+            result = await session.execute(
+                select(AnalysisRunDB).where(AnalysisRunDB.codegraph_job_id == job_id)
+            )
+        run = result.scalar_one_or_none()
+
+        if not run:
+            return None, None
+
+        # Get latest checkpoint (use run.id which is always the UUID)
+        checkpoint_result = await session.execute(
+            select(AnalysisCheckpointDB)
+            .where(AnalysisCheckpointDB.analysis_run_id == run.id)
+            .order_by(AnalysisCheckpointDB.updated_at.desc())
+            .limit(1)
+        )
+        checkpoint = checkpoint_result.scalar_one_or_none()
+
+        current_progress = checkpoint.phase_progress_pct if checkpoint else 0
+        current_phase = checkpoint.current_phase.value if checkpoint else "pending"
+        counters = {
+            "processed_files": checkpoint.processed_files if checkpoint else 0,
+            "total_files": checkpoint.total_files if checkpoint else 0,
+            "nodes_created": checkpoint.nodes_created if checkpoint else 0,
+            "relationships_created": checkpoint.relationships_created if checkpoint else 0,
+        }
+
+        if run.status == DBAnalysisStatus.COMPLETED:
+            return run.id, {
+                "type": "complete",
+                "phase": "completed",
+                "progress_pct": 100,
+                **counters,
+                "status": "completed",
+                "message": "Analysis completed successfully",
+            }
+
+        if run.status == DBAnalysisStatus.FAILED:
+            return run.id, {
+                "type": "error",
+                "phase": current_phase,
+                "progress_pct": current_progress,
+                "status": "failed",
+                "error": run.status_message or "Analysis failed",
+            }
+
+        return run.id, {
+            "type": "progress",
+            "phase": current_phase,
+            "progress_pct": current_progress,
+            **counters,
+            "status": run.status.value,
+        }
+
+
 @router.get("/{job_id}/progress/stream")
 async def stream_job_progress(job_id: str):
     """Stream live progress updates for an analysis job via SSE.
 
+    Sends the current state from the database, then pushes events from the
+    in-process progress bus as producers publish them. The database is only
+    re-read when no event arrives within the heartbeat interval, which
+    covers jobs updated by another process.
+
     Args:
         job_id: The analysis run ID.
 
@@ -429,100 +544,93 @@ async def stream_job_progress(job_id: str):
         """Generate SSE events."""
         last_progress = -1
         last_phase = None
-        poll_count = 0
-        max_polls = 3600  # 1 hour at 1s intervals
 
-        while poll_count < max_polls:
+        def render(event: Dict[str, Any]) -> Optional[str]:
+            """Format an event, or return None if nothing changed."""
+            nonlocal last_progress, last_phase
+            if event["type"] not in TERMINAL_EVENT_TYPES:
+                current_progress = event.get("progress_pct", 0)
+                current_phase = event.get("phase")
+                if current_progress == last_progress and current_phase == last_phase:
+                    return None
+                event = {**event, "type": "phase" if current_phase != last_phase else "progress"}
+                last_progress = current_progress
+                last_phase = current_phase
+            return f"data: {JobProgressEvent(**event).model_dump_json()}\n\n"
+
+        def error_event(error: str) -> str:
+            event = JobProgressEvent(type="error", error=error)
+            return f"data: {event.model_dump_json()}\n\n"
+
+        try:
+            run_id = await _resolve_run_id(job_id)
+        except Exception as e:
+            logger.error(f"Error streaming progress: {e}")
+            yield error_event(str(e))
+            return
+
+        if run_id is None:
+            yield error_event("Job not found")
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + PROGRESS_STREAM_MAX_SECONDS
+
+        # Subscribe before reading the snapshot so no event published in
+        # between (such as the terminal one) is missed
+        with progress_bus.subscribe(run_id) as subscription:
             try:
-                async with get_async_session() as session:
-                    # Get analysis run - look up by UUID id or by codegraph_job_id
-                    if is_uuid(job_id):
-                        result = await session.execute(
-                            select(AnalysisRunDB).where(AnalysisRunDB.id == job_id)
-                        )
-                    else:
-                        # job_id is a codegraph job ID format
-                        result = await session.execute(
-                            select(AnalysisRunDB).where(AnalysisRunDB.codegraph_job_id == job_id)
-                        )
-                    run = result.scalar_one_or_none()
-
-                    if not run:
-                        event = JobProgressEvent(
-                            type="error",
-                            error="Job not found",
-                        )
-                        yield f"data: {event.model_dump_json()}\n\n"
-                        break
+                _, event = await _load_progress_snapshot(run_id)
+            except Exception as e:
+                logger.error(f"Error streaming progress: {e}")
+                yield error_event(str(e))
+                return
 
-                    # Get latest checkpoint (use run.id which is always the UUID)
-                    checkpoint_result = await session.execute(
-                        select(AnalysisCheckpointDB)
-                        .where(AnalysisCheckpointDB.analysis_run_id == run.id)
-                        .order_by(AnalysisCheckpointDB.updated_at.desc())
-                        .limit(1)
-                    )
-                    checkpoint = checkpoint_result.scalar_one_or_none()
-
-                    # Build progress event
-                    current_progress = checkpoint.phase_progress_pct if checkpoint else 0
-                    current_phase = checkpoint.current_phase.value if checkpoint else "pending"
-
-                    # Check for completion
-                    if run.status == DBAnalysisStatus.COMPLETED:
-                        event = JobProgressEvent(
-                            type="complete",
-                            phase="completed",
-                            progress_pct=100,
-                            processed_files=checkpoint.processed_files if checkpoint else 0,
-                            total_files=checkpoint.total_files if checkpoint else 0,
-                            nodes_created=checkpoint.nodes_created if checkpoint else 0,
-                            relationships_created=checkpoint.relationships_created if checkpoint else 0,
-                            status="completed",
-                            message="Analysis completed successfully",
-                        )
-                        yield f"data: {event.model_dump_json()}\n\n"
-                        break
+            if event is None:
+                yield error_event("Job not found")
+                return
 
-                    # Check for failure
-                    if run.status == DBAnalysisStatus.FAILED:
-                        event = JobProgressEvent(
-                            type="error",
-                            phase=current_phase,
-                            progress_pct=current_progress,
-                            status="failed",
-                            error=run.status_message or "Analysis failed",
-                        )
-                        yield f"data: {event.model_dump_json()}\n\n"
+            pending = deque(
+                buffered for buffered in subscription.drain()
+                if not _covered_by_snapshot(buffered, event)
+            )
+
+            while True:
+                if event is not None:
+                    chunk = render(event)
+                    if chunk:
+                        yield chunk
+                    if event["type"] in TERMINAL_EVENT_TYPES:
                         break
 
-                    # Send progress update if changed
-                    if current_progress != last_progress or current_phase != last_phase:
-                        event = JobProgressEvent(
-                            type="phase" if current_phase != last_phase else "progress",
-                            phase=current_phase,
-                            progress_pct=current_progress,
-                            processed_files=checkpoint.processed_files if checkpoint else 0,
-                            total_files=checkpoint.total_files if checkpoint else 0,
-                            nodes_created=checkpoint.nodes_created if checkpoint else 0,
-                            relationships_created=checkpoint.relationships_created if checkpoint else 0,
-                            status=run.status.value,
-                        )
-                        yield f"data: {event.model_dump_json()}\n\n"
-                        last_progress = current_progress
-                        last_phase = current_phase
+                if pending:
+                    event = pending.popleft()
+                    continue
 
-            except Exception as e:
-                logger.error(f"Error streaming progress: {e}")
-                event = JobProgressEvent(
-                    type="error",
-                    error=str(e),
-                )
-                yield f"data: {event.model_dump_json()}\n\n"
-                break
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
 
-            await asyncio.sleep(1)
-            poll_count += 1
+                event = await subscription.get(
+                    timeout=min(PROGRESS_STREAM_HEARTBEAT_SECONDS, remaining)
+                )
+                if event is not None:
+                    continue
+
+                # No push within the heartbeat interval: re-check the database
+                try:
+                    _, event = await _load_progress_snapshot(run_id)
+                except Exception as e:
+                    logger.error(f"Error streaming progress: {e}")
+                    yield error_event(str(e))
+                    break
+
+                if event is None:
+                    yield error_event("Job not found")
+                    break
+
+                # Keep idle connections alive through proxies
+                yield ": keep-alive\n\n"
 
     return StreamingResponse(
         generate(),
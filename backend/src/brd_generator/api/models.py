@@ -102,6 +102,10 @@ class BRDSection(BaseModel):
         le=1000,
         description="Target word count for this section (100-1000)"
     )
+    depends_on: list[str] = Field(
+        default_factory=list,
+        description="Names of earlier sections this section builds on; sections without dependencies are generated concurrently"
+    )
 
 
 # =============================================================================
@@ -523,6 +527,11 @@ class GenerateBRDRequest(BaseModel):
         """
     )
 
+    bypass_cache: bool = Field(
+        False,
+        description="Ignore cached LLM responses for this generation and refresh them"
+    )
+
 
 class RequirementResponse(BaseModel):
     """Requirement in BRD response."""
@@ -653,6 +662,11 @@ class GenerateEpicsRequest(BaseModel):
         description="Use skill-based generation with MCP tools"
     )
 
+    bypass_cache: bool = Field(
+        False,
+        description="Ignore cached LLM responses for this generation and refresh them"
+    )
+
 
 class EpicResponse(BaseModel):
     """Epic in response."""
@@ -704,6 +718,11 @@ class GenerateBacklogsRequest(BaseModel):
         description="Use skill-based generation with MCP tools"
     )
 
+    bypass_cache: bool = Field(
+        False,
+        description="Ignore cached LLM responses for this generation and refresh them"
+    )
+
 
 class UserStoryResponse(BaseModel):
     """User Story in response."""
@@ -1719,6 +1738,82 @@ class BacklogsListResponse(BaseModel):
     total: int
 
 
+class BRDSummary(BaseModel):
+    """List row for a stored BRD (no content or children)."""
+    id: str
+    brd_number: str
+    title: str
+    repository_id: str
+    repository_name: Optional[str] = None
+    mode: str = "draft"
+    confidence_score: Optional[float] = None
+    status: str = "draft"
+    version: int = 1
+    refinement_count: int = 0
+    epic_count: int = 0
+    backlog_count: int = 0
+    created_at: datetime
+    updated_at: datetime
+
+
+class EpicSummary(BaseModel):
+    """List row for a stored EPIC (no content or backlogs)."""
+    id: str
+    epic_number: str
+    brd_id: str
+    brd_title: Optional[str] = None
+    repository_id: Optional[str] = None
+    repository_name: Optional[str] = None
+    title: str
+    priority: str = "medium"
+    status: str = "draft"
+    refinement_count: int = 0
+    display_order: int = 0
+    backlog_count: int = 0
+    created_at: datetime
+    updated_at: datetime
+
+
+class BacklogSummary(BaseModel):
+    """List row for a stored backlog item (no content)."""
+    id: str
+    backlog_number: str
+    epic_id: str
+    epic_title: Optional[str] = None
+    title: str
+    item_type: str
+    priority: str = "medium"
+    story_points: Optional[int] = None
+    status: str = "draft"
+    refinement_count: int = 0
+    created_at: datetime
+    updated_at: datetime
+
+
+class BRDSummaryListResponse(BaseModel):
+    """Page of BRD summaries."""
+    success: bool = True
+    data: list[BRDSummary]
+    limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page; None on the last page")
+
+
+class EpicSummaryListResponse(BaseModel):
+    """Page of EPIC summaries."""
+    success: bool = True
+    data: list[EpicSummary]
+    limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page; None on the last page")
+
+
+class BacklogSummaryListResponse(BaseModel):
+    """Page of backlog summaries."""
+    success: bool = True
+    data: list[BacklogSummary]
+    limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page; None on the last page")
+
+
 # =============================================================================
 # Module Dependencies - Request/Response Models
 # =============================================================================
@@ -9,10 +9,11 @@ from __future__ import annotations
 import json
 import asyncio
 import re
+import weakref
 from pathlib import Path
 from typing import Any, AsyncGenerator, Optional
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, Field
 from fastapi.responses import StreamingResponse
 
@@ -74,10 +75,18 @@ from .models import (
 )
 from ..core.generator import BRDGenerator
 from ..core.synthesizer import TemplateConfig
+from ..core.llm_cache import bypass_llm_cache
+from ..core.llm_gateway import llm_gateway
 from ..models.request import BRDRequest
 from ..models.output import BRDDocument, BRDOutput, Epic, UserStory, EpicsOutput, BacklogsOutput
 from ..database.config import get_async_session
-from ..database.models import RepositoryDB, RepositoryStatus as DBRepositoryStatus, AnalysisStatus as DBAnalysisStatus
+from ..database.models import (
+    AnalysisRunDB,
+    CodebaseStatisticsDB,
+    RepositoryDB,
+    RepositoryStatus as DBRepositoryStatus,
+    AnalysisStatus as DBAnalysisStatus,
+)
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -439,15 +448,9 @@ Return as JSON:
 }}
 ```
 """
-        response = await generator._copilot_session.send_and_wait({"prompt": prompt})
-
-        # Parse the response
-        if response and hasattr(response, 'text'):
-            response_text = response.text
-        elif isinstance(response, str):
-            response_text = response
-        else:
-            response_text = str(response) if response else ""
+        response_text = await llm_gateway.send(
+            generator._copilot_session, prompt, caller="template_sections"
+        )
 
         # Extract JSON from response
         json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response_text)
@@ -848,66 +851,75 @@ async def _generate_brd_draft_stream(
             repo_filesystem_client = FilesystemMCPClient(workspace_root=workspace_root)
             await repo_filesystem_client.connect()
 
-            aggregator = ContextAggregator(
-                generator.neo4j_client,
-                repo_filesystem_client,
-                copilot_session=generator._copilot_session,
-            )
-
-            context = await aggregator.build_context(
-                request=request.feature_description,
-                affected_components=request.affected_components,
-                include_similar=request.include_similar_features,
-            )
+            draft_generator = None
+            try:
+                aggregator = ContextAggregator(
+                    generator.neo4j_client,
+                    repo_filesystem_client,
+                    copilot_session=generator._copilot_session,
+                    model=generator._get_copilot_model(generator.copilot_model),
+                )
 
-            await progress_callback("context", f"Context ready: {len(context.architecture.components)} components")
-
-            # Parse BRD template if provided
-            parsed_template: ParsedBRDTemplate | None = None
-            if request.brd_template:
-                await progress_callback("template", "📋 Parsing BRD template...")
-                template_parser = BRDTemplateParser(copilot_session=generator._copilot_session)
-                parsed_template = await template_parser.parse_template(request.brd_template)
-                await progress_callback("template", f"Template parsed: {len(parsed_template.sections)} sections")
-                logger.info(f"Template sections: {parsed_template.get_section_names()}")
-
-            # Convert sections to dict format if provided
-            custom_sections = None
-            if request.sections:
-                custom_sections = [
-                    {
-                        "name": s.name,
-                        "description": s.description,
-                        "required": s.required,
-                        "target_words": s.target_words,
-                    }
-                    for s in request.sections
-                ]
+                context = await aggregator.build_context(
+                    request=request.feature_description,
+                    affected_components=request.affected_components,
+                    include_similar=request.include_similar_features,
+                )
 
-            # Create draft generator (same as verified, but with skip_verification=True)
-            await progress_callback("generator", "📝 Starting section-by-section BRD generation...")
-
-            draft_generator = VerifiedBRDGenerator(
-                copilot_session=generator._copilot_session,
-                neo4j_client=generator.neo4j_client,
-                filesystem_client=repo_filesystem_client,
-                max_iterations=1,  # Single pass in draft mode
-                parsed_template=parsed_template,
-                detail_level=request.detail_level.value,
-                custom_sections=custom_sections,
-                progress_callback=progress_callback,
-                temperature=request.temperature,
-                seed=request.seed,
-                default_section_words=request.default_section_words,
-                skip_verification=True,  # KEY: Skip verification for draft mode
-            )
+                await progress_callback("context", f"Context ready: {len(context.architecture.components)} components")
+
+                # Parse BRD template if provided
+                parsed_template: ParsedBRDTemplate | None = None
+                if request.brd_template:
+                    await progress_callback("template", "📋 Parsing BRD template...")
+                    template_parser = BRDTemplateParser(copilot_session=generator._copilot_session)
+                    parsed_template = await template_parser.parse_template(request.brd_template)
+                    await progress_callback("template", f"Template parsed: {len(parsed_template.sections)} sections")
+                    logger.info(f"Template sections: {parsed_template.get_section_names()}")
+
+                # Convert sections to dict format if provided
+                custom_sections = None
+                if request.sections:
+                    custom_sections = [
+                        {
+                            "name": s.name,
+                            "description": s.description,
+                            "required": s.required,
+                            "target_words": s.target_words,
+                            "depends_on": s.depends_on,
+                        }
+                        for s in request.sections
+                    ]
 
-            # Run generation (same flow as verified, but no verification loop)
-            output = await draft_generator.generate(context)
+                # Create draft generator (same as verified, but with skip_verification=True)
+                await progress_callback("generator", "📝 Starting section-by-section BRD generation...")
+
+                draft_generator = VerifiedBRDGenerator(
+                    copilot_session=generator._copilot_session,
+                    neo4j_client=generator.neo4j_client,
+                    filesystem_client=repo_filesystem_client,
+                    max_iterations=1,  # Single pass in draft mode
+                    parsed_template=parsed_template,
+                    detail_level=request.detail_level.value,
+                    custom_sections=custom_sections,
+                    progress_callback=progress_callback,
+                    temperature=request.temperature,
+                    seed=request.seed,
+                    default_section_words=request.default_section_words,
+                    skip_verification=True,  # KEY: Skip verification for draft mode
+                    session_factory=generator.create_copilot_session,  # Sessions for concurrent sections
+                    llm_model=generator._get_copilot_model(generator.copilot_model),
+                    cache_context={"repository_id": repository.id, "commit": repository.current_commit},
+                    bypass_cache=request.bypass_cache,
+                )
 
-            # Cleanup
-            await repo_filesystem_client.disconnect()
-            await draft_generator.cleanup()
+                # Run generation (same flow as verified, but no verification loop)
+                output = await draft_generator.generate(context)
+            finally:
+                # Release the orchestrator's Copilot sessions even when generation fails or is cancelled
+                await repo_filesystem_client.disconnect()
+                if draft_generator is not None:
+                    await draft_generator.cleanup()
 
             await progress_callback("complete", f"✅ Draft BRD complete: {output.brd.title}")
 
@@ -1094,114 +1106,123 @@ async def _generate_brd_verified_stream(
             repo_filesystem_client = FilesystemMCPClient(workspace_root=workspace_root)
             await repo_filesystem_client.connect()
 
-            aggregator = ContextAggregator(
-                generator.neo4j_client,
-                repo_filesystem_client,
-                copilot_session=generator._copilot_session,  # Enable agentic context gathering
-            )
+            verified_generator = None
+            try:
+                aggregator = ContextAggregator(
+                    generator.neo4j_client,
+                    repo_filesystem_client,
+                    copilot_session=generator._copilot_session,  # Enable agentic context gathering
+                    model=generator._get_copilot_model(generator.copilot_model),
+                )
 
-            context = await aggregator.build_context(
-                request=request.feature_description,
-                affected_components=request.affected_components,
-                include_similar=request.include_similar_features,
-            )
+                context = await aggregator.build_context(
+                    request=request.feature_description,
+                    affected_components=request.affected_components,
+                    include_similar=request.include_similar_features,
+                )
 
-            await progress_callback("context", f"Context ready: {len(context.architecture.components)} components")
+                await progress_callback("context", f"Context ready: {len(context.architecture.components)} components")
 
-            # Parse BRD template if provided (template-driven generation!)
-            parsed_template: ParsedBRDTemplate | None = None
-            if request.brd_template:
-                await progress_callback("template", "📋 Parsing BRD template...")
-                template_parser = BRDTemplateParser(copilot_session=generator._copilot_session)
-                parsed_template = await template_parser.parse_template(request.brd_template)
-                await progress_callback("template", f"Template parsed: {len(parsed_template.sections)} sections")
-                logger.info(f"Template sections: {parsed_template.get_section_names()}")
+                # Parse BRD template if provided (template-driven generation!)
+                parsed_template: ParsedBRDTemplate | None = None
+                if request.brd_template:
+                    await progress_callback("template", "📋 Parsing BRD template...")
+                    template_parser = BRDTemplateParser(copilot_session=generator._copilot_session)
+                    parsed_template = await template_parser.parse_template(request.brd_template)
+                    await progress_callback("template", f"Template parsed: {len(parsed_template.sections)} sections")
+                    logger.info(f"Template sections: {parsed_template.get_section_names()}")
 
-            # Create multi-agent generator
-            await progress_callback("agents", "🤖 Initializing Generator and Verifier agents...")
+                # Create multi-agent generator
+                await progress_callback("agents", "🤖 Initializing Generator and Verifier agents...")
 
-            verification_config = VerificationConfig(
-                min_confidence_for_approval=request.min_confidence,
-                max_iterations=request.max_iterations,
-            )
+                verification_config = VerificationConfig(
+                    min_confidence_for_approval=request.min_confidence,
+                    max_iterations=request.max_iterations,
+                )
+
+                # Convert sufficiency criteria if provided
+                sufficiency_dict = None
+                if request.sufficiency_criteria:
+                    sufficiency_dict = {
+                        "dimensions": [
+                            {
+                                "name": d.name,
+                                "description": d.description,
+                                "required": d.required,
+                            }
+                            for d in request.sufficiency_criteria.dimensions
+                        ],
+                        "output_requirements": {
+                            "code_traceability": request.sufficiency_criteria.output_requirements.code_traceability if request.sufficiency_criteria.output_requirements else True,
+                            "explicit_gaps": request.sufficiency_criteria.output_requirements.explicit_gaps if request.sufficiency_criteria.output_requirements else True,
+                            "evidence_based": request.sufficiency_criteria.output_requirements.evidence_based if request.sufficiency_criteria.output_requirements else True,
+                        } if request.sufficiency_criteria.output_requirements else None,
+                        "min_dimensions_covered": request.sufficiency_criteria.min_dimensions_covered,
+                    }
+                    await progress_callback("config", f"Custom sufficiency criteria: {len(request.sufficiency_criteria.dimensions)} dimensions")
 
-            # Convert sufficiency criteria if provided
-            sufficiency_dict = None
-            if request.sufficiency_criteria:
-                sufficiency_dict = {
-                    "dimensions": [
+                # Convert sections to dict format if provided (including target_words for length control)
+                custom_sections_verified = None
+                if request.sections:
+                    custom_sections_verified = [
                         {
-                            "name": d.name,
-                            "description": d.description,
-                            "required": d.required,
+                            "name": s.name,
+                            "description": s.description,
+                            "required": s.required,
+                            "target_words": s.target_words,
+                            "depends_on": s.depends_on,
                         }
-                        for d in request.sufficiency_criteria.dimensions
-                    ],
-                    "output_requirements": {
-                        "code_traceability": request.sufficiency_criteria.output_requirements.code_traceability if request.sufficiency_criteria.output_requirements else True,
-                        "explicit_gaps": request.sufficiency_criteria.output_requirements.explicit_gaps if request.sufficiency_criteria.output_requirements else True,
-                        "evidence_based": request.sufficiency_criteria.output_requirements.evidence_based if request.sufficiency_criteria.output_requirements else True,
-                    } if request.sufficiency_criteria.output_requirements else None,
-                    "min_dimensions_covered": request.sufficiency_criteria.min_dimensions_covered,
-                }
-                await progress_callback("config", f"Custom sufficiency criteria: {len(request.sufficiency_criteria.dimensions)} dimensions")
-
-            # Convert sections to dict format if provided (including target_words for length control)
-            custom_sections_verified = None
-            if request.sections:
-                custom_sections_verified = [
-                    {
-                        "name": s.name,
-                        "description": s.description,
-                        "required": s.required,
-                        "target_words": s.target_words,
-                    }
-                    for s in request.sections
-                ]
+                        for s in request.sections
+                    ]
 
-            # Convert verification limits to dict if provided
-            verification_limits_dict = None
-            if request.verification_limits:
-                verification_limits_dict = {
-                    "max_entities_per_claim": request.verification_limits.max_entities_per_claim,
-                    "max_patterns_per_claim": request.verification_limits.max_patterns_per_claim,
-                    "results_per_query": request.verification_limits.results_per_query,
-                    "code_refs_per_evidence": request.verification_limits.code_refs_per_evidence,
-                }
-
-            verified_generator = VerifiedBRDGenerator(
-                copilot_session=generator._copilot_session,
-                neo4j_client=generator.neo4j_client,
-                filesystem_client=repo_filesystem_client,
-                max_iterations=request.max_iterations,
-                parsed_template=parsed_template,  # Pass parsed template
-                sufficiency_criteria=sufficiency_dict,  # Pass sufficiency criteria
-                detail_level=request.detail_level.value,  # Pass detail level
-                custom_sections=custom_sections_verified,  # Pass custom sections
-                verification_limits=verification_limits_dict,  # Pass verification limits
-                progress_callback=progress_callback,  # Pass progress callback for streaming updates
-                temperature=request.temperature,  # Consistency control
-                seed=request.seed,  # Reproducibility control
-                claims_per_section=request.claims_per_section,  # Consistent claim extraction
-                default_section_words=request.default_section_words,  # Section length control
-            )
+                # Convert verification limits to dict if provided
+                verification_limits_dict = None
+                if request.verification_limits:
+                    verification_limits_dict = {
+                        "max_entities_per_claim": request.verification_limits.max_entities_per_claim,
+                        "max_patterns_per_claim": request.verification_limits.max_patterns_per_claim,
+                        "results_per_query": request.verification_limits.results_per_query,
+                        "code_refs_per_evidence": request.verification_limits.code_refs_per_evidence,
+                    }
 
-            # Run multi-agent generation
-            await progress_callback("agents", "Starting Generator-Verifier loop...")
+                verified_generator = VerifiedBRDGenerator(
+                    copilot_session=generator._copilot_session,
+                    neo4j_client=generator.neo4j_client,
+                    filesystem_client=repo_filesystem_client,
+                    max_iterations=request.max_iterations,
+                    parsed_template=parsed_template,  # Pass parsed template
+                    sufficiency_criteria=sufficiency_dict,  # Pass sufficiency criteria
+                    detail_level=request.detail_level.value,  # Pass detail level
+                    custom_sections=custom_sections_verified,  # Pass custom sections
+                    verification_limits=verification_limits_dict,  # Pass verification limits
+                    progress_callback=progress_callback,  # Pass progress callback for streaming updates
+                    temperature=request.temperature,  # Consistency control
+                    seed=request.seed,  # Reproducibility control
+                    claims_per_section=request.claims_per_section,  # Consistent claim extraction
+                    default_section_words=request.default_section_words,  # Section length control
+                    session_factory=generator.create_copilot_session,  # Sessions for concurrent claim checks
+                    llm_model=generator._get_copilot_model(generator.copilot_model),  # Part of the LLM cache key
+                    cache_context={"repository_id": repository.id, "commit": repository.current_commit},
+                    bypass_cache=request.bypass_cache,  # Skip cached LLM responses
+                )
 
-            output = await verified_generator.generate(context)
+                # Run multi-agent generation
+                await progress_callback("agents", "Starting Generator-Verifier loop...")
 
-            # Get evidence bundle
-            evidence_bundle = verified_generator.orchestrator.get_evidence_bundle()
+                output = await verified_generator.generate(context)
 
-            # Store evidence bundle for later retrieval
-            if output and output.brd:
-                brd_id = f"BRD-{hash(output.brd.title) % 10000:04d}"
-                _evidence_bundles[brd_id] = evidence_bundle
+                # Get evidence bundle
+                evidence_bundle = verified_generator.orchestrator.get_evidence_bundle()
 
-            # Cleanup
-            await repo_filesystem_client.disconnect()
-            await verified_generator.cleanup()
+                # Store evidence bundle for later retrieval
+                if output and output.brd:
+                    brd_id = f"BRD-{hash(output.brd.title) % 10000:04d}"
+                    _evidence_bundles[brd_id] = evidence_bundle
+            finally:
+                # Release the orchestrator's Copilot sessions even when generation fails or is cancelled
+                await repo_filesystem_client.disconnect()
+                if verified_generator is not None:
+                    await verified_generator.cleanup()
 
             await progress_callback("complete", f"✅ BRD complete! Confidence: {verified_generator.get_confidence_score():.2f}")
 
@@ -1851,7 +1872,8 @@ async def generate_epics_legacy(
         brd = _response_to_brd(request.brd)
 
         # Generate Epics
-        epics_output = await generator.generate_epics_from_brd(brd, use_skill=request.use_skill)
+        with bypass_llm_cache(request.bypass_cache):
+            epics_output = await generator.generate_epics_from_brd(brd, use_skill=request.use_skill)
 
         # Convert to response
         return GenerateEpicsResponse(
@@ -1910,10 +1932,11 @@ async def generate_backlogs_legacy(
         )
 
         # Generate Backlogs
-        backlogs_output = await generator.generate_backlogs_from_epics(
-            epics_output,
-            use_skill=request.use_skill,
-        )
+        with bypass_llm_cache(request.bypass_cache):
+            backlogs_output = await generator.generate_backlogs_from_epics(
+                epics_output,
+                use_skill=request.use_skill,
+            )
 
         # Calculate total points
         total_points = sum(s.estimated_points or 0 for s in backlogs_output.stories)
@@ -2201,6 +2224,388 @@ async def get_readiness_report(
 # Codebase Statistics
 # =============================================================================
 
+# Aggregate queries behind the statistics endpoint. They are independent of
+# each other, so a recompute runs them concurrently and combines the rows in
+# _build_codebase_statistics.
+# Note: Graph structure is Repository -> HAS_MODULE -> Module -> CONTAINS_FILE -> File
+CODEBASE_STATISTICS_QUERIES: dict[str, str] = {
+    # Basic file and LOC statistics
+    "files": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)
+    WHERE r.repositoryId = $repository_id
+    RETURN
+        count(f) as total_files,
+        sum(COALESCE(f.loc, f.lineCount, 0)) as total_loc,
+        avg(COALESCE(f.loc, f.lineCount, 0)) as avg_file_size
+    """,
+    # Language breakdown
+    "languages": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)
+    WHERE r.repositoryId = $repository_id AND f.language IS NOT NULL
+    RETURN
+        f.language as language,
+        count(f) as file_count,
+        sum(COALESCE(f.loc, f.lineCount, 0)) as loc
+    ORDER BY loc DESC
+    """,
+    # JSP pages, used for both the language breakdown and UI routes.
+    # JSP pages may be orphaned, so filter by filePath instead of traversing
+    "jsp_pages": """
+    MATCH (j:JSPPage)
+    WHERE j.filePath CONTAINS $repository_id
+    RETURN
+        count(j) as file_count,
+        sum(COALESCE(j.loc, j.lineCount, 0)) as loc
+    """,
+    "classes": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)
+    WHERE r.repositoryId = $repository_id
+        AND (c:Class OR c:JavaClass OR c:CSharpClass OR c:CppClass OR c:PythonClass)
+    RETURN count(c) as count
+    """,
+    "interfaces": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(i)
+    WHERE r.repositoryId = $repository_id
+        AND (i:Interface OR i:JavaInterface OR i:CSharpInterface OR i:GoInterface)
+    RETURN count(i) as count
+    """,
+    "functions": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)-[:HAS_METHOD]->(method)
+    WHERE r.repositoryId = $repository_id
+    RETURN count(method) as count
+    """,
+    "components": """
+    MATCH (r:Repository)-[*1..4]->(c:Component)
+    WHERE r.repositoryId = $repository_id
+    RETURN count(c) as count
+    """,
+    "rest_endpoints": """
+    MATCH (r:Repository)-[*1..4]->(e)
+    WHERE r.repositoryId = $repository_id
+        AND (e:RestEndpoint OR e:SpringController)
+    RETURN count(e) as count
+    """,
+    "graphql_operations": """
+    MATCH (r:Repository)-[*1..4]->(g:GraphQLOperation)
+    WHERE r.repositoryId = $repository_id
+    RETURN count(g) as count
+    """,
+    # Test files by name pattern
+    "test_files": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)
+    WHERE r.repositoryId = $repository_id
+        AND (f.name CONTAINS 'Test' OR f.name CONTAINS 'test'
+             OR f.filePath CONTAINS '/test/' OR f.filePath CONTAINS '/tests/')
+    RETURN count(f) as file_count
+    """,
+    "dependencies": """
+    MATCH (r:Repository)-[*1..3]->(d)
+    WHERE r.repositoryId = $repository_id
+        AND (d:GradleDependency OR d:MavenDependency OR d:NpmDependency)
+    RETURN count(d) as count
+    """,
+    # JAVA_IMPORTS as a proxy when no explicit dependencies are present
+    "imports": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)-[:JAVA_IMPORTS]->(imported)
+    WHERE r.repositoryId = $repository_id
+    RETURN count(DISTINCT imported) as count
+    """,
+    "database_models": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)
+    WHERE r.repositoryId = $repository_id
+        AND (c:Entity
+             OR c.stereotype = 'Entity'
+             OR (c:JavaClass AND (c.name ENDS WITH 'Entity' OR c.name ENDS WITH 'Model')))
+    RETURN count(c) as count
+    """,
+    "complexity": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)-[:HAS_METHOD]->(method)
+    WHERE r.repositoryId = $repository_id
+        AND method.complexity IS NOT NULL
+    RETURN
+        avg(method.complexity) as avg_complexity,
+        max(method.complexity) as max_complexity
+    """,
+    "services": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(s)
+    WHERE r.repositoryId = $repository_id
+        AND (s:SpringService OR s.stereotype = 'Service')
+    RETURN count(s) as count
+    """,
+    "controllers": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(ctrl)
+    WHERE r.repositoryId = $repository_id
+        AND (ctrl:SpringController OR ctrl.stereotype = 'Controller')
+    RETURN count(ctrl) as count
+    """,
+    "repository_classes": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(repo_class)
+    WHERE r.repositoryId = $repository_id
+        AND repo_class.stereotype = 'Repository'
+    RETURN count(repo_class) as count
+    """,
+    # React/Vue routes and pages
+    "ui_pages": """
+    MATCH (r:Repository)-[*1..4]->(page)
+    WHERE r.repositoryId = $repository_id
+        AND (page:UIRoute OR page:UIPage OR page:Component)
+    RETURN count(page) as count
+    """,
+    "documentation": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)
+    WHERE r.repositoryId = $repository_id
+    OPTIONAL MATCH (c)-[:HAS_METHOD]->(method)
+    WITH c, method
+    RETURN
+        count(DISTINCT c) + count(method) as total,
+        sum(CASE WHEN c.hasDocumentation = true
+                 OR (c.javadoc IS NOT NULL AND c.javadoc <> '')
+            THEN 1 ELSE 0 END) +
+        sum(CASE WHEN method.hasDocumentation = true
+                 OR (method.javadoc IS NOT NULL AND method.javadoc <> '')
+            THEN 1 ELSE 0 END) as documented
+    """,
+    "config_files": """
+    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)
+    WHERE r.repositoryId = $repository_id
+        AND (f.name ENDS WITH '.xml' OR f.name ENDS WITH '.properties'
+             OR f.name ENDS WITH '.yaml' OR f.name ENDS WITH '.yml'
+             OR f.name ENDS WITH '.json' OR f.name ENDS WITH '.toml'
+             OR f.name ENDS WITH '.env' OR f.name ENDS WITH '.config.js'
+             OR f.name ENDS WITH '.config.ts' OR f.name = 'package.json'
+             OR f.name = 'tsconfig.json' OR f.name = 'pom.xml'
+             OR f.name = 'build.gradle' OR f.name = 'settings.gradle'
+             OR f.filePath CONTAINS '/config/' OR f.filePath CONTAINS '/resources/')
+    RETURN count(f) as count
+    """,
+}
+
+# One lock per repository so concurrent dashboard requests share a single recompute.
+# Weak values drop a repository's lock once no request holds or awaits it.
+_statistics_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+async def _run_statistics_queries(
+    neo4j_client: Any,
+    repository_id: str,
+) -> tuple[dict[str, list[dict]], bool]:
+    """Run all statistics aggregate queries concurrently.
+
+    Returns:
+        Tuple of (rows per query name, whether every query succeeded).
+    """
+    names = list(CODEBASE_STATISTICS_QUERIES)
+    results = await asyncio.gather(
+        *(
+            neo4j_client.query_code_structure(
+                CODEBASE_STATISTICS_QUERIES[name],
+                {"repository_id": repository_id},
+            )
+            for name in names
+        ),
+        return_exceptions=True,
+    )
+
+    rows: dict[str, list[dict]] = {}
+    complete = True
+    for name, result in zip(names, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Statistics query '{name}' failed for {repository_id}: {result}")
+            complete = False
+            rows[name] = []
+        else:
+            rows[name] = (result or {}).get("nodes") or []
+    return rows, complete
+
+
+def _build_codebase_statistics(rows: dict[str, list[dict]]) -> CodebaseStatistics:
+    """Combine aggregate query rows into a CodebaseStatistics model."""
+    stats = CodebaseStatistics()
+
+    def first(name: str) -> Optional[dict]:
+        return rows[name][0] if rows.get(name) else None
+
+    def count(name: str, field: str = "count") -> int:
+        node = first(name)
+        return int(node.get(field, 0) or 0) if node else 0
+
+    node = first("files")
+    if node:
+        stats.total_files = int(node.get("total_files", 0) or 0)
+        stats.total_lines_of_code = int(node.get("total_loc", 0) or 0)
+        stats.avg_file_size = float(node.get("avg_file_size", 0) or 0)
+
+    languages = [
+        LanguageBreakdown(
+            language=node.get("language", "Unknown"),
+            file_count=int(node.get("file_count", 0) or 0),
+            lines_of_code=int(node.get("loc", 0) or 0),
+            percentage=0,
+        )
+        for node in rows.get("languages", [])
+    ]
+    if languages:
+        stats.primary_language = languages[0].language
+
+    # Add JSP pages to totals and the language breakdown
+    jsp_node = first("jsp_pages")
+    jsp_count = count("jsp_pages", "file_count")
+    if jsp_count > 0:
+        jsp_loc = int(jsp_node.get("loc", 0) or 0)
+        stats.total_files += jsp_count
+        stats.total_lines_of_code += jsp_loc
+        languages.append(LanguageBreakdown(
+            language="JSP",
+            file_count=jsp_count,
+            lines_of_code=jsp_loc,
+            percentage=0,
+        ))
+
+    total_loc = stats.total_lines_of_code or 1
+    for lang in languages:
+        lang.percentage = round((lang.lines_of_code / total_loc) * 100, 1)
+    stats.languages = languages
+
+    stats.total_classes = count("classes")
+    stats.total_interfaces = count("interfaces")
+    stats.total_functions = count("functions")
+
+    stats.rest_endpoints = count("rest_endpoints")
+    stats.graphql_operations = count("graphql_operations")
+    stats.total_api_endpoints = stats.rest_endpoints + stats.graphql_operations
+
+    stats.total_test_files = count("test_files", "file_count")
+    # Estimate test cases (avg 5 tests per test file)
+    stats.total_test_cases = stats.total_test_files * 5
+
+    stats.total_dependencies = count("dependencies") or count("imports")
+    stats.total_database_models = count("database_models")
+
+    node = first("complexity")
+    if node:
+        avg_c = node.get("avg_complexity")
+        max_c = node.get("max_complexity")
+        if avg_c is not None:
+            stats.avg_cyclomatic_complexity = round(float(avg_c), 2)
+        if max_c is not None:
+            stats.max_cyclomatic_complexity = int(max_c)
+
+    stats.services_count = count("services")
+    stats.controllers_count = count("controllers")
+    stats.repositories_count = count("repository_classes")
+
+    # JSP pages count as UI routes/components for Java web apps; fall back to
+    # Component nodes when the JSP query returned nothing
+    if jsp_node is not None:
+        stats.ui_routes = jsp_count
+        stats.ui_components = jsp_count
+        stats.total_components = jsp_count
+    else:
+        stats.total_components = count("components")
+        stats.ui_components = stats.total_components
+
+    page_count = count("ui_pages")
+    stats.ui_routes += page_count
+    stats.ui_components += page_count
+    stats.total_components += page_count
+
+    node = first("documentation")
+    if node:
+        total = int(node.get("total", 0) or 0)
+        documented = int(node.get("documented", 0) or 0)
+        stats.documented_entities = documented
+        if total > 0:
+            stats.documentation_coverage = round((documented / total) * 100, 1)
+
+    stats.config_files = count("config_files")
+    return stats
+
+
+async def _load_statistics_state(
+    repository_id: str,
+) -> tuple[RepositoryDB, Optional[AnalysisRunDB], Optional[CodebaseStatisticsDB]]:
+    """Load the repository, its latest completed analysis run and its
+    statistics snapshot for the current commit.
+
+    Raises:
+        HTTPException: If the repository does not exist or is not analyzed.
+    """
+    from sqlalchemy import select
+
+    async with get_async_session() as session:
+        result = await session.execute(
+            select(RepositoryDB).where(RepositoryDB.id == repository_id)
+        )
+        db_repo = result.scalar_one_or_none()
+
+        if not db_repo:
+            raise HTTPException(status_code=404, detail=f"Repository not found: {repository_id}")
+
+        if db_repo.analysis_status != DBAnalysisStatus.COMPLETED:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Repository not analyzed. Current status: {db_repo.analysis_status.value}"
+            )
+
+        run_result = await session.execute(
+            select(AnalysisRunDB)
+            .where(
+                AnalysisRunDB.repository_id == repository_id,
+                AnalysisRunDB.status == DBAnalysisStatus.COMPLETED,
+            )
+            .order_by(AnalysisRunDB.completed_at.desc())
+            .limit(1)
+        )
+        snapshot = await session.get(
+            CodebaseStatisticsDB, (repository_id, db_repo.current_commit or "")
+        )
+        return db_repo, run_result.scalar_one_or_none(), snapshot
+
+
+def _statistics_snapshot_is_fresh(
+    db_repo: RepositoryDB,
+    analysis_run: Optional[AnalysisRunDB],
+    snapshot: Optional[CodebaseStatisticsDB],
+) -> bool:
+    """A snapshot is valid until a newer analysis completes or the commit changes."""
+    if analysis_run is None or snapshot is None:
+        return False
+    return (
+        snapshot.commit_sha == (db_repo.current_commit or "")
+        and snapshot.analysis_run_id == analysis_run.id
+    )
+
+
+def _statistics_response(
+    db_repo: RepositoryDB,
+    snapshot: CodebaseStatisticsDB,
+) -> CodebaseStatisticsResponse:
+    """Build the endpoint response from a statistics snapshot."""
+    stats = CodebaseStatistics.model_validate(snapshot.statistics)
+
+    # Build summary for quick display
+    summary = {
+        "files": stats.total_files,
+        "loc": stats.total_lines_of_code,
+        "classes": stats.total_classes,
+        "functions": stats.total_functions,
+        "apis": stats.total_api_endpoints,
+        "components": stats.total_components,
+        "tests": stats.total_test_files,
+        "languages": len(stats.languages),
+        "primary_language": stats.primary_language,
+    }
+
+    return CodebaseStatisticsResponse(
+        success=True,
+        repository_id=db_repo.id,
+        repository_name=db_repo.name,
+        generated_at=snapshot.computed_at,
+        statistics=stats,
+        summary=summary,
+    )
+
+
 @router.get(
     "/repositories/{repository_id}/statistics",
     response_model=CodebaseStatisticsResponse,
@@ -2238,452 +2643,73 @@ async def get_readiness_report(
     - Complexity metrics (cyclomatic complexity)
     - Documentation coverage percentage
 
+    Statistics are computed once per repository commit and completed analysis
+    run, and cached. They are recomputed when a new analysis completes, when
+    the repository's commit changes, or when `refresh=true` is passed.
+
     Requires the repository to be analyzed first.
     """,
 )
 async def get_codebase_statistics(
     repository_id: str,
+    refresh: bool = False,
     generator: BRDGenerator = Depends(get_generator),
 ) -> CodebaseStatisticsResponse:
     """Get comprehensive codebase statistics for a repository."""
     from datetime import datetime
-    from sqlalchemy import select
 
     try:
         logger.info(f"[API] Getting codebase statistics for repository: {repository_id}")
 
-        # Get repository info
-        async with get_async_session() as session:
-            result = await session.execute(
-                select(RepositoryDB).where(RepositoryDB.id == repository_id)
-            )
-            db_repo = result.scalar_one_or_none()
-
-            if not db_repo:
-                raise HTTPException(status_code=404, detail=f"Repository not found: {repository_id}")
-
-            if db_repo.analysis_status != DBAnalysisStatus.COMPLETED:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Repository not analyzed. Current status: {db_repo.analysis_status.value}"
-                )
-
-            repository_name = db_repo.name
-
-        # Ensure generator is initialized (for Neo4j client access)
-        if not generator._initialized:
-            await generator.initialize()
-
-        # Initialize statistics with defaults
-        stats = CodebaseStatistics()
-        languages = []
-
-        # Query Neo4j for statistics if client is available
-        if generator.neo4j_client:
-            try:
-                # Note: Graph structure is Repository -> HAS_MODULE -> Module -> CONTAINS_FILE -> File
-                # We traverse from Repository node to get files for this specific repository
-
-                # Query 1: Basic file and LOC statistics
-                # Try traversing from Repository first, fall back to direct query
-                file_stats_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)
-                WHERE r.repositoryId = $repository_id
-                RETURN
-                    count(f) as total_files,
-                    sum(COALESCE(f.loc, f.lineCount, 0)) as total_loc,
-                    avg(COALESCE(f.loc, f.lineCount, 0)) as avg_file_size
-                """
-                file_result = await generator.neo4j_client.query_code_structure(
-                    file_stats_query,
-                    {"repository_id": repository_id}
-                )
-                if file_result and file_result.get("nodes"):
-                    node = file_result["nodes"][0]
-                    stats.total_files = int(node.get("total_files", 0) or 0)
-                    stats.total_lines_of_code = int(node.get("total_loc", 0) or 0)
-                    stats.avg_file_size = float(node.get("avg_file_size", 0) or 0)
-
-                # Query 2: Language breakdown (including JSP pages)
-                lang_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)
-                WHERE r.repositoryId = $repository_id AND f.language IS NOT NULL
-                RETURN
-                    f.language as language,
-                    count(f) as file_count,
-                    sum(COALESCE(f.loc, f.lineCount, 0)) as loc
-                ORDER BY loc DESC
-                """
-                lang_result = await generator.neo4j_client.query_code_structure(
-                    lang_query,
-                    {"repository_id": repository_id}
-                )
-                if lang_result and lang_result.get("nodes"):
-                    total_loc = stats.total_lines_of_code or 1
-                    for node in lang_result["nodes"]:
-                        lang_loc = int(node.get("loc", 0) or 0)
-                        languages.append(LanguageBreakdown(
-                            language=node.get("language", "Unknown"),
-                            file_count=int(node.get("file_count", 0) or 0),
-                            lines_of_code=lang_loc,
-                            percentage=round((lang_loc / total_loc) * 100, 1) if total_loc > 0 else 0
-                        ))
-                    if languages:
-                        stats.primary_language = languages[0].language
-
-                # Query 2b: Add JSP pages to language breakdown
-                jsp_lang_query = """
-                MATCH (j:JSPPage)
-                WHERE j.filePath CONTAINS $repository_id
-                RETURN
-                    'JSP' as language,
-                    count(j) as file_count,
-                    sum(COALESCE(j.loc, j.lineCount, 0)) as loc
-                """
-                jsp_lang_result = await generator.neo4j_client.query_code_structure(
-                    jsp_lang_query,
-                    {"repository_id": repository_id}
-                )
-                if jsp_lang_result and jsp_lang_result.get("nodes"):
-                    node = jsp_lang_result["nodes"][0]
-                    jsp_count = int(node.get("file_count", 0) or 0)
-                    jsp_loc = int(node.get("loc", 0) or 0)
-                    if jsp_count > 0:
-                        # Add JSP files to total
-                        stats.total_files += jsp_count
-                        stats.total_lines_of_code += jsp_loc
-                        total_loc = stats.total_lines_of_code or 1
-                        # Add JSP to languages
-                        languages.append(LanguageBreakdown(
-                            language="JSP",
-                            file_count=jsp_count,
-                            lines_of_code=jsp_loc,
-                            percentage=round((jsp_loc / total_loc) * 100, 1) if total_loc > 0 else 0
-                        ))
-                        # Recalculate percentages for existing languages
-                        for lang in languages[:-1]:  # All except JSP we just added
-                            lang.percentage = round((lang.lines_of_code / total_loc) * 100, 1) if total_loc > 0 else 0
-
-                # Query 3: Classes - traverse from Repository through modules to files to classes
-                class_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)
-                WHERE r.repositoryId = $repository_id
-                    AND (c:Class OR c:JavaClass OR c:CSharpClass OR c:CppClass OR c:PythonClass)
-                RETURN count(c) as count
-                """
-                class_result = await generator.neo4j_client.query_code_structure(
-                    class_query,
-                    {"repository_id": repository_id}
-                )
-                if class_result and class_result.get("nodes"):
-                    stats.total_classes = int(class_result["nodes"][0].get("count", 0) or 0)
-
-                # Query 4: Interfaces
-                interface_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(i)
-                WHERE r.repositoryId = $repository_id
-                    AND (i:Interface OR i:JavaInterface OR i:CSharpInterface OR i:GoInterface)
-                RETURN count(i) as count
-                """
-                interface_result = await generator.neo4j_client.query_code_structure(
-                    interface_query,
-                    {"repository_id": repository_id}
-                )
-                if interface_result and interface_result.get("nodes"):
-                    stats.total_interfaces = int(interface_result["nodes"][0].get("count", 0) or 0)
+        db_repo, analysis_run, snapshot = await _load_statistics_state(repository_id)
+        if not refresh and _statistics_snapshot_is_fresh(db_repo, analysis_run, snapshot):
+            return _statistics_response(db_repo, snapshot)
 
-                # Query 5: Functions/Methods - traverse from classes
-                func_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)-[:HAS_METHOD]->(method)
-                WHERE r.repositoryId = $repository_id
-                RETURN count(method) as count
-                """
-                func_result = await generator.neo4j_client.query_code_structure(
-                    func_query,
-                    {"repository_id": repository_id}
-                )
-                if func_result and func_result.get("nodes"):
-                    stats.total_functions = int(func_result["nodes"][0].get("count", 0) or 0)
+        lock = _statistics_locks.setdefault(repository_id, asyncio.Lock())
+        async with lock:
+            # Another request may have refreshed the snapshot while we waited
+            db_repo, analysis_run, snapshot = await _load_statistics_state(repository_id)
+            if not refresh and _statistics_snapshot_is_fresh(db_repo, analysis_run, snapshot):
+                return _statistics_response(db_repo, snapshot)
 
-                # Query 6: UI Components - traverse from Repository
-                component_query = """
-                MATCH (r:Repository)-[*1..4]->(c:Component)
-                WHERE r.repositoryId = $repository_id
-                RETURN count(c) as count
-                """
-                comp_result = await generator.neo4j_client.query_code_structure(
-                    component_query,
-                    {"repository_id": repository_id}
-                )
-                if comp_result and comp_result.get("nodes"):
-                    stats.total_components = int(comp_result["nodes"][0].get("count", 0) or 0)
-                    stats.ui_components = stats.total_components
+            # Ensure generator is initialized (for Neo4j client access)
+            if not generator._initialized:
+                await generator.initialize()
 
-                # Query 7: REST Endpoints - check SpringController or RestEndpoint through Repository
-                rest_query = """
-                MATCH (r:Repository)-[*1..4]->(e)
-                WHERE r.repositoryId = $repository_id
-                    AND (e:RestEndpoint OR e:SpringController)
-                RETURN count(e) as count
-                """
-                rest_result = await generator.neo4j_client.query_code_structure(
-                    rest_query,
-                    {"repository_id": repository_id}
+            rows: dict[str, list[dict]] = {}
+            complete = False
+            if generator.neo4j_client:
+                rows, complete = await _run_statistics_queries(
+                    generator.neo4j_client, repository_id
                 )
-                if rest_result and rest_result.get("nodes"):
-                    stats.rest_endpoints = int(rest_result["nodes"][0].get("count", 0) or 0)
 
-                # Query 8: GraphQL Operations
-                graphql_query = """
-                MATCH (r:Repository)-[*1..4]->(g:GraphQLOperation)
-                WHERE r.repositoryId = $repository_id
-                RETURN count(g) as count
-                """
-                gql_result = await generator.neo4j_client.query_code_structure(
-                    graphql_query,
-                    {"repository_id": repository_id}
-                )
-                if gql_result and gql_result.get("nodes"):
-                    stats.graphql_operations = int(gql_result["nodes"][0].get("count", 0) or 0)
-
-                stats.total_api_endpoints = stats.rest_endpoints + stats.graphql_operations
+            snapshot = CodebaseStatisticsDB(
+                repository_id=db_repo.id,
+                commit_sha=db_repo.current_commit or "",
+                analysis_run_id=analysis_run.id if analysis_run else None,
+                statistics=_build_codebase_statistics(rows).model_dump(mode="json"),
+                computed_at=datetime.now(),
+            )
 
-                # Query 9: Test Files (by name pattern or TestFile label)
-                test_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)
-                WHERE r.repositoryId = $repository_id
-                    AND (f.name CONTAINS 'Test' OR f.name CONTAINS 'test'
-                         OR f.filePath CONTAINS '/test/' OR f.filePath CONTAINS '/tests/')
-                RETURN count(f) as file_count
-                """
-                test_result = await generator.neo4j_client.query_code_structure(
-                    test_query,
-                    {"repository_id": repository_id}
-                )
-                if test_result and test_result.get("nodes"):
-                    stats.total_test_files = int(test_result["nodes"][0].get("file_count", 0) or 0)
-                    # Estimate test cases (avg 5 tests per test file)
-                    stats.total_test_cases = stats.total_test_files * 5
-
-                # Query 10: Dependencies (external imports/dependencies) - traverse from Repository
-                dep_query = """
-                MATCH (r:Repository)-[*1..3]->(d)
-                WHERE r.repositoryId = $repository_id
-                    AND (d:GradleDependency OR d:MavenDependency OR d:NpmDependency)
-                RETURN count(d) as count
-                """
-                dep_result = await generator.neo4j_client.query_code_structure(
-                    dep_query,
-                    {"repository_id": repository_id}
-                )
-                if dep_result and dep_result.get("nodes"):
-                    stats.total_dependencies = int(dep_result["nodes"][0].get("count", 0) or 0)
-
-                # If no explicit dependencies, count unique imports
-                if stats.total_dependencies == 0:
-                    # Count JAVA_IMPORTS relationships as proxy for dependencies
-                    import_query = """
-                    MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)-[:JAVA_IMPORTS]->(imported)
-                    WHERE r.repositoryId = $repository_id
-                    RETURN count(DISTINCT imported) as count
-                    """
-                    import_result = await generator.neo4j_client.query_code_structure(
-                        import_query,
-                        {"repository_id": repository_id}
+            # Only cache complete results so a transient Neo4j failure is retried
+            if complete and analysis_run is not None:
+                from sqlalchemy import delete
+
+                async with get_async_session() as session:
+                    await session.merge(snapshot)
+                    # Snapshots for earlier commits are never read again
+                    await session.execute(
+                        delete(CodebaseStatisticsDB).where(
+                            CodebaseStatisticsDB.repository_id == snapshot.repository_id,
+                            CodebaseStatisticsDB.commit_sha != snapshot.commit_sha,
+                        )
                     )
-                    if import_result and import_result.get("nodes"):
-                        dep_count = int(import_result["nodes"][0].get("count", 0) or 0)
-                        stats.total_dependencies = dep_count
-
-                # Query 11: Database Models - traverse from Repository to Entity classes
-                db_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)
-                WHERE r.repositoryId = $repository_id
-                    AND (c:Entity
-                         OR c.stereotype = 'Entity'
-                         OR (c:JavaClass AND (c.name ENDS WITH 'Entity' OR c.name ENDS WITH 'Model')))
-                RETURN count(c) as count
-                """
-                db_result = await generator.neo4j_client.query_code_structure(
-                    db_query,
-                    {"repository_id": repository_id}
+                logger.info(
+                    f"[API] Cached codebase statistics for {repository_id} "
+                    f"at commit {snapshot.commit_sha[:12] or 'unknown'}"
                 )
-                if db_result and db_result.get("nodes"):
-                    stats.total_database_models = int(db_result["nodes"][0].get("count", 0) or 0)
 
-                # Query 11: Complexity Metrics
-                # Query 12: Complexity Metrics - traverse from Repository
-                complexity_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)-[:HAS_METHOD]->(method)
-                WHERE r.repositoryId = $repository_id
-                    AND method.complexity IS NOT NULL
-                RETURN
-                    avg(method.complexity) as avg_complexity,
-                    max(method.complexity) as max_complexity
-                """
-                complexity_result = await generator.neo4j_client.query_code_structure(
-                    complexity_query,
-                    {"repository_id": repository_id}
-                )
-                if complexity_result and complexity_result.get("nodes"):
-                    node = complexity_result["nodes"][0]
-                    avg_c = node.get("avg_complexity")
-                    max_c = node.get("max_complexity")
-                    if avg_c is not None:
-                        stats.avg_cyclomatic_complexity = round(float(avg_c), 2)
-                    if max_c is not None:
-                        stats.max_cyclomatic_complexity = int(max_c)
-
-                # Query 13: Services, Controllers, Repositories - traverse from Repository
-                service_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(s)
-                WHERE r.repositoryId = $repository_id
-                    AND (s:SpringService OR s.stereotype = 'Service')
-                RETURN count(s) as count
-                """
-                svc_result = await generator.neo4j_client.query_code_structure(
-                    service_query,
-                    {"repository_id": repository_id}
-                )
-                if svc_result and svc_result.get("nodes"):
-                    stats.services_count = int(svc_result["nodes"][0].get("count", 0) or 0)
-
-                controller_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(ctrl)
-                WHERE r.repositoryId = $repository_id
-                    AND (ctrl:SpringController OR ctrl.stereotype = 'Controller')
-                RETURN count(ctrl) as count
-                """
-                ctrl_result = await generator.neo4j_client.query_code_structure(
-                    controller_query,
-                    {"repository_id": repository_id}
-                )
-                if ctrl_result and ctrl_result.get("nodes"):
-                    stats.controllers_count = int(ctrl_result["nodes"][0].get("count", 0) or 0)
-
-                repo_class_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(repo_class)
-                WHERE r.repositoryId = $repository_id
-                    AND repo_class.stereotype = 'Repository'
-                RETURN count(repo_class) as count
-                """
-                repo_result = await generator.neo4j_client.query_code_structure(
-                    repo_class_query,
-                    {"repository_id": repository_id}
-                )
-                if repo_result and repo_result.get("nodes"):
-                    stats.repositories_count = int(repo_result["nodes"][0].get("count", 0) or 0)
-
-                # Query 14: UI Routes/Pages - count JSP pages as UI components for Java web apps
-                # JSP pages may be orphaned, so filter by filePath instead of traversing
-                route_query = """
-                MATCH (j:JSPPage)
-                WHERE j.filePath CONTAINS $repository_id
-                RETURN count(j) as count
-                """
-                route_result = await generator.neo4j_client.query_code_structure(
-                    route_query,
-                    {"repository_id": repository_id}
-                )
-                if route_result and route_result.get("nodes"):
-                    jsp_count = int(route_result["nodes"][0].get("count", 0) or 0)
-                    stats.ui_routes = jsp_count
-                    stats.ui_components = jsp_count
-                    stats.total_components = jsp_count
-
-                # Also check for React/Vue components via Repository traversal
-                component_query2 = """
-                MATCH (r:Repository)-[*1..4]->(page)
-                WHERE r.repositoryId = $repository_id
-                    AND (page:UIRoute OR page:UIPage OR page:Component)
-                RETURN count(page) as count
-                """
-                comp_result2 = await generator.neo4j_client.query_code_structure(
-                    component_query2,
-                    {"repository_id": repository_id}
-                )
-                if comp_result2 and comp_result2.get("nodes"):
-                    count = int(comp_result2["nodes"][0].get("count", 0) or 0)
-                    if count > 0:
-                        stats.ui_routes += count
-                        stats.ui_components += count
-                        stats.total_components += count
-
-                # Query 15: Documentation Coverage - traverse from Repository
-                doc_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)-[:DEFINES_CLASS]->(c)
-                WHERE r.repositoryId = $repository_id
-                OPTIONAL MATCH (c)-[:HAS_METHOD]->(method)
-                WITH c, method
-                RETURN
-                    count(DISTINCT c) + count(method) as total,
-                    sum(CASE WHEN c.hasDocumentation = true
-                             OR (c.javadoc IS NOT NULL AND c.javadoc <> '')
-                        THEN 1 ELSE 0 END) +
-                    sum(CASE WHEN method.hasDocumentation = true
-                             OR (method.javadoc IS NOT NULL AND method.javadoc <> '')
-                        THEN 1 ELSE 0 END) as documented
-                """
-                doc_result = await generator.neo4j_client.query_code_structure(
-                    doc_query,
-                    {"repository_id": repository_id}
-                )
-                if doc_result and doc_result.get("nodes"):
-                    node = doc_result["nodes"][0]
-                    total = int(node.get("total", 0) or 0)
-                    documented = int(node.get("documented", 0) or 0)
-                    stats.documented_entities = documented
-                    if total > 0:
-                        stats.documentation_coverage = round((documented / total) * 100, 1)
-
-                # Query 16: Config Files - traverse from Repository
-                config_query = """
-                MATCH (r:Repository)-[:HAS_MODULE]->(m)-[:CONTAINS_FILE]->(f:File)
-                WHERE r.repositoryId = $repository_id
-                    AND (f.name ENDS WITH '.xml' OR f.name ENDS WITH '.properties'
-                         OR f.name ENDS WITH '.yaml' OR f.name ENDS WITH '.yml'
-                         OR f.name ENDS WITH '.json' OR f.name ENDS WITH '.toml'
-                         OR f.name ENDS WITH '.env' OR f.name ENDS WITH '.config.js'
-                         OR f.name ENDS WITH '.config.ts' OR f.name = 'package.json'
-                         OR f.name = 'tsconfig.json' OR f.name = 'pom.xml'
-                         OR f.name = 'build.gradle' OR f.name = 'settings.gradle'
-                         OR f.filePath CONTAINS '/config/' OR f.filePath CONTAINS '/resources/')
-                RETURN count(f) as count
-                """
-                config_result = await generator.neo4j_client.query_code_structure(
-                    config_query,
-                    {"repository_id": repository_id}
-                )
-                if config_result and config_result.get("nodes"):
-                    stats.config_files = int(config_result["nodes"][0].get("count", 0) or 0)
-
-            except Exception as neo4j_error:
-                logger.warning(f"Neo4j query failed, using default statistics: {neo4j_error}")
-
-        # Update languages in stats
-        stats.languages = languages
-
-        # Build summary for quick display
-        summary = {
-            "files": stats.total_files,
-            "loc": stats.total_lines_of_code,
-            "classes": stats.total_classes,
-            "functions": stats.total_functions,
-            "apis": stats.total_api_endpoints,
-            "components": stats.total_components,
-            "tests": stats.total_test_files,
-            "languages": len(languages),
-            "primary_language": stats.primary_language,
-        }
-
-        return CodebaseStatisticsResponse(
-            success=True,
-            repository_id=repository_id,
-            repository_name=repository_name,
-            generated_at=datetime.now(),
-            statistics=stats,
-            summary=summary,
-        )
+        return _statistics_response(db_repo, snapshot)
 
     except HTTPException:
         raise
@@ -3205,26 +3231,18 @@ Example:
 2|Contract Management
 """
 
-                if hasattr(session, 'send_and_wait'):
-                    import asyncio
-                    event = await asyncio.wait_for(
-                        session.send_and_wait({"prompt": prompt}, timeout=30),
-                        timeout=35
-                    )
-
-                    if event and hasattr(event, 'text'):
-                        response = event.text.strip()
-                        for line in response.split('\n'):
-                            parts = line.strip().split('|')
-                            if len(parts) >= 2:
-                                try:
-                                    idx = int(parts[0].strip()) - 1
-                                    name = parts[1].strip().strip('"').strip("'")
-                                    if 0 <= idx < len(business_candidates) and name:
-                                        original_idx = business_candidates[idx][0]
-                                        results[original_idx]['feature_name'] = name
-                                except (ValueError, IndexError):
-                                    continue
+                response = await llm_gateway.send(session, prompt, caller="feature_naming", timeout=30)
+                for line in response.strip().split('\n'):
+                    parts = line.strip().split('|')
+                    if len(parts) >= 2:
+                        try:
+                            idx = int(parts[0].strip()) - 1
+                            name = parts[1].strip().strip('"').strip("'")
+                            if 0 <= idx < len(business_candidates) and name:
+                                original_idx = business_candidates[idx][0]
+                                results[original_idx]['feature_name'] = name
+                        except (ValueError, IndexError):
+                            continue
 
         except Exception as e:
             logger.warning(f"LLM feature naming failed (using heuristic names): {e}")
@@ -3729,6 +3747,7 @@ async def get_epic_analyzer(generator: BRDGenerator = Depends(get_generator)) ->
     if _epic_analyzer is None:
         _epic_analyzer = EpicAnalyzer(
             copilot_session=generator._copilot_session if generator else None,
+            session_factory=generator.create_copilot_session if generator else None,
         )
     return _epic_analyzer
 
@@ -4867,6 +4886,12 @@ from .models import (
     StoredBRD,
     StoredEpic,
     StoredBacklog,
+    BRDSummary,
+    EpicSummary,
+    BacklogSummary,
+    BRDSummaryListResponse,
+    EpicSummaryListResponse,
+    BacklogSummaryListResponse,
 )
 from ..services.document_service import DocumentService
 
@@ -4882,6 +4907,11 @@ def get_document_service() -> DocumentService:
     return _document_service
 
 
+def _summary_fields(row: dict) -> dict:
+    """Plain values of a projected summary row (enum members to their values)."""
+    return {key: getattr(value, "value", value) for key, value in row.items()}
+
+
 def _brd_db_to_response(brd) -> StoredBRD:
     """Convert BRDDB to StoredBRD response model."""
     repository = brd.repository if hasattr(brd, 'repository') else None
@@ -5019,7 +5049,12 @@ def _backlog_db_to_response(backlog) -> StoredBacklog:
     response_model=BRDListResponse,
     tags=["BRD Library"],
     summary="List all BRDs",
-    description="Get a paginated list of all stored BRDs with optional filtering.",
+    description=(
+        "Get a paginated list of all stored BRDs with optional filtering. "
+        "Deprecated: loads every BRD's EPICs and backlogs and pages with OFFSET, so it slows "
+        "down as the library grows. Use /brds/summaries for lists and /brds/{brd_id} for details."
+    ),
+    deprecated=True,
 )
 async def list_brds(
     repository_id: Optional[str] = None,
@@ -5050,6 +5085,46 @@ async def list_brds(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get(
+    "/brds/summaries",
+    response_model=BRDSummaryListResponse,
+    tags=["BRD Library"],
+    summary="List BRD summaries",
+    description=(
+        "Get a page of BRD summary rows (no content, EPICs or backlogs; child counts included), "
+        "newest first. Pass next_cursor back as cursor for the following page."
+    ),
+)
+async def list_brd_summaries(
+    repository_id: Optional[str] = None,
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    doc_service: DocumentService = Depends(get_document_service),
+) -> BRDSummaryListResponse:
+    """List BRD summaries with keyset pagination."""
+    try:
+        rows, next_cursor = await doc_service.list_brd_summaries(
+            repository_id=repository_id,
+            status=status,
+            search=search,
+            limit=limit,
+            cursor=cursor,
+        )
+        return BRDSummaryListResponse(
+            success=True,
+            data=[BRDSummary(**_summary_fields(r)) for r in rows],
+            limit=limit,
+            next_cursor=next_cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Error listing BRD summaries")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get(
     "/brds/{brd_id}",
     response_model=BRDDetailResponse,
@@ -5290,7 +5365,12 @@ async def save_epics_for_brd(
     response_model=EpicsListResponse,
     tags=["BRD Library"],
     summary="List all EPICs",
-    description="Get all EPICs across all BRDs with optional filters.",
+    description=(
+        "Get all EPICs across all BRDs with optional filters. "
+        "Deprecated: loads every EPIC's backlogs and pages with OFFSET, so it slows down as "
+        "the library grows. Use /epics/summaries for lists and /epics/{epic_id} for details."
+    ),
+    deprecated=True,
 )
 async def list_all_epics(
     status: Optional[str] = None,
@@ -5317,6 +5397,44 @@ async def list_all_epics(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get(
+    "/epics/summaries",
+    response_model=EpicSummaryListResponse,
+    tags=["BRD Library"],
+    summary="List EPIC summaries",
+    description=(
+        "Get a page of EPIC summary rows across all BRDs (no content or backlogs; backlog count "
+        "included), newest first. Pass next_cursor back as cursor for the following page."
+    ),
+)
+async def list_epic_summaries(
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    doc_service: DocumentService = Depends(get_document_service),
+) -> EpicSummaryListResponse:
+    """List EPIC summaries with keyset pagination."""
+    try:
+        rows, next_cursor = await doc_service.list_epic_summaries(
+            status=status,
+            search=search,
+            limit=limit,
+            cursor=cursor,
+        )
+        return EpicSummaryListResponse(
+            success=True,
+            data=[EpicSummary(**_summary_fields(r)) for r in rows],
+            limit=limit,
+            next_cursor=next_cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Error listing EPIC summaries")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get(
     "/epics/{epic_id}",
     response_model=EpicDetailResponse,
@@ -5481,7 +5599,12 @@ async def save_backlogs_for_epic(
     response_model=BacklogsListResponse,
     tags=["BRD Library"],
     summary="List all backlogs",
-    description="Get all backlog items across all EPICs with optional filters.",
+    description=(
+        "Get all backlog items across all EPICs with optional filters. "
+        "Deprecated: pages with OFFSET and counts every match, so it slows down as the "
+        "library grows. Use /backlogs/summaries for lists and /epics/{epic_id}/backlogs for details."
+    ),
+    deprecated=True,
 )
 async def list_all_backlogs(
     status: Optional[str] = None,
@@ -5510,3 +5633,45 @@ async def list_all_backlogs(
     except Exception as e:
         logger.exception("Error listing backlogs")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/backlogs/summaries",
+    response_model=BacklogSummaryListResponse,
+    tags=["BRD Library"],
+    summary="List backlog summaries",
+    description=(
+        "Get a page of backlog summary rows across all EPICs (no content), newest first. "
+        "Pass next_cursor back as cursor for the following page."
+    ),
+)
+async def list_backlog_summaries(
+    status: Optional[str] = None,
+    item_type: Optional[str] = None,
+    priority: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    doc_service: DocumentService = Depends(get_document_service),
+) -> BacklogSummaryListResponse:
+    """List backlog summaries with keyset pagination."""
+    try:
+        rows, next_cursor = await doc_service.list_backlog_summaries(
+            status=status,
+            item_type=item_type,
+            priority=priority,
+            search=search,
+            limit=limit,
+            cursor=cursor,
+        )
+        return BacklogSummaryListResponse(
+            success=True,
+            data=[BacklogSummary(**_summary_fields(r)) for r in rows],
+            limit=limit,
+            next_cursor=next_cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Error listing backlog summaries")
+        raise HTTPException(status_code=500, detail=str(e))
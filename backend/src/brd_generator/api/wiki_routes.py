@@ -42,7 +42,8 @@ class WikiGenerationOptions(BaseModel):
     include_api_reference: bool = Field(False, description="Include API reference pages")
     include_class_pages: bool = Field(False, description="Include individual class documentation")
     include_data_models: bool = Field(False, description="Include data model documentation")
-    regenerate_all: bool = Field(False, description="Regenerate all pages even if not stale")
+    regenerate_all: bool = Field(False, description="Regenerate all pages instead of only pages whose sources changed")
+    bypass_cache: bool = Field(False, description="Ignore cached LLM responses and refresh them")
 
 
 class GenerateWikiRequest(BaseModel):
@@ -165,6 +166,8 @@ async def generate_wiki(
             _run_wiki_generation,
             repository_id,
             depth,
+            not request.options.regenerate_all,
+            request.options.bypass_cache,
         )
 
         return {
@@ -355,7 +358,12 @@ async def delete_wiki(repository_id: str):
 # Background Task Helper
 # =============================================================================
 
-async def _run_wiki_generation(repository_id: str, depth: str):
+async def _run_wiki_generation(
+    repository_id: str,
+    depth: str,
+    incremental: bool = False,
+    bypass_cache: bool = False,
+):
     """Run wiki generation in background."""
     try:
         async with get_async_session() as session:
@@ -364,6 +372,8 @@ async def _run_wiki_generation(repository_id: str, depth: str):
                 session,
                 repository_id,
                 depth=depth,
+                incremental=incremental,
+                bypass_cache=bypass_cache,
             )
             await session.commit()
             logger.info(f"Background wiki generation completed for {repository_id}")
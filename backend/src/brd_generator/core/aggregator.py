@@ -8,8 +8,11 @@ This module uses the Copilot SDK to let the LLM dynamically:
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import re
+import time
 from typing import Any, Callable, Optional, Awaitable
 
 from ..models.context import (
@@ -42,7 +45,10 @@ from ..models.flow_context import (
 from ..mcp_clients.neo4j_client import Neo4jMCPClient
 from ..mcp_clients.filesystem_client import FilesystemMCPClient
 from ..utils.logger import get_logger, get_progress_logger
+from ..utils.token_counter import truncate_to_token_limit
 from .enhanced_context import EnhancedContextRetriever
+from .llm_gateway import llm_gateway
+from .context_packer import ContextPacker, context_budget_for_model
 from .feature_flow import FeatureFlowService
 
 logger = get_logger(__name__)
@@ -55,6 +61,14 @@ DEFAULT_FULLTEXT_WEIGHT = 0.7  # Weight for fulltext score in combined score
 MIN_COMPONENTS_TO_RETURN = 5  # Minimum components even if scores are low
 MAX_COMPONENTS_CAP = 100  # Safety cap to prevent runaway queries
 
+# Enrichment phase: bounded fan-out of independent Neo4j lookups
+DEFAULT_ENRICHMENT_CONCURRENCY = int(os.getenv("ENRICHMENT_CONCURRENCY", "6"))
+DEFAULT_ENRICHMENT_QUERY_TIMEOUT = float(os.getenv("ENRICHMENT_QUERY_TIMEOUT", "30"))
+
+# Token limits for source files read into key_files
+DIRECT_FILE_MAX_TOKENS = int(os.getenv("CONTEXT_DIRECT_FILE_MAX_TOKENS", "2000"))
+BASIC_FILE_MAX_TOKENS = int(os.getenv("CONTEXT_BASIC_FILE_MAX_TOKENS", "1250"))
+
 # Type for progress callback: async function that takes (step: str, detail: str)
 ProgressCallback = Callable[[str, str], Awaitable[None]]
 
@@ -189,10 +203,13 @@ class ContextAggregator:
         neo4j_client: Neo4jMCPClient,
         filesystem_client: FilesystemMCPClient,
         copilot_session: Any = None,
-        max_tokens: int = 100000,
+        max_tokens: Optional[int] = None,
         fulltext_score_threshold: float = DEFAULT_FULLTEXT_SCORE_THRESHOLD,
         pagerank_weight: float = DEFAULT_PAGERANK_WEIGHT,
         use_enhanced_retrieval: bool = True,  # NEW: Enable enhanced context retrieval
+        enrichment_concurrency: int = DEFAULT_ENRICHMENT_CONCURRENCY,
+        enrichment_query_timeout: float = DEFAULT_ENRICHMENT_QUERY_TIMEOUT,
+        model: Optional[str] = None,
     ):
         """
         Initialize the context aggregator.
@@ -201,21 +218,29 @@ class ContextAggregator:
             neo4j_client: Neo4j MCP client
             filesystem_client: Filesystem MCP client
             copilot_session: Copilot SDK session for agentic queries
-            max_tokens: Maximum tokens for context (used for dynamic limiting)
+            max_tokens: Maximum tokens for context (used for dynamic limiting
+                        and packing); derived from the model's context window
+                        when not given
             fulltext_score_threshold: Minimum relevance score to include component
             pagerank_weight: Weight for PageRank in combined relevance score
             use_enhanced_retrieval: If True, use ENHANCED context retrieval with
                                    compound term detection and graph-based traversal.
                                    This eliminates false positives from keyword matching.
+            enrichment_concurrency: Maximum number of enrichment lookups in flight at once
+            enrichment_query_timeout: Per-lookup timeout in seconds for enrichment queries
+            model: Model the context is generated for, used to size the token budget
         """
         self.neo4j = neo4j_client
         self.filesystem = filesystem_client
         self.copilot_session = copilot_session
-        self.max_tokens = max_tokens
+        self.model = model
+        self.max_tokens = max_tokens if max_tokens is not None else context_budget_for_model(model)
         self.fulltext_score_threshold = fulltext_score_threshold
         self.pagerank_weight = pagerank_weight
         self.fulltext_weight = 1.0 - pagerank_weight
         self.use_enhanced_retrieval = use_enhanced_retrieval
+        self.enrichment_concurrency = max(1, enrichment_concurrency)
+        self.enrichment_query_timeout = enrichment_query_timeout
 
         # Cache for discovered schema
         self._schema_cache: Optional[dict[str, Any]] = None
@@ -448,7 +473,14 @@ class ContextAggregator:
             except Exception as e:
                 logger.warning(f"[AGGREGATOR] Feature flow extraction failed: {e}")
 
-        # Phase 6: Extract enhanced context (menu items, sub-features, validation chains, cross-feature deps)
+        # Phases 6 & 7: Enrichment lookups (menu items, sub-features, cross-feature deps,
+        # enriched rules, enhanced methods, transition conditions, form fields).
+        # Independent lookups fan out concurrently; see _run_enrichment_phase.
+        progress.step("build_context", "Extracting enhanced context", current=6, total=6)
+        await report("enhanced", "Extracting menu items, sub-features, and cross-feature dependencies...")
+        enrichment = await self._run_enrichment_phase(request, architecture, progress_callback)
+
+        # Phase 6: Enhanced context (menu items, sub-features, validation chains, cross-feature deps)
         menu_items_list: list[MenuItemInfo] = []
         sub_features_list: list[SubFeatureInfo] = []
         validation_chains_list: list[ValidationChainInfo] = []
@@ -456,11 +488,8 @@ class ContextAggregator:
         enriched_rules_list: list[dict] = []
 
         if self._enhanced_retriever:
-            progress.step("build_context", "Extracting enhanced context", current=6, total=6)
-            await report("enhanced", "Extracting menu items, sub-features, and cross-feature dependencies...")
             try:
-                # Get menu-based entry points
-                menu_result = await self._enhanced_retriever._find_entry_points_by_menu(request, max_entry_points=10)
+                menu_result = enrichment.get("menu")
                 if menu_result and menu_result.get("menu_items"):
                     for item in menu_result["menu_items"]:
                         menu_items_list.append(MenuItemInfo(
@@ -474,52 +503,37 @@ class ContextAggregator:
                             required_roles=item.get("required_roles", []),
                         ))
 
-                    # Get sub-features for the first matching flow
-                    if menu_result.get("flow_id"):
-                        sub_features_raw = await self._enhanced_retriever._get_sub_features(menu_result["flow_id"])
-                        for sf in sub_features_raw:
-                            sub_features_list.append(SubFeatureInfo(
-                                screen_id=sf.get("screen_id", ""),
-                                title=sf.get("title", ""),
-                                screen_type=sf.get("screen_type", "unknown"),
-                                jsps=sf.get("jsps", []),
-                                action_class=sf.get("action_class"),
-                                action_methods=sf.get("action_methods", []),
-                                transitions_to=sf.get("transitions_to", []),
-                                url_pattern=sf.get("url_pattern"),
-                            ))
+                for sf in enrichment.get("sub_features") or []:
+                    sub_features_list.append(SubFeatureInfo(
+                        screen_id=sf.get("screen_id", ""),
+                        title=sf.get("title", ""),
+                        screen_type=sf.get("screen_type", "unknown"),
+                        jsps=sf.get("jsps", []),
+                        action_class=sf.get("action_class"),
+                        action_methods=sf.get("action_methods", []),
+                        transitions_to=sf.get("transitions_to", []),
+                        url_pattern=sf.get("url_pattern"),
+                    ))
 
-                        # Get cross-feature dependencies
-                        cross_feature_data = await self._enhanced_retriever.get_cross_feature_dependencies(menu_result["flow_id"])
-                        if cross_feature_data:
-                            deps = []
-                            for dep in cross_feature_data.get("dependencies", []):
-                                deps.append(CrossFeatureDependency(
-                                    source_feature=dep.get("source_feature", ""),
-                                    target_feature=dep.get("target_feature", ""),
-                                    relationship_type=dep.get("relationship_type", ""),
-                                    shared_component=dep.get("shared_component", ""),
-                                    implication=dep.get("implication", ""),
-                                ))
-                            cross_feature_ctx = CrossFeatureContext(
-                                dependencies=deps,
-                                shared_entities=cross_feature_data.get("shared_entities", {}),
-                                shared_services=cross_feature_data.get("shared_services", {}),
-                                impact_summary=cross_feature_data.get("impact_summary"),
-                            )
-
-                # Get enriched business rules
-                if architecture.components:
-                    feature_context = {
-                        "menu_item": menu_items_list[0].label if menu_items_list else None,
-                        "request": request,
-                    }
-                    enriched_rules_raw = await self._enhanced_retriever.get_enriched_business_rules(
-                        entry_points=[{"name": c.name, "type": c.type} for c in architecture.components[:10]],
-                        feature_context=feature_context,
-                        max_rules=20
+                cross_feature_data = enrichment.get("cross_feature")
+                if cross_feature_data:
+                    deps = []
+                    for dep in cross_feature_data.get("dependencies", []):
+                        deps.append(CrossFeatureDependency(
+                            source_feature=dep.get("source_feature", ""),
+                            target_feature=dep.get("target_feature", ""),
+                            relationship_type=dep.get("relationship_type", ""),
+                            shared_component=dep.get("shared_component", ""),
+                            implication=dep.get("implication", ""),
+                        ))
+                    cross_feature_ctx = CrossFeatureContext(
+                        dependencies=deps,
+                        shared_entities=cross_feature_data.get("shared_entities", {}),
+                        shared_services=cross_feature_data.get("shared_services", {}),
+                        impact_summary=cross_feature_data.get("impact_summary"),
                     )
-                    enriched_rules_list = enriched_rules_raw if enriched_rules_raw else []
+
+                enriched_rules_list = enrichment.get("enriched_rules") or []
 
                 # Get validation chains (from entry points)
                 # This would need to be implemented in enhanced_context.py
@@ -548,7 +562,7 @@ class ContextAggregator:
             except Exception as e:
                 logger.warning(f"[ENHANCED] Enhanced context extraction failed: {e}")
 
-        # Phase 7: Extract code snippets, security rules, error messages (Phase 11 enhancement)
+        # Phase 7: Code snippets, security rules, error messages (Phase 11 enhancement)
         code_snippets_list: list[CodeSnippetInfo] = []
         security_rules_list: list[SecurityRuleInfo] = []
         error_messages_list: list[ErrorMessageInfo] = []
@@ -557,101 +571,88 @@ class ContextAggregator:
         enhanced_methods_list: list[EnhancedMethodContext] = []
 
         try:
-            await report("enhanced", "Extracting code snippets, security rules, and error messages...")
-
-            # Get method IDs from architecture components
-            method_components = [c for c in architecture.components if 'method' in c.type.lower() or 'action' in c.type.lower()]
-
-            if method_components:
-                # Fetch enhanced method context
-                method_names = [c.name for c in method_components[:20]]  # Limit to 20 methods
-                enhanced_methods_data = await self._fetch_enhanced_methods(method_names)
-
-                for method_data in enhanced_methods_data:
-                    # Extract code snippet
-                    if method_data.get("codeSnippet"):
-                        code_snippets_list.append(CodeSnippetInfo(
-                            method_name=method_data.get("methodName", ""),
-                            class_name=method_data.get("className"),
-                            file_path=method_data.get("filePath", ""),
-                            start_line=method_data.get("startLine", 0),
-                            end_line=method_data.get("endLine", 0),
-                            snippet=method_data.get("codeSnippet", ""),
-                        ))
-
-                    # Extract security rules
-                    for rule in method_data.get("securityRules", []):
-                        if rule.get("type"):
-                            security_rules_list.append(SecurityRuleInfo(
-                                annotation_type=rule.get("type", ""),
-                                annotation_text=rule.get("expression", ""),
-                                expression=rule.get("expression"),
-                                roles=rule.get("roles", []),
-                                target_name=method_data.get("methodName", ""),
-                                target_type="method",
-                                file_path=method_data.get("filePath"),
-                                line_number=method_data.get("startLine"),
-                                description=rule.get("description"),
-                            ))
-
-                    # Extract error messages
-                    for err_msg in method_data.get("errorMessages", []):
-                        if isinstance(err_msg, str) and err_msg:
-                            error_messages_list.append(ErrorMessageInfo(
-                                message_text=err_msg,
-                                source_type="inline",
-                                source_file=method_data.get("filePath"),
-                                context_method=method_data.get("methodName"),
-                            ))
-
-                    # Build enhanced method context
-                    enhanced_methods_list.append(EnhancedMethodContext(
+            for method_data in enrichment.get("methods") or []:
+                # Extract code snippet
+                if method_data.get("codeSnippet"):
+                    code_snippets_list.append(CodeSnippetInfo(
                         method_name=method_data.get("methodName", ""),
                         class_name=method_data.get("className"),
-                        signature=method_data.get("signature"),
                         file_path=method_data.get("filePath", ""),
                         start_line=method_data.get("startLine", 0),
                         end_line=method_data.get("endLine", 0),
-                        code_snippet=method_data.get("codeSnippet"),
-                        error_messages=[
-                            ErrorMessageInfo(message_text=e, source_type="inline")
-                            for e in method_data.get("errorMessages", []) if isinstance(e, str) and e
-                        ],
-                        security_rules=[
-                            SecurityRuleInfo(
-                                annotation_type=r.get("type", ""),
-                                annotation_text=r.get("expression", ""),
-                                expression=r.get("expression"),
-                                roles=r.get("roles", []),
-                                target_name=method_data.get("methodName", ""),
-                                target_type="method",
-                            )
-                            for r in method_data.get("securityRules", []) if r.get("type")
-                        ],
-                        invoked_methods=method_data.get("invokedMethods", []),
+                        snippet=method_data.get("codeSnippet", ""),
                     ))
 
-            # Fetch transition conditions from WebFlows
-            flow_components = [c for c in architecture.components if 'flow' in c.type.lower() or 'webflow' in c.type.lower()]
-            for flow in flow_components[:5]:  # Limit to 5 flows
-                conditions = await self._fetch_transition_conditions(flow.name)
+                # Extract security rules
+                for rule in method_data.get("securityRules", []):
+                    if rule.get("type"):
+                        security_rules_list.append(SecurityRuleInfo(
+                            annotation_type=rule.get("type", ""),
+                            annotation_text=rule.get("expression", ""),
+                            expression=rule.get("expression"),
+                            roles=rule.get("roles", []),
+                            target_name=method_data.get("methodName", ""),
+                            target_type="method",
+                            file_path=method_data.get("filePath"),
+                            line_number=method_data.get("startLine"),
+                            description=rule.get("description"),
+                        ))
+
+                # Extract error messages
+                for err_msg in method_data.get("errorMessages", []):
+                    if isinstance(err_msg, str) and err_msg:
+                        error_messages_list.append(ErrorMessageInfo(
+                            message_text=err_msg,
+                            source_type="inline",
+                            source_file=method_data.get("filePath"),
+                            context_method=method_data.get("methodName"),
+                        ))
+
+                # Build enhanced method context
+                enhanced_methods_list.append(EnhancedMethodContext(
+                    method_name=method_data.get("methodName", ""),
+                    class_name=method_data.get("className"),
+                    signature=method_data.get("signature"),
+                    file_path=method_data.get("filePath", ""),
+                    start_line=method_data.get("startLine", 0),
+                    end_line=method_data.get("endLine", 0),
+                    code_snippet=method_data.get("codeSnippet"),
+                    error_messages=[
+                        ErrorMessageInfo(message_text=e, source_type="inline")
+                        for e in method_data.get("errorMessages", []) if isinstance(e, str) and e
+                    ],
+                    security_rules=[
+                        SecurityRuleInfo(
+                            annotation_type=r.get("type", ""),
+                            annotation_text=r.get("expression", ""),
+                            expression=r.get("expression"),
+                            roles=r.get("roles", []),
+                            target_name=method_data.get("methodName", ""),
+                            target_type="method",
+                        )
+                        for r in method_data.get("securityRules", []) if r.get("type")
+                    ],
+                    invoked_methods=method_data.get("invokedMethods", []),
+                ))
+
+            # Transition conditions from WebFlows
+            for flow_name, conditions in enrichment.get("transition_conditions") or []:
                 for cond in conditions:
+                    metadata = cond.get("conditionMetadata") or {}
                     transition_conditions_list.append(TransitionConditionInfo(
-                        flow_name=cond.get("flowName", flow.name),
+                        flow_name=cond.get("flowName", flow_name),
                         transition_name=cond.get("transitionName", ""),
                         trigger_event=cond.get("triggerEvent", ""),
                         target_state=cond.get("targetState", ""),
                         condition_expression=cond.get("condition", ""),
-                        description=cond.get("conditionMetadata", {}).get("description") if cond.get("conditionMetadata") else None,
-                        variables=cond.get("conditionMetadata", {}).get("variables", []) if cond.get("conditionMetadata") else [],
-                        method_calls=cond.get("conditionMetadata", {}).get("methodCalls", []) if cond.get("conditionMetadata") else [],
-                        is_spel=cond.get("conditionMetadata", {}).get("isSpEL", False) if cond.get("conditionMetadata") else False,
+                        description=metadata.get("description"),
+                        variables=metadata.get("variables", []),
+                        method_calls=metadata.get("methodCalls", []),
+                        is_spel=metadata.get("isSpEL", False),
                     ))
 
-            # Fetch form field details from JSPs
-            jsp_components = [c for c in architecture.components if 'jsp' in c.type.lower() or 'page' in c.type.lower()]
-            for jsp in jsp_components[:5]:  # Limit to 5 JSPs
-                fields = await self._fetch_form_field_details(jsp.name)
+            # Form field details from JSPs
+            for jsp_name, fields in enrichment.get("form_fields") or []:
                 for field in fields:
                     form_field_details_list.append(FormFieldDetailInfo(
                         field_name=field.get("fieldName", ""),
@@ -664,7 +665,7 @@ class ContextAggregator:
                         error_path=field.get("errorPath"),
                         css_error_class=field.get("cssErrorClass"),
                         form_name=field.get("formName"),
-                        jsp_name=field.get("jspName", jsp.name),
+                        jsp_name=field.get("jspName", jsp_name),
                     ))
 
             logger.info(f"[ENHANCED-PHASE7] Extracted {len(code_snippets_list)} code snippets, "
@@ -925,29 +926,15 @@ Return ONLY a JSON array of keywords, no explanation:
         if not keywords:
             return []
 
-        # Build label filter
-        label_filter = " OR ".join([f"n:{label}" for label in schema.component_labels])
-        if not label_filter:
-            label_filter = "n:Class OR n:Function OR n:Module"
-
-        # Build keyword conditions
-        keyword_conditions = " OR ".join([f"toLower(n.name) CONTAINS '{kw}'" for kw in keywords])
-
-        query = f"""
-            MATCH (n)
-            WHERE ({label_filter}) AND ({keyword_conditions})
-            WITH n, COALESCE(n.pageRank, 0.1) AS pageRank
-            RETURN n.name AS name,
-                   labels(n)[0] AS type,
-                   n.filePath AS path,
-                   n.description AS description,
-                   pageRank
-            ORDER BY pageRank DESC
-            LIMIT {MAX_COMPONENTS_CAP}
-        """
+        labels = list(schema.component_labels) or ["Class", "Function", "Module"]
 
         try:
-            result = await self.neo4j.query_code_structure(query)
+            result = await self.neo4j.query_name_matches(
+                "SEARCH_COMPONENTS_FALLBACK",
+                keywords,
+                labels=labels,
+                limit=MAX_COMPONENTS_CAP,
+            )
             components = []
             for node in result.get("nodes", []):
                 name = node.get("name", "")
@@ -1139,23 +1126,28 @@ Return ONLY a JSON array of keywords, no explanation:
         configs: dict[str, Any] = {}
         patterns: list[str] = []
 
-        # Read files for components with paths
-        files_read = 0
-        for component in architecture.components[:15]:
-            if component.path and files_read < 10:
-                try:
-                    content = await self.filesystem.read_file(component.path)
-                    if content:
-                        key_files.append(FileContext(
-                            path=component.path,
-                            content=content[:8000] if len(content) > 8000 else content,
-                            relevance=f"Source for {component.name}",
-                            relevance_score=0.9,
-                        ))
-                        files_read += 1
-                        logger.debug(f"[IMPL-DIRECT] Read: {component.path} ({len(content)} chars)")
-                except Exception as e:
-                    logger.debug(f"[IMPL-DIRECT] Could not read {component.path}: {e}")
+        # Read files for components with paths in one concurrent batch
+        components = [c for c in architecture.components[:15] if c.path]
+        try:
+            contents, errors = await self.filesystem.read_files([c.path for c in components])
+        except Exception as e:
+            logger.debug(f"[IMPL-DIRECT] Batch read failed: {e}")
+            contents, errors = {}, {}
+
+        for component in components:
+            if len(key_files) >= 10:
+                break
+            content = contents.get(component.path)
+            if content:
+                key_files.append(FileContext(
+                    path=component.path,
+                    content=truncate_to_token_limit(content, DIRECT_FILE_MAX_TOKENS),
+                    relevance=f"Source for {component.name}",
+                    relevance_score=0.9,
+                ))
+                logger.debug(f"[IMPL-DIRECT] Read: {component.path} ({len(content)} chars)")
+            elif component.path in errors:
+                logger.debug(f"[IMPL-DIRECT] Could not read {component.path}: {errors[component.path]}")
 
         logger.info(f"[IMPL-DIRECT] Read {len(key_files)} source files")
 
@@ -1464,64 +1456,17 @@ Return ONLY the JSON array, no other text."""
         logger.info(f"[COPILOT-PROMPT] Prompt preview: {prompt[:500]}...")
 
         try:
-            # Build message options - SDK uses this format
-            message_options = {"prompt": prompt}
-
-            # Use send_and_wait method (correct SDK API)
-            if hasattr(self.copilot_session, 'send_and_wait'):
-                logger.info("[COPILOT-SDK] Using send_and_wait method")
-                event = await self.copilot_session.send_and_wait(message_options, timeout=120)
-
-                if event:
-                    # Extract text content from event
-                    response_text = self._extract_text_from_event(event)
-                    logger.info(f"[COPILOT-RESPONSE] Received response ({len(response_text)} chars)")
-                    logger.info(f"[COPILOT-RESPONSE] Response preview: {response_text[:500]}...")
-                    return response_text
-                else:
-                    logger.warning("[COPILOT-SDK] send_and_wait returned None")
-                    return ""
-
-            elif hasattr(self.copilot_session, 'send'):
-                logger.info("[COPILOT-SDK] Using send method (fallback)")
-                message_id = await self.copilot_session.send(message_options)
-                logger.info(f"[COPILOT-SDK] Message sent, ID: {message_id}")
-                # Would need to poll for response
-                return ""
-
-            else:
-                logger.error("[COPILOT-SDK] No suitable send method found on session")
-                return ""
+            response_text = await llm_gateway.send(
+                self.copilot_session, prompt, caller="aggregator", timeout=120
+            )
+            logger.info(f"[COPILOT-RESPONSE] Received response ({len(response_text)} chars)")
+            logger.info(f"[COPILOT-RESPONSE] Response preview: {response_text[:500]}...")
+            return response_text
 
         except Exception as e:
             logger.error(f"[COPILOT-ERROR] Copilot SDK call failed: {e}")
             raise
 
-    def _extract_text_from_event(self, event: Any) -> str:
-        """Extract text content from a Copilot SDK event."""
-        try:
-            # Try various event formats
-            if hasattr(event, 'data'):
-                data = event.data
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    return str(data.message.content)
-                if hasattr(data, 'content'):
-                    return str(data.content)
-                if hasattr(data, 'text'):
-                    return str(data.text)
-
-            if hasattr(event, 'content'):
-                return str(event.content)
-            if hasattr(event, 'text'):
-                return str(event.text)
-
-            # Last resort
-            return str(event)
-
-        except Exception as e:
-            logger.warning(f"[COPILOT-SDK] Error extracting text from event: {e}")
-            return ""
-
     def _extract_json_from_response(self, response: str) -> Optional[Any]:
         """Extract JSON from LLM response, handling markdown code blocks."""
         if not response:
@@ -1830,18 +1775,24 @@ Return ONLY the JSON array, no other text."""
 
         # Read files for components with paths - limit based on token budget
         max_files_to_read = self._calculate_dynamic_limit(estimated_tokens_per_item=1000)
-        for component in architecture.components[:max_files_to_read]:
-            if component.path:
-                try:
-                    await report("filesystem", f"Reading: {component.path.split('/')[-1]}")
-                    content = await self.filesystem.read_file(component.path)
+        paths = [c.path for c in architecture.components[:max_files_to_read] if c.path]
+        if paths:
+            await report("filesystem", f"Reading {len(paths)} files")
+            try:
+                contents, errors = await self.filesystem.read_files(paths)
+            except Exception as e:
+                logger.debug(f"Batch read failed: {e}")
+                contents, errors = {}, {}
+
+            for path in dict.fromkeys(paths):
+                if path in contents:
                     key_files.append(FileContext(
-                        path=component.path,
-                        content=content[:5000] if content else "",
+                        path=path,
+                        content=truncate_to_token_limit(contents[path], BASIC_FILE_MAX_TOKENS),
                         relevance_score=0.8,
                     ))
-                except Exception as e:
-                    logger.debug(f"Could not read {component.path}: {e}")
+                elif path in errors:
+                    logger.debug(f"Could not read {path}: {errors[path]}")
 
         # Try to find config files
         config_patterns = ["**/config/*", "**/*.yaml", "**/*.json"]
@@ -1996,6 +1947,197 @@ Return ONLY the JSON array, no other text."""
 
         return feature_flows, impl_mapping_md, tech_arch_md
 
+    # =========================================================================
+    # Enrichment Phase: concurrent, dependency-aware lookups
+    # =========================================================================
+
+    async def _run_enrichment_phase(
+        self,
+        request: str,
+        architecture: ArchitectureContext,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> dict[str, Any]:
+        """
+        Run the enrichment lookups for phases 6 and 7 concurrently.
+
+        Every lookup is an independent Neo4j round-trip except for the
+        sub-feature, cross-feature and enriched-rule lookups, which need the
+        menu result (flow id / menu label) first. Those run as a dependent
+        stage chained off the menu lookup; everything else starts immediately.
+        Concurrency is capped by ``enrichment_concurrency`` and each lookup is
+        bounded by ``enrichment_query_timeout``.
+
+        Args:
+            request: Original feature request
+            architecture: Architecture context with discovered components
+            progress_callback: Optional callback; receives per-lookup timings
+
+        Returns:
+            Dict of raw lookup results keyed by lookup name. Failed or timed-out
+            lookups yield their empty default.
+        """
+        semaphore = asyncio.Semaphore(self.enrichment_concurrency)
+        timings: dict[str, float] = {}
+
+        async def run(name: str, factory: Callable[[], Awaitable[Any]], default: Any) -> Any:
+            return await self._timed_enrichment_query(
+                name, factory, default, semaphore, timings, progress_callback
+            )
+
+        results: dict[str, Any] = {}
+        phase_start = time.perf_counter()
+
+        async def menu_stage() -> None:
+            retriever = self._enhanced_retriever
+            if not retriever:
+                return
+            menu_result = await run(
+                "menu_items",
+                lambda: retriever._find_entry_points_by_menu(request, max_entry_points=10),
+                None,
+            )
+            results["menu"] = menu_result
+
+            # Dependent lookups: need the flow id / menu label from the menu result
+            dependents: list[Awaitable[None]] = []
+            flow_id = menu_result.get("flow_id") if menu_result and menu_result.get("menu_items") else None
+
+            async def store(key: str, awaitable: Awaitable[Any]) -> None:
+                results[key] = await awaitable
+
+            if flow_id:
+                dependents.append(store("sub_features", run(
+                    "sub_features", lambda: retriever._get_sub_features(flow_id), [],
+                )))
+                dependents.append(store("cross_feature", run(
+                    "cross_feature_dependencies",
+                    lambda: retriever.get_cross_feature_dependencies(flow_id),
+                    None,
+                )))
+            if architecture.components:
+                menu_items = (menu_result or {}).get("menu_items") or []
+                first_label = None
+                if menu_items:
+                    first_label = menu_items[0].get("label", menu_items[0].get("name", ""))
+                feature_context = {"menu_item": first_label, "request": request}
+                entry_points = [{"name": c.name, "type": c.type} for c in architecture.components[:10]]
+                dependents.append(store("enriched_rules", run(
+                    "enriched_business_rules",
+                    lambda: retriever.get_enriched_business_rules(
+                        entry_points=entry_points,
+                        feature_context=feature_context,
+                        max_rules=20,
+                    ),
+                    [],
+                )))
+            if dependents:
+                await asyncio.gather(*dependents)
+
+        async def methods_stage() -> None:
+            method_components = [
+                c for c in architecture.components
+                if 'method' in c.type.lower() or 'action' in c.type.lower()
+            ]
+            if not method_components:
+                return
+            method_names = [c.name for c in method_components[:20]]  # Limit to 20 methods
+            results["methods"] = await run(
+                "enhanced_methods", lambda: self._fetch_enhanced_methods(method_names), [],
+            )
+
+        async def conditions_stage() -> None:
+            flow_names = [
+                c.name for c in architecture.components
+                if 'flow' in c.type.lower() or 'webflow' in c.type.lower()
+            ][:5]  # Limit to 5 flows
+            if not flow_names:
+                return
+            conditions = await run(
+                "transition_conditions",
+                lambda: self._fetch_transition_conditions(flow_names),
+                {},
+            )
+            results["transition_conditions"] = [
+                (name, conditions.get(name, [])) for name in flow_names
+            ]
+
+        async def fields_stage() -> None:
+            jsp_names = [
+                c.name for c in architecture.components
+                if 'jsp' in c.type.lower() or 'page' in c.type.lower()
+            ][:5]  # Limit to 5 JSPs
+            if not jsp_names:
+                return
+            fields = await run(
+                "form_fields",
+                lambda: self._fetch_form_field_details(jsp_names),
+                {},
+            )
+            results["form_fields"] = [
+                (name, fields.get(name, [])) for name in jsp_names
+            ]
+
+        await asyncio.gather(menu_stage(), methods_stage(), conditions_stage(), fields_stage())
+
+        elapsed_ms = (time.perf_counter() - phase_start) * 1000
+        serial_ms = sum(timings.values())
+        slowest = sorted(timings.items(), key=lambda kv: kv[1], reverse=True)[:3]
+        logger.info(
+            f"[ENRICHMENT] {len(timings)} lookups in {elapsed_ms:.0f}ms "
+            f"(serial sum {serial_ms:.0f}ms, concurrency={self.enrichment_concurrency}); "
+            f"slowest: {', '.join(f'{n}={ms:.0f}ms' for n, ms in slowest)}"
+        )
+        if progress_callback:
+            await progress_callback(
+                "enrichment",
+                f"Enrichment complete: {len(timings)} lookups in {elapsed_ms:.0f}ms",
+            )
+
+        return results
+
+    async def _timed_enrichment_query(
+        self,
+        name: str,
+        factory: Callable[[], Awaitable[Any]],
+        default: Any,
+        semaphore: asyncio.Semaphore,
+        timings: dict[str, float],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Any:
+        """
+        Run a single enrichment lookup under the concurrency cap and timeout.
+
+        The elapsed time (excluding time spent waiting for a semaphore slot)
+        is recorded in ``timings`` and reported through ``progress_callback``.
+        Failures and timeouts are logged and return ``default`` so a single
+        slow or broken lookup never fails the whole context build.
+        """
+        async with semaphore:
+            start = time.perf_counter()
+            status = "ok"
+            try:
+                result = await asyncio.wait_for(factory(), timeout=self.enrichment_query_timeout)
+            except asyncio.TimeoutError:
+                status = "timeout"
+                logger.warning(
+                    f"[ENRICHMENT] {name} timed out after {self.enrichment_query_timeout}s"
+                )
+                result = default
+            except Exception as e:
+                status = "error"
+                logger.warning(f"[ENRICHMENT] {name} failed: {e}")
+                result = default
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        timings[name] = elapsed_ms
+        logger.debug(f"[ENRICHMENT] {name}: {elapsed_ms:.0f}ms ({status})")
+        if progress_callback:
+            try:
+                await progress_callback("enrichment", f"{name}: {elapsed_ms:.0f}ms ({status})")
+            except Exception as e:
+                logger.debug(f"[ENRICHMENT] progress callback failed: {e}")
+        return result
+
     # =========================================================================
     # Phase 11: Enhanced Data Fetching Methods
     # =========================================================================
@@ -2007,11 +2149,13 @@ Return ONLY the JSON array, no other text."""
         """
         Fetch enhanced method context including code snippets, security rules, and error messages.
 
+        All methods are resolved in a single UNWIND query.
+
         Args:
             method_names: List of method names to fetch
 
         Returns:
-            List of method data dictionaries with enhanced fields
+            List of method data dictionaries with enhanced fields, in request order
         """
         if not method_names:
             return []
@@ -2019,8 +2163,9 @@ Return ONLY the JSON array, no other text."""
         try:
             # Build query to get method details with enhanced fields
             query = """
+                UNWIND $names AS requestedMethod
                 MATCH (method:JavaMethod)
-                WHERE method.name IN $methodNames
+                WHERE method.name = requestedMethod
 
                 // Get parent class
                 OPTIONAL MATCH (cls)-[:HAS_METHOD]->(method)
@@ -2032,6 +2177,7 @@ Return ONLY the JSON array, no other text."""
                 OPTIONAL MATCH (method)-[:INVOKES]->(inv:MethodInvocation)
 
                 RETURN
+                    requestedMethod AS key,
                     method.entityId AS entityId,
                     method.name AS methodName,
                     method.signature AS signature,
@@ -2051,27 +2197,28 @@ Return ONLY the JSON array, no other text."""
                     collect(DISTINCT inv.methodName) AS invokedMethods
             """
 
-            result = await self.neo4j.query_code_structure(query, {"methodNames": method_names})
+            grouped = await self.neo4j.query_by_names(query, method_names)
             methods = []
 
-            for record in result.get("nodes", []):
-                if record.get("methodName"):
-                    # Filter out empty security rules
-                    security_rules = [r for r in record.get("securityRules", []) if r.get("type")]
-                    methods.append({
-                        "entityId": record.get("entityId"),
-                        "methodName": record.get("methodName"),
-                        "signature": record.get("signature"),
-                        "filePath": record.get("filePath"),
-                        "startLine": record.get("startLine", 0),
-                        "endLine": record.get("endLine", 0),
-                        "codeSnippet": record.get("codeSnippet"),
-                        "errorMessages": record.get("errorMessages", []),
-                        "className": record.get("className"),
-                        "classType": record.get("classType"),
-                        "securityRules": security_rules,
-                        "invokedMethods": [m for m in record.get("invokedMethods", []) if m],
-                    })
+            for records in grouped.values():
+                for record in records:
+                    if record.get("methodName"):
+                        # Filter out empty security rules
+                        security_rules = [r for r in record.get("securityRules", []) if r.get("type")]
+                        methods.append({
+                            "entityId": record.get("entityId"),
+                            "methodName": record.get("methodName"),
+                            "signature": record.get("signature"),
+                            "filePath": record.get("filePath"),
+                            "startLine": record.get("startLine", 0),
+                            "endLine": record.get("endLine", 0),
+                            "codeSnippet": record.get("codeSnippet"),
+                            "errorMessages": record.get("errorMessages", []),
+                            "className": record.get("className"),
+                            "classType": record.get("classType"),
+                            "securityRules": security_rules,
+                            "invokedMethods": [m for m in record.get("invokedMethods", []) if m],
+                        })
 
             logger.info(f"[FETCH-METHODS] Fetched {len(methods)} enhanced methods")
             return methods
@@ -2082,28 +2229,32 @@ Return ONLY the JSON array, no other text."""
 
     async def _fetch_transition_conditions(
         self,
-        flow_name: str,
-    ) -> list[dict]:
+        flow_names: list[str],
+    ) -> dict[str, list[dict]]:
         """
-        Fetch transition conditions with parsed metadata from a WebFlow.
+        Fetch transition conditions with parsed metadata for several WebFlows.
+
+        All flows are resolved in a single UNWIND query.
 
         Args:
-            flow_name: Name of the WebFlow definition
+            flow_names: Names of the WebFlow definitions
 
         Returns:
-            List of transition condition dictionaries
+            Dict mapping each flow name to its transition condition dictionaries
         """
-        if not flow_name:
-            return []
+        if not flow_names:
+            return {}
 
         try:
             query = """
+                UNWIND $names AS requestedFlow
                 MATCH (flow:WebFlowDefinition)-[:HAS_TRANSITION|FLOW_DEFINES_STATE*1..2]->
                       (trans:FlowTransition)
-                WHERE flow.name = $flowName
+                WHERE flow.name = requestedFlow
                   AND trans.condition IS NOT NULL
 
                 RETURN
+                    requestedFlow AS key,
                     flow.name AS flowName,
                     trans.name AS transitionName,
                     trans.on AS triggerEvent,
@@ -2111,54 +2262,62 @@ Return ONLY the JSON array, no other text."""
                     trans.condition AS condition,
                     trans.conditionMetadata AS conditionMetadata,
                     trans.startLine AS lineNumber
-                ORDER BY trans.startLine
+                ORDER BY key, lineNumber
             """
 
-            result = await self.neo4j.query_code_structure(query, {"flowName": flow_name})
-            conditions = []
-
-            for record in result.get("nodes", []):
-                if record.get("condition"):
-                    conditions.append({
-                        "flowName": record.get("flowName", flow_name),
-                        "transitionName": record.get("transitionName", ""),
-                        "triggerEvent": record.get("triggerEvent", ""),
-                        "targetState": record.get("targetState", ""),
-                        "condition": record.get("condition", ""),
-                        "conditionMetadata": record.get("conditionMetadata"),
-                        "lineNumber": record.get("lineNumber"),
-                    })
-
-            logger.info(f"[FETCH-CONDITIONS] Fetched {len(conditions)} conditions for flow {flow_name}")
-            return conditions
+            grouped = await self.neo4j.query_by_names(query, flow_names)
+            conditions_by_flow: dict[str, list[dict]] = {}
+
+            for flow_name, records in grouped.items():
+                conditions = []
+                for record in records:
+                    if record.get("condition"):
+                        conditions.append({
+                            "flowName": record.get("flowName", flow_name),
+                            "transitionName": record.get("transitionName", ""),
+                            "triggerEvent": record.get("triggerEvent", ""),
+                            "targetState": record.get("targetState", ""),
+                            "condition": record.get("condition", ""),
+                            "conditionMetadata": record.get("conditionMetadata"),
+                            "lineNumber": record.get("lineNumber"),
+                        })
+                conditions_by_flow[flow_name] = conditions
+
+            total = sum(len(c) for c in conditions_by_flow.values())
+            logger.info(f"[FETCH-CONDITIONS] Fetched {total} conditions for {len(conditions_by_flow)} flows")
+            return conditions_by_flow
 
         except Exception as e:
-            logger.warning(f"[FETCH-CONDITIONS] Failed to fetch conditions for {flow_name}: {e}")
-            return []
+            logger.warning(f"[FETCH-CONDITIONS] Failed to fetch conditions for {flow_names}: {e}")
+            return {}
 
     async def _fetch_form_field_details(
         self,
-        jsp_name: str,
-    ) -> list[dict]:
+        jsp_names: list[str],
+    ) -> dict[str, list[dict]]:
         """
-        Fetch form field details with labels and validation rules from a JSP.
+        Fetch form field details with labels and validation rules for several JSPs.
+
+        All JSPs are resolved in a single UNWIND query.
 
         Args:
-            jsp_name: Name of the JSP page
+            jsp_names: Names of the JSP pages
 
         Returns:
-            List of form field dictionaries
+            Dict mapping each JSP name to its form field dictionaries
         """
-        if not jsp_name:
-            return []
+        if not jsp_names:
+            return {}
 
         try:
             query = """
+                UNWIND $names AS requestedJsp
                 MATCH (jsp:JSPPage)-[:HAS_FORM]->(form:JSPForm)-[:HAS_FIELD]->(field)
-                WHERE jsp.name = $jspName
-                   OR jsp.filePath CONTAINS $jspName
+                WHERE jsp.name = requestedJsp
+                   OR jsp.filePath CONTAINS requestedJsp
 
                 RETURN
+                    requestedJsp AS key,
                     jsp.name AS jspName,
                     form.name AS formName,
                     form.modelAttribute AS modelAttribute,
@@ -2171,60 +2330,74 @@ Return ONLY the JSON array, no other text."""
                     field.validationRules AS validationRules,
                     field.errorPath AS errorPath,
                     field.cssErrorClass AS cssErrorClass
-                ORDER BY form.name, field.name
+                ORDER BY key, formName, fieldName
             """
 
-            result = await self.neo4j.query_code_structure(query, {"jspName": jsp_name})
-            fields = []
-
-            for record in result.get("nodes", []):
-                if record.get("fieldName"):
-                    fields.append({
-                        "jspName": record.get("jspName", jsp_name),
-                        "formName": record.get("formName"),
-                        "modelAttribute": record.get("modelAttribute"),
-                        "fieldName": record.get("fieldName"),
-                        "fieldType": record.get("fieldType", "text"),
-                        "label": record.get("label"),
-                        "labelKey": record.get("labelKey"),
-                        "required": record.get("required", False),
-                        "placeholder": record.get("placeholder"),
-                        "validationRules": record.get("validationRules"),
-                        "errorPath": record.get("errorPath"),
-                        "cssErrorClass": record.get("cssErrorClass"),
-                    })
-
-            logger.info(f"[FETCH-FIELDS] Fetched {len(fields)} form fields for JSP {jsp_name}")
-            return fields
+            grouped = await self.neo4j.query_by_names(query, jsp_names)
+            fields_by_jsp: dict[str, list[dict]] = {}
+
+            for jsp_name, records in grouped.items():
+                fields = []
+                for record in records:
+                    if record.get("fieldName"):
+                        fields.append({
+                            "jspName": record.get("jspName", jsp_name),
+                            "formName": record.get("formName"),
+                            "modelAttribute": record.get("modelAttribute"),
+                            "fieldName": record.get("fieldName"),
+                            "fieldType": record.get("fieldType", "text"),
+                            "label": record.get("label"),
+                            "labelKey": record.get("labelKey"),
+                            "required": record.get("required", False),
+                            "placeholder": record.get("placeholder"),
+                            "validationRules": record.get("validationRules"),
+                            "errorPath": record.get("errorPath"),
+                            "cssErrorClass": record.get("cssErrorClass"),
+                        })
+                fields_by_jsp[jsp_name] = fields
+
+            total = sum(len(f) for f in fields_by_jsp.values())
+            logger.info(f"[FETCH-FIELDS] Fetched {total} form fields for {len(fields_by_jsp)} JSPs")
+            return fields_by_jsp
 
         except Exception as e:
-            logger.warning(f"[FETCH-FIELDS] Failed to fetch form fields for {jsp_name}: {e}")
-            return []
+            logger.warning(f"[FETCH-FIELDS] Failed to fetch form fields for {jsp_names}: {e}")
+            return {}
 
     async def _fetch_error_messages(
         self,
-        keyword: str,
-    ) -> list[dict]:
+        keywords: list[str],
+    ) -> dict[str, list[dict]]:
         """
-        Fetch error messages from resource bundles.
+        Fetch error messages from resource bundles for several keywords.
+
+        All keywords are resolved in a single UNWIND query; each keyword keeps
+        its own 50-message limit.
 
         Args:
-            keyword: Keyword to search in message keys/text
+            keywords: Keywords to search in message keys/text
 
         Returns:
-            List of error message dictionaries
+            Dict mapping each keyword to its error message dictionaries
         """
-        if not keyword:
-            return []
+        if not keywords:
+            return {}
 
         try:
             query = """
-                MATCH (msg:ErrorMessage)
-                WHERE msg.messageKey CONTAINS $keyword
-                   OR msg.messageText CONTAINS $keyword
-                   OR msg.sourceFile CONTAINS $keyword
-
+                UNWIND $names AS keyword
+                CALL {
+                    WITH keyword
+                    MATCH (msg:ErrorMessage)
+                    WHERE msg.messageKey CONTAINS keyword
+                       OR msg.messageText CONTAINS keyword
+                       OR msg.sourceFile CONTAINS keyword
+                    RETURN msg
+                    ORDER BY msg.messageKey
+                    LIMIT 50
+                }
                 RETURN
+                    keyword AS key,
                     msg.entityId AS entityId,
                     msg.messageKey AS messageKey,
                     msg.messageText AS messageText,
@@ -2232,65 +2405,45 @@ Return ONLY the JSON array, no other text."""
                     msg.locale AS locale,
                     msg.parameters AS parameters,
                     msg.startLine AS lineNumber
-                ORDER BY msg.messageKey
-                LIMIT 50
             """
 
-            result = await self.neo4j.query_code_structure(query, {"keyword": keyword})
-            messages = []
-
-            for record in result.get("nodes", []):
-                if record.get("messageText"):
-                    messages.append({
-                        "entityId": record.get("entityId"),
-                        "messageKey": record.get("messageKey"),
-                        "messageText": record.get("messageText"),
-                        "sourceFile": record.get("sourceFile"),
-                        "locale": record.get("locale"),
-                        "parameters": record.get("parameters", []),
-                        "lineNumber": record.get("lineNumber"),
-                    })
-
-            logger.info(f"[FETCH-ERRORS] Fetched {len(messages)} error messages for keyword {keyword}")
-            return messages
+            grouped = await self.neo4j.query_by_names(query, keywords)
+            messages_by_keyword: dict[str, list[dict]] = {}
+
+            for keyword, records in grouped.items():
+                messages = []
+                for record in records:
+                    if record.get("messageText"):
+                        messages.append({
+                            "entityId": record.get("entityId"),
+                            "messageKey": record.get("messageKey"),
+                            "messageText": record.get("messageText"),
+                            "sourceFile": record.get("sourceFile"),
+                            "locale": record.get("locale"),
+                            "parameters": record.get("parameters", []),
+                            "lineNumber": record.get("lineNumber"),
+                        })
+                messages_by_keyword[keyword] = messages
+
+            total = sum(len(m) for m in messages_by_keyword.values())
+            logger.info(f"[FETCH-ERRORS] Fetched {total} error messages for {len(messages_by_keyword)} keywords")
+            return messages_by_keyword
 
         except Exception as e:
-            logger.warning(f"[FETCH-ERRORS] Failed to fetch error messages for {keyword}: {e}")
-            return []
+            logger.warning(f"[FETCH-ERRORS] Failed to fetch error messages for {keywords}: {e}")
+            return {}
 
     async def _compress_context(
         self,
         context: AggregatedContext,
     ) -> AggregatedContext:
-        """Compress context to fit token budget."""
-        logger.info("Compressing context to fit token budget...")
-
-        # Strategy 1: Summarize file contents
-        for file_ctx in context.implementation.key_files:
-            if len(file_ctx.content) > 1000:
-                file_ctx.summary = (
-                    file_ctx.content[:500] + "\n... [truncated] ...\n" + file_ctx.content[-500:]
-                )
-                file_ctx.content = file_ctx.summary
-
-        # Strategy 2: Reduce number of components based on token budget
-        max_components = self._calculate_dynamic_limit(estimated_tokens_per_item=150)
-        if len(context.architecture.components) > max_components:
-            context.architecture.components = context.architecture.components[:max_components]
-
-        # Strategy 3: Reduce number of files based on token budget
-        max_files = self._calculate_dynamic_limit(estimated_tokens_per_item=500)
-        if len(context.implementation.key_files) > max_files:
-            sorted_files = sorted(
-                context.implementation.key_files,
-                key=lambda f: f.relevance_score,
-                reverse=True,
-            )
-            context.implementation.key_files = sorted_files[:max_files]
-
-        # Strategy 4: Remove similar features if still over budget
-        if context.estimated_tokens > self.max_tokens:
-            max_similar = self._calculate_dynamic_limit(estimated_tokens_per_item=30)
-            context.similar_features = context.similar_features[:max_similar]
+        """Pack context into the token budget.
 
+        Items are kept by relevance per token, and large files are reduced to
+        their most relevant line ranges (see ``ContextPacker``).
+        """
+        logger.info(
+            f"Packing context into token budget ({context.estimated_tokens} > {self.max_tokens})..."
+        )
+        ContextPacker(self.max_tokens).pack(context)
         return context
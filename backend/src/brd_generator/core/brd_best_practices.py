@@ -66,6 +66,9 @@ You must thoroughly extract and document:
 # Default BRD Sections with Descriptions
 # =============================================================================
 
+# "depends_on" names earlier sections whose content a section builds on.
+# Sections without dependencies are generated concurrently.
+
 DEFAULT_BRD_SECTIONS = [
     {
         "name": "Feature Overview",
@@ -230,6 +233,8 @@ sequenceDiagram
     SearchScreen-->>User: Display results
 ```""",
         "required": False,
+        # Diagrams the interactions and flow described earlier
+        "depends_on": ["Actors and System Interactions", "Business Process Flow"],
     },
     {
         "name": "Assumptions and Constraints",
@@ -268,6 +273,8 @@ Example:
 - When a user enters "NAT" in the name search, the system must return all entities whose names start with "NAT" (case-insensitive).
 - When results exceed the maximum limit, the system must display a warning message.""",
         "required": True,
+        # Criteria are derived from the requirements and rules
+        "depends_on": ["Functional Requirements", "Business Validations and Rules"],
     },
 ]
 
@@ -13,8 +13,9 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import re
-from typing import Any, Optional
+from typing import Optional
 
 from ..models.epic import (
     AnalyzeBRDRequest,
@@ -26,9 +27,14 @@ from ..models.epic import (
     SuggestedBacklogBreakdown,
     SuggestedEpicBreakdown,
 )
+from .llm_gateway import llm_gateway
+from .session_pool import CopilotSessionPool, SessionFactory
 
 logger = logging.getLogger(__name__)
 
+# Maximum EPICs analyzed at once
+DEFAULT_EPIC_ANALYSIS_CONCURRENCY = int(os.getenv("EPIC_ANALYSIS_CONCURRENCY", "4"))
+
 
 # =============================================================================
 # Analysis Prompts
@@ -461,17 +467,9 @@ The user wants to modify these suggestions. Keep what works, adjust what doesn't
 
             # Combine system and user prompt
             full_prompt = f"{BRD_ANALYSIS_SYSTEM_PROMPT}\n\n{prompt}"
-            message_options = {"prompt": full_prompt}
-
-            if hasattr(self.copilot_session, 'send_and_wait'):
-                event = await asyncio.wait_for(
-                    self.copilot_session.send_and_wait(message_options, timeout=120),
-                    timeout=120
-                )
-                response = self._extract_response_text(event)
-            else:
-                logger.warning("Copilot session does not support send_and_wait")
-                return None
+            response = await llm_gateway.send(
+                self.copilot_session, full_prompt, caller="brd_analyzer", timeout=120
+            )
 
             if not response:
                 logger.warning("Empty response from LLM")
@@ -495,32 +493,6 @@ The user wants to modify these suggestions. Keep what works, adjust what doesn't
             logger.error(f"LLM analysis error: {e}")
             return None
 
-    def _extract_response_text(self, event: Any) -> Optional[str]:
-        """Extract text content from a Copilot event."""
-        try:
-            if event is None:
-                return None
-            if hasattr(event, 'data'):
-                data = event.data
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    return data.message.content
-                if hasattr(data, 'content'):
-                    return data.content
-                if hasattr(data, 'text'):
-                    return data.text
-            if hasattr(event, 'content'):
-                return event.content
-            if hasattr(event, 'text'):
-                return event.text
-            if isinstance(event, str):
-                return event
-            if isinstance(event, dict):
-                return event.get('content') or event.get('text') or event.get('message', {}).get('content')
-            return str(event)
-        except Exception as e:
-            logger.warning(f"Failed to extract response text: {e}")
-            return None
-
     def _merge_analysis_results(
         self,
         request: AnalyzeBRDRequest,
@@ -643,9 +615,27 @@ The user wants to modify these suggestions. Keep what works, adjust what doesn't
 class EpicAnalyzer:
     """Analyzes EPICs to determine optimal backlog item decomposition."""
 
-    def __init__(self, copilot_session):
-        """Initialize with copilot session for LLM calls."""
+    def __init__(
+        self,
+        copilot_session,
+        session_factory: Optional[SessionFactory] = None,
+        max_concurrency: int = DEFAULT_EPIC_ANALYSIS_CONCURRENCY,
+    ):
+        """Initialize with copilot session for LLM calls.
+
+        Args:
+            copilot_session: Copilot SDK session
+            session_factory: Async callable creating extra Copilot sessions, so
+                EPICs can be analyzed concurrently
+            max_concurrency: Maximum EPICs analyzed at once
+        """
         self.copilot_session = copilot_session
+        self.max_concurrency = max(1, max_concurrency)
+        self._session_pool = CopilotSessionPool(
+            copilot_session,
+            session_factory=session_factory,
+            max_size=self.max_concurrency,
+        )
 
     async def analyze_epics(
         self,
@@ -657,7 +647,6 @@ class EpicAnalyzer:
         """
         logger.info(f"Analyzing {len(request.epics)} EPICs for backlog decomposition")
 
-        epic_analyses = []
         total_items = 0
         total_points = 0
         total_stories = 0
@@ -667,22 +656,31 @@ class EpicAnalyzer:
         # Get previous items per EPIC (for re-analysis)
         previous_items = request.previous_items or {}
 
-        for epic in request.epics:
-            # Get previous items for this EPIC if available
-            epic_previous_items = previous_items.get(epic.id, [])
+        # EPICs are analyzed concurrently; results keep the request order
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        completed = 0
+
+        async def analyze(epic: Epic) -> EpicAnalysisResult:
+            nonlocal completed
+            async with semaphore:
+                analysis = await self._analyze_single_epic(
+                    epic=epic,
+                    brd_markdown=request.brd_markdown,
+                    granularity=request.granularity_preference,
+                    include_tasks=request.include_technical_tasks,
+                    include_spikes=request.include_spikes,
+                    analysis_focus=request.analysis_focus,
+                    user_feedback=request.user_feedback,
+                    # Previous items for this EPIC, if re-analyzing
+                    previous_items=previous_items.get(epic.id, []),
+                )
+            completed += 1
+            logger.info(f"Analyzed EPIC {epic.id} ({completed}/{len(request.epics)})")
+            return analysis
 
-            analysis = await self._analyze_single_epic(
-                epic=epic,
-                brd_markdown=request.brd_markdown,
-                granularity=request.granularity_preference,
-                include_tasks=request.include_technical_tasks,
-                include_spikes=request.include_spikes,
-                analysis_focus=request.analysis_focus,
-                user_feedback=request.user_feedback,
-                previous_items=epic_previous_items,
-            )
-            epic_analyses.append(analysis)
+        epic_analyses = await asyncio.gather(*(analyze(epic) for epic in request.epics))
 
+        for analysis in epic_analyses:
             total_items += analysis.recommended_item_count
             total_points += analysis.estimated_total_points
             total_stories += analysis.suggested_user_stories
@@ -812,17 +810,13 @@ The user wants to modify these suggestions. Keep what works, adjust what doesn't
 
             # Combine system and user prompt
             full_prompt = f"{EPIC_ANALYSIS_SYSTEM_PROMPT}\n\n{prompt}"
-            message_options = {"prompt": full_prompt}
-
-            if hasattr(self.copilot_session, 'send_and_wait'):
-                event = await asyncio.wait_for(
-                    self.copilot_session.send_and_wait(message_options, timeout=120),
-                    timeout=120
+            # Concurrent EPIC analyses each borrow their own session
+            async with self._session_pool.acquire() as llm_session:
+                if llm_session is None:
+                    return None
+                response = await llm_gateway.send(
+                    llm_session, full_prompt, caller="epic_analyzer", timeout=120
                 )
-                response = self._extract_response_text(event)
-            else:
-                logger.warning("Copilot session does not support send_and_wait")
-                return None
 
             if not response:
                 logger.warning("Empty response from LLM for EPIC analysis")
@@ -841,32 +835,6 @@ The user wants to modify these suggestions. Keep what works, adjust what doesn't
             logger.warning(f"Failed to parse EPIC analysis: {e}")
             return None
 
-    def _extract_response_text(self, event: Any) -> Optional[str]:
-        """Extract text content from a Copilot event."""
-        try:
-            if event is None:
-                return None
-            if hasattr(event, 'data'):
-                data = event.data
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    return data.message.content
-                if hasattr(data, 'content'):
-                    return data.content
-                if hasattr(data, 'text'):
-                    return data.text
-            if hasattr(event, 'content'):
-                return event.content
-            if hasattr(event, 'text'):
-                return event.text
-            if isinstance(event, str):
-                return event
-            if isinstance(event, dict):
-                return event.get('content') or event.get('text') or event.get('message', {}).get('content')
-            return str(event)
-        except Exception as e:
-            logger.warning(f"Failed to extract response text: {e}")
-            return None
-
     def _extract_brd_context(self, brd_markdown: str, section_refs: list[str]) -> str:
         """Extract relevant BRD sections for context."""
         if not section_refs:
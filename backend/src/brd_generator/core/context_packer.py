@@ -0,0 +1,319 @@
+"""Token-aware packing of aggregated context into a model's budget.
+
+Every packable item of an ``AggregatedContext`` (components, key files,
+code snippets, feature flows, rules, similar features) is scored by its
+relevance to the feature request and priced by its estimated token cost.
+Items are then selected greedily by value per token, knapsack style, until
+the budget is filled. Files larger than their share of the budget are cut
+down to their most relevant line ranges instead of their head and tail.
+
+The budget comes from the model's context window in ``config/models.py``,
+minus a share reserved for the prompt template and the response.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from ..config.models import get_model_by_id
+from ..models.context import AggregatedContext, FileContext
+from ..utils.logger import get_logger
+from ..utils.token_counter import estimate_tokens, estimate_tokens_batch, truncate_to_token_limit
+
+logger = get_logger(__name__)
+
+# Share of the model's context window available to aggregated context
+DEFAULT_CONTEXT_BUDGET_FRACTION = float(os.getenv("CONTEXT_BUDGET_FRACTION", "0.6"))
+# Budget used when the model (or its context window) is unknown
+DEFAULT_CONTEXT_MAX_TOKENS = int(os.getenv("CONTEXT_MAX_TOKENS", "100000"))
+# Largest share of the item budget a single file may take
+DEFAULT_MAX_FILE_SHARE = float(os.getenv("CONTEXT_MAX_FILE_SHARE", "0.15"))
+# Lines per window when selecting relevant ranges of a file
+DEFAULT_FILE_WINDOW_LINES = int(os.getenv("CONTEXT_FILE_WINDOW_LINES", "20"))
+
+# Relative importance of each kind of item for BRD generation
+KIND_WEIGHTS: dict[str, float] = {
+    "component": 1.0,
+    "file": 1.0,
+    "snippet": 0.9,
+    "method": 0.8,
+    "flow": 1.0,
+    "business_rule": 0.9,
+    "security_rule": 0.8,
+    "validation_chain": 0.8,
+    "error_message": 0.5,
+    "similar_feature": 0.3,
+}
+
+# Packable lists: kind -> (getter, setter) on AggregatedContext
+_PACKABLE: dict[str, tuple[Callable[[AggregatedContext], Optional[list]], Callable[[AggregatedContext, list], None]]] = {
+    "component": (
+        lambda c: c.architecture.components,
+        lambda c, v: setattr(c.architecture, "components", v),
+    ),
+    "file": (
+        lambda c: c.implementation.key_files,
+        lambda c, v: setattr(c.implementation, "key_files", v),
+    ),
+    "snippet": (lambda c: c.code_snippets, lambda c, v: setattr(c, "code_snippets", v)),
+    "method": (lambda c: c.enhanced_methods, lambda c, v: setattr(c, "enhanced_methods", v)),
+    "flow": (lambda c: c.feature_flows, lambda c, v: setattr(c, "feature_flows", v)),
+    "business_rule": (
+        lambda c: c.enriched_business_rules,
+        lambda c, v: setattr(c, "enriched_business_rules", v),
+    ),
+    "security_rule": (lambda c: c.security_rules, lambda c, v: setattr(c, "security_rules", v)),
+    "validation_chain": (
+        lambda c: c.validation_chains,
+        lambda c, v: setattr(c, "validation_chains", v),
+    ),
+    "error_message": (lambda c: c.error_messages, lambda c, v: setattr(c, "error_messages", v)),
+    "similar_feature": (lambda c: c.similar_features, lambda c, v: setattr(c, "similar_features", v)),
+}
+
+_STOPWORDS = {
+    "the", "and", "for", "with", "that", "this", "from", "into", "when", "then",
+    "should", "must", "will", "can", "are", "was", "has", "have", "add", "new",
+    "user", "users", "feature", "allow", "allows", "able", "all", "any", "its",
+}
+
+
+def context_budget_for_model(
+    model: Optional[str],
+    fraction: float = DEFAULT_CONTEXT_BUDGET_FRACTION,
+    default: int = DEFAULT_CONTEXT_MAX_TOKENS,
+) -> int:
+    """Token budget for aggregated context sent to a model.
+
+    Args:
+        model: Model ID as listed in ``config/models.py``
+        fraction: Share of the context window given to the context
+        default: Budget when the model or its context window is unknown
+
+    Returns:
+        Token budget
+    """
+    info = get_model_by_id(model) if model else None
+    if info is None or not info.context_window:
+        return default
+    return int(info.context_window * fraction)
+
+
+def extract_terms(text: str) -> set[str]:
+    """Lower-cased search terms of a text, splitting camelCase and snake_case."""
+    words = re.findall(r"[A-Za-z][a-z]+|[A-Z]+(?![a-z])|\d+", text or "")
+    return {w.lower() for w in words if len(w) >= 3 and w.lower() not in _STOPWORDS}
+
+
+def _item_text(item: Any) -> str:
+    """Serialized form of an item, as it appears in the context JSON."""
+    if hasattr(item, "model_dump_json"):
+        return item.model_dump_json()
+    if isinstance(item, (dict, list)):
+        return json.dumps(item, default=str)
+    return str(item)
+
+
+@dataclass
+class PackItem:
+    """A context item priced for packing."""
+
+    kind: str
+    index: int
+    item: Any
+    tokens: int
+    value: float
+
+    @property
+    def density(self) -> float:
+        return self.value / max(1, self.tokens)
+
+
+@dataclass
+class PackResult:
+    """Outcome of a packing pass."""
+
+    budget: int
+    fixed_tokens: int
+    packed_tokens: int
+    kept: dict[str, int]
+    dropped: dict[str, int]
+    trimmed_files: int
+
+
+class ContextPacker:
+    """Selects the context items with the most relevance per token."""
+
+    def __init__(
+        self,
+        max_tokens: int,
+        max_file_share: float = DEFAULT_MAX_FILE_SHARE,
+        window_lines: int = DEFAULT_FILE_WINDOW_LINES,
+    ):
+        """Initialize the packer.
+
+        Args:
+            max_tokens: Token budget for the whole context
+            max_file_share: Largest share of the item budget a single file may take
+            window_lines: Lines per window when selecting relevant file ranges
+        """
+        self.max_tokens = max_tokens
+        self.max_file_share = max_file_share
+        self.window_lines = max(1, window_lines)
+
+    def pack(self, context: AggregatedContext) -> PackResult:
+        """Reduce a context in place to the items that best fit the budget.
+
+        Selected items keep their original order within each list.
+        """
+        terms = extract_terms(context.request)
+
+        # Everything that is not packable (request, data models, pre-generated
+        # sections, ...) is always sent and comes off the budget first
+        original = {kind: list(getter(context) or []) for kind, (getter, _) in _PACKABLE.items()}
+        for kind, (_, setter) in _PACKABLE.items():
+            setter(context, None if kind == "flow" and not original[kind] else [])
+        fixed_tokens = context.estimated_tokens
+        item_budget = max(0, self.max_tokens - fixed_tokens)
+
+        # Component names make files and snippets that mention them relevant
+        component_terms = set()
+        for component in original["component"]:
+            component_terms |= extract_terms(component.name)
+
+        trimmed_files = 0
+        file_cap = max(1, int(item_budget * self.max_file_share))
+        entries: list[tuple[str, int, Any, float]] = []
+        for kind, items in original.items():
+            for index, item in enumerate(items):
+                if kind == "file":
+                    trimmed = self.trim_file(item, terms | component_terms, file_cap)
+                    if trimmed is not item:
+                        trimmed_files += 1
+                        item = trimmed
+                value = self._score(kind, item, index, len(items), terms, component_terms)
+                entries.append((kind, index, item, value))
+
+        token_counts = estimate_tokens_batch(_item_text(entry[2]) for entry in entries)
+        candidates = [
+            PackItem(kind, index, item, tokens + 1, value)
+            for (kind, index, item, value), tokens in zip(entries, token_counts)
+        ]
+
+        # Greedy knapsack: best value per token first, skip what no longer fits
+        selected: list[PackItem] = []
+        remaining = item_budget
+        for candidate in sorted(candidates, key=lambda c: c.density, reverse=True):
+            if candidate.tokens <= remaining:
+                selected.append(candidate)
+                remaining -= candidate.tokens
+
+        kept: dict[str, int] = {}
+        dropped: dict[str, int] = {}
+        for kind, (_, setter) in _PACKABLE.items():
+            chosen = sorted((c for c in selected if c.kind == kind), key=lambda c: c.index)
+            if original[kind]:
+                setter(context, [c.item for c in chosen])
+                kept[kind] = len(chosen)
+                dropped[kind] = len(original[kind]) - len(chosen)
+
+        result = PackResult(
+            budget=self.max_tokens,
+            fixed_tokens=fixed_tokens,
+            packed_tokens=item_budget - remaining,
+            kept=kept,
+            dropped={k: v for k, v in dropped.items() if v},
+            trimmed_files=trimmed_files,
+        )
+        logger.info(
+            f"[PACKER] Packed {result.packed_tokens}/{item_budget} item tokens "
+            f"(+{fixed_tokens} fixed), trimmed {trimmed_files} files, dropped {result.dropped}"
+        )
+        return result
+
+    def _score(
+        self,
+        kind: str,
+        item: Any,
+        index: int,
+        count: int,
+        terms: set[str],
+        component_terms: set[str],
+    ) -> float:
+        """Relevance of an item to the request, weighted by its kind."""
+        item_terms = extract_terms(_item_text(item))
+        request_match = len(terms & item_terms) / len(terms) if terms else 0.0
+        component_match = (
+            len(component_terms & item_terms) / len(component_terms)
+            if component_terms and kind != "component" else 0.0
+        )
+
+        # Upstream ranking: explicit scores where present, list position otherwise
+        if isinstance(item, FileContext) and item.relevance_score:
+            prior = min(1.0, item.relevance_score)
+        else:
+            prior = 1.0 - index / max(1, count)
+
+        return KIND_WEIGHTS.get(kind, 0.5) * (0.2 + request_match + 0.5 * component_match + 0.5 * prior)
+
+    def trim_file(self, file_ctx: FileContext, terms: set[str], max_tokens: int) -> FileContext:
+        """Keep the line ranges of a file most relevant to the terms.
+
+        The file is split into windows of lines, which are ranked by term
+        hits (the first window, holding imports and declarations, gets a
+        bonus) and kept until ``max_tokens`` is reached. Omitted ranges are
+        marked in the returned content.
+
+        Returns:
+            The file unchanged if it fits, otherwise a trimmed copy
+        """
+        if estimate_tokens(file_ctx.content) <= max_tokens:
+            return file_ctx
+
+        lines = file_ctx.content.splitlines()
+        windows = [
+            (start, lines[start:start + self.window_lines])
+            for start in range(0, len(lines), self.window_lines)
+        ]
+        window_tokens = dict(zip(
+            (start for start, _ in windows),
+            estimate_tokens_batch("\n".join(window_lines) for _, window_lines in windows),
+        ))
+
+        def window_score(window: tuple[int, list[str]]) -> float:
+            start, window_lines = window
+            hits = sum(len(terms & extract_terms(line)) for line in window_lines)
+            return hits + (1.5 if start == 0 else 0.0)
+
+        kept: list[tuple[int, list[str]]] = []
+        used = 0
+        for window in sorted(windows, key=window_score, reverse=True):
+            tokens = window_tokens[window[0]] + 1
+            if used + tokens > max_tokens:
+                continue
+            kept.append(window)
+            used += tokens
+
+        if not kept:
+            # Not even one window fits: keep the start of the file
+            content = truncate_to_token_limit(file_ctx.content, max_tokens)
+        else:
+            parts = []
+            next_line = 0
+            for start, window_lines in sorted(kept):
+                if start > next_line:
+                    parts.append(f"... [lines {next_line + 1}-{start} omitted] ...")
+                parts.extend(window_lines)
+                next_line = start + len(window_lines)
+            if next_line < len(lines):
+                parts.append(f"... [lines {next_line + 1}-{len(lines)} omitted] ...")
+            content = "\n".join(parts)
+
+        return file_ctx.model_copy(update={
+            "content": content,
+            "summary": f"Relevant excerpts ({len(kept)} of {len(windows)} sections)",
+        })
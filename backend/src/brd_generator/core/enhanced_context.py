@@ -20,7 +20,9 @@ Usage:
 
 from __future__ import annotations
 
+import re
 from typing import Any, Optional
+from ..queries.registry import PreparedQuery, get_query
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -253,46 +255,15 @@ class EnhancedContextRetriever:
         # Build a fuzzy search pattern
         # "Point Maintenance" -> matches "Point Maintenance", "Point Info Maintenance", etc.
         search_words = search_term.split()
-        fuzzy_pattern = '.*'.join(search_words)
-
-        menu_query = f"""
-            // Find menu items matching the search term
-            MATCH (m:MenuItem)
-            WHERE toLower(m.label) CONTAINS '{search_term}'
-               OR toLower(m.label) =~ '.*{fuzzy_pattern}.*'
-               OR toLower(m.name) CONTAINS '{search_term}'
-
-            // Follow menu -> screen -> action chain
-            OPTIONAL MATCH (m)-[:MENU_OPENS_SCREEN]->(s:Screen)
-            OPTIONAL MATCH (s)-[:SCREEN_CALLS_ACTION]->(a:JavaClass)
-            OPTIONAL MATCH (s)-[:SCREEN_RENDERS_JSP]->(j:JSPPage)
-            OPTIONAL MATCH (m)-[:MENU_OPENS_FLOW]->(f:WebFlowDefinition)
-
-            // Get all screens in the same flow for sub-features
-            OPTIONAL MATCH (f)-[:FLOW_DEFINES_STATE]->(fs:FlowState)
-            WHERE fs.stateType = 'view-state'
-
-            RETURN m.label AS menuLabel,
-                   m.url AS menuUrl,
-                   m.parentMenu AS parentMenu,
-                   m.flowId AS flowId,
-                   m.viewStateId AS viewStateId,
-                   s.screenId AS screenId,
-                   s.title AS screenTitle,
-                   s.actionClass AS actionClass,
-                   s.actionMethods AS actionMethods,
-                   collect(DISTINCT a.name) AS actionClasses,
-                   collect(DISTINCT j.name) AS jspPages,
-                   f.name AS flowName,
-                   collect(DISTINCT fs.stateId) AS flowStates
-            ORDER BY
-                CASE WHEN toLower(m.label) = '{search_term}' THEN 0 ELSE 1 END,
-                m.menuLevel
-            LIMIT {max_entry_points}
-        """
+        label_pattern = ".*" + ".*".join(re.escape(word) for word in search_words) + ".*"
+        menu_query = get_query("ENTRY_POINT_MENU_ITEMS")
 
         try:
-            result = await self.neo4j.query_code_structure(menu_query)
+            result = await self.neo4j.query_code_structure(*menu_query.bind(
+                searchTerm=search_term,
+                labelPattern=label_pattern,
+                limit=max_entry_points,
+            ))
             menu_items = result.get("nodes", [])
 
             if not menu_items:
@@ -640,40 +611,20 @@ class EnhancedContextRetriever:
         # =================================================================
 
         if compound_term:
-            compound_filter = f"toLower(n.name) CONTAINS '{compound_term}'"
-            if action_words:
-                score_boost = " + ".join([f"CASE WHEN toLower(n.name) CONTAINS '{aw}' THEN 10 ELSE 0 END" for aw in action_words])
-            else:
-                score_boost = "0"
+            terms = [compound_term]
+            action_words = [aw.lower() for aw in action_words or []]
         else:
             # Fallback to OR logic if no compound term
-            compound_filter = " OR ".join([f"toLower(n.name) CONTAINS '{kw.lower()}'" for kw in keywords])
-            score_boost = "0"
-
-        controller_query = f"""
-            MATCH (n)
-            WHERE (n:SpringService OR n:JavaClass OR n:SpringController)
-              AND ({compound_filter})
-              AND (
-                toLower(n.name) ENDS WITH 'action'
-                OR toLower(n.name) ENDS WITH 'controller'
-              )
-              AND NOT toLower(n.name) CONTAINS 'test'
-            WITH n,
-                 ({score_boost}) AS action_score,
-                 COALESCE(n.pageRank, 0.1) AS pagerank
-            RETURN n.name AS name,
-                   labels(n)[0] AS type,
-                   n.filePath AS path,
-                   'controller' AS layer,
-                   80 AS layer_score,
-                   action_score + pagerank * 10 AS relevance_score
-            ORDER BY relevance_score DESC
-            LIMIT 500
-        """
+            terms = [kw.lower() for kw in keywords]
+            action_words = []
 
         try:
-            result = await self.neo4j.query_code_structure(controller_query)
+            result = await self.neo4j.query_name_matches(
+                "ENTRY_POINT_CONTROLLERS",
+                terms,
+                labels=["SpringService", "JavaClass", "SpringController"],
+                actionWords=action_words,
+            )
             controllers = result.get("nodes", [])
             logger.info(f"{LOG_PREFIX} [ENTRY-POINTS] Found {len(controllers)} controllers with compound term '{compound_term}'")
 
@@ -693,26 +644,17 @@ class EnhancedContextRetriever:
 
         if controllers:
             controller_names = [c.get("name") for c in controllers[:5] if c.get("name")]
-            webflow_patterns = []
-            for cn in controller_names:
-                base = cn.replace("Action", "").replace("Controller", "")
-                webflow_patterns.append(f"toLower(w.name) CONTAINS toLower('{base}')")
-
-            webflow_filter = " OR ".join(webflow_patterns) if webflow_patterns else "false"
-
-            webflow_query = f"""
-                MATCH (w:WebFlowDefinition)
-                WHERE {webflow_filter}
-                RETURN w.name AS name,
-                       'WebFlowDefinition' AS type,
-                       w.filePath AS path,
-                       'flow' AS layer,
-                       90 AS layer_score
-                LIMIT 500
-            """
+            base_names = [
+                cn.replace("Action", "").replace("Controller", "").lower()
+                for cn in controller_names
+            ]
 
             try:
-                result = await self.neo4j.query_code_structure(webflow_query)
+                result = await self.neo4j.query_name_matches(
+                    "ENTRY_POINT_WEBFLOWS",
+                    base_names,
+                    labels=["WebFlowDefinition"],
+                )
                 webflows = result.get("nodes", [])
                 logger.info(f"{LOG_PREFIX} [ENTRY-POINTS] Found {len(webflows)} WebFlows connected to controllers")
 
@@ -730,50 +672,17 @@ class EnhancedContextRetriever:
         # =================================================================
 
         if controllers and compound_term:
-            controller_names = [c.get("name") for c in controllers[:5] if c.get("name")]
-
-            jsp_patterns = []
-            for cn in controller_names:
-                base = cn.replace("Action", "").replace("Controller", "")
-                jsp_patterns.append(f"toLower(j.name) STARTS WITH toLower('{base}')")
-
-            # Also require compound term to be in JSP name
-            jsp_patterns.append(f"toLower(j.name) CONTAINS '{compound_term}'")
-
-            jsp_filter = " OR ".join(list(set(jsp_patterns))) if jsp_patterns else "false"
-
-            if action_words:
-                action_bonus = " OR ".join([f"toLower(j.name) CONTAINS '{aw}'" for aw in action_words])
-                jsp_query = f"""
-                    MATCH (j:JSPPage)
-                    WHERE ({jsp_filter})
-                    WITH j,
-                         CASE WHEN toLower(j.name) CONTAINS '{compound_term}' THEN 20 ELSE 0 END +
-                         CASE WHEN {action_bonus} THEN 10 ELSE 0 END AS relevance
-                    WHERE relevance >= 20
-                    RETURN j.name AS name,
-                           'JSPPage' AS type,
-                           j.filePath AS path,
-                           'ui' AS layer,
-                           100 AS layer_score,
-                           relevance
-                    ORDER BY relevance DESC
-                    LIMIT 500
-                """
-            else:
-                jsp_query = f"""
-                    MATCH (j:JSPPage)
-                    WHERE {jsp_filter}
-                    RETURN j.name AS name,
-                           'JSPPage' AS type,
-                           j.filePath AS path,
-                           'ui' AS layer,
-                           100 AS layer_score
-                    LIMIT 500
-                """
-
+            # JSPs starting with a controller base name or containing the
+            # compound term; with action words the compound term is required
             try:
-                result = await self.neo4j.query_code_structure(jsp_query)
+                result = await self.neo4j.query_name_matches(
+                    "ENTRY_POINT_JSPS",
+                    [*base_names, compound_term],
+                    labels=["JSPPage"],
+                    baseNames=base_names,
+                    compoundTerm=compound_term,
+                    actionWords=action_words,
+                )
                 jsps = result.get("nodes", [])
                 logger.info(f"{LOG_PREFIX} [ENTRY-POINTS] Found {len(jsps)} JSPs connected to controllers")
 
@@ -818,19 +727,15 @@ class EnhancedContextRetriever:
 
         logger.info(f"{LOG_PREFIX} [TRAVERSE] Starting traversal from {len(entry_points)} entry points")
 
-        # Build entry point filter
-        safe_entry_points = [ep.replace("'", "\\'") for ep in entry_points[:5]]
-        entry_filter = " OR ".join([f"start.name = '{name}'" for name in safe_entry_points])
-
         all_nodes = []
         seen_names = set()
 
         # Define queries to run
-        queries = self._build_traversal_queries(entry_filter, safe_entry_points, keywords)
+        queries = self._build_traversal_queries(entry_points[:5], keywords)
 
-        for query, label in queries:
+        for query, params, label in queries:
             try:
-                result = await self.neo4j.query_code_structure(query)
+                result = await self.neo4j.query_code_structure(*query.bind(**params))
                 nodes = result.get("nodes", [])
                 logger.info(f"{LOG_PREFIX} [TRAVERSE-{label}] Found {len(nodes)} nodes")
 
@@ -847,201 +752,43 @@ class EnhancedContextRetriever:
 
     def _build_traversal_queries(
         self,
-        entry_filter: str,
         entry_points: list[str],
         keywords: list[str],
-    ) -> list[tuple[str, str]]:
-        """Build the list of traversal queries to execute."""
-
-        queries = []
-
-        # Query 1: Direct relationships (depth 1)
-        query_depth1 = f"""
-            MATCH (start)-[r]->(related)
-            WHERE ({entry_filter})
-              AND type(r) IN [
-                'HAS_METHOD', 'HAS_FIELD', 'CALLS', 'USES', 'DEPENDS_ON',
-                'EXTENDS', 'IMPLEMENTS', 'JAVA_IMPORTS',
-                'FLOW_TRANSITIONS_TO', 'FLOW_EXECUTES_ACTION', 'FLOW_RENDERS_VIEW',
-                'CONTAINS_FORM', 'INCLUDES_JSP', 'USES_TAGLIB',
-                'BELONGS_TO', 'DEFINED_IN_MODULE', 'INSTANTIATES'
-              ]
-            RETURN DISTINCT related.name AS name,
-                   labels(related)[0] AS type,
-                   related.filePath AS path,
-                   related.description AS description,
-                   1 AS distance,
-                   type(r) AS relationship
-            LIMIT 500
-        """
-        queries.append((query_depth1, "depth1"))
+    ) -> list[tuple[PreparedQuery, dict[str, Any], str]]:
+        """Build the list of (prepared query, parameters, label) traversal steps to execute."""
+        entry = {"entryNames": list(entry_points)}
+        queries = [
+            (get_query("TRAVERSE_DIRECT"), entry, "depth1"),
+            (get_query("TRAVERSE_TWO_HOP"), entry, "depth2"),
+            (get_query("TRAVERSE_INJECTED_SERVICES"), entry, "injected"),
+        ]
 
-        # Query 2: Two-hop relationships (depth 2)
-        query_depth2 = f"""
-            MATCH (start)-[r1]->(mid)-[r2]->(related)
-            WHERE ({entry_filter})
-              AND type(r1) IN ['HAS_METHOD', 'HAS_FIELD', 'CALLS', 'USES', 'DEPENDS_ON', 'EXTENDS', 'IMPLEMENTS', 'JAVA_IMPORTS']
-              AND type(r2) IN ['HAS_METHOD', 'HAS_FIELD', 'CALLS', 'USES', 'DEPENDS_ON', 'EXTENDS', 'IMPLEMENTS', 'JAVA_IMPORTS', 'INSTANTIATES']
-            RETURN DISTINCT related.name AS name,
-                   labels(related)[0] AS type,
-                   related.filePath AS path,
-                   related.description AS description,
-                   2 AS distance,
-                   type(r2) AS relationship
-            LIMIT 500
-        """
-        queries.append((query_depth2, "depth2"))
+        # Related services and validators by naming pattern
+        base_names = {
+            "baseNames": [
+                ep.replace("Action", "").replace("Controller", "").lower()
+                for ep in entry_points[:3]
+            ]
+        }
+        if base_names["baseNames"]:
+            queries.append((get_query("TRAVERSE_RELATED_BY_NAME"), base_names, "related"))
 
-        # Query 3: Injected services (field name -> service name pattern)
-        query_injected = f"""
-            MATCH (start)-[:HAS_FIELD]->(field:JavaField)
-            WHERE ({entry_filter})
-            WITH field, toLower(field.name) AS field_name
-            MATCH (service)
-            WHERE (service:SpringService OR service:JavaClass OR service:JavaInterface)
-              AND toLower(service.name) = field_name
-            RETURN DISTINCT service.name AS name,
-                   labels(service)[0] AS type,
-                   service.filePath AS path,
-                   'Injected service' AS description,
-                   1 AS distance,
-                   'INJECTED_SERVICE' AS relationship
-            LIMIT 150
-        """
-        queries.append((query_injected, "injected"))
-
-        # Query 4: Related services by naming pattern
-        entry_base_names = [ep.replace("Action", "").replace("Controller", "").lower() for ep in entry_points[:3]]
-        if entry_base_names:
-            base_name_filter = " OR ".join([f"toLower(s.name) CONTAINS '{base}'" for base in entry_base_names])
-            query_related = f"""
-                MATCH (s)
-                WHERE (s:SpringService OR s:JavaInterface)
-                  AND ({base_name_filter})
-                  AND NOT toLower(s.name) ENDS WITH 'action'
-                  AND NOT toLower(s.name) ENDS WITH 'test'
-                WITH DISTINCT s, COALESCE(s.pageRank, 0.0) AS rank
-                ORDER BY rank DESC
-                RETURN s.name AS name,
-                       labels(s)[0] AS type,
-                       s.filePath AS path,
-                       s.description AS description,
-                       2 AS distance,
-                       'RELATED_BY_NAME' AS relationship
-                LIMIT 500
-            """
-            queries.append((query_related, "related"))
-
-        # Query 5: DAOs/Repositories
+        # DAOs/Repositories
         if keywords:
-            keyword_filter = " OR ".join([f"toLower(d.name) CONTAINS '{kw.lower()}'" for kw in keywords[:3]])
-            query_daos = f"""
-                MATCH (d)
-                WHERE (d:SpringService OR d:JavaClass)
-                  AND ({keyword_filter})
-                  AND (toLower(d.name) CONTAINS 'dao' OR toLower(d.name) CONTAINS 'repository' OR toLower(d.name) CONTAINS 'mapper')
-                  AND NOT toLower(d.name) ENDS WITH 'test'
-                WITH DISTINCT d, COALESCE(d.pageRank, 0.0) AS rank
-                ORDER BY rank DESC
-                RETURN d.name AS name,
-                       labels(d)[0] AS type,
-                       d.filePath AS path,
-                       'Data access layer' AS description,
-                       3 AS distance,
-                       'DATA_LAYER' AS relationship
-                LIMIT 500
-            """
-            queries.append((query_daos, "daos"))
+            queries.append((
+                get_query("TRAVERSE_DATA_LAYER"),
+                {"keywords": [kw.lower() for kw in keywords[:3]]},
+                "daos",
+            ))
 
         # =================================================================
         # Phase 2: Deep Traversal Queries (4-6 hops)
         # =================================================================
-
-        # Query 6: Deep chain traversal (up to 4 hops)
-        query_deep_chain = f"""
-            MATCH path = (start)-[*1..4]->(target)
-            WHERE ({entry_filter})
-              AND (target:JavaClass OR target:JavaInterface OR target:SpringService)
-              AND NOT toLower(target.name) CONTAINS 'test'
-              AND NOT target.name = start.name
-            WITH DISTINCT target, length(path) AS distance
-            ORDER BY distance
-            RETURN target.name AS name,
-                   labels(target)[0] AS type,
-                   target.filePath AS path,
-                   'Deep chain component' AS description,
-                   distance,
-                   'DEEP_CHAIN' AS relationship
-            LIMIT 200
-        """
-        queries.append((query_deep_chain, "deep_chain"))
-
-        # Query 7: Validators connected to entry points
-        if entry_points:
-            entry_base_names = [ep.replace("Action", "").replace("Controller", "").lower() for ep in entry_points[:3]]
-            if entry_base_names:
-                validator_filter = " OR ".join([f"toLower(v.name) CONTAINS '{base}'" for base in entry_base_names])
-                query_validators = f"""
-                    MATCH (v)
-                    WHERE (v:JavaClass OR v:SpringService)
-                      AND (toLower(v.name) CONTAINS 'validator' OR toLower(v.name) CONTAINS 'validation')
-                      AND ({validator_filter})
-                      AND NOT toLower(v.name) CONTAINS 'test'
-                    RETURN DISTINCT v.name AS name,
-                           labels(v)[0] AS type,
-                           v.filePath AS path,
-                           'Validation component' AS description,
-                           2 AS distance,
-                           'VALIDATOR' AS relationship
-                    LIMIT 500
-                """
-                queries.append((query_validators, "validators"))
-
-        # Query 8: Utility/Helper classes used by entry points
-        query_utilities = f"""
-            MATCH (start)-[*1..3]->(util)
-            WHERE ({entry_filter})
-              AND (util:JavaClass OR util:SpringService)
-              AND (
-                toLower(util.name) CONTAINS 'util'
-                OR toLower(util.name) CONTAINS 'helper'
-                OR toLower(util.name) CONTAINS 'converter'
-                OR toLower(util.name) CONTAINS 'formatter'
-                OR toLower(util.name) CONTAINS 'builder'
-              )
-              AND NOT toLower(util.name) CONTAINS 'test'
-            RETURN DISTINCT util.name AS name,
-                   labels(util)[0] AS type,
-                   util.filePath AS path,
-                   'Utility/Helper class' AS description,
-                   3 AS distance,
-                   'UTILITY' AS relationship
-            LIMIT 500
-        """
-        queries.append((query_utilities, "utilities"))
-
-        # Query 9: Entity classes used by services (for business rule extraction)
-        query_entities = f"""
-            MATCH (start)-[*1..4]->(entity)
-            WHERE ({entry_filter})
-              AND entity:JavaClass
-              AND (
-                toLower(entity.name) CONTAINS 'entity'
-                OR toLower(entity.name) CONTAINS 'model'
-                OR toLower(entity.name) CONTAINS 'dto'
-                OR toLower(entity.name) CONTAINS 'vo'
-              )
-              AND NOT toLower(entity.name) CONTAINS 'test'
-              AND NOT toLower(entity.name) CONTAINS 'builder'
-            RETURN DISTINCT entity.name AS name,
-                   labels(entity)[0] AS type,
-                   entity.filePath AS path,
-                   'Entity/Model class' AS description,
-                   3 AS distance,
-                   'ENTITY' AS relationship
-            LIMIT 500
-        """
-        queries.append((query_entities, "entities"))
+        queries.append((get_query("TRAVERSE_DEEP_CHAIN"), entry, "deep_chain"))
+        if base_names["baseNames"]:
+            queries.append((get_query("TRAVERSE_VALIDATORS"), base_names, "validators"))
+        queries.append((get_query("TRAVERSE_UTILITIES"), entry, "utilities"))
+        queries.append((get_query("TRAVERSE_ENTITIES"), entry, "entities"))
 
         return queries
 
@@ -7,8 +7,10 @@ Sections 7 (Technical Architecture) and 9 (Implementation Mapping).
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Any, Optional
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
 from ..models.flow_context import (
     CallChainRequest,
@@ -24,10 +26,25 @@ from ..models.flow_context import (
     TechnicalArchitectureView,
 )
 from ..queries import flow_queries
+from .flow_store import FeatureFlowStore, feature_flow_store
+from ..queries.registry import get_query
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Entry points traced by one materialization run
+DEFAULT_MATERIALIZE_MAX_ENTRY_POINTS = int(os.getenv("FEATURE_FLOW_MATERIALIZE_MAX_ENTRY_POINTS", "1000"))
+# Entry points traced concurrently by extract_feature_flows
+DEFAULT_FLOW_BATCH_CONCURRENCY = int(os.getenv("FEATURE_FLOW_BATCH_CONCURRENCY", "4"))
+
+T = TypeVar("T")
+
+# Lookups shared by the traces of one batch or materialization run, keyed by
+# (lookup, arguments). Unset outside of them, so single traces query directly.
+_shared_lookups: ContextVar[Optional[dict[tuple, asyncio.Future]]] = ContextVar(
+    "flow_shared_lookups", default=None
+)
+
 
 class FeatureFlowService:
     """Service for extracting feature flows from code graph.
@@ -45,13 +62,16 @@ class FeatureFlowService:
         print(flow.to_implementation_table_row())
     """
 
-    def __init__(self, neo4j_client):
+    def __init__(self, neo4j_client, flow_store: Optional[FeatureFlowStore] = None):
         """Initialize the feature flow service.
 
         Args:
             neo4j_client: Neo4j MCP client for executing queries
+            flow_store: Materialized flow store (defaults to the shared ``feature_flow_store``)
         """
         self.neo4j = neo4j_client
+        self.flow_store = flow_store or feature_flow_store
+        self._materialize_lock = asyncio.Lock()
         logger.info("FeatureFlowService initialized")
 
     async def extract_feature_flow(
@@ -64,6 +84,10 @@ class FeatureFlowService:
     ) -> FeatureFlowResponse:
         """Extract complete feature flow from an entry point.
 
+        Requests with the default options (auto type, SQL and data mappings)
+        are served from the materialized flow store when the entry point was
+        materialized at the current graph version.
+
         Args:
             entry_point: File path, name, or entity ID of entry point
             entry_point_type: Type hint (jsp, webflow, controller, auto)
@@ -76,6 +100,13 @@ class FeatureFlowService:
         """
         logger.info(f"Extracting feature flow from: {entry_point}")
 
+        # The flow traces use fixed-depth queries, so max_depth does not
+        # change the result and any depth can be served from the store
+        if entry_point_type == "auto" and include_sql and include_data_mappings:
+            flow = await self._get_materialized_flow(entry_point)
+            if flow is not None:
+                return FeatureFlowResponse(success=True, feature_flow=flow)
+
         try:
             # Determine entry point type if auto
             if entry_point_type == "auto":
@@ -89,37 +120,9 @@ class FeatureFlowService:
                     error=f"Entry point not found: {entry_point}",
                 )
 
-            # Extract the flow based on entry type
-            if entry_point_type == "jsp":
-                flow = await self._extract_jsp_flow(entry_point_id, max_depth)
-            elif entry_point_type == "webflow":
-                flow = await self._extract_webflow_flow(entry_point_id, max_depth)
-            else:
-                flow = await self._extract_generic_flow(entry_point_id, max_depth)
-
-            # Add SQL operations if requested
-            if include_sql and flow:
-                flow.sql_operations = await self._get_sql_operations_for_flow(flow)
-                # Add source class info to SQL operations
-                for sql_op in flow.sql_operations:
-                    for step in flow.flow_steps:
-                        if step.layer == LayerType.DAO:
-                            sql_op.source_class = step.component_name
-                            break
-
-            # Add data mappings if requested
-            if include_data_mappings and flow:
-                flow.data_mappings = await self._get_data_mappings_for_flow(
-                    entry_point_id, entry_point_type
-                )
-
-            # Enrich flow with validation information
-            if flow:
-                flow = await self.enrich_flow_with_validations(flow)
-
-            # Group steps by layer
-            if flow:
-                flow.layers = self._group_steps_by_layer(flow.flow_steps)
+            flow = await self._trace_flow(
+                entry_point_id, entry_point_type, include_sql, include_data_mappings, max_depth
+            )
 
             return FeatureFlowResponse(
                 success=True,
@@ -133,6 +136,108 @@ class FeatureFlowService:
                 error=str(e),
             )
 
+    async def extract_feature_flows(
+        self,
+        entry_points: list[str],
+        max_concurrency: int = DEFAULT_FLOW_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[tuple[str, FeatureFlowResponse]]:
+        """Extract the flows of several entry points concurrently.
+
+        Up to ``max_concurrency`` entry points are traced at once with
+        default options. Components reached from several entry points
+        (services, DAOs and their SQL) are looked up once for the whole
+        batch. Duplicate entry points are traced once.
+
+        Args:
+            entry_points: Entry point paths, names or entity IDs
+            max_concurrency: Maximum entry points traced at once
+
+        Yields:
+            (entry point, FeatureFlowResponse) pairs in completion order
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        lookups: dict[tuple, asyncio.Future] = {}
+
+        async def trace(entry_point: str) -> tuple[str, FeatureFlowResponse]:
+            async with semaphore:
+                # Tasks run in a copy of the caller's context, so this only
+                # applies to the trace (and the lookups it starts)
+                _shared_lookups.set(lookups)
+                return entry_point, await self.extract_feature_flow(entry_point)
+
+        tasks = [asyncio.create_task(trace(ep)) for ep in dict.fromkeys(entry_points)]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in [*tasks, *lookups.values()]:
+                task.cancel()
+            await asyncio.gather(*tasks, *lookups.values(), return_exceptions=True)
+
+    async def materialize_feature_flows(
+        self,
+        max_entry_points: int = DEFAULT_MATERIALIZE_MAX_ENTRY_POINTS,
+    ) -> int:
+        """Trace every entry point once and store the flows for the current graph.
+
+        Run after an analysis completes. Each entry point returned by
+        ``FIND_ENTRY_POINTS`` is stored under its entity ID, name and file
+        path, each with the flow ``extract_feature_flow`` returns for that
+        alias with default options. Flows of older graph versions are
+        deleted afterwards.
+
+        Args:
+            max_entry_points: Maximum entry points traced
+
+        Returns:
+            Number of entry point aliases stored
+        """
+        if not self.flow_store.available:
+            return 0
+
+        async with self._materialize_lock:
+            graph_version = await self.neo4j.graph_version(refresh=True)
+            result = await self.neo4j.query_code_structure(
+                flow_queries.FIND_ENTRY_POINTS,
+                {"keyword": ""},
+            )
+            entry_points = result.get("nodes", [])[:max_entry_points]
+            logger.info(f"[FLOW-STORE] Materializing flows for {len(entry_points)} entry points")
+
+            traced: dict[tuple[str, str], Optional[FeatureFlow]] = {}
+            flows: dict[str, tuple[Optional[str], FeatureFlow]] = {}
+            # Services and DAOs reached from several entry points are looked up once
+            lookups: dict[tuple, asyncio.Future] = {}
+            token = _shared_lookups.set(lookups)
+            try:
+                for entry in entry_points:
+                    for alias in (entry.get("entryId"), entry.get("name"), entry.get("path")):
+                        if not alias or alias in flows:
+                            continue
+                        entry_point_type = self._detect_entry_point_type(alias)
+                        try:
+                            entry_point_id = await self._resolve_entry_point(alias, entry_point_type)
+                            if not entry_point_id:
+                                continue
+                            key = (entry_point_id, entry_point_type)
+                            if key not in traced:
+                                traced[key] = await self._trace_flow(
+                                    entry_point_id, entry_point_type, True, True, 10
+                                )
+                        except Exception as e:
+                            logger.warning(f"[FLOW-STORE] Could not trace {alias}: {e}")
+                            continue
+                        if traced[key] is not None:
+                            flows[alias] = (entry_point_id, traced[key])
+            finally:
+                _shared_lookups.reset(token)
+
+            stored = await self.flow_store.put_many(graph_version, flows)
+            if stored:
+                await self.flow_store.delete_other_versions(graph_version)
+            logger.info(f"[FLOW-STORE] Stored {stored} flows from {len(traced)} traces")
+            return stored
+
     async def get_call_chain(
         self,
         method_id: str,
@@ -153,11 +258,11 @@ class FeatureFlowService:
 
         try:
             if direction == "upstream":
-                query = flow_queries.GET_UPSTREAM_CALL_CHAIN.replace("$maxDepth", str(max_depth))
+                query = get_query("GET_UPSTREAM_CALL_CHAIN", depth=max_depth)
             else:
-                query = flow_queries.GET_METHOD_CALL_CHAIN.replace("$maxDepth", str(max_depth))
+                query = get_query("GET_METHOD_CALL_CHAIN", depth=max_depth)
 
-            result = await self.neo4j.query_code_structure(query, {"methodId": method_id})
+            result = await self.neo4j.query_code_structure(*query.bind(methodId=method_id))
 
             # Parse results into FlowSteps
             chain = []
@@ -258,6 +363,11 @@ class FeatureFlowService:
         Returns:
             List of SQLOperation objects
         """
+        # Copies, since callers annotate the operations of their own flow
+        operations = await self._shared_lookup(self._query_sql_operations, dao_class)
+        return [op.model_copy() for op in operations]
+
+    async def _query_sql_operations(self, dao_class: str) -> list[SQLOperation]:
         logger.info(f"Finding SQL operations for: {dao_class}")
 
         try:
@@ -327,13 +437,14 @@ class FeatureFlowService:
         """
         logger.info(f"Generating implementation mapping for {len(entry_points)} entry points")
 
-        flows = []
-        for entry_point in entry_points:
-            response = await self.extract_feature_flow(entry_point)
+        flows: dict[str, FeatureFlow] = {}
+        async for entry_point, response in self.extract_feature_flows(entry_points):
             if response.success and response.feature_flow:
-                flows.append(response.feature_flow)
+                flows[entry_point] = response.feature_flow
 
-        return ImplementationMapping.from_feature_flows(flows)
+        return ImplementationMapping.from_feature_flows(
+            [flows[ep] for ep in dict.fromkeys(entry_points) if ep in flows]
+        )
 
     async def generate_technical_architecture(
         self,
@@ -409,6 +520,60 @@ class FeatureFlowService:
 
     # Private helper methods
 
+    async def _get_materialized_flow(self, entry_point: str) -> Optional[FeatureFlow]:
+        """The stored flow for an entry point at the current graph version, if any."""
+        if not self.flow_store.available:
+            return None
+        try:
+            graph_version = await self.neo4j.graph_version()
+        except Exception as e:
+            logger.debug(f"[FLOW-STORE] Graph version unavailable: {e}")
+            return None
+        return await self.flow_store.get(graph_version, entry_point)
+
+    async def _trace_flow(
+        self,
+        entry_point_id: str,
+        entry_point_type: str,
+        include_sql: bool,
+        include_data_mappings: bool,
+        max_depth: int,
+    ) -> Optional[FeatureFlow]:
+        """Trace the flow of a resolved entry point and enrich it."""
+        # Extract the flow based on entry type
+        if entry_point_type == "jsp":
+            flow = await self._extract_jsp_flow(entry_point_id, max_depth)
+        elif entry_point_type == "webflow":
+            flow = await self._extract_webflow_flow(entry_point_id, max_depth)
+        else:
+            flow = await self._extract_generic_flow(entry_point_id, max_depth)
+
+        # Add SQL operations if requested
+        if include_sql and flow:
+            flow.sql_operations = await self._get_sql_operations_for_flow(flow)
+            # Add source class info to SQL operations
+            for sql_op in flow.sql_operations:
+                for step in flow.flow_steps:
+                    if step.layer == LayerType.DAO:
+                        sql_op.source_class = step.component_name
+                        break
+
+        # Add data mappings if requested
+        if include_data_mappings and flow:
+            flow.data_mappings = await self._get_data_mappings_for_flow(
+                entry_point_id, entry_point_type
+            )
+
+        # Enrich flow with validation information
+        if flow:
+            flow = await self.enrich_flow_with_validations(flow)
+
+        # Group steps by layer
+        if flow:
+            flow.layers = self._group_steps_by_layer(flow.flow_steps)
+
+        return flow
+
     def _detect_entry_point_type(self, entry_point: str) -> str:
         """Detect entry point type from path/name."""
         lower = entry_point.lower()
@@ -420,12 +585,35 @@ class FeatureFlowService:
             return "controller"
         return "auto"
 
+    async def _shared_lookup(
+        self,
+        lookup: Callable[..., Awaitable[T]],
+        *args: Any,
+    ) -> T:
+        """Run a lookup once per arguments for all traces of the current batch.
+
+        Concurrent traces asking for the same component await the same task.
+        Outside a batch or materialization run the lookup runs directly.
+        """
+        lookups = _shared_lookups.get()
+        if lookups is None:
+            return await lookup(*args)
+        key = (lookup.__name__, *args)
+        task = lookups.get(key)
+        if task is None:
+            task = lookups[key] = asyncio.ensure_future(lookup(*args))
+        # Shielded so a cancelled trace does not cancel a lookup others await
+        return await asyncio.shield(task)
+
     async def _resolve_entry_point(
         self,
         entry_point: str,
         entry_point_type: str,
     ) -> Optional[str]:
         """Resolve entry point to entity ID."""
+        return await self._shared_lookup(self._query_entry_point, entry_point, entry_point_type)
+
+    async def _query_entry_point(self, entry_point: str, entry_point_type: str) -> Optional[str]:
         # Try direct match first
         query = """
             MATCH (n)
@@ -704,6 +892,10 @@ class FeatureFlowService:
         Returns:
             List of business rule descriptions
         """
+        rules = await self._shared_lookup(self._query_business_rules, component_name)
+        return list(rules)
+
+    async def _query_business_rules(self, component_name: str) -> list[str]:
         try:
             result = await self.neo4j.query_code_structure(
                 flow_queries.GET_BUSINESS_RULES_FOR_COMPONENT,
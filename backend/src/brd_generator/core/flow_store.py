@@ -0,0 +1,190 @@
+"""Store of feature flows materialized per code graph version.
+
+Tracing a feature flow runs ``TRACE_FULL_FLOW`` / ``TRACE_JSP_TO_DATABASE``,
+the SQL and form-binding lookups and the validation enrichment; doing that
+on every ``/flow/*`` request and BRD generation is wasted work while the
+graph is unchanged. After an analysis completes,
+``FeatureFlowService.materialize_feature_flows`` traces every entry point
+once and stores the result here, in the ``materialized_feature_flows``
+table: one zlib-compressed ``FeatureFlow`` JSON record per entry point
+alias (entity ID, name, file path), keyed by a digest of the graph version
+and the alias. ``extract_feature_flow`` then serves default requests with
+a single primary-key read.
+
+The graph version (see ``GRAPH_VERSION``) changes whenever a repository is
+re-analyzed, so records of superseded versions are never read again and
+are deleted when the next materialization finishes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncContextManager, Callable, Optional
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database.config import get_async_session
+from ..database.models import MaterializedFeatureFlowDB
+from ..models.flow_context import FeatureFlow
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Whether flows are materialized after analysis and read from the store
+DEFAULT_FLOW_STORE_ENABLED = os.getenv("FEATURE_FLOW_STORE_ENABLED", "true").lower() == "true"
+# Seconds the store is skipped after a database error
+DEFAULT_FLOW_STORE_RETRY_SECONDS = float(os.getenv("FEATURE_FLOW_STORE_RETRY_SECONDS", "30"))
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+def version_digest(graph_version: str) -> str:
+    """Fixed-length form of a graph version."""
+    return hashlib.sha256(graph_version.encode("utf-8")).hexdigest()
+
+
+def make_flow_key(graph_version: str, entry_point: str) -> str:
+    """Digest addressing one entry point alias at one graph version."""
+    return hashlib.sha256(f"{graph_version}\0{entry_point}".encode("utf-8")).hexdigest()
+
+
+def encode_flow(flow: FeatureFlow) -> bytes:
+    return zlib.compress(flow.model_dump_json().encode("utf-8"))
+
+
+def decode_flow(payload: bytes) -> FeatureFlow:
+    return FeatureFlow.model_validate_json(zlib.decompress(payload))
+
+
+@dataclass
+class FlowStoreStats:
+    """Store lookups and writes."""
+
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    written: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        lookups = self.hits + self.misses
+        data["hit_rate"] = round(self.hits / lookups, 3) if lookups else 0.0
+        return data
+
+
+class FeatureFlowStore:
+    """Database-backed feature flows keyed by graph version and entry point."""
+
+    def __init__(
+        self,
+        session_factory: Optional[SessionFactory] = None,
+        enabled: bool = DEFAULT_FLOW_STORE_ENABLED,
+        retry_seconds: float = DEFAULT_FLOW_STORE_RETRY_SECONDS,
+    ):
+        """Initialize the store.
+
+        Args:
+            session_factory: Async context manager factory yielding DB sessions
+            enabled: Whether flows are read from and written to the store
+            retry_seconds: How long to skip the store after a database error
+        """
+        self._session_factory = session_factory or get_async_session
+        self.enabled = enabled
+        self.retry_seconds = retry_seconds
+        self._retry_at = 0.0
+        self._stats = FlowStoreStats()
+
+    @property
+    def available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._retry_at
+
+    async def get(self, graph_version: str, entry_point: str) -> Optional[FeatureFlow]:
+        """The flow materialized for an entry point alias at a graph version."""
+        if not self.available:
+            return None
+        try:
+            async with self._session_factory() as session:
+                entry = await session.get(
+                    MaterializedFeatureFlowDB, make_flow_key(graph_version, entry_point)
+                )
+                flow = decode_flow(entry.payload) if entry is not None else None
+        except Exception as e:
+            self._record_error()
+            logger.warning(f"[FLOW-STORE] Lookup failed, tracing live: {e}")
+            return None
+
+        if flow is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+        return flow
+
+    async def put_many(
+        self,
+        graph_version: str,
+        flows: dict[str, tuple[Optional[str], FeatureFlow]],
+    ) -> int:
+        """Store flows by entry point alias, replacing existing records.
+
+        Args:
+            graph_version: Graph version the flows were traced at
+            flows: Entry point alias -> (entity ID, flow)
+
+        Returns:
+            Number of records written
+        """
+        if not self.available or not flows:
+            return 0
+        digest = version_digest(graph_version)
+        payloads: dict[int, bytes] = {}
+        try:
+            async with self._session_factory() as session:
+                for entry_point, (entity_id, flow) in flows.items():
+                    # Aliases of one entry point share the flow object
+                    payload = payloads.get(id(flow))
+                    if payload is None:
+                        payload = payloads[id(flow)] = encode_flow(flow)
+                    await session.merge(MaterializedFeatureFlowDB(
+                        key=make_flow_key(graph_version, entry_point),
+                        graph_version=digest,
+                        entry_point=entry_point,
+                        entity_id=entity_id,
+                        payload=payload,
+                    ))
+        except Exception as e:
+            self._record_error()
+            logger.warning(f"[FLOW-STORE] Failed to store flows: {e}")
+            return 0
+
+        self._stats.written += len(flows)
+        return len(flows)
+
+    async def delete_other_versions(self, graph_version: str) -> int:
+        """Delete records of every graph version except ``graph_version``."""
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    delete(MaterializedFeatureFlowDB).where(
+                        MaterializedFeatureFlowDB.graph_version != version_digest(graph_version)
+                    )
+                )
+                return result.rowcount or 0
+        except Exception as e:
+            logger.warning(f"[FLOW-STORE] Failed to delete superseded flows: {e}")
+            return 0
+
+    def _record_error(self) -> None:
+        self._stats.errors += 1
+        self._retry_at = time.monotonic() + self.retry_seconds
+
+    def stats(self) -> dict[str, Any]:
+        return {"enabled": self.enabled, **self._stats.to_dict()}
+
+
+# Shared instance used by all feature flow services
+feature_flow_store = FeatureFlowStore()
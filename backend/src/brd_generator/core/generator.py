@@ -118,6 +118,7 @@ class BRDGenerator:
 
         # Copilot SDK components (set in initialize())
         self._copilot_client: Optional[Any] = None
+        self._copilot_session_config: Optional[dict[str, Any]] = None
         self._copilot_session: Optional[Any] = None
 
         # Other components
@@ -269,6 +270,7 @@ class BRDGenerator:
                 # Create Copilot session
                 progress.step("initialize", "Creating Copilot session")
                 self._copilot_session = await self._copilot_client.create_session(session_config)
+                self._copilot_session_config = session_config
                 progress.info(f"Copilot session created", model=copilot_model, mcp_servers=list(mcp_servers.keys()))
 
             except Exception as e:
@@ -285,6 +287,7 @@ class BRDGenerator:
             self.neo4j_client,
             self.filesystem_client,
             copilot_session=self._copilot_session,  # Enable agentic context gathering
+            model=self._get_copilot_model(self.copilot_model),
         )
 
         # Step 4: Initialize synthesizer
@@ -296,6 +299,7 @@ class BRDGenerator:
             templates_dir=templates_dir,
             model=self._get_copilot_model(self.copilot_model),
             template_config=self.template_config,
+            session_factory=self.create_copilot_session,
         )
 
         self._initialized = True
@@ -773,6 +777,7 @@ class BRDGenerator:
             self.neo4j_client,
             repo_filesystem_client,
             copilot_session=session,  # Enable agentic context gathering
+            model=self._get_copilot_model(self.copilot_model),
         )
 
         # Build context
@@ -789,6 +794,7 @@ class BRDGenerator:
             templates_dir=templates_dir,
             model=self._get_copilot_model(self.copilot_model),
             template_config=self.template_config,
+            cache_context={"repository_id": repository.id, "commit": repository.current_commit},
         )
 
         # Generate BRD
@@ -918,6 +924,19 @@ class BRDGenerator:
 
         return mcp_servers
 
+    async def create_copilot_session(self) -> Optional[Any]:
+        """Create an additional Copilot session with the default configuration.
+
+        Used by services that run several LLM conversations concurrently
+        (e.g. wiki page generation). The caller owns the returned session.
+
+        Returns:
+            New Copilot session, or None if the SDK is not initialized.
+        """
+        if self._copilot_client is None or self._copilot_session_config is None:
+            return None
+        return await self._copilot_client.create_session(dict(self._copilot_session_config))
+
     async def cleanup(self) -> None:
         """Cleanup resources."""
         progress.start_operation("BRDGenerator.cleanup", "Releasing all resources")
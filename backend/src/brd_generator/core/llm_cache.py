@@ -0,0 +1,300 @@
+"""Content-addressed cache for LLM responses.
+
+Responses are stored in the ``llm_response_cache`` table under a SHA-256
+digest of the prompt, the model, the generation options and a caller
+supplied context (e.g. repository ID and commit). Re-running a generation
+over an unchanged repository therefore reuses earlier responses instead of
+calling the LLM again.
+
+Entries expire after a TTL, and the least recently used entries are pruned
+once the table grows past its size limit. A request can skip cached
+responses with an explicit bypass flag, or for a whole block of work with
+``bypass_llm_cache()``; the fresh responses still replace the cached ones.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncContextManager, Awaitable, Callable, Iterator, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database.config import get_async_session
+from ..database.models import LLMResponseCacheDB
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Whether LLM responses are cached at all
+DEFAULT_LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+# How long a cached response stays valid (0 = never expires)
+DEFAULT_LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+# Entries kept before the least recently used ones are pruned
+DEFAULT_LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+# Writes between two pruning passes
+DEFAULT_LLM_CACHE_PRUNE_EVERY = int(os.getenv("LLM_CACHE_PRUNE_EVERY", "100"))
+# Seconds the cache is skipped after a database error
+DEFAULT_LLM_CACHE_RETRY_SECONDS = float(os.getenv("LLM_CACHE_RETRY_SECONDS", "30"))
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+# Set by bypass_llm_cache() for everything awaited within its block
+llm_cache_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass_llm_cache(enabled: bool = True) -> Iterator[None]:
+    """Skip cached LLM responses for all calls made within the block."""
+    token = llm_cache_bypass.set(enabled)
+    try:
+        yield
+    finally:
+        llm_cache_bypass.reset(token)
+
+
+def make_cache_key(
+    prompt: str,
+    model: Optional[str] = None,
+    context: Optional[dict[str, Any]] = None,
+    options: Optional[dict[str, Any]] = None,
+) -> str:
+    """Digest of everything that determines an LLM response."""
+    payload = json.dumps(
+        {
+            "prompt": prompt,
+            "model": model,
+            "context": context or {},
+            "options": options or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Cache lookups for one caller."""
+
+    hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        lookups = self.hits + self.misses
+        data["hit_rate"] = round(self.hits / lookups, 3) if lookups else 0.0
+        return data
+
+
+class LLMResponseCache:
+    """Database-backed LLM response cache with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        session_factory: Optional[SessionFactory] = None,
+        enabled: bool = DEFAULT_LLM_CACHE_ENABLED,
+        ttl_seconds: int = DEFAULT_LLM_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_LLM_CACHE_MAX_ENTRIES,
+        prune_every: int = DEFAULT_LLM_CACHE_PRUNE_EVERY,
+        retry_seconds: float = DEFAULT_LLM_CACHE_RETRY_SECONDS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            session_factory: Async context manager factory yielding DB sessions
+            enabled: Whether responses are looked up and stored
+            ttl_seconds: Lifetime of an entry (0 = no expiry)
+            max_entries: Entries kept when pruning least recently used ones
+            prune_every: Writes between two pruning passes
+            retry_seconds: How long to skip the cache after a database error
+        """
+        self._session_factory = session_factory or get_async_session
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.prune_every = max(1, prune_every)
+        self.retry_seconds = retry_seconds
+        self._retry_at = 0.0
+        self._stats: dict[str, CacheStats] = {}
+        self._writes = 0
+
+    async def get_or_call(
+        self,
+        caller: str,
+        prompt: str,
+        call: Callable[[], Awaitable[Optional[str]]],
+        *,
+        model: Optional[str] = None,
+        context: Optional[dict[str, Any]] = None,
+        options: Optional[dict[str, Any]] = None,
+        bypass: bool = False,
+    ) -> Optional[str]:
+        """Return the cached response for a prompt, or call the LLM and cache it.
+
+        Only non-empty responses returned by ``call`` are stored, so callers
+        should substitute fallbacks (mocks, templates) outside of ``call``.
+
+        Args:
+            caller: Name used for hit-rate statistics
+            prompt: Prompt text
+            call: Coroutine function sending the prompt to the LLM
+            model: Model the prompt is sent to
+            context: Extra inputs that determine the response (e.g. commit)
+            options: Generation options (e.g. temperature, seed)
+            bypass: Ignore any cached response and refresh it
+
+        Returns:
+            The cached or freshly generated response
+        """
+        # A failing database must not slow down every LLM call
+        if not self.enabled or time.monotonic() < self._retry_at:
+            return await call()
+
+        stats = self._stats.setdefault(caller, CacheStats())
+        key = make_cache_key(prompt, model, context, options)
+
+        if bypass or llm_cache_bypass.get():
+            stats.bypasses += 1
+        else:
+            cached = await self.get(key, stats)
+            if cached is not None:
+                stats.hits += 1
+                logger.debug(f"[LLM-CACHE] {caller}: hit {key[:12]}")
+                return cached
+            stats.misses += 1
+
+        response = await call()
+        if response and time.monotonic() >= self._retry_at:
+            await self.put(key, response, caller=caller, model=model, prompt_chars=len(prompt), stats=stats)
+        return response
+
+    async def get(self, key: str, stats: Optional[CacheStats] = None) -> Optional[str]:
+        """Look up a response by key, refreshing its LRU position."""
+        try:
+            async with self._session_factory() as session:
+                entry = await session.get(LLMResponseCacheDB, key)
+                if entry is None:
+                    return None
+
+                now = datetime.utcnow()
+                if entry.expires_at is not None and entry.expires_at <= now:
+                    await session.delete(entry)
+                    return None
+
+                entry.hit_count = (entry.hit_count or 0) + 1
+                entry.last_accessed_at = now
+                return entry.response
+        except Exception as e:
+            self._record_error(stats)
+            logger.warning(f"[LLM-CACHE] Lookup failed, treating as miss: {e}")
+            return None
+
+    async def put(
+        self,
+        key: str,
+        response: str,
+        *,
+        caller: str,
+        model: Optional[str] = None,
+        prompt_chars: int = 0,
+        stats: Optional[CacheStats] = None,
+    ) -> None:
+        """Store a response, replacing any entry with the same key."""
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.ttl_seconds) if self.ttl_seconds > 0 else None
+        try:
+            async with self._session_factory() as session:
+                await session.merge(LLMResponseCacheDB(
+                    key=key,
+                    caller=caller,
+                    model=model,
+                    response=response,
+                    prompt_chars=prompt_chars,
+                    hit_count=0,
+                    created_at=now,
+                    last_accessed_at=now,
+                    expires_at=expires_at,
+                ))
+        except Exception as e:
+            self._record_error(stats)
+            logger.warning(f"[LLM-CACHE] Failed to store response: {e}")
+            return
+
+        self._writes += 1
+        if self._writes % self.prune_every == 0:
+            await self.prune()
+
+    async def prune(self) -> int:
+        """Delete expired entries and the least recently used ones over the limit.
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = 0
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    delete(LLMResponseCacheDB).where(
+                        LLMResponseCacheDB.expires_at <= datetime.utcnow()
+                    )
+                )
+                deleted += result.rowcount or 0
+
+                total = await session.scalar(select(func.count()).select_from(LLMResponseCacheDB))
+                excess = (total or 0) - self.max_entries
+                if excess > 0:
+                    oldest = (
+                        select(LLMResponseCacheDB.key)
+                        .order_by(LLMResponseCacheDB.last_accessed_at)
+                        .limit(excess)
+                    )
+                    result = await session.execute(
+                        delete(LLMResponseCacheDB).where(LLMResponseCacheDB.key.in_(oldest))
+                    )
+                    deleted += result.rowcount or 0
+        except Exception as e:
+            logger.warning(f"[LLM-CACHE] Pruning failed: {e}")
+            return 0
+
+        if deleted:
+            logger.info(f"[LLM-CACHE] Pruned {deleted} entries")
+        return deleted
+
+    def _record_error(self, stats: Optional[CacheStats]) -> None:
+        if stats is not None:
+            stats.errors += 1
+        self._retry_at = time.monotonic() + self.retry_seconds
+
+    def stats(self) -> dict[str, Any]:
+        """Hit rates overall and per caller."""
+        total = CacheStats()
+        for caller_stats in self._stats.values():
+            total.hits += caller_stats.hits
+            total.misses += caller_stats.misses
+            total.bypasses += caller_stats.bypasses
+            total.errors += caller_stats.errors
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "max_entries": self.max_entries,
+            "total": total.to_dict(),
+            "callers": {caller: s.to_dict() for caller, s in self._stats.items()},
+        }
+
+    def reset_stats(self) -> None:
+        """Clear hit-rate statistics."""
+        self._stats.clear()
+
+
+# Shared instance used by all services
+llm_response_cache = LLMResponseCache()
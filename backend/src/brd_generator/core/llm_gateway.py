@@ -0,0 +1,340 @@
+"""Shared gateway for LLM calls through Copilot SDK sessions.
+
+Every service sends its prompts through ``llm_gateway``. A call subscribes
+to the session's events and completes when the session goes idle after the
+assistant's reply, so no caller polls the message history. Events carry no
+turn id, so the gateway sends one turn at a time per session. The gateway also
+caps the number of in-flight LLM calls process-wide, applies per-caller
+timeouts, and records latency and token metrics per caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional
+
+from ..utils.logger import get_logger
+from ..utils.token_counter import estimate_tokens
+
+logger = get_logger(__name__)
+
+# Maximum LLM calls in flight across all services
+DEFAULT_LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+# Timeout for callers that neither pass one nor have an override
+DEFAULT_LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT_SECONDS", "120"))
+# Per-caller timeout overrides, e.g. "wiki=180,synthesizer=600"
+DEFAULT_LLM_CALLER_TIMEOUTS = os.getenv("LLM_CALLER_TIMEOUTS", "")
+
+ASSISTANT_MESSAGE_EVENT = "assistant.message"
+ASSISTANT_USAGE_EVENT = "assistant.usage"
+SESSION_IDLE_EVENT = "session.idle"
+SESSION_ERROR_EVENT = "session.error"
+
+
+class LLMSessionError(Exception):
+    """The Copilot session reported an error for the current turn."""
+
+
+def parse_caller_timeouts(spec: str) -> dict[str, float]:
+    """Parse ``caller=seconds`` pairs separated by commas."""
+    timeouts = {}
+    for item in spec.split(","):
+        caller, _, seconds = item.partition("=")
+        if caller.strip() and seconds.strip():
+            try:
+                timeouts[caller.strip()] = float(seconds)
+            except ValueError:
+                logger.warning(f"[LLM-GATEWAY] Ignoring invalid timeout: {item!r}")
+    return timeouts
+
+
+def extract_event_text(event: Any) -> str:
+    """Extract text content from a Copilot session event."""
+    try:
+        if hasattr(event, 'data'):
+            data = event.data
+            if hasattr(data, 'message') and hasattr(data.message, 'content'):
+                return str(data.message.content)
+            if hasattr(data, 'content'):
+                return str(data.content)
+            if hasattr(data, 'text'):
+                return str(data.text)
+
+        if hasattr(event, 'content'):
+            return str(event.content)
+        if hasattr(event, 'text'):
+            return str(event.text)
+
+        return str(event)
+    except Exception as e:
+        logger.error(f"[LLM-GATEWAY] Error extracting from event: {e}")
+        return ""
+
+
+def _event_type(event: Any) -> str:
+    event_type = getattr(event, "type", None)
+    return str(getattr(event_type, "value", event_type) or "")
+
+
+@dataclass
+class CallerMetrics:
+    """Aggregated LLM call statistics for one caller."""
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    total_queue_ms: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["avg_latency_ms"] = round(self.total_latency_ms / self.calls, 1) if self.calls else 0.0
+        return data
+
+
+class _Turn:
+    """Collects the events of one prompt/response turn."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        observer: Optional[Callable[[Any], None]] = None,
+    ):
+        self._loop = loop
+        self._observer = observer
+        self.done: asyncio.Future = loop.create_future()
+        self.reply: Any = None
+        self.input_tokens: Optional[int] = None
+        self.output_tokens: Optional[int] = None
+
+    def on_event(self, event: Any) -> None:
+        if self._observer is not None:
+            try:
+                self._observer(event)
+            except Exception as e:
+                logger.warning(f"[LLM-GATEWAY] Event observer failed: {e}")
+
+        # Events from sub-agents do not complete the caller's turn
+        if getattr(event, "agent_id", None):
+            return
+
+        event_type = _event_type(event)
+        data = getattr(event, "data", None)
+        if event_type == ASSISTANT_MESSAGE_EVENT:
+            self.reply = event
+        elif event_type == ASSISTANT_USAGE_EVENT:
+            self.input_tokens = (self.input_tokens or 0) + (getattr(data, "input_tokens", 0) or 0)
+            self.output_tokens = (self.output_tokens or 0) + (getattr(data, "output_tokens", 0) or 0)
+        elif event_type == SESSION_IDLE_EVENT:
+            self._loop.call_soon_threadsafe(self._resolve, None)
+        elif event_type == SESSION_ERROR_EVENT:
+            message = getattr(data, "message", None) or "session error"
+            self._loop.call_soon_threadsafe(self._resolve, LLMSessionError(message))
+
+    def _resolve(self, error: Optional[Exception]) -> None:
+        if self.done.done():
+            return
+        if error is not None:
+            self.done.set_exception(error)
+        else:
+            self.done.set_result(self.reply)
+
+
+class LLMGateway:
+    """Sends prompts to Copilot sessions under a global concurrency cap."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_LLM_MAX_CONCURRENCY,
+        default_timeout: float = DEFAULT_LLM_TIMEOUT,
+        caller_timeouts: Optional[dict[str, float]] = None,
+    ):
+        """Initialize the gateway.
+
+        Args:
+            max_concurrency: Maximum LLM calls in flight at once
+            default_timeout: Timeout (seconds) when a call does not pass one
+            caller_timeouts: Per-caller timeout overrides, by caller name
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.default_timeout = default_timeout
+        self.caller_timeouts = (
+            caller_timeouts if caller_timeouts is not None
+            else parse_caller_timeouts(DEFAULT_LLM_CALLER_TIMEOUTS)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session_locks: weakref.WeakKeyDictionary[Any, asyncio.Lock] = weakref.WeakKeyDictionary()
+        self._abandoned_turns: set[asyncio.Task] = set()
+        self._metrics: dict[str, CallerMetrics] = {}
+        self._in_flight = 0
+        self._waiting = 0
+
+    def timeout_for(self, caller: str, timeout: Optional[float] = None) -> float:
+        """Resolve the timeout of a call: caller override, then explicit, then default."""
+        if caller in self.caller_timeouts:
+            return self.caller_timeouts[caller]
+        return timeout if timeout is not None else self.default_timeout
+
+    async def send(
+        self,
+        session: Any,
+        prompt: str,
+        *,
+        caller: str,
+        timeout: Optional[float] = None,
+        options: Optional[dict[str, Any]] = None,
+        on_event: Optional[Callable[[Any], None]] = None,
+    ) -> str:
+        """Send a prompt and wait for the assistant's reply.
+
+        Args:
+            session: Copilot session to send through
+            prompt: Prompt text
+            caller: Name used for metrics and timeout overrides
+            timeout: Seconds to wait for the reply (not counting queueing)
+            options: Extra message options (e.g. temperature, seed)
+            on_event: Called with every session event of the turn (e.g. to
+                log tool calls); not called for sessions without events
+
+        Returns:
+            The reply text, or "" if the session produced none
+
+        Raises:
+            asyncio.TimeoutError: If no reply arrived within the timeout
+            LLMSessionError: If the session reported an error
+        """
+        timeout = self.timeout_for(caller, timeout)
+        metrics = self._metrics.setdefault(caller, CallerMetrics())
+        message_options = {**(options or {}), "prompt": prompt}
+
+        turn: Optional[_Turn] = None
+        if hasattr(session, 'on') and hasattr(session, 'send'):
+            turn = _Turn(asyncio.get_running_loop(), on_event)
+
+        queued_at = time.perf_counter()
+        lock = self._session_lock(session)
+        self._waiting += 1
+        try:
+            # Replies are matched to turns only by arrival order
+            await lock.acquire()
+            try:
+                await self._semaphore.acquire()
+            except BaseException:
+                lock.release()
+                raise
+        finally:
+            self._waiting -= 1
+
+        started_at = time.perf_counter()
+        self._in_flight += 1
+        release_lock = True
+        try:
+            if turn is not None:
+                unsubscribe = session.on(turn.on_event)
+                try:
+                    await session.send(message_options)
+                    event = await asyncio.wait_for(asyncio.shield(turn.done), timeout=timeout)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    # A late reply would complete the next turn on this session
+                    self._release_after_turn(turn, unsubscribe, lock, timeout)
+                    release_lock = False
+                    raise
+                finally:
+                    if release_lock:
+                        unsubscribe()
+            elif hasattr(session, 'send_and_wait'):
+                event = await asyncio.wait_for(
+                    session.send_and_wait(message_options, timeout=timeout),
+                    timeout=timeout,
+                )
+            else:
+                logger.warning(f"[LLM-GATEWAY] {caller}: session has no send methods")
+                event = None
+
+            response = extract_event_text(event) if event is not None else ""
+        except asyncio.TimeoutError:
+            metrics.timeouts += 1
+            raise
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+            if release_lock:
+                lock.release()
+                if turn is not None and not turn.done.done():
+                    turn.done.cancel()
+
+            latency_ms = (time.perf_counter() - started_at) * 1000
+            metrics.calls += 1
+            metrics.total_latency_ms += latency_ms
+            metrics.max_latency_ms = max(metrics.max_latency_ms, latency_ms)
+            metrics.total_queue_ms += (started_at - queued_at) * 1000
+
+        # Prefer the usage the session reported; estimate otherwise
+        input_tokens = turn.input_tokens if turn and turn.input_tokens is not None else estimate_tokens(prompt)
+        output_tokens = turn.output_tokens if turn and turn.output_tokens is not None else estimate_tokens(response)
+        metrics.input_tokens += input_tokens
+        metrics.output_tokens += output_tokens
+
+        logger.debug(
+            f"[LLM-GATEWAY] {caller}: {len(prompt)} chars -> {len(response)} chars "
+            f"in {latency_ms:.0f}ms (queued {(started_at - queued_at) * 1000:.0f}ms)"
+        )
+        return response
+
+    def _session_lock(self, session: Any) -> asyncio.Lock:
+        lock = self._session_locks.get(session)
+        if lock is None:
+            lock = self._session_locks[session] = asyncio.Lock()
+        return lock
+
+    def _release_after_turn(
+        self,
+        turn: _Turn,
+        unsubscribe: Any,
+        lock: asyncio.Lock,
+        timeout: float,
+    ) -> None:
+        """Keep an abandoned turn's session locked until the session goes idle.
+
+        Waits at most one more timeout, so a session that never answers is not
+        blocked forever.
+        """
+        async def wait() -> None:
+            try:
+                await asyncio.wait_for(turn.done, timeout=timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError, LLMSessionError):
+                pass
+            finally:
+                unsubscribe()
+                lock.release()
+
+        task = asyncio.create_task(wait())
+        self._abandoned_turns.add(task)
+        task.add_done_callback(self._abandoned_turns.discard)
+
+    def metrics(self) -> dict[str, Any]:
+        """Snapshot of gateway load and per-caller statistics."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "callers": {caller: m.to_dict() for caller, m in self._metrics.items()},
+        }
+
+    def reset_metrics(self) -> None:
+        """Clear per-caller statistics."""
+        self._metrics.clear()
+
+
+# Shared instance used by all services
+llm_gateway = LLMGateway()
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 import time
 from typing import Any, Optional, TYPE_CHECKING
 
@@ -41,6 +42,10 @@ from ..models.verification import (
 from ..mcp_clients.neo4j_client import Neo4jMCPClient
 from ..mcp_clients.filesystem_client import FilesystemMCPClient
 from ..utils.logger import get_logger, get_progress_logger
+from ..utils.token_counter import truncate_to_token_limit
+from .llm_cache import llm_response_cache
+from .llm_gateway import llm_gateway
+from .session_pool import CopilotSessionPool, SessionFactory
 from typing import Callable, Awaitable
 
 # Type alias for progress callback
@@ -58,6 +63,16 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 progress = get_progress_logger(__name__, "Orchestrator")
 
+# Number of claims verified at once within a section
+DEFAULT_CLAIM_VERIFICATION_CONCURRENCY = int(os.getenv("CLAIM_VERIFICATION_CONCURRENCY", "4"))
+# Number of independent sections generated at once
+DEFAULT_SECTION_CONCURRENCY = int(os.getenv("BRD_SECTION_CONCURRENCY", "4"))
+
+# Sections whose name contains one of these summarize everything before them
+SUMMARY_SECTION_KEYWORDS = ("summary", "conclusion", "recap")
+# Tokens of each previously generated section quoted in a section prompt
+PREVIOUS_SECTION_MAX_TOKENS = int(os.getenv("BRD_PREVIOUS_SECTION_MAX_TOKENS", "150"))
+
 
 # Default BRD section names (from best practices module)
 DEFAULT_BRD_SECTION_NAMES = [s["name"] for s in DEFAULT_BRD_SECTIONS]
@@ -140,6 +155,12 @@ class MultiAgentOrchestrator:
         claims_per_section: int = 5,
         default_section_words: Optional[int] = None,
         skip_verification: bool = False,
+        session_factory: Optional[SessionFactory] = None,
+        claim_concurrency: int = DEFAULT_CLAIM_VERIFICATION_CONCURRENCY,
+        section_concurrency: int = DEFAULT_SECTION_CONCURRENCY,
+        llm_model: Optional[str] = None,
+        cache_context: Optional[dict[str, Any]] = None,
+        bypass_cache: bool = False,
     ):
         """
         Initialize the orchestrator.
@@ -157,6 +178,15 @@ class MultiAgentOrchestrator:
             seed: Optional seed for reproducible outputs
             claims_per_section: Target number of claims to extract per section (default: 5)
             default_section_words: Default target word count per section (None = no limit)
+            session_factory: Async callable creating extra Copilot sessions, so
+                concurrent claim verification does not share one conversation
+            claim_concurrency: Max claims verified at once within a section
+            section_concurrency: Max sections generated at once. Sections wait
+                only for the sections they depend on (see _resolve_section_dependencies)
+            llm_model: Model the Copilot session uses; part of the response cache key
+            cache_context: Inputs that scope cached LLM responses (e.g.
+                repository ID and commit), so responses are not reused across them
+            bypass_cache: Ignore cached LLM responses and refresh them
             sufficiency_criteria: Custom criteria for what makes a complete analysis.
                 Structure:
                 {
@@ -239,6 +269,25 @@ class MultiAgentOrchestrator:
         else:
             logger.info("VERIFIED MODE: Claims will be verified against codebase")
 
+        # Sections and claims run concurrently; each LLM call borrows its own session
+        self.claim_concurrency = max(1, claim_concurrency)
+        self.section_concurrency = max(1, section_concurrency)
+        self._session_pool = CopilotSessionPool(
+            copilot_session,
+            session_factory=session_factory,
+            max_size=max(self.claim_concurrency, self.section_concurrency),
+        )
+
+        # LLM responses are cached by prompt, model, options and context
+        self.llm_model = llm_model or os.getenv("COPILOT_MODEL", "gpt-4o")
+        self.cache_context = cache_context or {}
+        self.bypass_cache = bypass_cache
+
+        # Per-generation evidence cache: Neo4j lookups keyed by (query,
+        # parameters, name), shared by all claims of one BRD run. File reads
+        # are cached by the filesystem client (read_lines).
+        self._lookup_cache: dict[tuple[str, str, str], asyncio.Future] = {}
+
         # Get sections from template, custom_sections, or defaults (from best practices)
         if custom_sections:
             self.sections = [s.get("name", f"Section {i}") for i, s in enumerate(custom_sections, 1)]
@@ -249,6 +298,7 @@ class MultiAgentOrchestrator:
         else:
             self.sections = DEFAULT_BRD_SECTION_NAMES
             self.section_configs = DEFAULT_BRD_SECTIONS  # Full config with descriptions
+        self.section_dependencies = self._resolve_section_dependencies()
 
         # Skills are auto-discovered by Copilot SDK from skill_directories
         # We just use trigger phrases in prompts (e.g., "generate brd", "verify brd")
@@ -297,7 +347,10 @@ class MultiAgentOrchestrator:
         1. Generate section content
         2. Extract and verify claims
         3. If failed, regenerate with feedback (up to max_iterations)
-        4. Move to next section
+
+        Sections run concurrently (up to section_concurrency); a section
+        starts once the sections it depends on are done and sees only their
+        content, so wall-clock time follows the dependency critical path.
 
         Args:
             context: Aggregated context from code analysis
@@ -323,26 +376,36 @@ class MultiAgentOrchestrator:
         # Reset state
         self.section_contents = {}
         self.section_evidence = {}
+        self._lookup_cache = {}
         total_claims = 0
         verified_claims = 0
 
         try:
-            # Process each section
-            for section_idx, section_name in enumerate(self.sections, 1):
-                logger.info("")
-                logger.info("=" * 70)
-                logger.info(f"SECTION {section_idx}/{len(self.sections)}: {section_name.upper()}")
-                logger.info("=" * 70)
-
-                progress.step("BRD Generation", f"Processing section: {section_name}")
-                await self._emit_progress("section", f"📝 Section {section_idx}/{len(self.sections)}: {section_name}")
-
-                # Generate and verify this section
-                section_result = await self._process_section(
-                    section_name=section_name,
-                    context=context,
-                    previous_sections=self.section_contents,
-                )
+            # Sections run as soon as the sections they depend on are done
+            semaphore = asyncio.Semaphore(self.section_concurrency)
+            section_tasks: dict[str, asyncio.Task] = {}
+
+            async def run_section(section_idx: int, section_name: str) -> None:
+                nonlocal total_claims, verified_claims
+                dependencies = self.section_dependencies.get(section_name, [])
+                if dependencies:
+                    await asyncio.gather(*(section_tasks[name] for name in dependencies))
+
+                async with semaphore:
+                    logger.info("")
+                    logger.info("=" * 70)
+                    logger.info(f"SECTION {section_idx}/{len(self.sections)}: {section_name.upper()}")
+                    logger.info("=" * 70)
+
+                    progress.step("BRD Generation", f"Processing section: {section_name}")
+                    await self._emit_progress("section", f"📝 Section {section_idx}/{len(self.sections)}: {section_name}")
+
+                    # Generate and verify this section
+                    section_result = await self._process_section(
+                        section_name=section_name,
+                        context=context,
+                        previous_sections={name: self.section_contents[name] for name in dependencies},
+                    )
 
                 # Store results
                 self.section_contents[section_name] = section_result["content"]
@@ -374,6 +437,19 @@ class MultiAgentOrchestrator:
                     f"{status_icon} {section_name}: {evidence.verified_claims}/{evidence.total_claims} claims verified ({evidence.overall_confidence:.0%} confidence)"
                 )
 
+            for section_idx, section_name in enumerate(self.sections, 1):
+                section_tasks[section_name] = asyncio.create_task(run_section(section_idx, section_name))
+            try:
+                await asyncio.gather(*section_tasks.values())
+            except BaseException:
+                for task in section_tasks.values():
+                    task.cancel()
+                raise
+
+            # Keep the template's section order regardless of completion order
+            self.section_contents = {name: self.section_contents[name] for name in self.sections}
+            self.section_evidence = {name: self.section_evidence[name] for name in self.sections}
+
             # Combine all sections into final BRD
             logger.info("")
             logger.info("=" * 70)
@@ -422,6 +498,49 @@ class MultiAgentOrchestrator:
             progress.end_operation("BRD Generation", success=False, details=str(e))
             raise
 
+    def _resolve_section_dependencies(self) -> dict[str, list[str]]:
+        """Determine which earlier sections each section builds on.
+
+        Dependencies come from the section configs or parsed template
+        ("depends_on"). Summary-like sections (see SUMMARY_SECTION_KEYWORDS)
+        without declared dependencies depend on every earlier section.
+        Dependencies on unknown or later sections are dropped, so the result
+        is always acyclic.
+
+        Returns:
+            Section name -> names of the sections it waits for
+        """
+        configs = {
+            config.get("name"): config
+            for config in (self.section_configs or [])
+            if isinstance(config, dict)
+        }
+
+        dependencies: dict[str, list[str]] = {}
+        for idx, section_name in enumerate(self.sections):
+            earlier = self.sections[:idx]
+            declared = configs.get(section_name, {}).get("depends_on")
+            if declared is None and self.parsed_template and hasattr(self.parsed_template, "get_section"):
+                template_section = self.parsed_template.get_section(section_name)
+                declared = getattr(template_section, "depends_on", None)
+
+            if declared:
+                earlier_by_lower = {name.lower(): name for name in earlier}
+                resolved = []
+                for name in declared:
+                    match = earlier_by_lower.get(str(name).lower())
+                    if match is None:
+                        logger.warning(f"[{section_name}] Ignoring dependency on unknown or later section: {name}")
+                    elif match not in resolved:
+                        resolved.append(match)
+                dependencies[section_name] = resolved
+            elif any(keyword in section_name.lower() for keyword in SUMMARY_SECTION_KEYWORDS):
+                dependencies[section_name] = list(earlier)
+            else:
+                dependencies[section_name] = []
+
+        return dependencies
+
     async def _process_section(
         self,
         section_name: str,
@@ -434,7 +553,7 @@ class MultiAgentOrchestrator:
         Args:
             section_name: Name of the section to process
             context: Aggregated codebase context
-            previous_sections: Already generated sections for continuity
+            previous_sections: Generated sections this section depends on
 
         Returns:
             Dict with 'content' and 'evidence'
@@ -568,11 +687,16 @@ class MultiAgentOrchestrator:
         # Emit claims extraction progress
         await self._emit_progress("claims", f"📋 Extracted {len(claims)} claims from {section_name}")
 
-        # Step 2: Verify each claim using direct MCP client queries
+        # Step 2: Verify claims concurrently using direct MCP client queries
         verified_count = 0
+        done_count = 0
         total_claims = len(claims)
-        for idx, claim in enumerate(claims, 1):
-            await self._verify_claim_direct(claim, context)
+        semaphore = asyncio.Semaphore(self.claim_concurrency)
+
+        async def verify(claim: Claim) -> None:
+            nonlocal verified_count, done_count
+            async with semaphore:
+                await self._verify_claim_direct(claim, context)
             # IMPORTANT: If no evidence was found, ensure confidence is 0
             # (recalculate_confidence only runs when evidence is added)
             if not claim.evidence:
@@ -581,14 +705,17 @@ class MultiAgentOrchestrator:
                 claim.hallucination_risk = HallucinationRisk.HIGH
             else:
                 verified_count += 1
+            done_count += 1
 
             # Emit progress every few claims (to avoid flooding)
-            if idx == total_claims or idx % 3 == 0:
+            if done_count == total_claims or done_count % 3 == 0:
                 await self._emit_progress(
                     "verifying",
-                    f"🔍 Verifying claims: {idx}/{total_claims} ({verified_count} verified)"
+                    f"🔍 Verifying claims: {done_count}/{total_claims} ({verified_count} verified)"
                 )
 
+        await asyncio.gather(*(verify(claim) for claim in claims))
+
         # Step 3: Build section verification result
         result = SectionVerificationResult(
             section_name=section_name,
@@ -702,98 +829,112 @@ IMPORTANT:
 
         try:
             # Search for mentioned entities in Neo4j - get detailed code info
-            for entity in claim.mentioned_entities[:max_entities]:
-                # Query for methods/classes with their code locations
-                query = f"""
-                MATCH (n)
-                WHERE n.name CONTAINS '{entity}' OR n.qualifiedName CONTAINS '{entity}'
-                OPTIONAL MATCH (n)-[:CONTAINS|DECLARES|HAS_METHOD]->(m)
-                RETURN n.name as name, labels(n) as labels, n.filePath as filePath,
+            # (one UNWIND query for all entities of the claim)
+            entities = claim.mentioned_entities[:max_entities]
+            entity_query = """
+                UNWIND $names AS entity
+                CALL {
+                    WITH entity
+                    MATCH (n)
+                    WHERE n.name CONTAINS entity OR n.qualifiedName CONTAINS entity
+                    OPTIONAL MATCH (n)-[:CONTAINS|DECLARES|HAS_METHOD]->(m)
+                    WITH n, collect(DISTINCT m.name) AS members
+                    RETURN n, members
+                    LIMIT $limit
+                }
+                RETURN entity AS key, n.name as name, labels(n) as labels, n.filePath as filePath,
                        n.startLine as startLine, n.endLine as endLine,
                        n.sourceCode as sourceCode, n.body as body,
-                       collect(DISTINCT m.name) as members
-                LIMIT {results_limit}
-                """
-                result = await self.neo4j_client.query_code_structure(query)
-
-                if result and result.get("nodes"):
-                    for node in result["nodes"][:code_refs_limit]:
-                        file_path = node.get("filePath") or node.get("path")
-                        if not file_path:
-                            continue
-
-                        entity_name = node.get("name", entity)
-                        entity_type = node.get("labels", ["Unknown"])[0] if node.get("labels") else "Unknown"
-                        start_line = node.get("startLine", 1) or 1
-                        end_line = node.get("endLine", start_line + 10) or start_line + 10
-
-                        # Try to get actual code snippet
-                        snippet = node.get("sourceCode") or node.get("body")
-                        if not snippet and self.filesystem_client:
-                            try:
-                                # Translate Neo4j path to backend filesystem path
-                                # Neo4j stores: /app/repos/... but backend has: /codebase/...
-                                actual_file_path = file_path
-                                if file_path.startswith("/app/repos/"):
-                                    actual_file_path = file_path.replace("/app/repos/", "/codebase/", 1)
-
-                                # Fetch code from file
-                                file_content = await self.filesystem_client.read_file(actual_file_path)
-                                if file_content:
-                                    lines = file_content.split('\n')
-                                    # Get lines around the entity (±10 lines for context)
-                                    start_idx = max(0, start_line - 1)
-                                    end_idx = min(len(lines), end_line + 5)
-                                    snippet = '\n'.join(lines[start_idx:end_idx])
-                            except Exception as e:
-                                logger.debug(f"Could not read file {file_path}: {e}")
-
-                        # Add entity even without snippet (partial evidence)
-                        # Having file location is valuable for verification
-                        code_snippets_found.append({
-                            "file_path": file_path,
-                            "start_line": start_line,
-                            "end_line": end_line,
-                            "snippet": snippet[:500] if snippet else f"[Entity found: {entity_name} in {file_path}:{start_line}]",
-                            "entity_name": entity_name,
-                            "entity_type": entity_type,
-                            "members": node.get("members", []),
-                            "has_full_snippet": bool(snippet),  # Track if we have actual code
-                        })
+                       members
+            """
+            entity_results = await self._cached_lookup(
+                entity_query, entities, {"limit": results_limit}
+            )
+
+            for entity, nodes in entity_results.items():
+                for node in nodes[:code_refs_limit]:
+                    file_path = node.get("filePath") or node.get("path")
+                    if not file_path:
+                        continue
+
+                    entity_name = node.get("name", entity)
+                    entity_type = node.get("labels", ["Unknown"])[0] if node.get("labels") else "Unknown"
+                    start_line = node.get("startLine", 1) or 1
+                    end_line = node.get("endLine", start_line + 10) or start_line + 10
+
+                    # Try to get actual code snippet
+                    snippet = node.get("sourceCode") or node.get("body")
+                    if not snippet and self.filesystem_client:
+                        try:
+                            # Translate Neo4j path to backend filesystem path
+                            # Neo4j stores: /app/repos/... but backend has: /codebase/...
+                            actual_file_path = file_path
+                            if file_path.startswith("/app/repos/"):
+                                actual_file_path = file_path.replace("/app/repos/", "/codebase/", 1)
+
+                            # Fetch the entity's lines (plus 5 lines of context)
+                            snippet = await self.filesystem_client.read_lines(
+                                actual_file_path, start_line, end_line + 5
+                            )
+                        except Exception as e:
+                            logger.debug(f"Could not read file {file_path}: {e}")
+
+                    # Add entity even without snippet (partial evidence)
+                    # Having file location is valuable for verification
+                    code_snippets_found.append({
+                        "file_path": file_path,
+                        "start_line": start_line,
+                        "end_line": end_line,
+                        "snippet": snippet[:500] if snippet else f"[Entity found: {entity_name} in {file_path}:{start_line}]",
+                        "entity_name": entity_name,
+                        "entity_type": entity_type,
+                        "members": node.get("members", []),
+                        "has_full_snippet": bool(snippet),  # Track if we have actual code
+                    })
 
-            # Search using patterns for additional evidence
-            for pattern in claim.search_patterns[:max_patterns]:
-                query = f"""
-                MATCH (n)
-                WHERE n.name =~ '(?i).*{pattern}.*' OR n.qualifiedName =~ '(?i).*{pattern}.*'
-                RETURN n.name as name, labels(n) as labels, n.filePath as filePath,
+            # Search using patterns for additional evidence (one UNWIND query)
+            patterns = claim.search_patterns[:max_patterns]
+            pattern_query = """
+                UNWIND $names AS pattern
+                CALL {
+                    WITH pattern
+                    MATCH (n)
+                    WHERE n.name =~ ('(?i).*' + pattern + '.*')
+                       OR n.qualifiedName =~ ('(?i).*' + pattern + '.*')
+                    RETURN n
+                    LIMIT $limit
+                }
+                RETURN pattern AS key, n.name as name, labels(n) as labels, n.filePath as filePath,
                        n.startLine as startLine, n.endLine as endLine,
                        n.sourceCode as sourceCode
-                LIMIT {results_limit}
-                """
-                try:
-                    result = await self.neo4j_client.query_code_structure(query)
-                    if result and result.get("nodes"):
-                        for node in result["nodes"][:2]:  # Limit pattern results
-                            file_path = node.get("filePath")
-                            if not file_path:
-                                continue
-                            snippet = node.get("sourceCode")
-                            entity_name = node.get("name", pattern)
-                            start_line = node.get("startLine", 1) or 1
-                            end_line = node.get("endLine", 10) or 10
-                            # Add entity even without snippet (partial evidence)
-                            code_snippets_found.append({
-                                "file_path": file_path,
-                                "start_line": start_line,
-                                "end_line": end_line,
-                                "snippet": snippet[:500] if snippet else f"[Pattern match: {entity_name} in {file_path}:{start_line}]",
-                                "entity_name": entity_name,
-                                "entity_type": node.get("labels", ["Code"])[0] if node.get("labels") else "Code",
-                                "has_full_snippet": bool(snippet),
-                            })
-                except Exception as e:
-                    logger.debug(f"Pattern search failed for '{pattern}': {e}")
+            """
+            try:
+                pattern_results = await self._cached_lookup(
+                    pattern_query, patterns, {"limit": results_limit}
+                )
+            except Exception as e:
+                logger.debug(f"Pattern search failed for {patterns}: {e}")
+                pattern_results = {}
+
+            for pattern, nodes in pattern_results.items():
+                for node in nodes[:2]:  # Limit pattern results
+                    file_path = node.get("filePath")
+                    if not file_path:
+                        continue
+                    snippet = node.get("sourceCode")
+                    entity_name = node.get("name", pattern)
+                    start_line = node.get("startLine", 1) or 1
+                    end_line = node.get("endLine", 10) or 10
+                    # Add entity even without snippet (partial evidence)
+                    code_snippets_found.append({
+                        "file_path": file_path,
+                        "start_line": start_line,
+                        "end_line": end_line,
+                        "snippet": snippet[:500] if snippet else f"[Pattern match: {entity_name} in {file_path}:{start_line}]",
+                        "entity_name": entity_name,
+                        "entity_type": node.get("labels", ["Code"])[0] if node.get("labels") else "Code",
+                        "has_full_snippet": bool(snippet),
+                    })
 
             # If we found code, use LLM to explain how it supports the claim
             if code_snippets_found:
@@ -857,6 +998,40 @@ IMPORTANT:
         except Exception as e:
             logger.warning(f"Claim verification failed: {e}")
 
+    async def _cached_lookup(
+        self,
+        cypher: str,
+        names: list[str],
+        parameters: dict[str, Any],
+    ) -> dict[str, list[dict]]:
+        """Run a per-name UNWIND query through the evidence cache.
+
+        Only names not yet looked up in this generation are sent to Neo4j;
+        concurrent claims asking for the same name share one in-flight query.
+        Failed lookups are not cached.
+        """
+        names = list(dict.fromkeys(name for name in names if name))
+        # Parameters shape the result too, so they are part of the key
+        params_key = json.dumps(parameters, sort_keys=True, default=str)
+        missing = [name for name in names if (cypher, params_key, name) not in self._lookup_cache]
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            pending = {name: loop.create_future() for name in missing}
+            for name, future in pending.items():
+                self._lookup_cache[(cypher, params_key, name)] = future
+            try:
+                fetched = await self.neo4j_client.query_by_names(cypher, missing, parameters)
+            except Exception:
+                for name, future in pending.items():
+                    self._lookup_cache.pop((cypher, params_key, name), None)
+                    future.set_result([])
+                raise
+            for name, future in pending.items():
+                future.set_result(fetched.get(name, []))
+
+        return {name: await self._lookup_cache[(cypher, params_key, name)] for name in names}
+
     async def _explain_code_evidence(self, claim_text: str, code_snippets: list[dict]) -> dict:
         """Use LLM to explain how code snippets support the claim."""
         if not code_snippets:
@@ -932,7 +1107,8 @@ Return as JSON:
         if previous_sections:
             prev_sections_text = "\n\n## Previously Generated Sections\n"
             for name, content in previous_sections.items():
-                prev_sections_text += f"\n### {name}\n{content[:500]}...\n"
+                excerpt = truncate_to_token_limit(content, PREVIOUS_SECTION_MAX_TOKENS)
+                prev_sections_text += f"\n### {name}\n{excerpt}\n"
 
         feedback_text = ""
         if feedback:
@@ -2286,25 +2462,35 @@ Remember to:
         try:
             logger.debug(f"[LLM] Sending prompt ({len(prompt)} chars), temp={self.temperature}")
 
-            # Build message options with consistency controls
-            message_options = {
-                "prompt": prompt,
-                "temperature": self.temperature,
-            }
+            # Consistency controls
+            options: dict[str, Any] = {"temperature": self.temperature}
 
             # Add seed if specified for reproducibility
             if self.seed is not None:
-                message_options["seed"] = self.seed
+                options["seed"] = self.seed
+
+            async def send() -> str:
+                # Borrow a session so concurrent claim verifications never
+                # interleave turns in one conversation
+                async with self._session_pool.acquire() as llm_session:
+                    if llm_session is None:
+                        return ""
+                    return await llm_gateway.send(
+                        llm_session, prompt, caller="orchestrator", timeout=timeout, options=options
+                    )
 
-            if hasattr(self.session, 'send_and_wait'):
-                event = await asyncio.wait_for(
-                    self.session.send_and_wait(message_options, timeout=timeout),
-                    timeout=timeout
-                )
-                if event:
-                    response = self._extract_response(event)
-                    logger.debug(f"[LLM] Response received ({len(response)} chars)")
-                    return response
+            response = await llm_response_cache.get_or_call(
+                "orchestrator",
+                prompt,
+                send,
+                model=self.llm_model,
+                context=self.cache_context,
+                options=options,
+                bypass=self.bypass_cache,
+            )
+            if response:
+                logger.debug(f"[LLM] Response received ({len(response)} chars)")
+                return response
 
             logger.warning("[LLM] No response from SDK")
             return self._generate_mock_response(prompt)
@@ -2316,28 +2502,6 @@ Remember to:
             logger.error(f"[LLM] Error: {e}")
             return self._generate_mock_response(prompt)
 
-    def _extract_response(self, event: Any) -> str:
-        """Extract text from SDK event."""
-        try:
-            if hasattr(event, 'data'):
-                data = event.data
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    return str(data.message.content)
-                if hasattr(data, 'content'):
-                    return str(data.content)
-                if hasattr(data, 'text'):
-                    return str(data.text)
-
-            if hasattr(event, 'content'):
-                return str(event.content)
-            if hasattr(event, 'text'):
-                return str(event.text)
-
-            return str(event)
-        except Exception as e:
-            logger.error(f"Error extracting response: {e}")
-            return ""
-
     def _extract_json(self, text: str) -> Optional[str]:
         """Extract JSON from text (handles markdown code blocks)."""
         import re
@@ -2666,6 +2830,7 @@ This is mock content generated because Copilot SDK is not available.
 
     async def cleanup(self) -> None:
         """Cleanup resources."""
+        await self._session_pool.close()
         logger.info("Orchestrator cleanup complete")
 
     # Compatibility methods for tests
@@ -2750,6 +2915,12 @@ class VerifiedBRDGenerator:
         claims_per_section: int = 5,
         default_section_words: Optional[int] = None,
         skip_verification: bool = False,
+        session_factory: Optional[SessionFactory] = None,
+        claim_concurrency: int = DEFAULT_CLAIM_VERIFICATION_CONCURRENCY,
+        section_concurrency: int = DEFAULT_SECTION_CONCURRENCY,
+        llm_model: Optional[str] = None,
+        cache_context: Optional[dict[str, Any]] = None,
+        bypass_cache: bool = False,
     ):
         self.orchestrator = MultiAgentOrchestrator(
             copilot_session=copilot_session,
@@ -2768,6 +2939,12 @@ class VerifiedBRDGenerator:
             claims_per_section=claims_per_section,
             default_section_words=default_section_words,
             skip_verification=skip_verification,
+            session_factory=session_factory,
+            claim_concurrency=claim_concurrency,
+            section_concurrency=section_concurrency,
+            llm_model=llm_model,
+            cache_context=cache_context,
+            bypass_cache=bypass_cache,
         )
         self._last_output: Optional[BRDOutput] = None
         self._skip_verification = skip_verification
@@ -0,0 +1,106 @@
+"""Bounded pool of Copilot SDK sessions for concurrent LLM calls.
+
+A Copilot session carries a single conversation, so concurrent callers
+sending through one session would interleave their turns. The pool hands
+each caller its own session, creating up to ``max_size`` sessions lazily
+through a factory and reusing idle ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SessionFactory = Callable[[], Awaitable[Any]]
+
+
+class CopilotSessionPool:
+    """Hands out Copilot sessions to at most ``max_size`` concurrent callers.
+
+    Sessions are created on demand through ``session_factory``, so a pool
+    never hands out a session that other pools or direct callers also use.
+    The base session is only a fallback: without a factory, or when the
+    factory fails before creating any session, callers are serialized on it.
+    """
+
+    def __init__(
+        self,
+        base_session: Any = None,
+        session_factory: Optional[SessionFactory] = None,
+        max_size: int = 4,
+    ):
+        """Initialize the pool.
+
+        Args:
+            base_session: Existing session to fall back on (not destroyed by close()).
+            session_factory: Async callable creating a new session.
+            max_size: Maximum number of sessions handed out at once.
+        """
+        self._base_session = base_session
+        self._session_factory = session_factory
+        self.max_size = max(1, max_size) if session_factory else 1
+        self._idle: asyncio.Queue[Any] = asyncio.Queue()
+        self._owned: list[Any] = []
+        self._size = 0
+
+        if base_session is not None and session_factory is None:
+            self._idle.put_nowait(base_session)
+            self._size = 1
+
+    @property
+    def size(self) -> int:
+        """Number of sessions currently in the pool."""
+        return self._size
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Borrow a session for the duration of the block.
+
+        Yields:
+            A Copilot session, or None if none could be created.
+        """
+        session = await self._checkout()
+        try:
+            yield session
+        finally:
+            if session is not None:
+                self._idle.put_nowait(session)
+
+    async def _checkout(self) -> Any:
+        """Take an idle session, creating one if the pool has room."""
+        if self._idle.empty() and self._session_factory and self._size < self.max_size:
+            self._size += 1
+            try:
+                session = await self._session_factory()
+                if session is None:
+                    raise RuntimeError("session factory returned no session")
+                self._owned.append(session)
+                logger.info(f"[SESSION-POOL] Created Copilot session ({self._size}/{self.max_size})")
+                return session
+            except Exception as e:
+                self._size -= 1
+                # Stop growing; callers share the sessions that already exist
+                self._session_factory = None
+                if self._size == 0 and self._base_session is not None:
+                    self._size = 1
+                    logger.warning(f"[SESSION-POOL] Failed to create session, using the base session: {e}")
+                    return self._base_session
+                logger.warning(f"[SESSION-POOL] Failed to create session, pool capped at {self._size}: {e}")
+
+        if self._size == 0:
+            return None
+        return await self._idle.get()
+
+    async def close(self) -> None:
+        """Destroy the sessions created by the pool."""
+        for session in self._owned:
+            try:
+                await session.destroy()
+            except Exception as e:
+                logger.warning(f"[SESSION-POOL] Error destroying session: {e}")
+        self._owned.clear()
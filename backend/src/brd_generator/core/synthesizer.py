@@ -8,7 +8,7 @@ import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ..models.context import AggregatedContext
 from ..models.output import (
@@ -20,6 +20,9 @@ from ..models.output import (
     JiraCreationResult,
 )
 from ..utils.logger import get_logger, get_progress_logger
+from .llm_cache import llm_response_cache
+from .llm_gateway import llm_gateway
+from .session_pool import CopilotSessionPool, SessionFactory
 from .brd_best_practices import (
     BRD_BEST_PRACTICES,
     DEFAULT_BRD_SECTIONS,
@@ -32,6 +35,8 @@ progress = get_progress_logger(__name__, "LLMSynthesizer")
 
 # Default timeout for LLM responses (5 minutes)
 LLM_TIMEOUT_SECONDS = 300
+# Maximum epics whose backlogs are generated at once
+DEFAULT_BACKLOG_EPIC_CONCURRENCY = int(os.getenv("BACKLOG_EPIC_CONCURRENCY", "4"))
 
 
 @dataclass
@@ -84,6 +89,10 @@ class LLMSynthesizer:
         templates_dir: Optional[Path] = None,
         model: str = "gpt-4o",  # Default to GPT-4o (works on all Copilot tiers)
         template_config: Optional[TemplateConfig] = None,
+        session_factory: Optional[SessionFactory] = None,
+        max_concurrency: int = DEFAULT_BACKLOG_EPIC_CONCURRENCY,
+        cache_context: Optional[dict[str, Any]] = None,
+        bypass_cache: bool = False,
     ):
         """
         Initialize the LLM Synthesizer.
@@ -93,6 +102,12 @@ class LLMSynthesizer:
             templates_dir: Directory containing template files
             model: LLM model to use
             template_config: Configuration for output templates
+            session_factory: Async callable creating extra Copilot sessions, so
+                per-epic backlog generation can run concurrently
+            max_concurrency: Maximum epics whose backlogs are generated at once
+            cache_context: Inputs that scope cached LLM responses (e.g.
+                repository ID and commit), so responses are not reused across them
+            bypass_cache: Ignore cached LLM responses and refresh them
 
         Note: MCP tools are available via the Copilot SDK session's mcp_servers config.
         """
@@ -101,6 +116,16 @@ class LLMSynthesizer:
         self.model = model
         self.template_config = template_config or TemplateConfig()
         self._copilot_available = session is not None
+        self.max_concurrency = max(1, max_concurrency)
+        self._session_pool = CopilotSessionPool(
+            session,
+            session_factory=session_factory,
+            max_size=self.max_concurrency,
+        )
+
+        # LLM responses are cached by prompt, model and context
+        self.cache_context = cache_context or {}
+        self.bypass_cache = bypass_cache
 
         # Load templates
         self._load_templates()
@@ -1026,19 +1051,39 @@ Generate 2-4 Epics that cover all requirements from the BRD.
         """
         progress.start_operation("LLM.generate_backlogs", f"From {len(epics)} Epics")
 
-        all_stories = []
-        for i, epic in enumerate(epics, 1):
-            progress.step("generate_backlogs", f"Generating stories for Epic {i}/{len(epics)}: {epic.id}", current=i, total=len(epics))
-
-            if use_skill and self._copilot_available:
-                prompt = self._build_backlogs_prompt(epic)
-                progress.info(f"Sending prompt for {epic.id} to LLM")
-                response = await self._send_to_llm(prompt)
-                stories = self._parse_stories_response(response, epic.id)
-            else:
-                stories = self._generate_basic_stories_for_epic(epic)
+        # Epics are generated concurrently; results keep the epic order
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        completed = 0
+
+        async def generate(epic: Epic) -> list[UserStory]:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    if use_skill and self._copilot_available:
+                        prompt = self._build_backlogs_prompt(epic)
+                        progress.info(f"Sending prompt for {epic.id} to LLM")
+                        response = await self._send_to_llm(prompt)
+                        stories = self._parse_stories_response(response, epic.id)
+                    else:
+                        stories = self._generate_basic_stories_for_epic(epic)
+                except Exception as e:
+                    # One failing epic must not discard the others' stories
+                    progress.error(f"Story generation failed for {epic.id}: {e}")
+                    stories = self._generate_basic_stories_for_epic(epic)
+
+            completed += 1
+            progress.step(
+                "generate_backlogs",
+                f"Generated {len(stories)} stories for Epic {epic.id} ({completed}/{len(epics)})",
+                current=completed,
+                total=len(epics),
+            )
+            return stories
+
+        results = await asyncio.gather(*(generate(epic) for epic in epics))
 
-            progress.info(f"Generated {len(stories)} stories for {epic.id}")
+        all_stories = []
+        for epic, stories in zip(epics, results):
             all_stories.extend(stories)
             epic.stories = [s.id for s in stories]
 
@@ -1638,17 +1683,18 @@ Report any errors encountered.
 
     async def cleanup(self):
         """Cleanup resources."""
-        pass  # Session cleanup is handled by the generator
+        # The base session is owned by the generator; only pooled extras are closed
+        await self._session_pool.close()
 
     async def _send_with_event_logging(self, prompt: str) -> str:
         """
         Send prompt to LLM via Copilot SDK with detailed event logging.
 
-        This method streams events from the SDK session to capture:
+        The prompt goes through the LLM gateway, which reports every session
+        event of the turn so that this method can log:
         - MCP tool invocations (Neo4j queries, file reads)
         - Tool results
         - LLM thinking/reasoning steps
-        - Final response
 
         Args:
             prompt: The prompt to send
@@ -1665,33 +1711,11 @@ Report any errors encountered.
         logger.info(f"[EVENT-STREAM] Prompt ({len(prompt)} chars):\n{prompt}")
         logger.info("=" * 80)
 
+        tool_calls: list[str] = []
         try:
-            message_options = {"prompt": prompt}
-
-            # Check if session supports event streaming
-            if hasattr(self.session, 'send_and_stream'):
-                logger.info("[EVENT-STREAM] Using send_and_stream for event capture")
-                return await self._stream_events(message_options)
-
-            elif hasattr(self.session, 'send_and_wait'):
-                # Use send_and_wait but try to get events
-                logger.info("[EVENT-STREAM] Using send_and_wait (limited event capture)")
-                event = await asyncio.wait_for(
-                    self.session.send_and_wait(message_options, timeout=LLM_TIMEOUT_SECONDS),
-                    timeout=LLM_TIMEOUT_SECONDS,
-                )
-
-                if event:
-                    self._log_event(event)
-                    return self._extract_from_event(event)
-                else:
-                    logger.warning("[EVENT-STREAM] No event received")
-                    return ""
-
-            else:
-                logger.warning("[EVENT-STREAM] No streaming method available")
-                return await self._send_to_llm(prompt)
-
+            final_response = await self._send_to_session(
+                prompt, on_event=lambda event: self._record_event(event, tool_calls)
+            )
         except asyncio.TimeoutError:
             logger.error(f"[EVENT-STREAM] Timeout after {LLM_TIMEOUT_SECONDS}s")
             return self._generate_mock_response(prompt)
@@ -1701,41 +1725,6 @@ Report any errors encountered.
             logger.error(f"[EVENT-STREAM] Traceback:\n{traceback.format_exc()}")
             return self._generate_mock_response(prompt)
 
-    async def _stream_events(self, message_options: dict) -> str:
-        """Stream events from SDK and log each one."""
-        final_response = ""
-        tool_calls = []
-
-        try:
-            async for event in self.session.send_and_stream(message_options):
-                event_type = type(event).__name__
-                logger.info(f"[EVENT] Type: {event_type}")
-
-                # Log event details
-                self._log_event(event)
-
-                # Track tool calls
-                if self._is_tool_call_event(event):
-                    tool_info = self._extract_tool_call_info(event)
-                    if tool_info:
-                        tool_calls.append(tool_info)
-                        logger.info(f"[MCP-TOOL-CALL] {tool_info}")
-
-                # Track tool results
-                if self._is_tool_result_event(event):
-                    result_info = self._extract_tool_result_info(event)
-                    if result_info:
-                        logger.info(f"[MCP-TOOL-RESULT] {result_info[:500]}...")
-
-                # Accumulate final response
-                if self._is_content_event(event):
-                    content = self._extract_content_from_event(event)
-                    if content:
-                        final_response += content
-
-        except Exception as e:
-            logger.error(f"[EVENT-STREAM] Error during streaming: {e}")
-
         logger.info("=" * 80)
         logger.info(f"[EVENT-STREAM] Complete. Tool calls made: {len(tool_calls)}")
         for i, tc in enumerate(tool_calls, 1):
@@ -1745,6 +1734,27 @@ Report any errors encountered.
 
         return final_response
 
+    def _record_event(self, event: Any, tool_calls: list[str]) -> None:
+        """Log one session event and collect the tool calls it reports."""
+        event_type = type(event).__name__
+        logger.info(f"[EVENT] Type: {event_type}")
+
+        # Log event details
+        self._log_event(event)
+
+        # Track tool calls
+        if self._is_tool_call_event(event):
+            tool_info = self._extract_tool_call_info(event)
+            if tool_info:
+                tool_calls.append(tool_info)
+                logger.info(f"[MCP-TOOL-CALL] {tool_info}")
+
+        # Track tool results
+        if self._is_tool_result_event(event):
+            result_info = self._extract_tool_result_info(event)
+            if result_info:
+                logger.info(f"[MCP-TOOL-RESULT] {result_info[:500]}...")
+
     def _log_event(self, event: Any) -> None:
         """Log details of a session event."""
         try:
@@ -1816,16 +1826,6 @@ Report any errors encountered.
         except Exception:
             return False
 
-    def _is_content_event(self, event: Any) -> bool:
-        """Check if event contains content."""
-        try:
-            if hasattr(event, 'data'):
-                data = event.data
-                return hasattr(data, 'content') or hasattr(data, 'text')
-            return False
-        except Exception:
-            return False
-
     def _extract_tool_call_info(self, event: Any) -> Optional[str]:
         """Extract tool call information from event."""
         try:
@@ -1850,19 +1850,6 @@ Report any errors encountered.
         except Exception:
             return None
 
-    def _extract_content_from_event(self, event: Any) -> Optional[str]:
-        """Extract content from event."""
-        try:
-            if hasattr(event, 'data'):
-                data = event.data
-                if hasattr(data, 'content'):
-                    return str(data.content)
-                if hasattr(data, 'text'):
-                    return str(data.text)
-            return None
-        except Exception:
-            return None
-
     def _create_mock_brd(self, feature_request: str) -> "BRDDocument":
         """Create a mock BRD when SDK is not available."""
         from datetime import datetime
@@ -1901,10 +1888,7 @@ Report any errors encountered.
             progress.info(f"Sending prompt to LLM ({len(prompt)} chars, timeout={LLM_TIMEOUT_SECONDS}s)")
 
             # Send message using SDK session with correct MessageOptions format
-            response = await asyncio.wait_for(
-                self._send_to_session(prompt),
-                timeout=LLM_TIMEOUT_SECONDS,
-            )
+            response = await self._send_to_session(prompt)
 
             if response:
                 logger.info(f"[LLM-RESPONSE] Received response ({len(response)} chars)")
@@ -1925,106 +1909,47 @@ Report any errors encountered.
             logger.error(f"[LLM-ERROR] Copilot call failed: {e}")
             return self._generate_mock_response(prompt)
 
-    async def _send_to_session(self, prompt: str) -> str:
-        """Send message to Copilot SDK session using correct API."""
-        try:
-            # Build MessageOptions with prompt key
-            message_options = {"prompt": prompt}
-            logger.info("[SDK-SESSION] Building message options for Copilot SDK")
-            progress.debug(f"Building message options for Copilot SDK")
-
-            # Use send_and_wait for synchronous response (it's async)
-            if hasattr(self.session, 'send_and_wait'):
-                logger.info("[SDK-SESSION] Calling session.send_and_wait()...")
-                progress.info("Calling session.send_and_wait()...")
-                # send_and_wait is an async method - await it directly
-                event = await self.session.send_and_wait(message_options, timeout=LLM_TIMEOUT_SECONDS)
-
-                if event:
-                    # Extract content from SessionEvent
-                    logger.info(f"[SDK-SESSION] Received event type: {type(event).__name__}")
-                    logger.info(f"[SDK-SESSION] Event attributes: {dir(event)}")
-                    progress.debug(f"Received event type: {type(event).__name__}")
-                    return self._extract_from_event(event)
-                else:
-                    logger.warning("[SDK-SESSION] send_and_wait returned None")
-                    progress.warning("send_and_wait returned None")
-
-            # Fallback to send() method
-            if hasattr(self.session, 'send'):
-                progress.info("Using fallback send() method...")
-                # send() is also async
-                message_id = await self.session.send(message_options)
-                progress.info(f"Message sent, ID: {message_id}")
-
-                # Wait for response by polling get_messages
-                return await self._wait_for_response(message_id)
-
-            progress.error("No suitable send method found on session")
-            return ""
+    async def _send_to_session(
+        self,
+        prompt: str,
+        on_event: Optional[Callable[[Any], None]] = None,
+    ) -> str:
+        """Send message to Copilot SDK session through the shared LLM gateway.
 
+        Args:
+            prompt: The prompt to send
+            on_event: Called with each session event of the turn (not on cache hits)
+        """
+        try:
+            progress.info("Sending prompt through LLM gateway...")
+
+            async def send() -> str:
+                # Concurrent callers each borrow their own session
+                async with self._session_pool.acquire() as llm_session:
+                    if llm_session is None:
+                        return ""
+                    return await llm_gateway.send(
+                        llm_session,
+                        prompt,
+                        caller="synthesizer",
+                        timeout=LLM_TIMEOUT_SECONDS,
+                        on_event=on_event,
+                    )
+
+            return await llm_response_cache.get_or_call(
+                "synthesizer",
+                prompt,
+                send,
+                model=self.model,
+                context=self.cache_context,
+                bypass=self.bypass_cache,
+            )
+        except asyncio.TimeoutError:
+            raise
         except Exception as e:
             progress.error(f"Error sending to Copilot session: {e}")
             raise
 
-    def _extract_from_event(self, event: Any) -> str:
-        """Extract text content from a SessionEvent."""
-        try:
-            if hasattr(event, 'data'):
-                data = event.data
-                # Check for message content
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    return str(data.message.content)
-                if hasattr(data, 'content'):
-                    return str(data.content)
-                if hasattr(data, 'text'):
-                    return str(data.text)
-
-            # Try direct attributes
-            if hasattr(event, 'content'):
-                return str(event.content)
-            if hasattr(event, 'text'):
-                return str(event.text)
-
-            # Convert to string as last resort
-            logger.warning(f"Unknown event format: {type(event)}")
-            return str(event)
-
-        except Exception as e:
-            logger.error(f"Error extracting from event: {e}")
-            return ""
-
-    async def _wait_for_response(self, message_id: str) -> str:
-        """Wait for a response to a sent message by polling get_messages."""
-        start_time = asyncio.get_event_loop().time()
-        poll_interval = 1.0
-
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > LLM_TIMEOUT_SECONDS:
-                logger.warning("Timeout waiting for response")
-                return ""
-
-            try:
-                messages = self.session.get_messages()
-                # Look for a response event
-                for msg in reversed(messages):
-                    if hasattr(msg, 'data'):
-                        data = msg.data
-                        # Check if this is a response to our message
-                        if hasattr(data, 'message_type') and 'assistant' in str(data.message_type).lower():
-                            return self._extract_from_event(msg)
-                        if hasattr(data, 'role') and data.role == 'assistant':
-                            return self._extract_from_event(msg)
-                        # Check for completion event
-                        if hasattr(data, 'type') and 'completion' in str(data.type).lower():
-                            return self._extract_from_event(msg)
-
-            except Exception as e:
-                logger.warning(f"Error polling messages: {e}")
-
-            await asyncio.sleep(poll_interval)
-
     def _generate_mock_response(self, prompt: str) -> str:
         """Generate mock response for testing without LLM."""
         if "business requirements" in prompt.lower() or "brd" in prompt.lower():
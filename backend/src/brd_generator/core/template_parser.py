@@ -12,6 +12,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+from .llm_gateway import llm_gateway
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,6 +30,7 @@ class BRDSection:
     examples: list[str] = field(default_factory=list)  # Example content from template
     is_required: bool = True
     is_diagram: bool = False  # Whether this section expects a diagram
+    depends_on: list[str] = field(default_factory=list)  # Earlier sections this one builds on
 
 
 @dataclass
@@ -128,6 +130,8 @@ Parse this template and extract:
    - Example content if provided
    - Whether it's required or optional
    - Whether it expects a diagram (Mermaid, PlantUML, etc.)
+   - Which earlier sections it builds on (e.g. a summary or acceptance criteria
+     derived from the requirements); leave empty if it stands on its own
 
 ## Output Format (JSON):
 
@@ -148,7 +152,8 @@ Parse this template and extract:
       "format_hints": ["Use bullet points", "Include table"],
       "examples": ["Example content from template"],
       "is_required": true,
-      "is_diagram": false
+      "is_diagram": false,
+      "depends_on": ["Names of earlier sections whose content this section summarizes or derives from"]
     }}
   ]
 }}
@@ -205,77 +210,13 @@ Output ONLY valid JSON, no other text.
             return ""
 
         try:
-            import asyncio
-
-            message_options = {"prompt": prompt}
             logger.info(f"Sending template parsing prompt to LLM ({len(prompt)} chars)")
-
-            # Use send_and_wait if available
-            if hasattr(self.session, 'send_and_wait'):
-                event = await asyncio.wait_for(
-                    self.session.send_and_wait(message_options, timeout=120),
-                    timeout=120
-                )
-                if event:
-                    return self._extract_from_event(event)
-
-            # Fallback to send()
-            if hasattr(self.session, 'send'):
-                await self.session.send(message_options)
-                return await self._wait_for_response(120)
-
-            return ""
+            return await llm_gateway.send(self.session, prompt, caller="template_parser", timeout=120)
 
         except Exception as e:
-            logger.error(f"LLM call failed: {e}")
+            logger.error(f"LLM call failed: {type(e).__name__}: {e}")
             return ""
 
-    def _extract_from_event(self, event: Any) -> str:
-        """Extract text content from a Copilot event."""
-        try:
-            if hasattr(event, 'data'):
-                data = event.data
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    return str(data.message.content)
-                if hasattr(data, 'content'):
-                    return str(data.content)
-                if hasattr(data, 'text'):
-                    return str(data.text)
-
-            if hasattr(event, 'content'):
-                return str(event.content)
-            if hasattr(event, 'text'):
-                return str(event.text)
-
-            return str(event)
-        except Exception as e:
-            logger.error(f"Error extracting from event: {e}")
-            return ""
-
-    async def _wait_for_response(self, timeout: float) -> str:
-        """Wait for LLM response by polling messages."""
-        import asyncio
-
-        start_time = asyncio.get_event_loop().time()
-        poll_interval = 1.0
-
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
-                return ""
-
-            try:
-                messages = self.session.get_messages()
-                for msg in reversed(messages):
-                    if hasattr(msg, 'data'):
-                        data = msg.data
-                        if hasattr(data, 'role') and data.role == 'assistant':
-                            return self._extract_from_event(msg)
-            except Exception:
-                pass
-
-            await asyncio.sleep(poll_interval)
-
     def _parse_llm_response(
         self,
         response: str,
@@ -316,6 +257,7 @@ Output ONLY valid JSON, no other text.
                     examples=section_data.get("examples", []),
                     is_required=section_data.get("is_required", True),
                     is_diagram=section_data.get("is_diagram", False),
+                    depends_on=section_data.get("depends_on") or [],
                 )
                 template.sections.append(section)
 
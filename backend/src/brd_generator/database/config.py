@@ -6,6 +6,9 @@ import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -112,7 +115,8 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
 async def init_db() -> None:
     """Initialize database tables.
 
-    Creates all tables defined in the models.
+    Creates all tables defined in the models, then any model indexes
+    missing from tables that already existed.
     """
     from .models import Base
 
@@ -120,10 +124,34 @@ async def init_db() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_missing_indexes)
 
     logger.info("Database tables initialized")
 
 
+# Indexes replaced by a renamed successor (ix_brds_created -> ix_brds_created_id)
+RETIRED_INDEXES = ("ix_brds_created",)
+
+
+def create_missing_indexes(connection: Connection) -> None:
+    """Create model indexes that existing tables do not have yet.
+
+    ``create_all`` skips tables that already exist, so indexes added to a
+    model later never reach deployed databases. ``IF NOT EXISTS`` makes this
+    a no-op for indexes already present. An index whose columns change must
+    be given a new name to be picked up, and its old name added to
+    ``RETIRED_INDEXES`` so the superseded index is dropped.
+    """
+    from .models import Base
+
+    for name in RETIRED_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            connection.execute(CreateIndex(index, if_not_exists=True))
+
+
 async def close_db() -> None:
     """Close database connections."""
     global _engine, _session_factory
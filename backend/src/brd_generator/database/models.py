@@ -19,6 +19,7 @@ from sqlalchemy import (
     ForeignKey,
     JSON,
     Index,
+    LargeBinary,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, relationship, Mapped, mapped_column
@@ -847,7 +848,7 @@ class BRDDB(Base):
     # Indexes
     __table_args__ = (
         Index("ix_brds_repo_status", "repository_id", "status"),
-        Index("ix_brds_created", "created_at"),
+        Index("ix_brds_created_id", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -957,6 +958,7 @@ class EpicDB(Base):
     __table_args__ = (
         Index("ix_epics_brd_status", "brd_id", "status"),
         Index("ix_epics_priority", "priority"),
+        Index("ix_epics_created", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -1057,6 +1059,7 @@ class BacklogDB(Base):
         Index("ix_backlogs_epic_status", "epic_id", "status"),
         Index("ix_backlogs_type", "item_type"),
         Index("ix_backlogs_priority", "priority"),
+        Index("ix_backlogs_created", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -1307,3 +1310,122 @@ class WikiPageDB(Base):
 
     def __repr__(self) -> str:
         return f"<WikiPageDB(id={self.id}, slug={self.slug}, type={self.page_type})>"
+
+
+# =============================================================================
+# LLM Response Cache
+# =============================================================================
+
+class LLMResponseCacheDB(Base):
+    """Cached LLM response, addressed by a digest of its inputs.
+
+    The key hashes the prompt, model, generation options and the caller's
+    context (e.g. repository and commit), so identical requests reuse the
+    stored response instead of calling the LLM again.
+    """
+    __tablename__ = "llm_response_cache"
+
+    # SHA-256 of the request inputs
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    caller: Mapped[str] = mapped_column(String(100), nullable=False)
+    model: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    response: Mapped[str] = mapped_column(Text, nullable=False)
+    prompt_chars: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Usage tracking for TTL/LRU eviction
+    hit_count: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+    )
+    last_accessed_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+    )
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_llm_response_cache_expires", "expires_at"),
+        Index("ix_llm_response_cache_accessed", "last_accessed_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<LLMResponseCacheDB(key={self.key[:12]}, caller={self.caller})>"
+
+
+# =============================================================================
+# Materialized Feature Flows
+# =============================================================================
+
+class MaterializedFeatureFlowDB(Base):
+    """Feature flow traced once per code graph version for one entry point.
+
+    Written by the post-analysis materialization job for every entry point
+    found by ``FIND_ENTRY_POINTS``, under each name a caller may use for it
+    (entity ID, name and file path), so flow endpoints read it by key
+    instead of re-tracing the graph.
+    """
+    __tablename__ = "materialized_feature_flows"
+
+    # SHA-256 of graph version and entry point alias
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    # Code graph version (analyzed repositories and commits) the flow was traced at
+    graph_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    entry_point: Mapped[str] = mapped_column(Text, nullable=False)
+    entity_id: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+
+    # zlib-compressed FeatureFlow JSON
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_materialized_feature_flows_version", "graph_version"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<MaterializedFeatureFlowDB(entry_point={self.entry_point[:40]}, version={self.graph_version[:12]})>"
+
+
+# =============================================================================
+# Codebase Statistics
+# =============================================================================
+
+class CodebaseStatisticsDB(Base):
+    """Codebase statistics snapshot for one repository at one commit.
+
+    Served by ``/repositories/{id}/statistics`` until a newer analysis run
+    completes or the repository moves to another commit.
+    """
+    __tablename__ = "codebase_statistics"
+
+    repository_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("repositories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Empty when the repository has no recorded commit
+    commit_sha: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    # Completed analysis run the snapshot was computed after
+    analysis_run_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), nullable=True)
+
+    # CodebaseStatistics JSON
+    statistics: Mapped[dict] = mapped_column(JSON, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<CodebaseStatisticsDB(repository_id={self.repository_id}, commit={self.commit_sha[:12]})>"
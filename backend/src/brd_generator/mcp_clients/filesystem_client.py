@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
@@ -11,6 +15,52 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Total size of file contents kept by the snippet cache
+DEFAULT_FILE_CACHE_MAX_BYTES = int(os.getenv("FILESYSTEM_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# How long a cached file is trusted before its mtime is checked again
+DEFAULT_FILE_CACHE_REVALIDATE_SECONDS = float(os.getenv("FILESYSTEM_CACHE_REVALIDATE_SECONDS", "5"))
+# Concurrent requests per batch read (read_files / read_multiple_files)
+DEFAULT_READ_CONCURRENCY = int(os.getenv("FILESYSTEM_READ_CONCURRENCY", "8"))
+# Total content returned by one batch read
+DEFAULT_BATCH_MAX_BYTES = int(os.getenv("FILESYSTEM_BATCH_MAX_BYTES", str(8 * 1024 * 1024)))
+
+# Metadata fields the server may use for the modification time
+_MTIME_FIELDS = ("mtime", "mtimeMs", "modified", "modifiedAt", "modified_time", "lastModified")
+
+
+@dataclass
+class _CachedFile:
+    """File content with the start offset of every line."""
+
+    content: str
+    line_offsets: list[int]
+    version: Optional[str]
+    commit: Optional[str]
+    checked_at: float
+
+    @classmethod
+    def build(cls, content: str, version: Optional[str], commit: Optional[str]) -> "_CachedFile":
+        offsets = [0]
+        pos = content.find("\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = content.find("\n", pos + 1)
+        return cls(content, offsets, version, commit, time.monotonic())
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_offsets)
+
+    def lines(self, start: int, end: int) -> str:
+        """Return lines ``start``..``end`` (1-based, inclusive), clamped to the file."""
+        start = max(1, start)
+        end = min(self.line_count, end)
+        if start > end:
+            return ""
+        begin = self.line_offsets[start - 1]
+        stop = self.line_offsets[end] - 1 if end < self.line_count else len(self.content)
+        return self.content[begin:stop]
+
 
 class FilesystemMCPClient(MCPClient):
     """
@@ -24,6 +74,10 @@ class FilesystemMCPClient(MCPClient):
         server_url: Optional[str] = None,
         workspace_root: Optional[Path] = None,
         timeout: int = 30,
+        cache_max_bytes: int = DEFAULT_FILE_CACHE_MAX_BYTES,
+        cache_revalidate_seconds: float = DEFAULT_FILE_CACHE_REVALIDATE_SECONDS,
+        read_concurrency: int = DEFAULT_READ_CONCURRENCY,
+        batch_max_bytes: int = DEFAULT_BATCH_MAX_BYTES,
     ):
         """
         Initialize Filesystem MCP client.
@@ -32,6 +86,10 @@ class FilesystemMCPClient(MCPClient):
             server_url: MCP server URL (defaults to env FILESYSTEM_MCP_URL)
             workspace_root: Root path for codebase
             timeout: Request timeout in seconds
+            cache_max_bytes: Size budget of the file snippet cache (0 disables it)
+            cache_revalidate_seconds: Age after which a cached file's mtime is rechecked
+            read_concurrency: Concurrent requests per batch read
+            batch_max_bytes: Default total content budget of one batch read
         """
         url = server_url or os.getenv("FILESYSTEM_MCP_URL", "http://localhost:3004")
         super().__init__(
@@ -43,6 +101,19 @@ class FilesystemMCPClient(MCPClient):
         codebase_root = os.getenv("CODEBASE_ROOT", str(Path.cwd()))
         self.workspace_root = workspace_root or Path(codebase_root)
 
+        # LRU cache of file contents backing read_lines()/read_file_cached()
+        self.cache_max_bytes = max(0, cache_max_bytes)
+        self.cache_revalidate_seconds = cache_revalidate_seconds
+        self._file_cache: OrderedDict[str, _CachedFile] = OrderedDict()
+        self._file_cache_bytes = 0
+        self._pending_reads: dict[str, asyncio.Future] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Batch reads run concurrently over the pooled HTTP client
+        self.read_concurrency = max(1, read_concurrency)
+        self.batch_max_bytes = batch_max_bytes
+
     async def connect(self) -> None:
         """Initialize connection."""
         logger.info(f"Filesystem MCP client connecting to: {self.server_url}")
@@ -149,13 +220,12 @@ class FilesystemMCPClient(MCPClient):
         files = result.get("files", [])
 
         if include_content:
-            # Fetch content for each file
-            for i, file_path in enumerate(files):
-                try:
-                    content = await self._read_file(file_path)
-                    files[i] = {"path": file_path, "content": content}
-                except Exception as e:
-                    files[i] = {"path": file_path, "error": str(e)}
+            contents, errors = await self._read_batch(files)
+            files = [
+                {"path": file_path, "content": contents[file_path]} if file_path in contents
+                else {"path": file_path, "error": errors[file_path]}
+                for file_path in files
+            ]
 
         return files
 
@@ -164,16 +234,84 @@ class FilesystemMCPClient(MCPClient):
         resolved_path = self._resolve_path(path)
         return await self._http_post("/metadata", {"path": resolved_path})
 
-    async def _read_multiple_files(self, paths: list[str]) -> dict[str, str]:
-        """Batch read multiple files."""
-        results = {}
-        for path in paths:
-            try:
-                content = await self._read_file(path)
-                results[path] = content
-            except Exception as e:
-                results[path] = f"Error: {str(e)}"
-        return results
+    async def _read_multiple_files(
+        self,
+        paths: list[str],
+        max_bytes: Optional[int] = None,
+    ) -> dict[str, str]:
+        """Batch read multiple files; failures are reported as "Error: ..." content."""
+        contents, errors = await self._read_batch(paths, max_bytes=max_bytes)
+        return {
+            path: contents[path] if path in contents else f"Error: {errors[path]}"
+            for path in dict.fromkeys(paths)
+        }
+
+    async def _read_batch(
+        self,
+        paths: list[str],
+        commit: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Read files concurrently under a total byte budget.
+
+        Files are read ``read_concurrency`` at a time. The budget is applied
+        in request order: a file that does not fit is skipped and reported as
+        an error, and reads not yet started once the budget is spent are not
+        issued.
+
+        Args:
+            paths: Files to read (duplicates are read once)
+            commit: Read through the snippet cache, trusting entries at this commit
+            max_bytes: Total UTF-8 bytes returned (defaults to batch_max_bytes)
+
+        Returns:
+            (contents, errors), both keyed by path in request order
+        """
+        budget = self.batch_max_bytes if max_bytes is None else max_bytes
+        unique_paths = list(dict.fromkeys(p for p in paths if p))
+        semaphore = asyncio.Semaphore(self.read_concurrency)
+        bytes_read = 0
+
+        async def read(path: str) -> tuple[Optional[str], Optional[str]]:
+            nonlocal bytes_read
+            async with semaphore:
+                if bytes_read >= budget:
+                    return None, None
+                try:
+                    if commit is not None:
+                        content = (await self._get_cached_file(path, commit)).content
+                    else:
+                        content = await self._read_file(path)
+                except Exception as e:
+                    return None, str(e) or type(e).__name__
+            content = content or ""
+            # Only content that can still fit counts towards stopping early
+            size = len(content.encode("utf-8"))
+            if bytes_read + size <= budget:
+                bytes_read += size
+            return content, None
+
+        results = await asyncio.gather(*(read(path) for path in unique_paths))
+
+        contents: dict[str, str] = {}
+        errors: dict[str, str] = {}
+        remaining = budget
+        for path, (content, error) in zip(unique_paths, results):
+            if error is not None:
+                errors[path] = error
+                continue
+            size = len(content.encode("utf-8")) if content is not None else None
+            if size is None or size > remaining:
+                errors[path] = f"skipped: batch byte budget of {budget} bytes exhausted"
+                continue
+            contents[path] = content
+            remaining -= size
+
+        logger.debug(
+            f"[FS-BATCH] Read {len(contents)}/{len(unique_paths)} files "
+            f"({budget - remaining} bytes, {len(errors)} errors)"
+        )
+        return contents, errors
 
     async def _list_directory(self, path: str = "") -> list[dict[str, Any]]:
         """List directory contents."""
@@ -202,10 +340,163 @@ class FilesystemMCPClient(MCPClient):
         """Get file metadata."""
         return await self.call_tool("get_file_metadata", {"path": path})
 
-    async def read_multiple_files(self, paths: list[str]) -> dict[str, str]:
+    async def read_multiple_files(
+        self,
+        paths: list[str],
+        max_bytes: Optional[int] = None,
+    ) -> dict[str, str]:
         """Batch read multiple files."""
-        return await self.call_tool("read_multiple_files", {"paths": paths})
+        return await self.call_tool("read_multiple_files", {"paths": paths, "max_bytes": max_bytes})
+
+    async def read_files(
+        self,
+        paths: list[str],
+        commit: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Read many files concurrently, keeping per-file errors.
+
+        Args:
+            paths: File paths (absolute or relative to the workspace root)
+            commit: Commit the caller expects; reads go through the snippet
+                cache (see read_lines)
+            max_bytes: Total content budget (defaults to batch_max_bytes)
+
+        Returns:
+            (contents, errors): file contents and error messages, keyed by path
+        """
+        if not self._connected:
+            raise MCPToolError("Filesystem MCP client not connected")
+        logger.info(f"[MCP-TOOL] Filesystem batch read: {len(paths)} files")
+        return await self._read_batch(paths, commit=commit, max_bytes=max_bytes)
 
     async def list_directory(self, path: str = "") -> list[dict[str, Any]]:
         """List directory contents."""
         return await self.call_tool("list_directory", {"path": path})
+
+    async def read_lines(
+        self,
+        path: str,
+        start: int,
+        end: int,
+        commit: Optional[str] = None,
+    ) -> str:
+        """Read a line range of a file through the snippet cache.
+
+        Args:
+            path: File path (absolute or relative to the workspace root)
+            start: First line (1-based, inclusive)
+            end: Last line (inclusive); clamped to the file length
+            commit: Commit the caller expects; a cached copy read at the same
+                commit is used without asking the server
+
+        Returns:
+            The requested lines joined by newlines
+        """
+        entry = await self._get_cached_file(path, commit)
+        return entry.lines(start, end)
+
+    async def read_file_cached(self, path: str, commit: Optional[str] = None) -> str:
+        """Read a whole file through the snippet cache (see read_lines)."""
+        entry = await self._get_cached_file(path, commit)
+        return entry.content
+
+    def invalidate_cache(self, path: Optional[str] = None) -> None:
+        """Drop one file, or the whole snippet cache."""
+        if path is None:
+            self._file_cache.clear()
+            self._file_cache_bytes = 0
+            return
+        entry = self._file_cache.pop(self._resolve_path(path), None)
+        if entry is not None:
+            self._file_cache_bytes -= len(entry.content)
+
+    def cache_stats(self) -> dict[str, int]:
+        """Snippet cache counters."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "files": len(self._file_cache),
+            "bytes": self._file_cache_bytes,
+        }
+
+    async def _get_cached_file(self, path: str, commit: Optional[str]) -> _CachedFile:
+        """Return a fresh cache entry, downloading the file on a miss.
+
+        Concurrent misses for the same file share one download.
+        """
+        key = self._resolve_path(path)
+        entry = self._file_cache.get(key)
+        if entry is not None and await self._is_fresh(key, entry, commit):
+            self._file_cache.move_to_end(key)
+            self._cache_hits += 1
+            return entry
+
+        pending = self._pending_reads.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        self._cache_misses += 1
+        pending = asyncio.get_running_loop().create_future()
+        self._pending_reads[key] = pending
+        try:
+            # Take the version stamp before reading so a concurrent write
+            # shows up as a changed mtime on the next check
+            version = None if commit else await self._file_version(key)
+            content = await self.read_file(path)
+            entry = _CachedFile.build(content or "", version, commit)
+            self._store_cached_file(key, entry)
+            pending.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as e:
+            pending.set_exception(e)
+            # Waiters re-raise it; mark retrieved so an unshared failure is not logged
+            pending.exception()
+            raise
+        finally:
+            self._pending_reads.pop(key, None)
+
+    async def _is_fresh(self, key: str, entry: _CachedFile, commit: Optional[str]) -> bool:
+        """Check a cache entry against the caller's commit or the file mtime."""
+        if commit is not None:
+            return entry.commit == commit
+
+        if time.monotonic() - entry.checked_at < self.cache_revalidate_seconds:
+            return True
+
+        version = await self._file_version(key)
+        if version is None or version != entry.version:
+            return False
+        entry.checked_at = time.monotonic()
+        return True
+
+    async def _file_version(self, resolved_path: str) -> Optional[str]:
+        """Version stamp (mtime and size) from the server's file metadata."""
+        try:
+            metadata = await self._get_file_metadata(resolved_path)
+        except Exception as e:
+            logger.debug(f"Could not stat {resolved_path}: {e}")
+            return None
+
+        mtime = next((metadata[f] for f in _MTIME_FIELDS if metadata.get(f) is not None), None)
+        if mtime is None:
+            return None
+        return f"{mtime}:{metadata.get('size', '')}"
+
+    def _store_cached_file(self, key: str, entry: _CachedFile) -> None:
+        """Insert an entry and evict least recently used files over budget."""
+        previous = self._file_cache.pop(key, None)
+        if previous is not None:
+            self._file_cache_bytes -= len(previous.content)
+        size = len(entry.content)
+        if size > self.cache_max_bytes:
+            return
+
+        self._file_cache[key] = entry
+        self._file_cache_bytes += size
+        while self._file_cache_bytes > self.cache_max_bytes:
+            _, evicted = self._file_cache.popitem(last=False)
+            self._file_cache_bytes -= len(evicted.content)
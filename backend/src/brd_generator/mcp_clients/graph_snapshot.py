@@ -0,0 +1,548 @@
+"""In-memory snapshot of the code graph for local traversals.
+
+Call chains, caller lookups, seed expansion and deep dependency traversal
+walk the same CALLS / HAS_METHOD / USES edges over and over, each time as
+a variable-length Cypher pattern. A ``GraphSnapshot`` holds the named nodes
+and their relationships compactly so these walks run in process:
+
+- nodes get dense integer ids; names, labels, paths and signatures are
+  interned, numeric properties live in ``array`` columns
+- relationships are stored CSR-style in both directions: per node an
+  offset into flat target and relationship-type-code arrays, so a
+  neighbour scan is a slice filtered by type code
+
+Snapshots are tagged with the graph version (the analyzed repositories'
+commits, see ``GRAPH_VERSION``) and kept in a ``GraphSnapshotCache``: a
+memory-accounted LRU shared by all clients, so a re-analysis loads a new
+snapshot and the superseded one is evicted. When no snapshot is loaded the
+callers run their Cypher queries.
+
+The client answers the registered queries listed in ``SNAPSHOT_QUERIES``
+from the snapshot (same parameters, same row shape), so call sites keep
+binding prepared queries as before.
+
+Only named nodes are loaded (like the name index), so paths through
+unnamed nodes are not followed. Traversals return the shortest depth per
+reached node (one row per node) where the Cypher versions return one row
+per path.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sys
+from array import array
+from collections import OrderedDict, deque
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Memory budget for all cached snapshots
+DEFAULT_SNAPSHOT_MAX_BYTES = int(float(os.getenv("NEO4J_GRAPH_SNAPSHOT_MAX_MB", "512")) * 1024 * 1024)
+
+# Relationship types followed by call chains (as in GET_METHOD_CALL_CHAIN)
+CALL_CHAIN_TYPES = ("CALLS", "INVOKES", "HAS_METHOD")
+
+# Relationship types followed by caller lookups (as in GET_CALLERS_OF)
+CALLER_TYPES = ("CALLS", "IMPORTS", "USES_COMPONENT", "DEPENDS_ON")
+
+OUTGOING = "out"
+INCOMING = "in"
+BOTH = "both"
+
+
+class GraphSnapshotBuilder:
+    """Accumulates streamed node and relationship records into a snapshot."""
+
+    def __init__(self):
+        self._positions: dict[str, int] = {}
+        self._strings: dict[str, str] = {}
+        self._label_sets: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self.names: list[str] = []
+        self.entity_ids: list[Optional[str]] = []
+        self.labels: list[tuple[str, ...]] = []
+        self.paths: list[Optional[str]] = []
+        self.signatures: list[Optional[str]] = []
+        self.page_ranks = array("d")
+        self.start_lines = array("i")
+        self.end_lines = array("i")
+        self.types: dict[str, int] = {}
+        self.sources = array("I")
+        self.targets = array("I")
+        self.codes = array("H")
+
+    def _intern(self, value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return None
+        return self._strings.setdefault(value, value)
+
+    def add_node(self, record: dict[str, Any]) -> None:
+        """Add a ``GRAPH_SNAPSHOT_NODES`` row."""
+        name = record.get("name")
+        if not isinstance(name, str) or record["id"] in self._positions:
+            return
+        self._positions[record["id"]] = len(self.names)
+        self.names.append(self._intern(name))
+        self.entity_ids.append(record.get("entityId") if isinstance(record.get("entityId"), str) else None)
+        labels = tuple(self._intern(label) for label in record.get("labels") or ())
+        self.labels.append(self._label_sets.setdefault(labels, labels))
+        self.paths.append(self._intern(record.get("path")))
+        self.signatures.append(self._intern(record.get("signature")))
+        rank = record.get("pageRank")
+        self.page_ranks.append(float(rank) if isinstance(rank, (int, float)) else math.nan)
+        self.start_lines.append(_line(record.get("startLine")))
+        self.end_lines.append(_line(record.get("endLine")))
+
+    def add_relationship(self, source: str, target: str, rel_type: str) -> bool:
+        """Add a relationship between two added nodes; returns False if either is unknown."""
+        start = self._positions.get(source)
+        end = self._positions.get(target)
+        if start is None or end is None:
+            return False
+        self.sources.append(start)
+        self.targets.append(end)
+        self.codes.append(self.types.setdefault(rel_type, len(self.types)))
+        return True
+
+    def build(self, version: str = "") -> "GraphSnapshot":
+        """Freeze into a snapshot (CPU-bound; run it off the event loop)."""
+        return GraphSnapshot(self, version)
+
+
+class GraphSnapshot:
+    """Immutable, compact code graph with local traversals."""
+
+    def __init__(self, builder: GraphSnapshotBuilder, version: str = ""):
+        self.version = version
+        self.names = builder.names
+        self.labels = builder.labels
+        self.paths = builder.paths
+        self.signatures = builder.signatures
+        self.entity_ids = builder.entity_ids
+        self.page_ranks = builder.page_ranks
+        self.start_lines = builder.start_lines
+        self.end_lines = builder.end_lines
+        self.type_codes = dict(builder.types)
+
+        node_count = len(self.names)
+        self._out_offsets, self._out_targets, self._out_codes = _csr(
+            node_count, builder.sources, builder.targets, builder.codes
+        )
+        self._in_offsets, self._in_targets, self._in_codes = _csr(
+            node_count, builder.targets, builder.sources, builder.codes
+        )
+        self._by_name: dict[str, list[int]] = {}
+        for node, name in enumerate(self.names):
+            self._by_name.setdefault(name, []).append(node)
+        self._by_entity = {
+            entity_id: node for node, entity_id in enumerate(self.entity_ids) if entity_id
+        }
+        self.nbytes = self._measure(builder)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def relationship_count(self) -> int:
+        return len(self._out_targets)
+
+    def _measure(self, builder: GraphSnapshotBuilder) -> int:
+        """Approximate resident size in bytes."""
+        arrays = (
+            self.page_ranks, self.start_lines, self.end_lines,
+            self._out_offsets, self._out_targets, self._out_codes,
+            self._in_offsets, self._in_targets, self._in_codes,
+        )
+        size = sum(a.itemsize * len(a) for a in arrays)
+        size += sum(sys.getsizeof(s) for s in builder._strings.values())
+        size += sum(sys.getsizeof(s) for s in self.entity_ids if s)
+        size += sum(sys.getsizeof(labels) for labels in builder._label_sets.values())
+        # List slots and lookup dicts
+        size += 8 * 5 * len(self.names)
+        size += sys.getsizeof(self._by_name) + sys.getsizeof(self._by_entity)
+        size += sum(sys.getsizeof(nodes) for nodes in self._by_name.values())
+        return size
+
+    # -------------------------------------------------------------------------
+    # Primitives
+    # -------------------------------------------------------------------------
+
+    def nodes_named(self, names: Iterable[str]) -> list[int]:
+        """Nodes whose name equals one of ``names``."""
+        return [node for name in names for node in self._by_name.get(name, ())]
+
+    def node_for_entity(self, entity_id: str) -> Optional[int]:
+        return self._by_entity.get(entity_id)
+
+    def page_rank(self, node: int, default: Optional[float] = 0.1) -> Optional[float]:
+        """PageRank, or ``default`` when the node has none (COALESCE semantics)."""
+        rank = self.page_ranks[node]
+        return default if math.isnan(rank) else rank
+
+    def node_type(self, node: int) -> Optional[str]:
+        """First label, as ``labels(n)[0]``."""
+        labels = self.labels[node]
+        return labels[0] if labels else None
+
+    def _codes(self, rel_types: Optional[Iterable[str]]) -> Optional[set[int]]:
+        if rel_types is None:
+            return None
+        return {self.type_codes[t] for t in rel_types if t in self.type_codes}
+
+    def neighbors(
+        self,
+        node: int,
+        rel_types: Optional[Iterable[str]] = None,
+        direction: str = OUTGOING,
+    ) -> list[int]:
+        """Adjacent nodes over ``rel_types`` (all types when None)."""
+        return list(self._neighbors(node, self._codes(rel_types), direction))
+
+    def _neighbors(self, node: int, codes: Optional[set[int]], direction: str):
+        sides = []
+        if direction in (OUTGOING, BOTH):
+            sides.append((self._out_offsets, self._out_targets, self._out_codes))
+        if direction in (INCOMING, BOTH):
+            sides.append((self._in_offsets, self._in_targets, self._in_codes))
+        for offsets, targets, edge_codes in sides:
+            for edge in range(offsets[node], offsets[node + 1]):
+                if codes is None or edge_codes[edge] in codes:
+                    yield targets[edge]
+
+    def bfs(
+        self,
+        starts: Iterable[int],
+        rel_types: Optional[Iterable[str]] = None,
+        direction: str = OUTGOING,
+        max_depth: int = 1,
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        """
+        Bounded breadth-first search.
+
+        Args:
+            starts: Start nodes (never reported as reached)
+            rel_types: Relationship types to follow (all when None)
+            direction: ``out``, ``in`` or ``both``
+            max_depth: Maximum number of hops
+
+        Returns:
+            (depth per reached node, BFS parent per reached node)
+        """
+        codes = self._codes(rel_types)
+        if codes is not None and not codes:
+            return {}, {}
+        start_set = set(starts)
+        depths: dict[int, int] = {}
+        parents: dict[int, int] = {}
+        frontier = deque((node, 0) for node in start_set)
+        while frontier:
+            node, depth = frontier.popleft()
+            if depth >= max_depth:
+                continue
+            for neighbor in self._neighbors(node, codes, direction):
+                if neighbor in start_set or neighbor in depths:
+                    continue
+                depths[neighbor] = depth + 1
+                parents[neighbor] = node
+                frontier.append((neighbor, depth + 1))
+        return depths, parents
+
+    # -------------------------------------------------------------------------
+    # Local equivalents of the traversal queries
+    # -------------------------------------------------------------------------
+
+    def callers_of(self, name: str, max_depth: int, limit: int = 150) -> list[dict[str, Any]]:
+        """Rows of ``GET_CALLERS_OF``: upstream callers by depth, then PageRank."""
+        depths, _ = self.bfs(self.nodes_named([name]), CALLER_TYPES, INCOMING, max_depth)
+        rows = [
+            {
+                "name": self.names[node],
+                "type": self.node_type(node),
+                "path": self.paths[node],
+                "depth": depth,
+                "pageRank": self.page_rank(node),
+            }
+            for node, depth in depths.items()
+        ]
+        rows.sort(key=lambda row: (row["depth"], -row["pageRank"]))
+        return rows[:limit]
+
+    def expand_from_seeds(
+        self,
+        seed_names: list[str],
+        max_hops: int,
+        min_pagerank: float,
+        per_seed_limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """Rows of ``EXPAND_FROM_SEEDS``: neighbourhood of each seed, by PageRank."""
+        rows = []
+        for seed in self.nodes_named(dict.fromkeys(seed_names)):
+            depths, parents = self.bfs([seed], None, BOTH, max_hops)
+            connected = [
+                node for node in depths if self.page_rank(node) >= min_pagerank
+            ]
+            connected.sort(key=lambda node: -self.page_rank(node))
+            for node in connected[:per_seed_limit]:
+                path = [node]
+                while path[-1] != seed:
+                    path.append(parents[path[-1]])
+                rows.append({
+                    "seedName": self.names[seed],
+                    "name": self.names[node],
+                    "type": self.node_type(node),
+                    "path": self.paths[node],
+                    "pageRank": self.page_rank(node, default=None),
+                    "distance": depths[node],
+                    "pathNodes": [self.names[n] for n in reversed(path)],
+                })
+        rows.sort(key=lambda row: -(row["pageRank"] if row["pageRank"] is not None else -math.inf))
+        return rows
+
+    def call_chain(
+        self,
+        entity_id: str,
+        direction: str,
+        max_depth: int,
+    ) -> Optional[list[dict[str, Any]]]:
+        """
+        Rows of ``GET_METHOD_CALL_CHAIN`` (downstream) or ``GET_UPSTREAM_CALL_CHAIN``.
+
+        Returns:
+            Rows ordered by depth, or None if the entity is not in the snapshot
+        """
+        entry = self.node_for_entity(entity_id)
+        if entry is None:
+            return None
+        upstream = direction == "upstream"
+        depths, _ = self.bfs([entry], CALL_CHAIN_TYPES, INCOMING if upstream else OUTGOING, max_depth)
+        has_method = self._codes(["HAS_METHOD"])
+
+        rows = []
+        for node, depth in sorted(depths.items(), key=lambda item: item[1]):
+            parents = list(self._neighbors(node, has_method, INCOMING)) or [None]
+            for parent in parents:
+                parent_name = self.names[parent] if parent is not None else None
+                rows.append({
+                    "nodeId": self.entity_ids[node],
+                    "name": self.names[node],
+                    "type": self.node_type(node),
+                    "filePath": self.paths[node],
+                    "startLine": _optional_line(self.start_lines[node]),
+                    "endLine": _optional_line(self.end_lines[node]),
+                    "signature": self.signatures[node] or "",
+                    "parentClass": parent_name,
+                    "depth": depth,
+                    "layer": _call_chain_layer(
+                        self.labels[node], self.names[node], parent_name, upstream
+                    ),
+                })
+        return rows
+
+    def reachable(
+        self,
+        start_names: list[str],
+        max_depth: int,
+        labels: Iterable[str],
+        name_contains: Iterable[str] = (),
+        name_excludes: Iterable[str] = (),
+        limit: Optional[int] = None,
+    ) -> list[tuple[int, int]]:
+        """
+        Nodes reachable downstream over any relationship type.
+
+        Equivalent to ``(start)-[*1..max_depth]->(target)`` with ``start.name
+        IN start_names``, a label filter, and lowercase name filters (contains
+        any of ``name_contains`` if given, none of ``name_excludes``). Start
+        names themselves are not returned.
+
+        Returns:
+            (node, depth) pairs ordered by depth
+        """
+        wanted = set(labels)
+        includes = [term.lower() for term in name_contains]
+        excludes = [term.lower() for term in name_excludes]
+        start_names = set(start_names)
+        depths, _ = self.bfs(self.nodes_named(start_names), None, OUTGOING, max_depth)
+
+        matches = []
+        for node, depth in sorted(depths.items(), key=lambda item: item[1]):
+            name = self.names[node]
+            lowered = name.lower()
+            if name in start_names or wanted.isdisjoint(self.labels[node]):
+                continue
+            if includes and not any(term in lowered for term in includes):
+                continue
+            if any(term in lowered for term in excludes):
+                continue
+            matches.append((node, depth))
+            if limit is not None and len(matches) >= limit:
+                break
+        return matches
+
+
+class GraphSnapshotCache:
+    """LRU of graph snapshots bounded by their accounted memory."""
+
+    def __init__(self, max_bytes: int = DEFAULT_SNAPSHOT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._snapshots: OrderedDict[Hashable, GraphSnapshot] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(snapshot.nbytes for snapshot in self._snapshots.values())
+
+    def get(self, key: Hashable) -> Optional[GraphSnapshot]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            self.misses += 1
+            return None
+        self._snapshots.move_to_end(key)
+        self.hits += 1
+        return snapshot
+
+    def put(self, key: Hashable, snapshot: GraphSnapshot) -> bool:
+        """Cache a snapshot, evicting least recently used ones to stay in budget."""
+        if snapshot.nbytes > self.max_bytes:
+            logger.warning(
+                f"[GRAPH-SNAPSHOT] Snapshot of {snapshot.nbytes / 1e6:.0f}MB exceeds the "
+                f"{self.max_bytes / 1e6:.0f}MB budget; not cached"
+            )
+            return False
+        self._snapshots.pop(key, None)
+        self._snapshots[key] = snapshot
+        while self.nbytes > self.max_bytes:
+            evicted_key, _ = self._snapshots.popitem(last=False)
+            self.evictions += 1
+            logger.info(f"[GRAPH-SNAPSHOT] Evicted snapshot {evicted_key}")
+        return True
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "snapshots": len(self._snapshots),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def _csr(node_count: int, sources: array, targets: array, codes: array) -> tuple[array, array, array]:
+    """Group edges by source into offset / target / type-code arrays."""
+    offsets = array("I", bytes(4 * (node_count + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+
+    cursor = array("I", offsets)
+    grouped_targets = array("I", bytes(4 * len(targets)))
+    grouped_codes = array("H", bytes(2 * len(codes)))
+    for source, target, code in zip(sources, targets, codes):
+        slot = cursor[source]
+        grouped_targets[slot] = target
+        grouped_codes[slot] = code
+        cursor[source] = slot + 1
+    return offsets, grouped_targets, grouped_codes
+
+
+def _line(value: Any) -> int:
+    return int(value) if isinstance(value, (int, float)) else -1
+
+
+def _optional_line(value: int) -> Optional[int]:
+    return value if value >= 0 else None
+
+
+def _call_chain_layer(
+    labels: tuple[str, ...],
+    name: str,
+    parent_name: Optional[str],
+    upstream: bool,
+) -> str:
+    """The ``layer`` CASE of the call chain queries."""
+    lowered = name.lower()
+    owner = (parent_name or name).lower()
+    if "JSPPage" in labels:
+        return "UI"
+    if "WebFlowDefinition" in labels or (not upstream and "FlowState" in labels):
+        return "Flow"
+    if lowered.endswith("action") or (not upstream and lowered.endswith("controller")):
+        return "Controller"
+    if "dao" in owner or (not upstream and "repository" in owner):
+        return "DAO"
+    if "service" in owner or (not upstream and "builder" in owner):
+        return "Service"
+    return "Unknown"
+
+
+def _traversal_rows(
+    snapshot: GraphSnapshot,
+    matches: list[tuple[int, int]],
+    description: str,
+    relationship: str,
+    distance: Optional[int] = None,
+) -> list[dict[str, Any]]:
+    """Rows shaped like the ``TRAVERSE_*`` queries' results."""
+    return [
+        {
+            "name": snapshot.names[node],
+            "type": snapshot.node_type(node),
+            "path": snapshot.paths[node],
+            "description": description,
+            "distance": depth if distance is None else distance,
+            "relationship": relationship,
+        }
+        for node, depth in matches
+    ]
+
+
+# Registered queries answerable from a snapshot:
+# query name -> (snapshot, depth variant, parameters) -> rows, or None to use Cypher
+SNAPSHOT_QUERIES: dict[str, Callable[[GraphSnapshot, Optional[int], dict[str, Any]], Optional[list]]] = {
+    "GET_CALLERS_OF": lambda s, depth, p: s.callers_of(p["name"], depth),
+    "EXPAND_FROM_SEEDS": lambda s, depth, p: s.expand_from_seeds(
+        p["seedNames"], depth, p["minPagerank"]
+    ),
+    "GET_METHOD_CALL_CHAIN": lambda s, depth, p: s.call_chain(p["methodId"], "downstream", depth),
+    "GET_UPSTREAM_CALL_CHAIN": lambda s, depth, p: s.call_chain(p["methodId"], "upstream", depth),
+    "TRAVERSE_DEEP_CHAIN": lambda s, depth, p: _traversal_rows(
+        s,
+        s.reachable(
+            p["entryNames"], 4, ["JavaClass", "JavaInterface", "SpringService"],
+            name_excludes=["test"], limit=200,
+        ),
+        "Deep chain component", "DEEP_CHAIN",
+    ),
+    "TRAVERSE_UTILITIES": lambda s, depth, p: _traversal_rows(
+        s,
+        s.reachable(
+            p["entryNames"], 3, ["JavaClass", "SpringService"],
+            name_contains=["util", "helper", "converter", "formatter", "builder"],
+            name_excludes=["test"], limit=500,
+        ),
+        "Utility/Helper class", "UTILITY", distance=3,
+    ),
+    "TRAVERSE_ENTITIES": lambda s, depth, p: _traversal_rows(
+        s,
+        s.reachable(
+            p["entryNames"], 4, ["JavaClass"],
+            name_contains=["entity", "model", "dto", "vo"],
+            name_excludes=["test", "builder"], limit=500,
+        ),
+        "Entity/Model class", "ENTITY", distance=3,
+    ),
+}
+
+
+# Shared cache used by all Neo4j clients
+graph_snapshots = GraphSnapshotCache()
@@ -0,0 +1,157 @@
+"""In-process trigram index over code graph node names.
+
+Entry-point discovery and keyword search used to match components with
+``toLower(n.name) CONTAINS '...'``. Neo4j cannot serve that predicate from
+an index across many labels, so every such query scanned and lowercased
+every candidate node. ``NameIndex`` answers the same substring question in
+memory: each lowercase name is split into trigrams, a term is looked up
+through its rarest trigram and the few candidates are verified with a plain
+``in`` check. Searches return element ids, ordered by PageRank, which the
+callers then fetch with ``elementId(n) IN $ids`` (a direct node seek).
+
+File paths are indexed the same way over the distinct paths only, since
+many nodes share one file.
+
+The index covers the whole graph database and is tagged with a graph
+version built from the ``IndexState`` nodes that the analyzer writes per
+repository, so the client rebuilds it when any repository is re-analyzed.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from typing import Any, Iterable, Optional
+
+# Shortest term that can be answered from trigram postings; shorter terms
+# are checked against every key
+TRIGRAM_LENGTH = 3
+
+# Rank of nodes without a pageRank, as in the queries' COALESCE(n.pageRank, 0.1)
+DEFAULT_PAGERANK = 0.1
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + TRIGRAM_LENGTH] for i in range(len(text) - TRIGRAM_LENGTH + 1)}
+
+
+class _SubstringIndex:
+    """Trigram postings over a list of lowercase keys."""
+
+    def __init__(self, keys: list[str]):
+        self.keys = keys
+        postings: dict[str, array] = {}
+        for position, key in enumerate(keys):
+            for trigram in _trigrams(key):
+                posting = postings.get(trigram)
+                if posting is None:
+                    posting = postings[trigram] = array("I")
+                posting.append(position)
+        self._postings = postings
+
+    def find(self, term: str) -> list[int]:
+        """Positions of the keys containing ``term`` (already lowercase)."""
+        if len(term) < TRIGRAM_LENGTH:
+            return [position for position, key in enumerate(self.keys) if term in key]
+
+        rarest = None
+        for trigram in _trigrams(term):
+            posting = self._postings.get(trigram)
+            if posting is None:
+                return []
+            if rarest is None or len(posting) < len(rarest):
+                rarest = posting
+        return [position for position in rarest if term in self.keys[position]]
+
+
+class NameIndex:
+    """Substring search over node names (and optionally file paths)."""
+
+    def __init__(self, records: Iterable[dict[str, Any]], version: str = ""):
+        """
+        Build the index.
+
+        Args:
+            records: Rows with ``id`` (element id), ``name``, ``labels``,
+                ``path`` and ``pageRank``, as returned by ``NAME_INDEX_NODES``
+            version: Graph version the records were read at
+        """
+        self.version = version
+        self._ids: list[str] = []
+        self._labels: list[frozenset[str]] = []
+        self._ranks = array("d")
+        names: list[str] = []
+        path_positions: dict[str, int] = {}
+        path_nodes: list[list[int]] = []
+        label_sets: dict[tuple[str, ...], frozenset[str]] = {}
+
+        for record in records:
+            name = record.get("name")
+            if not isinstance(name, str) or not name:
+                continue
+            node = len(self._ids)
+            self._ids.append(record["id"])
+            labels = tuple(record.get("labels") or ())
+            self._labels.append(label_sets.setdefault(labels, frozenset(labels)))
+            rank = record.get("pageRank")
+            self._ranks.append(float(rank) if rank is not None else DEFAULT_PAGERANK)
+            names.append(name.lower())
+
+            path = record.get("path")
+            if isinstance(path, str) and path:
+                path = path.lower()
+                position = path_positions.get(path)
+                if position is None:
+                    position = path_positions[path] = len(path_nodes)
+                    path_nodes.append([])
+                path_nodes[position].append(node)
+
+        self._names = _SubstringIndex(names)
+        self._paths = _SubstringIndex(list(path_positions))
+        self._path_nodes = path_nodes
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def path_count(self) -> int:
+        return len(self._path_nodes)
+
+    def search(
+        self,
+        terms: Iterable[str],
+        labels: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        include_paths: bool = False,
+    ) -> list[str]:
+        """
+        Element ids of nodes whose name contains any of ``terms``.
+
+        Equivalent to ``ANY(t IN terms WHERE toLower(n.name) CONTAINS t)``.
+
+        Args:
+            terms: Substrings to look for (matched case-insensitively)
+            labels: Only return nodes carrying at least one of these labels
+            limit: Maximum ids returned, highest PageRank first
+            include_paths: Also match ``toLower(n.filePath) CONTAINS t``
+
+        Returns:
+            Matching element ids ordered by PageRank descending
+        """
+        wanted = frozenset(labels) if labels is not None else None
+        matched: set[int] = set()
+        for term in {t.lower() for t in terms if t}:
+            matched.update(self._names.find(term))
+            if include_paths:
+                for position in self._paths.find(term):
+                    matched.update(self._path_nodes[position])
+
+        if wanted is not None:
+            matched = {node for node in matched if not self._labels[node].isdisjoint(wanted)}
+
+        ranks = self._ranks
+        if limit is not None and limit < len(matched):
+            ranked = heapq.nsmallest(limit, matched, key=lambda node: (-ranks[node], node))
+        else:
+            ranked = sorted(matched, key=lambda node: (-ranks[node], node))
+        return [self._ids[node] for node in ranked]
@@ -2,28 +2,85 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
-from typing import Any, Optional
+import time
+from typing import Any, AsyncIterator, Optional
 
-from neo4j import AsyncGraphDatabase
+from neo4j import READ_ACCESS, AsyncGraphDatabase
 
 from .base import MCPClient, MCPToolError
+from .graph_snapshot import (
+    SNAPSHOT_QUERIES,
+    GraphSnapshot,
+    GraphSnapshotBuilder,
+    GraphSnapshotCache,
+    graph_snapshots,
+)
+from .name_index import NameIndex
+from .query_metrics import QueryMetrics, format_profile, query_metrics, query_name_for
+from ..queries.registry import QUERY_REGISTRY, get_query
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum names sent in one UNWIND batch (keeps parameter payloads bounded)
+DEFAULT_NAME_BATCH_SIZE = 500
+
+# Records pulled from the server per round-trip while consuming a result
+DEFAULT_FETCH_SIZE = int(os.getenv("NEO4J_FETCH_SIZE", "1000"))
+
+# Resolve name-substring searches through the in-process name index
+DEFAULT_NAME_INDEX_ENABLED = os.getenv("NEO4J_NAME_INDEX_ENABLED", "true").lower() == "true"
+# Seconds between graph-version checks (name index and graph snapshots)
+DEFAULT_GRAPH_VERSION_REFRESH_SECONDS = float(os.getenv("NEO4J_GRAPH_VERSION_REFRESH_SECONDS", "60"))
+# Maximum element ids a name search hands to the follow-up query
+DEFAULT_NAME_SEARCH_LIMIT = 5000
+
+# Answer traversal queries from an in-memory graph snapshot when one is loaded
+DEFAULT_GRAPH_SNAPSHOT_ENABLED = os.getenv("NEO4J_GRAPH_SNAPSHOT_ENABLED", "false").lower() == "true"
+
+# Labels searched by search_similar_features (as in SEARCH_SIMILAR_FEATURES)
+SIMILAR_FEATURE_LABELS = [
+    "JavaClass", "JavaInterface", "SpringService", "SpringController",
+    "JSPPage", "WebFlowDefinition", "FlowState", "FlowAction",
+    "SQLTable", "RestEndpoint",
+]
+
+
+async def _read_records(tx, cypher_query: str, parameters: dict[str, Any]) -> list[dict[str, Any]]:
+    """Transaction function: run a query and materialize its records."""
+    result = await tx.run(cypher_query, parameters)
+    return await result.data()
+
+
+async def _profile_plan(tx, cypher_query: str, parameters: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Transaction function: run a query under PROFILE and return its plan."""
+    result = await tx.run(f"PROFILE {cypher_query}", parameters)
+    summary = await result.consume()
+    return summary.profile
+
 
 class Neo4jMCPClient(MCPClient):
     """
     Client for Neo4j code graph queries.
 
-    Uses direct bolt connection for reliable access to Neo4j.
+    Uses direct bolt connection for reliable access to Neo4j. All code
+    graph queries are read-only, so they run as managed read transactions
+    (routed to read replicas in a cluster and retried on transient errors).
     """
 
     def __init__(
         self,
         server_url: Optional[str] = None,
         timeout: int = 30,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        metrics: Optional[QueryMetrics] = None,
+        name_index_enabled: bool = DEFAULT_NAME_INDEX_ENABLED,
+        graph_version_refresh_seconds: float = DEFAULT_GRAPH_VERSION_REFRESH_SECONDS,
+        graph_snapshot_enabled: bool = DEFAULT_GRAPH_SNAPSHOT_ENABLED,
+        snapshot_cache: Optional[GraphSnapshotCache] = None,
     ):
         """
         Initialize Neo4j client.
@@ -31,6 +88,15 @@ class Neo4jMCPClient(MCPClient):
         Args:
             server_url: Neo4j bolt URI (defaults to env NEO4J_URI)
             timeout: Request timeout in seconds
+            fetch_size: Records fetched per round-trip (defaults to env NEO4J_FETCH_SIZE)
+            metrics: Query metrics sink (defaults to the shared ``query_metrics``)
+            name_index_enabled: Use the in-process name index for name searches
+                (defaults to env NEO4J_NAME_INDEX_ENABLED)
+            graph_version_refresh_seconds: Seconds between graph-version checks
+                (defaults to env NEO4J_GRAPH_VERSION_REFRESH_SECONDS)
+            graph_snapshot_enabled: Answer traversal queries from an in-memory
+                graph snapshot (defaults to env NEO4J_GRAPH_SNAPSHOT_ENABLED)
+            snapshot_cache: Snapshot cache (defaults to the shared ``graph_snapshots``)
         """
         self.neo4j_uri = server_url or os.getenv("NEO4J_URI", "bolt://localhost:7687")
         self.neo4j_user = os.getenv("NEO4J_USER", "neo4j")
@@ -43,7 +109,27 @@ class Neo4jMCPClient(MCPClient):
             timeout=timeout,
         )
 
+        self.fetch_size = fetch_size
+        self.metrics = metrics or query_metrics
         self._driver = None
+        self._profile_tasks: set[asyncio.Task] = set()
+
+        self.graph_version_refresh_seconds = graph_version_refresh_seconds
+        self._graph_version: Optional[str] = None
+        self._graph_version_checked_at = float("-inf")
+
+        self.name_index_enabled = name_index_enabled
+        self._name_index: Optional[NameIndex] = None
+        self._name_index_failed_at = float("-inf")
+        self._name_index_lock = asyncio.Lock()
+
+        self.graph_snapshot_enabled = graph_snapshot_enabled
+        self.graph_snapshots = snapshot_cache or graph_snapshots
+        self._snapshot_lock = asyncio.Lock()
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._snapshot_failed_at = float("-inf")
+        # Key of a snapshot too large for the cache; not reloaded until the version changes
+        self._snapshot_oversized_key: Optional[tuple[str, str, str]] = None
 
     async def connect(self) -> None:
         """Initialize bolt connection."""
@@ -67,10 +153,19 @@ class Neo4jMCPClient(MCPClient):
 
     async def disconnect(self) -> None:
         """Close connection."""
+        for task in list(self._profile_tasks):
+            task.cancel()
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
         if self._driver:
             await self._driver.close()
             self._driver = None
         self._connected = False
+        self._name_index = None
+        self._name_index_failed_at = float("-inf")
+        self._graph_version = None
+        self._graph_version_checked_at = float("-inf")
         logger.info("Neo4j client disconnected")
 
     async def health_check(self) -> bool:
@@ -106,6 +201,346 @@ class Neo4jMCPClient(MCPClient):
         """
         return await self._query_code_structure(cypher_query, parameters)
 
+    async def stream_query(
+        self,
+        cypher_query: str,
+        parameters: Optional[dict[str, Any]] = None,
+        fetch_size: Optional[int] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream records of a read-only Cypher query.
+
+        Records are pulled from the server in batches of ``fetch_size`` as
+        the caller iterates, so memory stays bounded for large traversals.
+        Unlike ``query_code_structure`` the transaction is not retried: a
+        failure after records have been yielded is raised to the caller.
+
+        Example:
+            async for record in client.stream_query(query, {"names": names}):
+                process(record)
+
+        Args:
+            cypher_query: The Cypher query to execute
+            parameters: Optional query parameters
+            fetch_size: Records per round-trip (defaults to the client setting)
+
+        Yields:
+            One dict per result record
+        """
+        if not self._driver:
+            raise MCPToolError("Neo4j not connected")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[NEO4J-STREAM] {cypher_query}")
+            logger.debug(f"[NEO4J-STREAM] Parameters: {parameters}")
+
+        name = query_name_for(cypher_query)
+        started = time.perf_counter()
+        count = 0
+        try:
+            async with self._read_session(fetch_size) as session:
+                async with await session.begin_transaction() as tx:
+                    result = await tx.run(cypher_query, parameters or {})
+                    async for record in result:
+                        count += 1
+                        yield record.data()
+        except Exception as e:
+            self.metrics.record_error(name)
+            logger.error(f"[NEO4J-STREAM] Cypher query failed after {count} records: {e}")
+            raise MCPToolError(f"Query failed: {e}")
+
+        self._observe(name, cypher_query, parameters, started, count)
+        logger.debug(f"[NEO4J-STREAM] Streamed {count} records")
+
+    async def query_by_names(
+        self,
+        cypher_query: str,
+        names: list[str],
+        parameters: Optional[dict[str, Any]] = None,
+        key_field: str = "key",
+        batch_size: int = DEFAULT_NAME_BATCH_SIZE,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Execute a batched per-name lookup in a single round-trip.
+
+        The query receives the de-duplicated names as ``$names`` and is
+        expected to ``UNWIND $names AS <var>`` and return the originating
+        name in the ``key_field`` column. Records are demultiplexed back to
+        their name; the key column itself is stripped from each record.
+
+        Example:
+            UNWIND $names AS name
+            MATCH (n:JSPPage) WHERE n.name = name
+            RETURN name AS key, n.filePath AS filePath
+
+        Args:
+            cypher_query: UNWIND-based Cypher query using ``$names``
+            names: Names to look up (blanks and duplicates are ignored)
+            parameters: Additional query parameters
+            key_field: Result column holding the originating name
+            batch_size: Maximum names sent per query; larger lists are chunked
+
+        Returns:
+            Dict mapping every requested name to its list of result records
+            (empty list when nothing matched), in request order
+        """
+        unique_names = list(dict.fromkeys(n for n in names if n))
+        grouped: dict[str, list[dict[str, Any]]] = {name: [] for name in unique_names}
+        if not unique_names:
+            return grouped
+
+        for offset in range(0, len(unique_names), max(1, batch_size)):
+            chunk = unique_names[offset:offset + max(1, batch_size)]
+            result = await self.query_code_structure(
+                cypher_query, {**(parameters or {}), "names": chunk}
+            )
+            for record in result.get("nodes", []):
+                key = record.get(key_field)
+                if key in grouped:
+                    grouped[key].append(
+                        {k: v for k, v in record.items() if k != key_field}
+                    )
+
+        return grouped
+
+    async def graph_version(self, refresh: bool = False) -> str:
+        """
+        Fingerprint of the analyzed repositories' commits (``GRAPH_VERSION``).
+
+        Re-read at most every ``graph_version_refresh_seconds`` unless
+        ``refresh`` is set; it changes whenever a repository is re-analyzed.
+        """
+        now = time.monotonic()
+        if (
+            not refresh
+            and self._graph_version is not None
+            and now - self._graph_version_checked_at < self.graph_version_refresh_seconds
+        ):
+            return self._graph_version
+        records = await self._read(get_query("GRAPH_VERSION").text)
+        self._graph_version = "|".join(records[0].get("states") or []) if records else ""
+        self._graph_version_checked_at = now
+        return self._graph_version
+
+    async def get_name_index(self) -> Optional[NameIndex]:
+        """
+        The name index for the current graph version.
+
+        The index is rebuilt when the graph version changes. After a failed
+        build, no rebuild is attempted for ``graph_version_refresh_seconds``.
+
+        Returns:
+            The index, or None when disabled, not connected or not buildable
+        """
+        if not self.name_index_enabled or not self._driver:
+            return None
+
+        async with self._name_index_lock:
+            try:
+                version = await self.graph_version()
+                if self._name_index is not None and self._name_index.version == version:
+                    return self._name_index
+                if time.monotonic() - self._name_index_failed_at < self.graph_version_refresh_seconds:
+                    return self._name_index
+                self._name_index = await self._build_name_index(version)
+            except Exception as e:
+                self._name_index_failed_at = time.monotonic()
+                logger.warning(f"[NAME-INDEX] Name index unavailable, using scans: {e}")
+            return self._name_index
+
+    async def _build_name_index(self, version: str) -> NameIndex:
+        """Read every named node and build the index off the event loop."""
+        started = time.perf_counter()
+        records = [record async for record in self.stream_query(get_query("NAME_INDEX_NODES").text)]
+        index = await asyncio.to_thread(NameIndex, records, version)
+        logger.info(
+            f"[NAME-INDEX] Indexed {len(index)} names across {index.path_count} files "
+            f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return index
+
+    async def search_names(
+        self,
+        terms: list[str],
+        labels: Optional[list[str]] = None,
+        limit: int = DEFAULT_NAME_SEARCH_LIMIT,
+        include_paths: bool = False,
+    ) -> Optional[list[str]]:
+        """
+        Element ids of nodes whose name contains any of ``terms``.
+
+        Args:
+            terms: Substrings to look for (case-insensitive)
+            labels: Only match nodes with at least one of these labels
+            limit: Maximum ids returned, highest PageRank first
+            include_paths: Also match on the node's file path
+
+        Returns:
+            Matching element ids, or None when the name index is unavailable
+        """
+        index = await self.get_name_index()
+        if index is None:
+            return None
+        return index.search(terms, labels=labels, limit=limit, include_paths=include_paths)
+
+    async def get_graph_snapshot(self) -> Optional[GraphSnapshot]:
+        """
+        The graph snapshot for the current graph version, if one is loaded.
+
+        A missing snapshot is loaded in the background (not retried for
+        ``graph_version_refresh_seconds`` after a failed load); until it is
+        ready callers run their Cypher queries. A version whose snapshot
+        exceeds the cache budget is not loaded again.
+
+        Returns:
+            The snapshot, or None when disabled, not connected or not loaded yet
+        """
+        if not self.graph_snapshot_enabled or not self._driver:
+            return None
+        try:
+            version = await self.graph_version()
+        except Exception as e:
+            logger.warning(f"[GRAPH-SNAPSHOT] Graph version unavailable: {e}")
+            return None
+
+        key = self._snapshot_key(version)
+        snapshot = self.graph_snapshots.get(key)
+        if (
+            snapshot is None
+            and key != self._snapshot_oversized_key
+            and time.monotonic() - self._snapshot_failed_at >= self.graph_version_refresh_seconds
+        ):
+            self.warm_graph_snapshot()
+        return snapshot
+
+    def warm_graph_snapshot(self) -> Optional[asyncio.Task]:
+        """Start loading the snapshot for the current graph version in the background."""
+        if not self.graph_snapshot_enabled or not self._driver:
+            return None
+        if self._snapshot_task is None or self._snapshot_task.done():
+            self._snapshot_task = asyncio.create_task(self._load_graph_snapshot_in_background())
+        return self._snapshot_task
+
+    async def _load_graph_snapshot_in_background(self) -> None:
+        try:
+            await self.load_graph_snapshot(refresh=True)
+        except Exception as e:
+            self._snapshot_failed_at = time.monotonic()
+            logger.warning(f"[GRAPH-SNAPSHOT] Snapshot load failed, using Cypher: {e}")
+
+    async def load_graph_snapshot(self, refresh: bool = False) -> Optional[GraphSnapshot]:
+        """
+        Load the snapshot for the current graph version (or return the cached one).
+
+        Args:
+            refresh: Re-read the graph version first, e.g. right after an analysis
+
+        Returns:
+            The snapshot, or None when it does not fit in the snapshot cache
+        """
+        async with self._snapshot_lock:
+            version = await self.graph_version(refresh=refresh)
+            key = self._snapshot_key(version)
+            snapshot = self.graph_snapshots.get(key)
+            if snapshot is not None or key == self._snapshot_oversized_key:
+                return snapshot
+
+            started = time.perf_counter()
+            builder = GraphSnapshotBuilder()
+            async for record in self.stream_query(get_query("GRAPH_SNAPSHOT_NODES").text):
+                builder.add_node(record)
+            async for record in self.stream_query(get_query("GRAPH_SNAPSHOT_RELATIONSHIPS").text):
+                builder.add_relationship(record["source"], record["target"], record["type"])
+            snapshot = await asyncio.to_thread(builder.build, version)
+            logger.info(
+                f"[GRAPH-SNAPSHOT] Loaded {len(snapshot)} nodes and "
+                f"{snapshot.relationship_count} relationships ({snapshot.nbytes / 1e6:.1f}MB) "
+                f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+            )
+            if not self.graph_snapshots.put(key, snapshot):
+                self._snapshot_oversized_key = key
+                logger.warning(
+                    f"[GRAPH-SNAPSHOT] Snapshot exceeds the {self.graph_snapshots.max_bytes / 1e6:.0f}MB "
+                    f"budget, using Cypher until the graph version changes"
+                )
+                return None
+            return snapshot
+
+    def _snapshot_key(self, version: str) -> tuple[str, str, str]:
+        return (self.neo4j_uri, self.neo4j_database, version)
+
+    async def _read_from_snapshot(
+        self,
+        cypher_query: str,
+        parameters: Optional[dict[str, Any]],
+    ) -> Optional[list[dict[str, Any]]]:
+        """Answer a registered traversal query from the graph snapshot, if possible."""
+        query = QUERY_REGISTRY.lookup_text(cypher_query)
+        if query is None or query.name not in SNAPSHOT_QUERIES:
+            return None
+        snapshot = await self.get_graph_snapshot()
+        if snapshot is None:
+            return None
+
+        started = time.perf_counter()
+        records = await asyncio.to_thread(
+            SNAPSHOT_QUERIES[query.name], snapshot, query.depth, parameters or {}
+        )
+        if records is not None:
+            duration_ms = (time.perf_counter() - started) * 1000
+            self.metrics.record(f"snapshot:{query.name}", duration_ms, len(records))
+        return records
+
+    async def query_name_matches(
+        self,
+        query_name: str,
+        terms: list[str],
+        labels: Optional[list[str]] = None,
+        include_paths: bool = False,
+        limit: int = DEFAULT_NAME_SEARCH_LIMIT,
+        **parameters: Any,
+    ) -> dict[str, Any]:
+        """
+        Run a name-substring query, resolving the names through the name index.
+
+        ``query_name`` is a registered scan query matching lowercase
+        ``$terms``. When the name index is available its ``<query_name>_BY_ID``
+        counterpart runs instead, with the matching element ids as ``$ids``.
+
+        Example:
+            await client.query_name_matches(
+                "ENTRY_POINT_WEBFLOWS", ["legalentity"], labels=["WebFlowDefinition"]
+            )
+
+        Args:
+            query_name: Registered scan query taking ``$terms``
+            terms: Substrings to match (lowercased here)
+            labels: Labels the scan query restricts to (bound to ``$labels``
+                if the scan query takes it)
+            include_paths: Whether the scan query also matches file paths
+            limit: Maximum matches (bound to ``$limit`` if the scan query takes it)
+            **parameters: Other parameters shared by both queries
+
+        Returns:
+            Dict with 'nodes' key containing query results
+        """
+        terms = list(dict.fromkeys(t.lower() for t in terms if t))
+        if not terms:
+            return {"nodes": []}
+
+        ids = await self.search_names(terms, labels=labels, limit=limit, include_paths=include_paths)
+        if ids is None:
+            query = get_query(query_name)
+            if "labels" in query.parameters:
+                parameters["labels"] = labels
+            if "limit" in query.parameters:
+                parameters["limit"] = limit
+            return await self.query_code_structure(*query.bind(terms=terms, **parameters))
+        if not ids:
+            return {"nodes": []}
+        query = get_query(f"{query_name}_BY_ID")
+        return await self.query_code_structure(*query.bind(ids=ids, **parameters))
+
     async def call_tool(
         self,
         tool_name: str,
@@ -126,7 +561,7 @@ class Neo4jMCPClient(MCPClient):
 
         # Log MCP tool invocation
         logger.info(f"[MCP-TOOL] Neo4j tool invoked: {tool_name}")
-        logger.info(f"[MCP-TOOL] Parameters: {parameters}")
+        logger.debug(f"[MCP-TOOL] Parameters: {parameters}")
 
         # Map tool names to HTTP endpoints
         tool_handlers = {
@@ -146,9 +581,84 @@ class Neo4jMCPClient(MCPClient):
             raise MCPToolError(f"Unknown tool: {tool_name}")
 
         result = await handler(**parameters)
-        logger.info(f"[MCP-TOOL] Result: {str(result)[:500]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[MCP-TOOL] Result: {str(result)[:500]}...")
         return result
 
+    def _read_session(self, fetch_size: Optional[int] = None):
+        """Open a read-access session with the configured fetch size."""
+        return self._driver.session(
+            database=self.neo4j_database,
+            default_access_mode=READ_ACCESS,
+            fetch_size=fetch_size or self.fetch_size,
+        )
+
+    async def _read(
+        self,
+        cypher_query: str,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Run a read-only query in a managed read transaction, recording metrics.
+
+        Registered traversal queries are answered from the graph snapshot
+        when one is loaded.
+        """
+        records = await self._read_from_snapshot(cypher_query, parameters)
+        if records is not None:
+            return records
+
+        name = query_name_for(cypher_query)
+        started = time.perf_counter()
+        try:
+            async with self._read_session() as session:
+                records = await session.execute_read(
+                    _read_records, cypher_query, parameters or {}
+                )
+        except Exception:
+            self.metrics.record_error(name)
+            raise
+
+        self._observe(name, cypher_query, parameters, started, len(records))
+        return records
+
+    def _observe(
+        self,
+        name: str,
+        cypher_query: str,
+        parameters: Optional[dict[str, Any]],
+        started: float,
+        rows: int,
+    ) -> None:
+        """Record a finished query and capture a profile if it was slow."""
+        duration_ms = (time.perf_counter() - started) * 1000
+        self.metrics.record(name, duration_ms, rows)
+        if not self.metrics.is_slow(duration_ms):
+            return
+
+        logger.warning(f"[NEO4J-SLOW] {name} took {duration_ms:.0f}ms ({rows} rows)")
+        entry = self.metrics.log_slow_query(name, cypher_query, duration_ms, rows)
+        if self.metrics.should_profile(name):
+            task = asyncio.create_task(self._capture_profile(entry, cypher_query, parameters))
+            self._profile_tasks.add(task)
+            task.add_done_callback(self._profile_tasks.discard)
+
+    async def _capture_profile(
+        self,
+        entry: dict[str, Any],
+        cypher_query: str,
+        parameters: Optional[dict[str, Any]],
+    ) -> None:
+        """Re-run a slow query under PROFILE and attach the plan to its log entry."""
+        if not self._driver:
+            return
+        try:
+            async with self._read_session() as session:
+                plan = await session.execute_read(_profile_plan, cypher_query, parameters or {})
+            entry["profile"] = format_profile(plan)
+        except Exception as e:
+            logger.warning(f"[NEO4J-SLOW] PROFILE capture failed for {entry['query']}: {e}")
+
     async def _query_code_structure(
         self,
         cypher_query: str,
@@ -158,24 +668,24 @@ class Neo4jMCPClient(MCPClient):
         if not self._driver:
             raise MCPToolError("Neo4j not connected")
 
-        # Log the Cypher query
-        logger.info(f"[NEO4J-QUERY] Executing Cypher query:")
-        logger.info(f"[NEO4J-QUERY] {cypher_query}")
-        if parameters:
-            logger.info(f"[NEO4J-QUERY] Parameters: {parameters}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"[NEO4J-QUERY] {cypher_query}")
+            if parameters:
+                logger.debug(f"[NEO4J-QUERY] Parameters: {parameters}")
 
         try:
-            async with self._driver.session(database=self.neo4j_database) as session:
-                result = await session.run(cypher_query, parameters or {})
-                records = await result.data()
-                logger.info(f"[NEO4J-QUERY] Query returned {len(records)} records")
-                if records:
-                    logger.info(f"[NEO4J-QUERY] Sample result: {str(records[0])[:200]}...")
-                return {"nodes": records}
+            records = await self._read(cypher_query, parameters)
         except Exception as e:
             logger.error(f"[NEO4J-QUERY] Cypher query failed: {e}")
             raise MCPToolError(f"Query failed: {e}")
 
+        if debug:
+            logger.debug(f"[NEO4J-QUERY] Query returned {len(records)} records")
+            if records:
+                logger.debug(f"[NEO4J-QUERY] Sample result: {str(records[0])[:200]}...")
+        return {"nodes": records}
+
     async def _get_component_dependencies(
         self,
         component_name: str,
@@ -184,24 +694,21 @@ class Neo4jMCPClient(MCPClient):
         if not self._driver:
             raise MCPToolError("Neo4j not connected")
 
-        async with self._driver.session(database=self.neo4j_database) as session:
-            # Query for upstream dependencies
-            upstream_query = """
-                MATCH (comp)-[:DEPENDS_ON|:IMPORTS|:CALLS]->(dep)
-                WHERE comp.name = $name
-                RETURN dep.name as dependency
-            """
-            upstream_result = await session.run(upstream_query, name=component_name)
-            upstream_records = await upstream_result.data()
-
-            # Query for downstream (dependents)
-            downstream_query = """
-                MATCH (dep)-[:DEPENDS_ON|:IMPORTS|:CALLS]->(comp)
-                WHERE comp.name = $name
-                RETURN dep.name as dependent
-            """
-            downstream_result = await session.run(downstream_query, name=component_name)
-            downstream_records = await downstream_result.data()
+        # Query for upstream dependencies
+        upstream_query = """
+            MATCH (comp)-[:DEPENDS_ON|:IMPORTS|:CALLS]->(dep)
+            WHERE comp.name = $name
+            RETURN dep.name as dependency
+        """
+        upstream_records = await self._read(upstream_query, {"name": component_name})
+
+        # Query for downstream (dependents)
+        downstream_query = """
+            MATCH (dep)-[:DEPENDS_ON|:IMPORTS|:CALLS]->(comp)
+            WHERE comp.name = $name
+            RETURN dep.name as dependent
+        """
+        downstream_records = await self._read(downstream_query, {"name": component_name})
 
         return {
             "upstream": [n.get("dependency") for n in upstream_records if n.get("dependency")],
@@ -213,17 +720,14 @@ class Neo4jMCPClient(MCPClient):
         if not self._driver:
             return []
 
-        async with self._driver.session(database=self.neo4j_database) as session:
-            # Try different relationship patterns for API exposure
-            query = """
-                MATCH (s)-[:EXPOSES|:HAS_ENDPOINT|:HAS_METHOD]->(api)
-                WHERE s.name = $name
-                RETURN api.endpoint as endpoint, api.method as method,
-                       api.parameters as parameters
-            """
-            result = await session.run(query, name=service_name)
-            records = await result.data()
-        return records
+        # Try different relationship patterns for API exposure
+        query = """
+            MATCH (s)-[:EXPOSES|:HAS_ENDPOINT|:HAS_METHOD]->(api)
+            WHERE s.name = $name
+            RETURN api.endpoint as endpoint, api.method as method,
+                   api.parameters as parameters
+        """
+        return await self._read(query, {"name": service_name})
 
     async def _search_similar_features(
         self,
@@ -238,21 +742,16 @@ class Neo4jMCPClient(MCPClient):
         keywords = [w.lower() for w in description.split() if len(w) > 3][:3]
         results = []
 
-        async with self._driver.session(database=self.neo4j_database) as session:
-            for keyword in keywords:
-                # Search across all code component types
-                query = """
-                    MATCH (n)
-                    WHERE (n:JavaClass OR n:JavaInterface OR n:SpringService OR n:SpringController
-                           OR n:JSPPage OR n:WebFlowDefinition OR n:FlowState OR n:FlowAction
-                           OR n:SQLTable OR n:RestEndpoint)
-                    AND (toLower(n.name) CONTAINS $keyword OR toLower(n.filePath) CONTAINS $keyword)
-                    RETURN n.name as name, n.filePath as description, labels(n)[0] as type
-                    LIMIT $limit
-                """
-                result = await session.run(query, keyword=keyword, limit=limit)
-                records = await result.data()
-                results.extend(records)
+        # Search across all code component types
+        for keyword in keywords:
+            result = await self.query_name_matches(
+                "SEARCH_SIMILAR_FEATURES",
+                [keyword],
+                labels=SIMILAR_FEATURE_LABELS,
+                include_paths=True,
+                limit=limit,
+            )
+            results.extend(result.get("nodes", []))
 
         # Deduplicate
         seen = set()
@@ -319,22 +818,9 @@ class Neo4jMCPClient(MCPClient):
         if not self._driver:
             raise MCPToolError("Neo4j not connected")
 
-        async with self._driver.session(database=self.neo4j_database) as session:
-            # Find direct and indirect callers with relevance scores
-            query = """
-                MATCH (caller)-[r:CALLS|IMPORTS|USES_COMPONENT|DEPENDS_ON*1..$maxDepth]->(target)
-                WHERE target.name = $name
-                WITH caller, min(length(r)) AS depth, COALESCE(caller.pageRank, 0.1) AS pageRank
-                RETURN caller.name AS name,
-                       labels(caller)[0] AS type,
-                       caller.filePath AS path,
-                       depth,
-                       pageRank
-                ORDER BY depth ASC, pageRank DESC
-                LIMIT 150
-            """
-            result = await session.run(query, name=component_name, maxDepth=max_depth)
-            records = await result.data()
+        # Find direct and indirect callers with relevance scores
+        query = get_query("GET_CALLERS_OF", depth=max_depth)
+        records = await self._read(*query.bind(name=component_name))
 
         callers = [
             {
@@ -371,29 +857,10 @@ class Neo4jMCPClient(MCPClient):
         if not self._driver:
             raise MCPToolError("Neo4j not connected")
 
-        rel_filter = ""
-        if relationship_types:
-            rel_types = "|".join(relationship_types)
-            rel_filter = f":{rel_types}"
-
-        async with self._driver.session(database=self.neo4j_database) as session:
-            query = f"""
-                MATCH (source)-[r{rel_filter}]-(related)
-                WHERE source.name = $name
-                WITH type(r) AS relType,
-                     CASE WHEN startNode(r) = source THEN 'outgoing' ELSE 'incoming' END AS direction,
-                     related,
-                     COALESCE(related.pageRank, 0.1) AS pageRank
-                RETURN relType,
-                       direction,
-                       related.name AS name,
-                       labels(related)[0] AS type,
-                       related.filePath AS path,
-                       pageRank
-                ORDER BY pageRank DESC
-            """
-            result = await session.run(query, name=component_name)
-            records = await result.data()
+        query = get_query("GET_RELATED_COMPONENTS")
+        records = await self._read(
+            *query.bind(name=component_name, relTypes=relationship_types or None)
+        )
 
         # Group by relationship type and direction
         grouped: dict[str, list[dict]] = {}
@@ -434,72 +901,48 @@ class Neo4jMCPClient(MCPClient):
         if not self._driver:
             raise MCPToolError("Neo4j not connected")
 
-        async with self._driver.session(database=self.neo4j_database) as session:
-            try:
-                if include_pagerank:
-                    query = """
-                        CALL db.index.fulltext.queryNodes('component_fulltext_search', $terms)
-                        YIELD node, score
-                        WHERE score >= $minScore
-                        WITH node, score AS fulltextScore, COALESCE(node.pageRank, 0.1) AS pageRank
-                        WITH node, fulltextScore, pageRank,
-                             (fulltextScore * 0.7 + pageRank * 0.3) AS combinedScore
-                        RETURN node.name AS name,
-                               labels(node)[0] AS type,
-                               node.filePath AS path,
-                               node.description AS description,
-                               fulltextScore,
-                               pageRank,
-                               combinedScore
-                        ORDER BY combinedScore DESC
-                    """
-                else:
-                    query = """
-                        CALL db.index.fulltext.queryNodes('component_fulltext_search', $terms)
-                        YIELD node, score
-                        WHERE score >= $minScore
-                        RETURN node.name AS name,
-                               labels(node)[0] AS type,
-                               node.filePath AS path,
-                               node.description AS description,
-                               score AS combinedScore
-                        ORDER BY combinedScore DESC
-                    """
-
-                result = await session.run(query, terms=search_terms, minScore=min_score)
-                records = await result.data()
-
-                logger.info(f"[MCP-TOOL] search_by_relevance('{search_terms}'): Found {len(records)} results")
-                return records
-
-            except Exception as e:
-                # Fallback if fulltext index not available
-                logger.warning(f"[MCP-TOOL] Fulltext search failed, using fallback: {e}")
-                keywords = search_terms.lower().split()
-                keyword_filter = " OR ".join([f"toLower(n.name) CONTAINS '{kw}'" for kw in keywords])
-
-                # Include all code component labels for comprehensive search
-                fallback_query = f"""
-                    MATCH (n)
-                    WHERE (n:JavaClass OR n:JavaInterface OR n:JavaMethod OR n:JavaField
-                           OR n:SpringService OR n:SpringController
-                           OR n:JSPPage OR n:JSPForm OR n:JSPInclude OR n:JSPTagLib
-                           OR n:WebFlowDefinition OR n:FlowState OR n:FlowAction OR n:FlowTransition
-                           OR n:SQLTable OR n:SQLView OR n:SQLColumn
-                           OR n:RestEndpoint OR n:Function OR n:Class
-                           OR n:ValidationConstraint OR n:GuardClause OR n:TestAssertion)
-                      AND ({keyword_filter})
-                    WITH n, COALESCE(n.pageRank, 0.1) AS pageRank
-                    RETURN n.name AS name,
-                           labels(n)[0] AS type,
-                           n.filePath AS path,
-                           pageRank AS combinedScore
+        try:
+            if include_pagerank:
+                query = """
+                    CALL db.index.fulltext.queryNodes('component_fulltext_search', $terms)
+                    YIELD node, score
+                    WHERE score >= $minScore
+                    WITH node, score AS fulltextScore, COALESCE(node.pageRank, 0.1) AS pageRank
+                    WITH node, fulltextScore, pageRank,
+                         (fulltextScore * 0.7 + pageRank * 0.3) AS combinedScore
+                    RETURN node.name AS name,
+                           labels(node)[0] AS type,
+                           node.filePath AS path,
+                           node.description AS description,
+                           fulltextScore,
+                           pageRank,
+                           combinedScore
                     ORDER BY combinedScore DESC
-                    LIMIT 500
                 """
-                result = await session.run(fallback_query)
-                records = await result.data()
-                return records
+            else:
+                query = """
+                    CALL db.index.fulltext.queryNodes('component_fulltext_search', $terms)
+                    YIELD node, score
+                    WHERE score >= $minScore
+                    RETURN node.name AS name,
+                           labels(node)[0] AS type,
+                           node.filePath AS path,
+                           node.description AS description,
+                           score AS combinedScore
+                    ORDER BY combinedScore DESC
+                """
+
+            records = await self._read(query, {"terms": search_terms, "minScore": min_score})
+
+            logger.info(f"[MCP-TOOL] search_by_relevance('{search_terms}'): Found {len(records)} results")
+            return records
+
+        except Exception as e:
+            # Fallback if fulltext index not available
+            logger.warning(f"[MCP-TOOL] Fulltext search failed, using fallback: {e}")
+            keywords = search_terms.lower().split()
+            fallback_query = get_query("SEARCH_COMPONENTS_BY_KEYWORDS")
+            return await self._read(*fallback_query.bind(keywords=keywords))
 
     async def _expand_from_seeds(
         self,
@@ -531,37 +974,10 @@ class Neo4jMCPClient(MCPClient):
         if not seed_components:
             return {"seeds": [], "expanded": [], "paths": []}
 
-        async with self._driver.session(database=self.neo4j_database) as session:
-            # Build seed filter
-            seed_filter = " OR ".join([f"seed.name = '{name}'" for name in seed_components])
-
-            query = f"""
-                MATCH (seed)
-                WHERE {seed_filter}
-                CALL {{
-                    WITH seed
-                    MATCH path = (seed)-[*1..{max_hops}]-(connected)
-                    WHERE COALESCE(connected.pageRank, 0.1) >= $minPagerank
-                      AND connected <> seed
-                    WITH connected, length(path) AS distance, path
-                    RETURN connected, distance, path
-                    ORDER BY connected.pageRank DESC
-                    LIMIT 500
-                }}
-                WITH seed, connected, distance,
-                     [node IN nodes(path) | node.name] AS pathNodes
-                RETURN seed.name AS seedName,
-                       connected.name AS name,
-                       labels(connected)[0] AS type,
-                       connected.filePath AS path,
-                       connected.pageRank AS pageRank,
-                       distance,
-                       pathNodes
-                ORDER BY pageRank DESC
-            """
-
-            result = await session.run(query, minPagerank=min_pagerank)
-            records = await result.data()
+        query = get_query("EXPAND_FROM_SEEDS", depth=max_hops)
+        records = await self._read(
+            *query.bind(seedNames=list(seed_components), minPagerank=min_pagerank)
+        )
 
         # Deduplicate and organize results
         expanded = {}
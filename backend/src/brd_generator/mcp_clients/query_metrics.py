@@ -0,0 +1,219 @@
+"""Query-level metrics and slow-query log for the code graph client.
+
+Every query run by ``Neo4jMCPClient`` is recorded under a query name: the
+registry name for prepared queries (``queries.registry``), otherwise an
+``adhoc:`` fingerprint of the text with literals masked, so interpolated
+variants of the same query aggregate together. Per name we keep a latency
+histogram, returned row counts and error counts.
+
+Queries slower than the slow-query threshold are added to a bounded slow
+log. For those, the client also re-runs the query under ``PROFILE`` (at
+most once per name per profile interval) and attaches the rendered plan,
+so indexes and rewrites can be targeted with data.
+
+Metrics are served on ``/metrics`` in Prometheus text format, or as JSON.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from ..queries.registry import QUERY_REGISTRY
+
+# Queries at or above this duration are logged as slow (0 disables)
+DEFAULT_SLOW_QUERY_MS = float(os.getenv("NEO4J_SLOW_QUERY_MS", "1000"))
+# Minimum seconds between two PROFILE captures of the same query name
+DEFAULT_PROFILE_INTERVAL_SECONDS = float(os.getenv("NEO4J_PROFILE_INTERVAL_SECONDS", "300"))
+# Slow-query entries kept in memory
+DEFAULT_SLOW_LOG_SIZE = int(os.getenv("NEO4J_SLOW_LOG_SIZE", "50"))
+
+# Latency histogram bucket upper bounds in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])\d+(?:\.\d+)?")
+_WHITESPACE = re.compile(r"\s+")
+_FIRST_CLAUSE = re.compile(r"[A-Za-z]+")
+
+
+def query_name_for(cypher_query: str) -> str:
+    """Metrics name of a query: its registry name or a literal-masked fingerprint."""
+    prepared = QUERY_REGISTRY.lookup_text(cypher_query)
+    if prepared:
+        return prepared.name
+
+    normalized = _STRING_LITERAL.sub("?", cypher_query)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    clause = _FIRST_CLAUSE.search(normalized)
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:10]
+    return f"adhoc:{clause.group(0).upper() if clause else 'QUERY'}:{digest}"
+
+
+@dataclass
+class QueryStats:
+    """Counters and latency histogram for one query name."""
+
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS_MS))
+
+    def observe(self, duration_ms: float, rows: int) -> None:
+        self.calls += 1
+        self.rows += rows
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                self.buckets[index] += 1
+                break
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "buckets_ms": dict(zip(LATENCY_BUCKETS_MS, self.buckets)),
+        }
+
+
+class QueryMetrics:
+    """Per-query-name metrics and slow-query log."""
+
+    def __init__(
+        self,
+        slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+        profile_interval_seconds: float = DEFAULT_PROFILE_INTERVAL_SECONDS,
+        slow_log_size: int = DEFAULT_SLOW_LOG_SIZE,
+    ):
+        self.slow_query_ms = slow_query_ms
+        self.profile_interval_seconds = profile_interval_seconds
+        self._stats: dict[str, QueryStats] = {}
+        self._slow_log: deque[dict[str, Any]] = deque(maxlen=slow_log_size)
+        self._last_profiled: dict[str, float] = {}
+
+    def record(self, name: str, duration_ms: float, rows: int) -> None:
+        """Record a successful query."""
+        self._stats.setdefault(name, QueryStats()).observe(duration_ms, rows)
+
+    def record_error(self, name: str) -> None:
+        """Record a failed query."""
+        self._stats.setdefault(name, QueryStats()).errors += 1
+
+    def is_slow(self, duration_ms: float) -> bool:
+        return self.slow_query_ms > 0 and duration_ms >= self.slow_query_ms
+
+    def log_slow_query(
+        self,
+        name: str,
+        cypher_query: str,
+        duration_ms: float,
+        rows: int,
+    ) -> dict[str, Any]:
+        """Append a slow query to the log; the returned entry can take a profile later."""
+        entry = {
+            "query": name,
+            "duration_ms": round(duration_ms, 2),
+            "rows": rows,
+            "at": datetime.now(timezone.utc).isoformat(),
+            "cypher": cypher_query.strip(),
+            "profile": None,
+        }
+        self._slow_log.append(entry)
+        return entry
+
+    def should_profile(self, name: str) -> bool:
+        """Claim the PROFILE capture slot for ``name`` if its interval has passed."""
+        now = time.monotonic()
+        last = self._last_profiled.get(name)
+        if last is not None and now - last < self.profile_interval_seconds:
+            return False
+        self._last_profiled[name] = now
+        return True
+
+    def snapshot(self) -> dict[str, Any]:
+        """All metrics and the slow-query log as plain data."""
+        return {
+            "slow_query_ms": self.slow_query_ms,
+            "queries": {name: s.to_dict() for name, s in sorted(self._stats.items())},
+            "slow_queries": list(self._slow_log),
+        }
+
+    def render_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP codegraph_query_duration_seconds Code graph query latency.",
+            "# TYPE codegraph_query_duration_seconds histogram",
+        ]
+        for name, stats in sorted(self._stats.items()):
+            label = _label(name)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS_MS, stats.buckets):
+                cumulative += count
+                lines.append(
+                    f'codegraph_query_duration_seconds_bucket{{query="{label}",le="{bound / 1000:g}"}}'
+                    f" {cumulative}"
+                )
+            lines.append(
+                f'codegraph_query_duration_seconds_bucket{{query="{label}",le="+Inf"}} {stats.calls}'
+            )
+            lines.append(
+                f'codegraph_query_duration_seconds_sum{{query="{label}"}} {stats.total_ms / 1000:.6f}'
+            )
+            lines.append(f'codegraph_query_duration_seconds_count{{query="{label}"}} {stats.calls}')
+
+        for metric, help_text, attr in (
+            ("codegraph_query_rows_total", "Records returned by code graph queries.", "rows"),
+            ("codegraph_query_errors_total", "Failed code graph queries.", "errors"),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, stats in sorted(self._stats.items()):
+                lines.append(f'{metric}{{query="{_label(name)}"}} {getattr(stats, attr)}')
+
+        lines.append("# HELP codegraph_slow_queries Slow queries currently in the slow-query log.")
+        lines.append("# TYPE codegraph_slow_queries gauge")
+        lines.append(f"codegraph_slow_queries {len(self._slow_log)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear all metrics and the slow-query log."""
+        self._stats.clear()
+        self._slow_log.clear()
+        self._last_profiled.clear()
+
+
+def format_profile(plan: Optional[dict[str, Any]], depth: int = 0) -> str:
+    """Render a driver PROFILE plan tree as indented operator lines."""
+    if not plan:
+        return ""
+    args = plan.get("args") or {}
+    details = args.get("Details") or args.get("details")
+    line = (
+        f"{'  ' * depth}{plan.get('operatorType', '?')}"
+        f" rows={plan.get('rows', '?')} dbHits={plan.get('dbHits', '?')}"
+    )
+    if details:
+        line += f" [{details}]"
+    children = [format_profile(child, depth + 1) for child in plan.get("children") or []]
+    return "\n".join([line, *children])
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Shared instance used by all Neo4j clients
+query_metrics = QueryMetrics()
@@ -6,6 +6,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from ..utils.token_counter import estimate_tokens
+
 
 class SchemaInfo(BaseModel):
     """Schema information from Neo4j code graph."""
@@ -401,10 +403,8 @@ class AggregatedContext(BaseModel):
 
     @property
     def estimated_tokens(self) -> int:
-        """Rough token count estimation."""
-        # Simple heuristic: ~4 chars per token
-        total_chars = len(self.model_dump_json())
-        return total_chars // 4
+        """Token count of the serialized context."""
+        return estimate_tokens(self.model_dump_json())
 
 
 # Import BusinessLogicContext for type annotation after class definition to avoid circular imports
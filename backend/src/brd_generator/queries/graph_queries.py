@@ -0,0 +1,531 @@
+"""Cypher queries for code graph retrieval and context traversal.
+
+Every query here is fully parameterized: names, keywords and labels are
+passed as list parameters and matched with ``IN`` / ``ANY(...)`` so the
+query text never changes between calls. Variable-length bounds, which
+Cypher cannot take as parameters, are written as ``*1..$maxDepth`` and
+registered as bounded depth variants (see ``queries.registry``).
+
+Name-substring searches come in pairs: a scan query taking lowercase
+``$terms``, and a ``*_BY_ID`` query taking the ``$ids`` the in-process name
+index (``mcp_clients.name_index``) resolved for those terms. The client runs
+the ``*_BY_ID`` query when the index is available.
+"""
+
+# =============================================================================
+# Name index
+# =============================================================================
+
+# Graph version: one entry per analyzed repository, changes on every analysis
+GRAPH_VERSION = """
+    MATCH (s:IndexState)
+    WITH s ORDER BY s.repositoryId
+    RETURN collect(
+        s.repositoryId + '@' + COALESCE(s.lastCommitSha, '')
+        + '@' + COALESCE(toString(s.lastIndexedAt), '')
+    ) AS states
+"""
+
+# Every named node, read once per graph version to build the name index
+NAME_INDEX_NODES = """
+    MATCH (n)
+    WHERE n.name IS NOT NULL
+    RETURN elementId(n) AS id,
+           n.name AS name,
+           labels(n) AS labels,
+           n.filePath AS path,
+           n.pageRank AS pageRank
+"""
+
+# =============================================================================
+# Graph snapshot (mcp_clients.graph_snapshot)
+# =============================================================================
+
+# Named nodes with the properties local traversals return
+GRAPH_SNAPSHOT_NODES = """
+    MATCH (n)
+    WHERE n.name IS NOT NULL
+    RETURN elementId(n) AS id,
+           n.entityId AS entityId,
+           n.name AS name,
+           labels(n) AS labels,
+           n.filePath AS path,
+           n.pageRank AS pageRank,
+           n.startLine AS startLine,
+           n.endLine AS endLine,
+           n.signature AS signature
+"""
+
+# Relationships between named nodes
+GRAPH_SNAPSHOT_RELATIONSHIPS = """
+    MATCH (a)-[r]->(b)
+    WHERE a.name IS NOT NULL AND b.name IS NOT NULL
+    RETURN elementId(a) AS source, elementId(b) AS target, type(r) AS type
+"""
+
+# =============================================================================
+# Neo4jMCPClient agentic tools
+# =============================================================================
+
+# Components that call/use a component, up to $maxDepth hops upstream
+GET_CALLERS_OF = """
+    MATCH (caller)-[r:CALLS|IMPORTS|USES_COMPONENT|DEPENDS_ON*1..$maxDepth]->(target)
+    WHERE target.name = $name
+    WITH caller, min(length(r)) AS depth, COALESCE(caller.pageRank, 0.1) AS pageRank
+    RETURN caller.name AS name,
+           labels(caller)[0] AS type,
+           caller.filePath AS path,
+           depth,
+           pageRank
+    ORDER BY depth ASC, pageRank DESC
+    LIMIT 150
+"""
+
+# Direct neighbours of a component; $relTypes = null matches any relationship
+GET_RELATED_COMPONENTS = """
+    MATCH (source)-[r]-(related)
+    WHERE source.name = $name
+      AND ($relTypes IS NULL OR type(r) IN $relTypes)
+    WITH type(r) AS relType,
+         CASE WHEN startNode(r) = source THEN 'outgoing' ELSE 'incoming' END AS direction,
+         related,
+         COALESCE(related.pageRank, 0.1) AS pageRank
+    RETURN relType,
+           direction,
+           related.name AS name,
+           labels(related)[0] AS type,
+           related.filePath AS path,
+           pageRank
+    ORDER BY pageRank DESC
+"""
+
+# Keyword search across code component labels (fulltext index fallback)
+SEARCH_COMPONENTS_BY_KEYWORDS = """
+    MATCH (n)
+    WHERE (n:JavaClass OR n:JavaInterface OR n:JavaMethod OR n:JavaField
+           OR n:SpringService OR n:SpringController
+           OR n:JSPPage OR n:JSPForm OR n:JSPInclude OR n:JSPTagLib
+           OR n:WebFlowDefinition OR n:FlowState OR n:FlowAction OR n:FlowTransition
+           OR n:SQLTable OR n:SQLView OR n:SQLColumn
+           OR n:RestEndpoint OR n:Function OR n:Class
+           OR n:ValidationConstraint OR n:GuardClause OR n:TestAssertion)
+      AND ANY(kw IN $keywords WHERE toLower(n.name) CONTAINS kw)
+    WITH n, COALESCE(n.pageRank, 0.1) AS pageRank
+    RETURN n.name AS name,
+           labels(n)[0] AS type,
+           n.filePath AS path,
+           pageRank AS combinedScore
+    ORDER BY combinedScore DESC
+    LIMIT 500
+"""
+
+# Personalized-PageRank-like expansion from seed components, up to $maxDepth hops
+EXPAND_FROM_SEEDS = """
+    MATCH (seed)
+    WHERE seed.name IN $seedNames
+    CALL {
+        WITH seed
+        MATCH path = (seed)-[*1..$maxDepth]-(connected)
+        WHERE COALESCE(connected.pageRank, 0.1) >= $minPagerank
+          AND connected <> seed
+        WITH connected, length(path) AS distance, path
+        RETURN connected, distance, path
+        ORDER BY connected.pageRank DESC
+        LIMIT 500
+    }
+    WITH seed, connected, distance,
+         [node IN nodes(path) | node.name] AS pathNodes
+    RETURN seed.name AS seedName,
+           connected.name AS name,
+           labels(connected)[0] AS type,
+           connected.filePath AS path,
+           connected.pageRank AS pageRank,
+           distance,
+           pathNodes
+    ORDER BY pageRank DESC
+"""
+
+# Similar features: name or file path contains one of $terms
+SEARCH_SIMILAR_FEATURES = """
+    MATCH (n)
+    WHERE (n:JavaClass OR n:JavaInterface OR n:SpringService OR n:SpringController
+           OR n:JSPPage OR n:WebFlowDefinition OR n:FlowState OR n:FlowAction
+           OR n:SQLTable OR n:RestEndpoint)
+      AND ANY(t IN $terms WHERE toLower(n.name) CONTAINS t OR toLower(n.filePath) CONTAINS t)
+    RETURN n.name AS name, n.filePath AS description, labels(n)[0] AS type
+    LIMIT $limit
+"""
+
+SEARCH_SIMILAR_FEATURES_BY_ID = """
+    MATCH (n)
+    WHERE elementId(n) IN $ids
+    RETURN n.name AS name, n.filePath AS description, labels(n)[0] AS type
+    ORDER BY COALESCE(n.pageRank, 0.1) DESC
+"""
+
+# =============================================================================
+# ContextAggregator
+# =============================================================================
+
+# Components whose label is in $labels and whose name contains any keyword
+SEARCH_COMPONENTS_FALLBACK = """
+    MATCH (n)
+    WHERE ANY(label IN labels(n) WHERE label IN $labels)
+      AND ANY(t IN $terms WHERE toLower(n.name) CONTAINS t)
+    WITH n, COALESCE(n.pageRank, 0.1) AS pageRank
+    RETURN n.name AS name,
+           labels(n)[0] AS type,
+           n.filePath AS path,
+           n.description AS description,
+           pageRank
+    ORDER BY pageRank DESC
+    LIMIT $limit
+"""
+
+SEARCH_COMPONENTS_FALLBACK_BY_ID = """
+    MATCH (n)
+    WHERE elementId(n) IN $ids
+    WITH n, COALESCE(n.pageRank, 0.1) AS pageRank
+    RETURN n.name AS name,
+           labels(n)[0] AS type,
+           n.filePath AS path,
+           n.description AS description,
+           pageRank
+    ORDER BY pageRank DESC
+"""
+
+# =============================================================================
+# EnhancedContextRetriever entry-point discovery
+# =============================================================================
+
+# Menu items whose label or name matches the feature description
+ENTRY_POINT_MENU_ITEMS = """
+    MATCH (m:MenuItem)
+    WHERE toLower(m.label) CONTAINS $searchTerm
+       OR toLower(m.label) =~ $labelPattern
+       OR toLower(m.name) CONTAINS $searchTerm
+
+    // Follow menu -> screen -> action chain
+    OPTIONAL MATCH (m)-[:MENU_OPENS_SCREEN]->(s:Screen)
+    OPTIONAL MATCH (s)-[:SCREEN_CALLS_ACTION]->(a:JavaClass)
+    OPTIONAL MATCH (s)-[:SCREEN_RENDERS_JSP]->(j:JSPPage)
+    OPTIONAL MATCH (m)-[:MENU_OPENS_FLOW]->(f:WebFlowDefinition)
+
+    // Get all screens in the same flow for sub-features
+    OPTIONAL MATCH (f)-[:FLOW_DEFINES_STATE]->(fs:FlowState)
+    WHERE fs.stateType = 'view-state'
+
+    RETURN m.label AS menuLabel,
+           m.url AS menuUrl,
+           m.parentMenu AS parentMenu,
+           m.flowId AS flowId,
+           m.viewStateId AS viewStateId,
+           s.screenId AS screenId,
+           s.title AS screenTitle,
+           s.actionClass AS actionClass,
+           s.actionMethods AS actionMethods,
+           collect(DISTINCT a.name) AS actionClasses,
+           collect(DISTINCT j.name) AS jspPages,
+           f.name AS flowName,
+           collect(DISTINCT fs.stateId) AS flowStates
+    ORDER BY
+        CASE WHEN toLower(m.label) = $searchTerm THEN 0 ELSE 1 END,
+        m.menuLevel
+    LIMIT $limit
+"""
+
+# Action/Controller classes whose name contains one of $terms, boosted by $actionWords
+ENTRY_POINT_CONTROLLERS = """
+    MATCH (n)
+    WHERE (n:SpringService OR n:JavaClass OR n:SpringController)
+      AND ANY(t IN $terms WHERE toLower(n.name) CONTAINS t)
+      AND (toLower(n.name) ENDS WITH 'action' OR toLower(n.name) ENDS WITH 'controller')
+      AND NOT toLower(n.name) CONTAINS 'test'
+    WITH n,
+         reduce(score = 0, aw IN $actionWords |
+                score + CASE WHEN toLower(n.name) CONTAINS aw THEN 10 ELSE 0 END) AS action_score,
+         COALESCE(n.pageRank, 0.1) AS pagerank
+    RETURN n.name AS name,
+           labels(n)[0] AS type,
+           n.filePath AS path,
+           'controller' AS layer,
+           80 AS layer_score,
+           action_score + pagerank * 10 AS relevance_score
+    ORDER BY relevance_score DESC
+    LIMIT 500
+"""
+
+ENTRY_POINT_CONTROLLERS_BY_ID = """
+    MATCH (n)
+    WHERE elementId(n) IN $ids
+      AND (toLower(n.name) ENDS WITH 'action' OR toLower(n.name) ENDS WITH 'controller')
+      AND NOT toLower(n.name) CONTAINS 'test'
+    WITH n,
+         reduce(score = 0, aw IN $actionWords |
+                score + CASE WHEN toLower(n.name) CONTAINS aw THEN 10 ELSE 0 END) AS action_score,
+         COALESCE(n.pageRank, 0.1) AS pagerank
+    RETURN n.name AS name,
+           labels(n)[0] AS type,
+           n.filePath AS path,
+           'controller' AS layer,
+           80 AS layer_score,
+           action_score + pagerank * 10 AS relevance_score
+    ORDER BY relevance_score DESC
+    LIMIT 500
+"""
+
+# Web flows named after the matched controllers ($terms are controller base names)
+ENTRY_POINT_WEBFLOWS = """
+    MATCH (w:WebFlowDefinition)
+    WHERE ANY(t IN $terms WHERE toLower(w.name) CONTAINS t)
+    RETURN w.name AS name,
+           'WebFlowDefinition' AS type,
+           w.filePath AS path,
+           'flow' AS layer,
+           90 AS layer_score
+    LIMIT 500
+"""
+
+ENTRY_POINT_WEBFLOWS_BY_ID = """
+    MATCH (w:WebFlowDefinition)
+    WHERE elementId(w) IN $ids
+    RETURN w.name AS name,
+           'WebFlowDefinition' AS type,
+           w.filePath AS path,
+           'flow' AS layer,
+           90 AS layer_score
+    LIMIT 500
+"""
+
+# JSPs starting with a controller base name or containing the compound term.
+# With $actionWords, only JSPs containing the compound term are kept.
+ENTRY_POINT_JSPS = """
+    MATCH (j:JSPPage)
+    WHERE ANY(t IN $terms WHERE toLower(j.name) CONTAINS t)
+      AND (ANY(base IN $baseNames WHERE toLower(j.name) STARTS WITH base)
+           OR toLower(j.name) CONTAINS $compoundTerm)
+    WITH j,
+         CASE WHEN toLower(j.name) CONTAINS $compoundTerm THEN 20 ELSE 0 END +
+         CASE WHEN ANY(aw IN $actionWords WHERE toLower(j.name) CONTAINS aw) THEN 10 ELSE 0 END
+         AS relevance
+    WHERE size($actionWords) = 0 OR relevance >= 20
+    RETURN j.name AS name,
+           'JSPPage' AS type,
+           j.filePath AS path,
+           'ui' AS layer,
+           100 AS layer_score,
+           relevance
+    ORDER BY relevance DESC
+    LIMIT 500
+"""
+
+ENTRY_POINT_JSPS_BY_ID = """
+    MATCH (j:JSPPage)
+    WHERE elementId(j) IN $ids
+      AND (ANY(base IN $baseNames WHERE toLower(j.name) STARTS WITH base)
+           OR toLower(j.name) CONTAINS $compoundTerm)
+    WITH j,
+         CASE WHEN toLower(j.name) CONTAINS $compoundTerm THEN 20 ELSE 0 END +
+         CASE WHEN ANY(aw IN $actionWords WHERE toLower(j.name) CONTAINS aw) THEN 10 ELSE 0 END
+         AS relevance
+    WHERE size($actionWords) = 0 OR relevance >= 20
+    RETURN j.name AS name,
+           'JSPPage' AS type,
+           j.filePath AS path,
+           'ui' AS layer,
+           100 AS layer_score,
+           relevance
+    ORDER BY relevance DESC
+    LIMIT 500
+"""
+
+# =============================================================================
+# CodeAssistantService
+# =============================================================================
+
+# Generic keyword search: name or file path contains one of $terms
+KEYWORD_SEARCH = """
+    MATCH (n)
+    WHERE ANY(t IN $terms WHERE toLower(n.name) CONTAINS t OR toLower(n.filePath) CONTAINS t)
+    RETURN n.name AS name, n.filePath AS filePath, n.startLine AS startLine,
+           n.endLine AS endLine, labels(n)[0] AS type, n.sourceCode AS sourceCode
+    LIMIT $limit
+"""
+
+KEYWORD_SEARCH_BY_ID = """
+    MATCH (n)
+    WHERE elementId(n) IN $ids
+    RETURN n.name AS name, n.filePath AS filePath, n.startLine AS startLine,
+           n.endLine AS endLine, labels(n)[0] AS type, n.sourceCode AS sourceCode
+    ORDER BY COALESCE(n.pageRank, 0.1) DESC
+"""
+
+# =============================================================================
+# EnhancedContextRetriever dependency traversal
+# =============================================================================
+
+# Direct relationships from entry points (depth 1)
+TRAVERSE_DIRECT = """
+    MATCH (start)-[r]->(related)
+    WHERE start.name IN $entryNames
+      AND type(r) IN [
+        'HAS_METHOD', 'HAS_FIELD', 'CALLS', 'USES', 'DEPENDS_ON',
+        'EXTENDS', 'IMPLEMENTS', 'JAVA_IMPORTS',
+        'FLOW_TRANSITIONS_TO', 'FLOW_EXECUTES_ACTION', 'FLOW_RENDERS_VIEW',
+        'CONTAINS_FORM', 'INCLUDES_JSP', 'USES_TAGLIB',
+        'BELONGS_TO', 'DEFINED_IN_MODULE', 'INSTANTIATES'
+      ]
+    RETURN DISTINCT related.name AS name,
+           labels(related)[0] AS type,
+           related.filePath AS path,
+           related.description AS description,
+           1 AS distance,
+           type(r) AS relationship
+    LIMIT 500
+"""
+
+# Two-hop relationships from entry points (depth 2)
+TRAVERSE_TWO_HOP = """
+    MATCH (start)-[r1]->(mid)-[r2]->(related)
+    WHERE start.name IN $entryNames
+      AND type(r1) IN ['HAS_METHOD', 'HAS_FIELD', 'CALLS', 'USES', 'DEPENDS_ON', 'EXTENDS', 'IMPLEMENTS', 'JAVA_IMPORTS']
+      AND type(r2) IN ['HAS_METHOD', 'HAS_FIELD', 'CALLS', 'USES', 'DEPENDS_ON', 'EXTENDS', 'IMPLEMENTS', 'JAVA_IMPORTS', 'INSTANTIATES']
+    RETURN DISTINCT related.name AS name,
+           labels(related)[0] AS type,
+           related.filePath AS path,
+           related.description AS description,
+           2 AS distance,
+           type(r2) AS relationship
+    LIMIT 500
+"""
+
+# Injected services (field name -> service name pattern)
+TRAVERSE_INJECTED_SERVICES = """
+    MATCH (start)-[:HAS_FIELD]->(field:JavaField)
+    WHERE start.name IN $entryNames
+    WITH field, toLower(field.name) AS field_name
+    MATCH (service)
+    WHERE (service:SpringService OR service:JavaClass OR service:JavaInterface)
+      AND toLower(service.name) = field_name
+    RETURN DISTINCT service.name AS name,
+           labels(service)[0] AS type,
+           service.filePath AS path,
+           'Injected service' AS description,
+           1 AS distance,
+           'INJECTED_SERVICE' AS relationship
+    LIMIT 150
+"""
+
+# Services related to entry points by naming pattern
+TRAVERSE_RELATED_BY_NAME = """
+    MATCH (s)
+    WHERE (s:SpringService OR s:JavaInterface)
+      AND ANY(base IN $baseNames WHERE toLower(s.name) CONTAINS base)
+      AND NOT toLower(s.name) ENDS WITH 'action'
+      AND NOT toLower(s.name) ENDS WITH 'test'
+    WITH DISTINCT s, COALESCE(s.pageRank, 0.0) AS rank
+    ORDER BY rank DESC
+    RETURN s.name AS name,
+           labels(s)[0] AS type,
+           s.filePath AS path,
+           s.description AS description,
+           2 AS distance,
+           'RELATED_BY_NAME' AS relationship
+    LIMIT 500
+"""
+
+# DAOs/Repositories matching the request keywords
+TRAVERSE_DATA_LAYER = """
+    MATCH (d)
+    WHERE (d:SpringService OR d:JavaClass)
+      AND ANY(kw IN $keywords WHERE toLower(d.name) CONTAINS kw)
+      AND (toLower(d.name) CONTAINS 'dao' OR toLower(d.name) CONTAINS 'repository' OR toLower(d.name) CONTAINS 'mapper')
+      AND NOT toLower(d.name) ENDS WITH 'test'
+    WITH DISTINCT d, COALESCE(d.pageRank, 0.0) AS rank
+    ORDER BY rank DESC
+    RETURN d.name AS name,
+           labels(d)[0] AS type,
+           d.filePath AS path,
+           'Data access layer' AS description,
+           3 AS distance,
+           'DATA_LAYER' AS relationship
+    LIMIT 500
+"""
+
+# Deep chain traversal (up to 4 hops)
+TRAVERSE_DEEP_CHAIN = """
+    MATCH path = (start)-[*1..4]->(target)
+    WHERE start.name IN $entryNames
+      AND (target:JavaClass OR target:JavaInterface OR target:SpringService)
+      AND NOT toLower(target.name) CONTAINS 'test'
+      AND NOT target.name = start.name
+    WITH DISTINCT target, length(path) AS distance
+    ORDER BY distance
+    RETURN target.name AS name,
+           labels(target)[0] AS type,
+           target.filePath AS path,
+           'Deep chain component' AS description,
+           distance,
+           'DEEP_CHAIN' AS relationship
+    LIMIT 200
+"""
+
+# Validators named after the entry points
+TRAVERSE_VALIDATORS = """
+    MATCH (v)
+    WHERE (v:JavaClass OR v:SpringService)
+      AND (toLower(v.name) CONTAINS 'validator' OR toLower(v.name) CONTAINS 'validation')
+      AND ANY(base IN $baseNames WHERE toLower(v.name) CONTAINS base)
+      AND NOT toLower(v.name) CONTAINS 'test'
+    RETURN DISTINCT v.name AS name,
+           labels(v)[0] AS type,
+           v.filePath AS path,
+           'Validation component' AS description,
+           2 AS distance,
+           'VALIDATOR' AS relationship
+    LIMIT 500
+"""
+
+# Utility/Helper classes used by entry points
+TRAVERSE_UTILITIES = """
+    MATCH (start)-[*1..3]->(util)
+    WHERE start.name IN $entryNames
+      AND (util:JavaClass OR util:SpringService)
+      AND (
+        toLower(util.name) CONTAINS 'util'
+        OR toLower(util.name) CONTAINS 'helper'
+        OR toLower(util.name) CONTAINS 'converter'
+        OR toLower(util.name) CONTAINS 'formatter'
+        OR toLower(util.name) CONTAINS 'builder'
+      )
+      AND NOT toLower(util.name) CONTAINS 'test'
+    RETURN DISTINCT util.name AS name,
+           labels(util)[0] AS type,
+           util.filePath AS path,
+           'Utility/Helper class' AS description,
+           3 AS distance,
+           'UTILITY' AS relationship
+    LIMIT 500
+"""
+
+# Entity classes reachable from entry points (for business rule extraction)
+TRAVERSE_ENTITIES = """
+    MATCH (start)-[*1..4]->(entity)
+    WHERE start.name IN $entryNames
+      AND entity:JavaClass
+      AND (
+        toLower(entity.name) CONTAINS 'entity'
+        OR toLower(entity.name) CONTAINS 'model'
+        OR toLower(entity.name) CONTAINS 'dto'
+        OR toLower(entity.name) CONTAINS 'vo'
+      )
+      AND NOT toLower(entity.name) CONTAINS 'test'
+      AND NOT toLower(entity.name) CONTAINS 'builder'
+    RETURN DISTINCT entity.name AS name,
+           labels(entity)[0] AS type,
+           entity.filePath AS path,
+           'Entity/Model class' AS description,
+           3 AS distance,
+           'ENTITY' AS relationship
+    LIMIT 500
+"""
@@ -0,0 +1,163 @@
+"""Prepared-query registry for code graph Cypher.
+
+Neo4j caches execution plans keyed by the exact query text, so splicing
+names, keywords or depths into a query string makes every call a plan-cache
+miss. All queries in ``flow_queries``, ``blueprint_queries`` and
+``graph_queries`` are registered here once, with their parameters derived
+from the text, and callers bind values instead of building strings:
+
+    query = get_query("GET_METHOD_CALL_CHAIN", depth=max_depth)
+    cypher, params = query.bind(methodId=method_id)
+    result = await neo4j.query_code_structure(cypher, params)
+
+Variable-length bounds cannot be Cypher parameters. Queries that write
+``*1..$maxDepth`` are registered as one variant per depth from 1 to
+``MAX_TRAVERSAL_DEPTH``; requested depths are clamped into that range, so
+the number of distinct plans stays bounded.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Iterator, Optional
+
+from . import blueprint_queries, flow_queries, graph_queries
+
+# Marker for a variable-length upper bound in a depth-variant template
+DEPTH_MARKER = "$maxDepth"
+
+# Deepest variant registered for depth-variant queries
+MAX_TRAVERSAL_DEPTH = 20
+
+_PARAM_PATTERN = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+@dataclass(frozen=True)
+class PreparedQuery:
+    """A registered Cypher query with a fixed text and known parameters."""
+
+    name: str
+    text: str
+    parameters: frozenset[str]
+    depth: Optional[int] = None
+
+    def bind(self, **params: Any) -> tuple[str, dict[str, Any]]:
+        """
+        Pair the query text with parameter values.
+
+        Raises:
+            ValueError: If a parameter is missing or not used by the query
+        """
+        missing = self.parameters - params.keys()
+        if missing:
+            raise ValueError(f"Query {self.name} missing parameters: {sorted(missing)}")
+        unknown = params.keys() - self.parameters
+        if unknown:
+            raise ValueError(f"Query {self.name} does not take parameters: {sorted(unknown)}")
+        return self.text, dict(params)
+
+
+class QueryRegistry:
+    """Name-indexed collection of prepared queries."""
+
+    def __init__(self, max_depth: int = MAX_TRAVERSAL_DEPTH):
+        self.max_depth = max_depth
+        self._queries: dict[str, PreparedQuery] = {}
+        self._depth_variants: dict[str, dict[int, PreparedQuery]] = {}
+        self._by_text: dict[str, PreparedQuery] = {}
+
+    def register(self, name: str, text: str) -> PreparedQuery:
+        """Register a fully parameterized query under ``name``."""
+        if name in self._queries or name in self._depth_variants:
+            raise ValueError(f"Query already registered: {name}")
+        if DEPTH_MARKER in text:
+            raise ValueError(
+                f"Query {name} has a variable-length bound; use register_depth_variants"
+            )
+        query = PreparedQuery(name, text, _parameters_of(text))
+        self._queries[name] = query
+        self._by_text.setdefault(text, query)
+        return query
+
+    def register_depth_variants(self, name: str, template: str) -> list[PreparedQuery]:
+        """Register one variant of ``template`` per depth in 1..max_depth."""
+        if name in self._queries or name in self._depth_variants:
+            raise ValueError(f"Query already registered: {name}")
+        if DEPTH_MARKER not in template:
+            raise ValueError(f"Query {name} has no {DEPTH_MARKER} bound")
+        variants = {}
+        for depth in range(1, self.max_depth + 1):
+            text = template.replace(DEPTH_MARKER, str(depth))
+            variants[depth] = PreparedQuery(name, text, _parameters_of(text), depth)
+            self._by_text.setdefault(text, variants[depth])
+        self._depth_variants[name] = variants
+        return list(variants.values())
+
+    def get(self, name: str, depth: Optional[int] = None) -> PreparedQuery:
+        """
+        Look up a registered query.
+
+        Args:
+            name: Registered query name
+            depth: Traversal depth for depth-variant queries (clamped to
+                1..max_depth); ignored for other queries
+
+        Raises:
+            KeyError: If no query is registered under ``name``
+            ValueError: If a depth-variant query is requested without a depth
+        """
+        if name in self._depth_variants:
+            if depth is None:
+                raise ValueError(f"Query {name} requires a depth")
+            return self._depth_variants[name][max(1, min(int(depth), self.max_depth))]
+        return self._queries[name]
+
+    def lookup_text(self, text: str) -> Optional[PreparedQuery]:
+        """The registered query with exactly this text, if any."""
+        return self._by_text.get(text)
+
+    def names(self) -> list[str]:
+        """Names of all registered queries."""
+        return sorted([*self._queries, *self._depth_variants])
+
+    def __iter__(self) -> Iterator[PreparedQuery]:
+        """Iterate every registered query text, including all depth variants."""
+        yield from self._queries.values()
+        for variants in self._depth_variants.values():
+            yield from variants.values()
+
+    def __len__(self) -> int:
+        return len(self._queries) + sum(len(v) for v in self._depth_variants.values())
+
+    def register_module(self, module: ModuleType) -> None:
+        """Register every upper-case string constant defined in ``module``."""
+        for name, value in vars(module).items():
+            if not name.isupper() or not isinstance(value, str):
+                continue
+            if DEPTH_MARKER in value:
+                self.register_depth_variants(name, value)
+            else:
+                self.register(name, value)
+
+
+def _parameters_of(text: str) -> frozenset[str]:
+    """Parameter names (without ``$``) referenced by a query text."""
+    return frozenset(_PARAM_PATTERN.findall(text))
+
+
+def build_default_registry() -> QueryRegistry:
+    """Registry holding all code graph queries shipped with the package."""
+    registry = QueryRegistry()
+    for module in (flow_queries, blueprint_queries, graph_queries):
+        registry.register_module(module)
+    return registry
+
+
+QUERY_REGISTRY = build_default_registry()
+
+
+def get_query(name: str, depth: Optional[int] = None) -> PreparedQuery:
+    """Look up a query in the default registry."""
+    return QUERY_REGISTRY.get(name, depth)
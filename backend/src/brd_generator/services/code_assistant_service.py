@@ -11,6 +11,7 @@ from typing import Any, Optional
 from ..api.chat_models import ChatRequest, ChatResponse, Citation, RelatedEntity
 from ..mcp_clients.neo4j_client import Neo4jMCPClient
 from ..mcp_clients.filesystem_client import FilesystemMCPClient
+from ..core.llm_gateway import llm_gateway
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -416,15 +417,9 @@ class CodeAssistantService:
         items = []
 
         for keyword in keywords[:5]:
-            query = """
-                MATCH (n)
-                WHERE toLower(n.name) CONTAINS toLower($keyword)
-                   OR toLower(n.filePath) CONTAINS toLower($keyword)
-                RETURN n.name as name, n.filePath as filePath, n.startLine as startLine,
-                       n.endLine as endLine, labels(n)[0] as type, n.sourceCode as sourceCode
-                LIMIT 100
-            """
-            result = await self.neo4j_client.query_code_structure(query, {"keyword": keyword})
+            result = await self.neo4j_client.query_name_matches(
+                "KEYWORD_SEARCH", [keyword], include_paths=True, limit=100
+            )
             for node in result.get("nodes", []):
                 items.append({
                     "name": node.get("name", "unknown"),
@@ -468,23 +463,19 @@ class CodeAssistantService:
                 if not file_path.startswith(workspace_root):
                     full_path = os.path.join(workspace_root, file_path.lstrip("/"))
 
-                # Read the file content
-                content = await self.filesystem_client.read_file(full_path)
+                # Relevant lines plus surrounding context (5 lines before and after)
+                start = max(0, (item.get("line_start", 1) or 1) - 1)
+                end = item.get("line_end", start + 20) or start + 20
+                context_start = max(0, start - 5)
 
-                if content:
-                    # Extract relevant lines
-                    lines = content.split("\n")
-                    start = max(0, (item.get("line_start", 1) or 1) - 1)
-                    end = min(len(lines), (item.get("line_end", start + 20) or start + 20))
-
-                    # Get surrounding context (5 lines before and after)
-                    context_start = max(0, start - 5)
-                    context_end = min(len(lines), end + 5)
+                snippet = await self.filesystem_client.read_lines(
+                    full_path, context_start + 1, end + 5
+                )
 
-                    snippet = "\n".join(lines[context_start:context_end])
+                if snippet:
                     item["source_code"] = snippet
                     item["line_start"] = context_start + 1
-                    item["line_end"] = context_end
+                    item["line_end"] = context_start + snippet.count("\n") + 1
 
             except Exception as e:
                 logger.debug(f"Could not read file {file_path}: {e}")
@@ -583,17 +574,11 @@ Instructions:
 Provide your answer:"""
 
         try:
-            import asyncio
-
-            if hasattr(self.copilot_session, 'send_and_wait'):
-                message_options = {"prompt": prompt}
-                event = await asyncio.wait_for(
-                    self.copilot_session.send_and_wait(message_options, timeout=60),
-                    timeout=60,
-                )
-
-                if event:
-                    return self._extract_content(event)
+            response = await llm_gateway.send(
+                self.copilot_session, prompt, caller="code_assistant", timeout=60
+            )
+            if response:
+                return response
 
             # Fallback to basic response if LLM fails
             return self._generate_mock_answer(question, question_type, context_items, citations)
@@ -602,27 +587,6 @@ Provide your answer:"""
             logger.error(f"LLM generation failed: {e}")
             return self._generate_mock_answer(question, question_type, context_items, citations)
 
-    def _extract_content(self, event: Any) -> str:
-        """Extract text content from a session event."""
-        try:
-            if hasattr(event, 'data'):
-                data = event.data
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    return str(data.message.content)
-                if hasattr(data, 'content'):
-                    return str(data.content)
-                if hasattr(data, 'text'):
-                    return str(data.text)
-
-            if hasattr(event, 'content'):
-                return str(event.content)
-            if hasattr(event, 'text'):
-                return str(event.text)
-
-            return str(event)
-        except Exception:
-            return ""
-
     def _generate_mock_answer(
         self,
         question: str,
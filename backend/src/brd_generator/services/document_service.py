@@ -5,16 +5,19 @@ This service provides:
 - EPIC management with parent BRD linking
 - Backlog item management with parent EPIC linking
 - Pagination, filtering, and sorting
+- Summary listings: column-projected rows with child counts, paginated
+  by (created_at, id) keyset cursors
 - Export functionality
 """
 
 from __future__ import annotations
 
+import base64
 from datetime import datetime
 from typing import Any, Optional
 from uuid import uuid4
 
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, func, and_, or_, desc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
@@ -33,6 +36,115 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """Opaque cursor for the row after which the next page starts."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Parse a cursor from ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), id
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+async def _keyset_page(
+    session: AsyncSession,
+    query,
+    model,
+    limit: int,
+    cursor: Optional[str],
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """Run a projected query newest first, one page after ``cursor``.
+
+    Ordering by (created_at, id) and seeking past the cursor row keeps
+    every page an index range scan, however deep the page.
+
+    Returns:
+        Tuple of (row mappings, cursor of the next page or None)
+    """
+    if cursor:
+        query = query.where(tuple_(model.created_at, model.id) < decode_cursor(cursor))
+    query = query.order_by(desc(model.created_at), desc(model.id)).limit(limit + 1)
+
+    result = await session.execute(query)
+    rows = [dict(row) for row in result.mappings().all()]
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+
+def _brd_conditions(
+    repository_id: Optional[str] = None,
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+) -> list:
+    conditions = []
+    if repository_id:
+        conditions.append(BRDDB.repository_id == repository_id)
+    if status:
+        conditions.append(BRDDB.status == DocumentStatus(status))
+    if search:
+        search_pattern = f"%{search}%"
+        conditions.append(
+            or_(
+                BRDDB.title.ilike(search_pattern),
+                BRDDB.feature_description.ilike(search_pattern),
+                BRDDB.brd_number.ilike(search_pattern),
+            )
+        )
+    return conditions
+
+
+def _epic_conditions(
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+) -> list:
+    conditions = []
+    if status:
+        conditions.append(EpicDB.status == DocumentStatus(status))
+    if search:
+        search_pattern = f"%{search}%"
+        conditions.append(
+            or_(
+                EpicDB.title.ilike(search_pattern),
+                EpicDB.description.ilike(search_pattern),
+                EpicDB.epic_number.ilike(search_pattern),
+            )
+        )
+    return conditions
+
+
+def _backlog_conditions(
+    status: Optional[str] = None,
+    item_type: Optional[str] = None,
+    priority: Optional[str] = None,
+    search: Optional[str] = None,
+) -> list:
+    conditions = []
+    if status:
+        conditions.append(BacklogDB.status == DocumentStatus(status))
+    if item_type:
+        conditions.append(BacklogDB.item_type == item_type)
+    if priority:
+        conditions.append(BacklogDB.priority == EpicPriority(priority))
+    if search:
+        conditions.append(
+            or_(
+                BacklogDB.title.ilike(f"%{search}%"),
+                BacklogDB.description.ilike(f"%{search}%"),
+            )
+        )
+    return conditions
+
+
 class DocumentService:
     """Service for managing BRD, EPIC, and Backlog documents.
 
@@ -180,21 +292,7 @@ class DocumentService:
             count_query = select(func.count(BRDDB.id))
 
             # Apply filters
-            conditions = []
-            if repository_id:
-                conditions.append(BRDDB.repository_id == repository_id)
-            if status:
-                conditions.append(BRDDB.status == DocumentStatus(status))
-            if search:
-                search_pattern = f"%{search}%"
-                conditions.append(
-                    or_(
-                        BRDDB.title.ilike(search_pattern),
-                        BRDDB.feature_description.ilike(search_pattern),
-                        BRDDB.brd_number.ilike(search_pattern),
-                    )
-                )
-
+            conditions = _brd_conditions(repository_id, status, search)
             if conditions:
                 query = query.where(and_(*conditions))
                 count_query = count_query.where(and_(*conditions))
@@ -211,6 +309,71 @@ class DocumentService:
 
             return brds, total
 
+    async def list_brd_summaries(
+        self,
+        repository_id: Optional[str] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """List BRD summary rows, newest first.
+
+        Only list columns are read: no markdown, sections or verification
+        report, and EPIC/backlog counts come from per-row count subqueries
+        instead of loading the children. Use ``get_brd`` for the full
+        document.
+
+        Args:
+            repository_id: Filter by repository
+            status: Filter by status
+            search: Search in title/description
+            limit: Max results
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Tuple of (summary rows, cursor of the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        epic_count = (
+            select(func.count(EpicDB.id))
+            .where(EpicDB.brd_id == BRDDB.id)
+            .correlate(BRDDB)
+            .scalar_subquery()
+        )
+        backlog_count = (
+            select(func.count(BacklogDB.id))
+            .join(EpicDB, BacklogDB.epic_id == EpicDB.id)
+            .where(EpicDB.brd_id == BRDDB.id)
+            .correlate(BRDDB)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                BRDDB.id,
+                BRDDB.brd_number,
+                BRDDB.title,
+                BRDDB.repository_id,
+                RepositoryDB.name.label("repository_name"),
+                BRDDB.mode,
+                BRDDB.confidence_score,
+                BRDDB.status,
+                BRDDB.version,
+                BRDDB.refinement_count,
+                epic_count.label("epic_count"),
+                backlog_count.label("backlog_count"),
+                BRDDB.created_at,
+                BRDDB.updated_at,
+            )
+            .outerjoin(RepositoryDB, BRDDB.repository_id == RepositoryDB.id)
+            .where(*_brd_conditions(repository_id, status, search))
+        )
+
+        async with get_async_session() as session:
+            return await _keyset_page(session, query, BRDDB, limit, cursor)
+
     async def get_brd(self, brd_id: str) -> Optional[BRDDB]:
         """Get a BRD by ID with all relationships loaded."""
         async with get_async_session() as session:
@@ -355,19 +518,7 @@ class DocumentService:
             count_query = select(func.count(EpicDB.id))
 
             # Apply filters
-            conditions = []
-            if status:
-                conditions.append(EpicDB.status == DocumentStatus(status))
-            if search:
-                search_pattern = f"%{search}%"
-                conditions.append(
-                    or_(
-                        EpicDB.title.ilike(search_pattern),
-                        EpicDB.description.ilike(search_pattern),
-                        EpicDB.epic_number.ilike(search_pattern),
-                    )
-                )
-
+            conditions = _epic_conditions(status, search)
             if conditions:
                 query = query.where(and_(*conditions))
                 count_query = count_query.where(and_(*conditions))
@@ -384,6 +535,58 @@ class DocumentService:
 
             return epics, total
 
+    async def list_epic_summaries(
+        self,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """List EPIC summary rows across all BRDs, newest first.
+
+        Args:
+            status: Filter by status
+            search: Search in title/description
+            limit: Max results
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Tuple of (summary rows, cursor of the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        backlog_count = (
+            select(func.count(BacklogDB.id))
+            .where(BacklogDB.epic_id == EpicDB.id)
+            .correlate(EpicDB)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                EpicDB.id,
+                EpicDB.epic_number,
+                EpicDB.brd_id,
+                BRDDB.title.label("brd_title"),
+                BRDDB.repository_id,
+                RepositoryDB.name.label("repository_name"),
+                EpicDB.title,
+                EpicDB.priority,
+                EpicDB.status,
+                EpicDB.refinement_count,
+                EpicDB.display_order,
+                backlog_count.label("backlog_count"),
+                EpicDB.created_at,
+                EpicDB.updated_at,
+            )
+            .join(BRDDB, EpicDB.brd_id == BRDDB.id)
+            .outerjoin(RepositoryDB, BRDDB.repository_id == RepositoryDB.id)
+            .where(*_epic_conditions(status, search))
+        )
+
+        async with get_async_session() as session:
+            return await _keyset_page(session, query, EpicDB, limit, cursor)
+
     async def save_epics_for_brd(
         self,
         brd_id: str,
@@ -614,18 +817,9 @@ class DocumentService:
             )
 
             # Apply filters
-            if status:
-                query = query.where(BacklogDB.status == DocumentStatus(status))
-            if item_type:
-                query = query.where(BacklogDB.item_type == item_type)
-            if priority:
-                query = query.where(BacklogDB.priority == EpicPriority(priority))
-            if search:
-                search_filter = or_(
-                    BacklogDB.title.ilike(f"%{search}%"),
-                    BacklogDB.description.ilike(f"%{search}%"),
-                )
-                query = query.where(search_filter)
+            conditions = _backlog_conditions(status, item_type, priority, search)
+            if conditions:
+                query = query.where(and_(*conditions))
 
             # Get total count
             count_query = select(func.count()).select_from(query.subquery())
@@ -641,6 +835,53 @@ class DocumentService:
 
             return backlogs, total
 
+    async def list_backlog_summaries(
+        self,
+        status: Optional[str] = None,
+        item_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """List backlog summary rows across all EPICs, newest first.
+
+        Args:
+            status: Filter by status
+            item_type: Filter by item type
+            priority: Filter by priority
+            search: Search in title/description
+            limit: Max results
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Tuple of (summary rows, cursor of the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = (
+            select(
+                BacklogDB.id,
+                BacklogDB.backlog_number,
+                BacklogDB.epic_id,
+                EpicDB.title.label("epic_title"),
+                BacklogDB.title,
+                BacklogDB.item_type,
+                BacklogDB.priority,
+                BacklogDB.story_points,
+                BacklogDB.status,
+                BacklogDB.refinement_count,
+                BacklogDB.created_at,
+                BacklogDB.updated_at,
+            )
+            .join(EpicDB, BacklogDB.epic_id == EpicDB.id)
+            .where(*_backlog_conditions(status, item_type, priority, search))
+        )
+
+        async with get_async_session() as session:
+            return await _keyset_page(session, query, BacklogDB, limit, cursor)
+
     async def get_backlog(self, backlog_id: str) -> Optional[BacklogDB]:
         """Get a backlog item by ID."""
         async with get_async_session() as session:
@@ -270,6 +270,36 @@ class GitClient:
             behind=behind,
         )
 
+    async def get_changed_files(
+        self,
+        repo_path: Path,
+        from_commit: str,
+        to_commit: str = "HEAD",
+    ) -> Optional[list[str]]:
+        """List files changed between two commits.
+
+        Renames are reported as a deletion plus an addition, so both the old
+        and new paths are included.
+
+        Args:
+            repo_path: Path to the repository.
+            from_commit: Base commit SHA.
+            to_commit: Target commit SHA.
+
+        Returns:
+            Repository-relative paths, or None if the diff could not be
+            computed (e.g. the base commit is missing from a shallow clone).
+        """
+        returncode, output, _ = await self._run_git(
+            "diff", "--name-only", "--no-renames", from_commit, to_commit,
+            cwd=repo_path
+        )
+
+        if returncode != 0:
+            return None
+
+        return [line for line in output.splitlines() if line]
+
     async def get_default_branch(self, repo_path: Path) -> str:
         """Get the default branch name from remote.
 
@@ -0,0 +1,140 @@
+"""In-process pub/sub bus for analysis job progress.
+
+Producers (CheckpointedTask, the codegraph callback routes and the
+repository service's completion poller) publish progress events keyed by
+analysis run ID. SSE endpoints subscribe and receive events as they happen
+instead of polling the database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# Configuration from environment
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("PROGRESS_BUS_QUEUE_SIZE", "100"))
+
+# Event types after which a job produces no further progress
+TERMINAL_EVENT_TYPES = frozenset({"complete", "error"})
+
+
+class ProgressSubscription:
+    """A single subscriber's view of one analysis run's progress events."""
+
+    def __init__(self, analysis_run_id: str, maxsize: int = SUBSCRIBER_QUEUE_SIZE):
+        """Initialize the subscription.
+
+        Args:
+            analysis_run_id: The analysis run ID.
+            maxsize: Maximum number of buffered events.
+        """
+        self.analysis_run_id = analysis_run_id
+        self._queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(maxsize=maxsize)
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        """Enqueue an event without blocking the publisher.
+
+        Progress events are cumulative snapshots, so when a slow consumer's
+        buffer is full the oldest event is dropped.
+        """
+        if self._queue.full():
+            try:
+                self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        self._queue.put_nowait(event)
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Remove and return all buffered events, oldest first."""
+        events = []
+        while not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            The event, or None if the timeout expired.
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ProgressBus:
+    """Fan-out of progress events to subscribers, keyed by analysis run ID.
+
+    Must be used from the event loop thread; publishing never blocks.
+    """
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        """Initialize the bus.
+
+        Args:
+            queue_size: Per-subscriber event buffer size.
+        """
+        self._queue_size = queue_size
+        self._subscribers: Dict[str, Set[ProgressSubscription]] = {}
+
+    def publish(self, analysis_run_id: str, event: Dict[str, Any]) -> int:
+        """Publish an event to all subscribers of an analysis run.
+
+        Args:
+            analysis_run_id: The analysis run ID.
+            event: Event payload (fields of JobProgressEvent).
+
+        Returns:
+            Number of subscribers the event was delivered to.
+        """
+        subscribers = self._subscribers.get(analysis_run_id)
+        if not subscribers:
+            return 0
+
+        for subscription in list(subscribers):
+            subscription.offer(dict(event))
+        return len(subscribers)
+
+    @contextmanager
+    def subscribe(self, analysis_run_id: str) -> Iterator[ProgressSubscription]:
+        """Subscribe to an analysis run's events for the duration of the block.
+
+        Args:
+            analysis_run_id: The analysis run ID.
+
+        Yields:
+            The subscription to read events from.
+        """
+        subscription = ProgressSubscription(analysis_run_id, maxsize=self._queue_size)
+        self._subscribers.setdefault(analysis_run_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(analysis_run_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[analysis_run_id]
+
+    def subscriber_count(self, analysis_run_id: Optional[str] = None) -> int:
+        """Get the number of active subscribers.
+
+        Args:
+            analysis_run_id: Count only this run's subscribers if given.
+
+        Returns:
+            Number of subscribers.
+        """
+        if analysis_run_id is not None:
+            return len(self._subscribers.get(analysis_run_id, ()))
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+# Singleton instance
+progress_bus = ProgressBus()
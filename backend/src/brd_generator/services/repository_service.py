@@ -41,6 +41,7 @@ from ..models.repository import (
 )
 from .git_client import GitClient
 from .platform_client import PlatformClient, create_platform_client
+from .progress_bus import progress_bus
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -1001,6 +1002,15 @@ class RepositoryService:
                             db_repo.analysis_status = DBAnalysisStatus.COMPLETED
                             db_repo.last_analyzed_at = datetime.utcnow()
                         await session.commit()
+                        progress_bus.publish(analysis_id, {
+                            "type": "complete",
+                            "phase": "completed",
+                            "progress_pct": 100,
+                            "nodes_created": stats.get("nodes_created", 0),
+                            "relationships_created": stats.get("relationships_created", 0),
+                            "status": "completed",
+                            "message": "Analysis completed successfully",
+                        })
 
                         logger.info(
                             f"Analysis completed: {analysis_id} - "
@@ -1026,6 +1036,12 @@ class RepositoryService:
                         if db_repo:
                             db_repo.analysis_status = DBAnalysisStatus.FAILED
                         await session.commit()
+                        progress_bus.publish(analysis_id, {
+                            "type": "error",
+                            "phase": "failed",
+                            "status": "failed",
+                            "error": error,
+                        })
 
                         logger.error(f"Analysis failed: {analysis_id} - {error}")
                         return
@@ -1057,6 +1073,12 @@ class RepositoryService:
 
             await session.commit()
 
+        progress_bus.publish(analysis_id, {
+            "type": "error",
+            "phase": "failed",
+            "status": "failed",
+            "error": "Analysis timed out",
+        })
         logger.error(f"Analysis timed out: {analysis_id}")
 
     async def get_analysis_run(
@@ -1332,6 +1354,7 @@ class RepositoryService:
                     depth=depth,
                     wiki_options=wiki_options,  # Pass full options for advanced mode
                     progress_callback=None,  # Could add logging callback
+                    incremental=True,  # Only regenerate pages whose sources changed
                 )
 
                 # Mark analysis as having wiki generated
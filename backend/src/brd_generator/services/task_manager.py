@@ -28,6 +28,7 @@ from ..database.models import (
     RepositoryDB,
 )
 from ..utils.logger import get_logger
+from .progress_bus import progress_bus
 
 logger = get_logger(__name__)
 
@@ -88,6 +89,7 @@ class CheckpointedTask:
         """
         self.current_phase = phase
         self._files_since_checkpoint = 0
+        self._publish()
         await self._save_checkpoint()
         await self._log(LogLevel.INFO, phase.value, f"Entered phase: {phase.value}")
 
@@ -120,6 +122,7 @@ class CheckpointedTask:
             self.checkpoint_data.update(checkpoint_data)
 
         self._files_since_checkpoint += 1
+        self._publish()
 
         # Save checkpoint at interval
         if self._files_since_checkpoint >= self.checkpoint_interval:
@@ -135,6 +138,12 @@ class CheckpointedTask:
         self.current_phase = AnalysisJobPhase.COMPLETED
         if stats:
             self.checkpoint_data["final_stats"] = stats
+        self._publish(
+            "complete",
+            progress_pct=100,
+            status="completed",
+            message="Analysis completed successfully",
+        )
         await self._save_checkpoint()
         await self._log(LogLevel.INFO, "completed", "Analysis job completed successfully")
 
@@ -146,6 +155,7 @@ class CheckpointedTask:
         """
         self.current_phase = AnalysisJobPhase.FAILED
         self.checkpoint_data["error"] = error
+        self._publish("error", status="failed", error=error)
         await self._save_checkpoint()
         await self._log(LogLevel.ERROR, "failed", f"Analysis job failed: {error}")
 
@@ -153,6 +163,7 @@ class CheckpointedTask:
         """Pause the task and save checkpoint."""
         self._paused = True
         self.current_phase = AnalysisJobPhase.PAUSED
+        self._publish(status="paused")
         await self._save_checkpoint()
         await self._log(LogLevel.INFO, "paused", "Analysis job paused")
 
@@ -177,6 +188,26 @@ class CheckpointedTask:
             return 0
         return int((self.processed_files / self.total_files) * 100)
 
+    def _publish(self, event_type: str = "progress", **fields: Any) -> None:
+        """Push current progress to SSE subscribers via the progress bus.
+
+        Args:
+            event_type: JobProgressEvent type.
+            **fields: Overrides for the event payload.
+        """
+        event = {
+            "type": event_type,
+            "phase": self.current_phase.value,
+            "progress_pct": self.progress_pct,
+            "processed_files": self.processed_files,
+            "total_files": self.total_files,
+            "nodes_created": self.nodes_created,
+            "relationships_created": self.relationships_created,
+            "status": "running",
+        }
+        event.update(fields)
+        progress_bus.publish(self.analysis_run_id, event)
+
     async def _save_checkpoint(self) -> None:
         """Save current progress to database."""
         async with get_async_session() as session:
@@ -5,9 +5,11 @@ Uses Copilot SDK for LLM-powered intelligent content generation.
 """
 
 import asyncio
+import os
 import time
 from datetime import datetime
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Iterable, Optional
 from uuid import uuid4
 
 from sqlalchemy import select
@@ -20,10 +22,17 @@ from ..database.models import (
     WikiPageType,
     RepositoryDB,
 )
+from ..core.llm_cache import llm_cache_bypass, llm_response_cache
+from ..core.llm_gateway import llm_gateway
+from ..core.session_pool import CopilotSessionPool, SessionFactory
+from .git_client import GitClient
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum wiki pages (and Copilot sessions) generated concurrently
+DEFAULT_WIKI_PAGE_CONCURRENCY = int(os.getenv("WIKI_PAGE_CONCURRENCY", "4"))
+
 
 # =============================================================================
 # LLM Prompts for Wiki Generation
@@ -651,18 +660,40 @@ class WikiService:
     Falls back to template-based generation when SDK is not available.
     """
 
-    def __init__(self, neo4j_client=None, filesystem_client=None, copilot_session: Any = None):
+    def __init__(
+        self,
+        neo4j_client=None,
+        filesystem_client=None,
+        copilot_session: Any = None,
+        session_factory: Optional[SessionFactory] = None,
+        max_concurrency: int = DEFAULT_WIKI_PAGE_CONCURRENCY,
+        git_client: Optional[GitClient] = None,
+        model: Optional[str] = None,
+    ):
         """Initialize the wiki service.
 
         Args:
             neo4j_client: Neo4j client for querying code graph (metadata, relationships)
             filesystem_client: Filesystem MCP client for reading actual source code
             copilot_session: Copilot SDK session for LLM-powered generation
+            session_factory: Async callable creating extra Copilot sessions so
+                pages can be generated concurrently
+            max_concurrency: Maximum pages generated at once
+            git_client: Git client for diffing commits in incremental mode
+            model: Model the Copilot sessions use; part of the LLM cache key
         """
         self.neo4j_client = neo4j_client
         self.filesystem_client = filesystem_client
         self.copilot_session = copilot_session
+        self.max_concurrency = max(1, max_concurrency)
+        self._session_pool = CopilotSessionPool(
+            copilot_session,
+            session_factory=session_factory,
+            max_size=self.max_concurrency,
+        )
         self._llm_available = copilot_session is not None
+        self.git_client = git_client or GitClient()
+        self.model = model or os.getenv("COPILOT_MODEL", "gpt-4o")
 
         if self._llm_available:
             logger.info("WikiService initialized with Copilot SDK for LLM-powered generation")
@@ -674,12 +705,23 @@ class WikiService:
         else:
             logger.warning("WikiService: No filesystem client - source code reading disabled")
 
-    async def _send_to_llm(self, prompt: str, timeout: float = 120) -> Optional[str]:
+    async def _send_to_llm(
+        self,
+        prompt: str,
+        timeout: float = 120,
+        repository: Optional[RepositoryDB] = None,
+    ) -> Optional[str]:
         """Send a prompt to the LLM via Copilot SDK.
 
+        Each call borrows a session from the pool, so concurrent page
+        generation never interleaves turns on one conversation. Responses
+        are cached per repository commit, so regenerating an unchanged
+        page reuses the earlier response.
+
         Args:
             prompt: The prompt to send
             timeout: Timeout in seconds
+            repository: Repository the prompt documents; scopes the cache entry
 
         Returns:
             LLM response text or None if failed
@@ -687,36 +729,37 @@ class WikiService:
         if not self.copilot_session:
             return None
 
+        async def send() -> Optional[str]:
+            async with self._session_pool.acquire() as llm_session:
+                if llm_session is None:
+                    return None
+                return await self._send_with_session(llm_session, prompt, timeout)
+
+        cache_context = None
+        if repository is not None:
+            cache_context = {"repository_id": repository.id, "commit": repository.current_commit}
+
+        return await llm_response_cache.get_or_call(
+            "wiki", prompt, send, model=self.model, context=cache_context
+        )
+
+    async def _send_with_session(self, llm_session: Any, prompt: str, timeout: float) -> Optional[str]:
+        """Send a prompt through a specific Copilot session."""
         try:
-            import time
             start_time = time.time()
 
             prompt_preview = prompt[:100] + "..." if len(prompt) > 100 else prompt
             logger.info(f"[WIKI] Sending to LLM ({len(prompt)} chars)")
             logger.debug(f"[WIKI] Prompt preview: {prompt_preview}")
 
-            message_options = {"prompt": prompt}
-
-            if hasattr(self.copilot_session, 'send_and_wait'):
-                event = await asyncio.wait_for(
-                    self.copilot_session.send_and_wait(message_options, timeout=timeout),
-                    timeout=timeout
-                )
-                elapsed = time.time() - start_time
-
-                if event:
-                    response = self._extract_from_event(event)
-                    logger.info(f"[WIKI] Response received ({len(response)} chars, {elapsed:.2f}s)")
-                    return response
-                else:
-                    logger.warning(f"[WIKI] No event returned from SDK ({elapsed:.2f}s)")
-                    return None
+            response = await llm_gateway.send(llm_session, prompt, caller="wiki", timeout=timeout)
+            elapsed = time.time() - start_time
 
-            elif hasattr(self.copilot_session, 'send'):
-                await self.copilot_session.send(message_options)
-                response = await self._wait_for_response(timeout)
+            if response:
+                logger.info(f"[WIKI] Response received ({len(response)} chars, {elapsed:.2f}s)")
                 return response
 
+            logger.warning(f"[WIKI] No response returned from SDK ({elapsed:.2f}s)")
             return None
 
         except asyncio.TimeoutError:
@@ -726,50 +769,6 @@ class WikiService:
             logger.error(f"[WIKI] LLM error: {e}")
             return None
 
-    def _extract_from_event(self, event: Any) -> str:
-        """Extract text content from a Copilot event."""
-        try:
-            if hasattr(event, 'data'):
-                data = event.data
-                if hasattr(data, 'message') and hasattr(data.message, 'content'):
-                    return str(data.message.content)
-                if hasattr(data, 'content'):
-                    return str(data.content)
-                if hasattr(data, 'text'):
-                    return str(data.text)
-
-            if hasattr(event, 'content'):
-                return str(event.content)
-            if hasattr(event, 'text'):
-                return str(event.text)
-
-            return str(event)
-        except Exception as e:
-            logger.error(f"[WIKI] Error extracting from event: {e}")
-            return ""
-
-    async def _wait_for_response(self, timeout: float) -> str:
-        """Wait for LLM response by polling messages."""
-        start_time = asyncio.get_event_loop().time()
-        poll_interval = 1.0
-
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
-                return ""
-
-            try:
-                messages = self.copilot_session.get_messages()
-                for msg in reversed(messages):
-                    if hasattr(msg, 'data'):
-                        data = msg.data
-                        if hasattr(data, 'role') and data.role == 'assistant':
-                            return self._extract_from_event(msg)
-            except Exception as e:
-                logger.debug(f"[WIKI] Poll error: {e}")
-
-            await asyncio.sleep(poll_interval)
-
     async def get_or_create_wiki(
         self,
         session: AsyncSession,
@@ -801,6 +800,8 @@ class WikiService:
         depth: str = "standard",  # quick, standard, comprehensive, custom
         wiki_options: Optional[dict] = None,  # Full wiki configuration options
         progress_callback=None,
+        incremental: bool = False,
+        bypass_cache: bool = False,
     ) -> WikiDB:
         """Generate wiki documentation for a repository.
 
@@ -811,6 +812,9 @@ class WikiService:
             depth: Generation depth level
             wiki_options: Full wiki configuration options including advanced mode settings
             progress_callback: Async callback for progress updates
+            incremental: Only regenerate pages whose sources changed since the
+                wiki's commit; falls back to a full rebuild when not possible
+            bypass_cache: Ignore cached LLM responses and refresh them
 
         Returns:
             Updated WikiDB instance
@@ -821,6 +825,7 @@ class WikiService:
 
         # Get or create wiki
         wiki = await self.get_or_create_wiki(session, repository_id)
+        previous_status = wiki.status
         wiki.status = WikiStatus.GENERATING
         wiki.status_message = "Starting wiki generation..."
         await session.flush()
@@ -828,6 +833,7 @@ class WikiService:
         if progress_callback:
             await progress_callback("init", "Starting wiki generation...")
 
+        bypass_token = llm_cache_bypass.set(bypass_cache)
         try:
             # Get repository info
             repo_result = await session.execute(
@@ -838,11 +844,24 @@ class WikiService:
             if not repository:
                 raise ValueError(f"Repository not found: {repository_id}")
 
+            if incremental and previous_status == WikiStatus.GENERATED:
+                updated = await self._update_wiki_incrementally(
+                    session,
+                    wiki,
+                    repository,
+                    commit_sha or repository.current_commit,
+                    depth,
+                    wiki_options,
+                    progress_callback,
+                )
+                if updated:
+                    return wiki
+
             # Gather data from Neo4j and Filesystem
             if progress_callback:
                 await progress_callback("gathering", "Gathering codebase information...")
 
-            codebase_data = await self._gather_codebase_data(repository_id)
+            codebase_data = await self._gather_codebase_data(repository_id, repository)
 
             # Add context notes to codebase_data for LLM prompts (advanced mode)
             if mode == "advanced":
@@ -874,23 +893,14 @@ class WikiService:
             if progress_callback:
                 await progress_callback("generating", f"Generating {total_pages} pages...")
 
-            # Generate each page
-            generated_pages = []
-            for idx, page_spec in enumerate(pages_to_generate):
-                if progress_callback:
-                    await progress_callback(
-                        "page",
-                        f"Generating: {page_spec['title']} ({idx + 1}/{total_pages})"
-                    )
-
-                page = await self._generate_page(
-                    session,
-                    wiki.id,
-                    page_spec,
-                    codebase_data,
-                    repository,
-                )
-                generated_pages.append(page)
+            generated_pages = await self._generate_pages(
+                session,
+                wiki.id,
+                pages_to_generate,
+                codebase_data,
+                repository,
+                progress_callback,
+            )
 
             # Update wiki status
             wiki.status = WikiStatus.GENERATED
@@ -900,6 +910,15 @@ class WikiService:
             wiki.stale_pages = 0
             wiki.generation_mode = "llm-powered" if self._llm_available else "template"
             wiki.generated_at = datetime.utcnow()
+            # Remember the page layout so later runs can regenerate incrementally
+            wiki.config = {
+                "depth": depth,
+                "wiki_options": wiki_options,
+                "page_specs": [
+                    {**spec, "type": WikiPageType(spec["type"]).value}
+                    for spec in pages_to_generate
+                ],
+            }
 
             duration_ms = int((time.time() - start_time) * 1000)
             generation_mode = "llm-powered" if self._llm_available else "template-based"
@@ -919,6 +938,233 @@ class WikiService:
             wiki.status_message = str(e)
             await session.flush()
             raise
+        finally:
+            llm_cache_bypass.reset(bypass_token)
+
+    async def _update_wiki_incrementally(
+        self,
+        session: AsyncSession,
+        wiki: WikiDB,
+        repository: RepositoryDB,
+        target_commit: Optional[str],
+        depth: str,
+        wiki_options: dict,
+        progress_callback=None,
+    ) -> bool:
+        """Regenerate only the pages whose source files changed since the wiki's commit.
+
+        Returns:
+            True if the wiki was updated, False if a full rebuild is needed
+            (no previous layout, different options, or no usable diff).
+        """
+        start_time = time.time()
+        config = wiki.config or {}
+        stored_specs = config.get("page_specs")
+
+        if (
+            not stored_specs
+            or not wiki.commit_sha
+            or not target_commit
+            or not repository.local_path
+            or config.get("depth") != depth
+            or config.get("wiki_options") != wiki_options
+        ):
+            logger.info(f"[WIKI] Incremental update not possible for {repository.id}, regenerating all pages")
+            return False
+
+        changed_files: list[str] = []
+        if wiki.commit_sha != target_commit:
+            changed_files = await self.git_client.get_changed_files(
+                Path(repository.local_path), wiki.commit_sha, target_commit
+            )
+            if changed_files is None:
+                logger.info(
+                    f"[WIKI] Could not diff {wiki.commit_sha}..{target_commit}, regenerating all pages"
+                )
+                return False
+
+        existing_pages = await self._load_existing_pages(session, wiki.id)
+        codebase_data: dict = {}
+        affected_slugs: set[str] = set()
+
+        if changed_files:
+            if progress_callback:
+                await progress_callback("gathering", f"Gathering codebase information ({len(changed_files)} changed files)...")
+
+            codebase_data = await self._gather_codebase_data(repository.id, repository)
+            context_notes = wiki_options.get("context_notes", [])
+            if wiki_options.get("mode") == "advanced" and context_notes:
+                codebase_data["context_notes"] = context_notes
+
+            affected_slugs = self._find_affected_pages(
+                existing_pages.values(), changed_files, codebase_data, repository.local_path
+            )
+
+        pages_to_generate = [
+            {**spec, "type": WikiPageType(spec["type"])}
+            for spec in stored_specs
+            if spec["slug"] in affected_slugs
+        ]
+
+        for spec in pages_to_generate:
+            page = existing_pages.get(spec["slug"])
+            if page:
+                page.is_stale = True
+                page.stale_reason = f"Sources changed since {wiki.commit_sha}"
+        wiki.stale_pages = len(pages_to_generate)
+        wiki.status_message = f"Regenerating {len(pages_to_generate)} changed pages..."
+        await session.flush()
+
+        if progress_callback:
+            await progress_callback(
+                "generating",
+                f"Regenerating {len(pages_to_generate)} of {len(stored_specs)} pages "
+                f"({len(changed_files)} files changed)..."
+            )
+
+        generated_pages = await self._generate_pages(
+            session,
+            wiki.id,
+            pages_to_generate,
+            codebase_data,
+            repository,
+            progress_callback,
+        )
+
+        wiki.status = WikiStatus.GENERATED
+        wiki.status_message = None
+        wiki.commit_sha = target_commit
+        wiki.total_pages = len(existing_pages)
+        wiki.stale_pages = 0
+        wiki.generated_at = datetime.utcnow()
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"Wiki updated incrementally for repository {repository.id}: "
+            f"{len(generated_pages)}/{len(stored_specs)} pages regenerated for "
+            f"{len(changed_files)} changed files in {duration_ms}ms"
+        )
+
+        if progress_callback:
+            await progress_callback("complete", f"Wiki updated: {len(generated_pages)} pages regenerated")
+
+        return True
+
+    def _find_affected_pages(
+        self,
+        pages: Iterable[WikiPageDB],
+        changed_files: list[str],
+        codebase_data: dict,
+        repo_root: Optional[str] = None,
+    ) -> set[str]:
+        """Map changed files to the slugs of pages that referenced them.
+
+        A page is affected if one of its source files (or module directories)
+        changed, or if it documents a class or module defined in a changed file.
+        """
+        changed = {self._relative_path(path, repo_root) for path in changed_files}
+
+        changed_entities = {
+            c.get("name")
+            for c in codebase_data.get("classes", [])
+            if c.get("name") and c.get("file_path")
+            and self._path_changed(c["file_path"], changed, repo_root)
+        }
+        changed_entities.update(
+            m.get("name")
+            for m in codebase_data.get("modules", [])
+            if m.get("name") and m.get("path")
+            and self._path_changed(m["path"], changed, repo_root)
+        )
+
+        affected = set()
+        for page in pages:
+            if changed_entities.intersection(page.source_entities or []) or any(
+                self._path_changed(path, changed, repo_root) for path in page.source_files or []
+            ):
+                affected.add(page.slug)
+
+        logger.info(
+            f"[WIKI] {len(changed)} changed files touch {len(changed_entities)} classes/modules "
+            f"and {len(affected)} pages"
+        )
+        return affected
+
+    @staticmethod
+    def _relative_path(path: str, repo_root: Optional[str]) -> str:
+        """Strip the repository root from a path."""
+        if repo_root:
+            root = repo_root.rstrip("/") + "/"
+            if path.startswith(root):
+                return path[len(root):]
+        if path.startswith("./"):
+            return path[2:]
+        return path
+
+    def _path_changed(self, path: str, changed: set[str], repo_root: Optional[str]) -> bool:
+        """Check whether a file, or any file under a directory, is in the changed set."""
+        path = self._relative_path(path, repo_root).rstrip("/")
+        if path in changed:
+            return True
+        return any(
+            changed_path.startswith(path + "/") or path.endswith("/" + changed_path)
+            for changed_path in changed
+        )
+
+    def _page_sources(self, page_spec: dict, codebase_data: dict) -> tuple[list[str], list[str]]:
+        """Get the source files and entities a page's content is generated from.
+
+        Mirrors the class selection in _generate_page_with_llm so incremental
+        updates know which pages a changed class affects.
+
+        Returns:
+            Tuple of (source file paths, class/module names).
+        """
+        page_type = page_spec["type"]
+        data = page_spec.get("data") or {}
+        classes = codebase_data.get("classes", [])
+        endpoints = codebase_data.get("endpoints", [])
+        source_code = codebase_data.get("source_code", {})
+
+        names: set[str] = set()
+        files: set[str] = set()
+
+        if page_type == WikiPageType.OVERVIEW:
+            names.update(c.get("name") for c in classes[:20])
+            names.update(source_code)
+        elif page_type == WikiPageType.ARCHITECTURE:
+            names.update(c.get("name") for c in classes)
+        elif page_type == WikiPageType.MODULE:
+            module_name = page_spec["title"].lower()
+            names.update(c.get("name") for c in classes if module_name in c.get("file_path", "").lower())
+            if data.get("name"):
+                names.add(data["name"])
+            if data.get("path"):
+                files.add(data["path"])
+        elif page_type == WikiPageType.CLASS:
+            names.add(data.get("name", page_spec["title"]))
+        elif page_type == WikiPageType.API:
+            names.update(e.get("controller") for e in endpoints)
+        elif page_type == WikiPageType.DATA_MODEL:
+            names.update(
+                c.get("name") for c in classes
+                if any(x in c.get("name", "").lower() for x in ["entity", "model", "dto", "repository"])
+            )
+        elif page_type in (WikiPageType.INSTALLATION, WikiPageType.CONFIGURATION, WikiPageType.TECH_STACK):
+            names.update(source_code)
+        elif data:
+            # Discovered concepts (core systems, features, integrations)
+            names.update(data.get("related_classes") or [])
+            files.update(f for f in data.get("related_files") or [] if f)
+
+        names.discard(None)
+        file_paths = {c.get("name"): c.get("file_path") for c in classes}
+        for name in names:
+            file_path = file_paths.get(name) or source_code.get(name, {}).get("file_path")
+            if file_path:
+                files.add(file_path)
+
+        return sorted(files), sorted(names)
 
     async def _gather_codebase_data(self, repository_id: str, repository: RepositoryDB = None) -> dict:
         """Gather all codebase data needed for wiki generation.
@@ -1027,29 +1273,30 @@ class WikiService:
                 files_read = 0
                 max_files = 25  # Limit to prevent excessive reads
 
-                for cls in data["classes"][:max_files]:
-                    file_path = cls.get("file_path", "")
-                    class_name = cls.get("name", "")
-
-                    if not file_path or not class_name:
-                        continue
-
-                    try:
-                        # Read source code from filesystem (same as aggregator does)
-                        content = await self.filesystem_client.read_file(file_path)
-
-                        if content:
-                            # Store source code keyed by class name
-                            data["source_code"][class_name] = {
-                                "code": content[:5000],  # Limit to 5000 chars per class
-                                "file_path": file_path,
-                                "type": cls.get("type", ""),
-                                "labels": cls.get("labels", []),
-                            }
-                            files_read += 1
+                classes = [
+                    cls for cls in data["classes"][:max_files]
+                    if cls.get("file_path") and cls.get("name")
+                ]
+                # Read all files in one concurrent batch (same files as aggregator does)
+                contents, errors = await self.filesystem_client.read_files(
+                    [cls["file_path"] for cls in classes],
+                    commit=getattr(repository, "current_commit", None),
+                )
 
-                    except Exception as e:
-                        logger.debug(f"Could not read file {file_path}: {e}")
+                for cls in classes:
+                    file_path = cls["file_path"]
+                    content = contents.get(file_path)
+                    if content:
+                        # Store source code keyed by class name
+                        data["source_code"][cls["name"]] = {
+                            "code": content[:5000],  # Limit to 5000 chars per class
+                            "file_path": file_path,
+                            "type": cls.get("type", ""),
+                            "labels": cls.get("labels", []),
+                        }
+                        files_read += 1
+                    elif file_path in errors:
+                        logger.debug(f"Could not read file {file_path}: {errors[file_path]}")
 
                 logger.info(f"Read source code for {files_read} classes via Filesystem MCP")
 
@@ -1108,7 +1355,7 @@ class WikiService:
             )
 
             logger.info("[WIKI] Discovering concepts via LLM...")
-            response = await self._send_to_llm(prompt, timeout=180)
+            response = await self._send_to_llm(prompt, timeout=180, repository=repository)
 
             if response:
                 # Parse JSON response
@@ -1477,34 +1724,74 @@ class WikiService:
 
         return pages
 
-    async def _generate_page(
+    async def _generate_pages(
         self,
         session: AsyncSession,
         wiki_id: str,
-        page_spec: dict,
+        pages_to_generate: list[dict],
         codebase_data: dict,
         repository: RepositoryDB,
-    ) -> WikiPageDB:
-        """Generate a single wiki page."""
-        start_time = time.time()
+        progress_callback=None,
+    ) -> list[WikiPageDB]:
+        """Generate pages concurrently and store them through a single writer.
 
-        # Check if page already exists
-        result = await session.execute(
-            select(WikiPageDB).where(
-                WikiPageDB.wiki_id == wiki_id,
-                WikiPageDB.slug == page_spec["slug"]
-            )
-        )
-        existing_page = result.scalar_one_or_none()
+        Page content is produced by up to ``max_concurrency`` concurrent
+        tasks (LLM calls go through the session pool). Only this coroutine
+        touches the database session, storing each page as it completes.
+        """
+        total_pages = len(pages_to_generate)
+        existing_pages = await self._load_existing_pages(session, wiki_id)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def generate(page_spec: dict) -> tuple[dict, str, int]:
+            async with semaphore:
+                start_time = time.time()
+                content = await self._generate_page_content(
+                    page_spec,
+                    codebase_data,
+                    repository,
+                )
+                return page_spec, content, int((time.time() - start_time) * 1000)
 
-        # Generate content based on page type
-        content = await self._generate_page_content(
-            page_spec,
-            codebase_data,
-            repository,
+        tasks = [asyncio.create_task(generate(page_spec)) for page_spec in pages_to_generate]
+        generated_pages = []
+        try:
+            for completed, next_result in enumerate(asyncio.as_completed(tasks), start=1):
+                page_spec, content, duration_ms = await next_result
+                page = self._store_page(session, wiki_id, page_spec, content, duration_ms, existing_pages)
+                page.source_files, page.source_entities = self._page_sources(page_spec, codebase_data)
+                generated_pages.append(page)
+
+                if progress_callback:
+                    await progress_callback(
+                        "page",
+                        f"Generated: {page_spec['title']} ({completed}/{total_pages})"
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return generated_pages
+
+    async def _load_existing_pages(self, session: AsyncSession, wiki_id: str) -> dict[str, WikiPageDB]:
+        """Load a wiki's existing pages keyed by slug."""
+        result = await session.execute(
+            select(WikiPageDB).where(WikiPageDB.wiki_id == wiki_id)
         )
+        return {page.slug: page for page in result.scalars().all()}
 
-        duration_ms = int((time.time() - start_time) * 1000)
+    def _store_page(
+        self,
+        session: AsyncSession,
+        wiki_id: str,
+        page_spec: dict,
+        content: str,
+        duration_ms: int,
+        existing_pages: dict[str, WikiPageDB],
+    ) -> WikiPageDB:
+        """Create or update a wiki page with generated content."""
+        existing_page = existing_pages.get(page_spec["slug"])
 
         if existing_page:
             # Update existing page
@@ -1528,6 +1815,7 @@ class WikiService:
                 generation_duration_ms=duration_ms,
             )
             session.add(page)
+            existing_pages[page.slug] = page
             return page
 
     async def _generate_page_content(
@@ -1934,7 +2222,7 @@ Output ONLY the markdown content."""
 
             # Send to LLM
             logger.info(f"[WIKI] Generating {page_type.value} page with LLM: {page_spec['title']}")
-            response = await self._send_to_llm(prompt)
+            response = await self._send_to_llm(prompt, repository=repository)
 
             if response:
                 # Clean up the response (remove code blocks if present)
@@ -2122,6 +2410,10 @@ Output ONLY the markdown content."""
 
         return "\n".join([f"- {t}" for t in sorted(tech)])
 
+    async def close(self) -> None:
+        """Destroy Copilot sessions created for concurrent page generation."""
+        await self._session_pool.close()
+
     async def get_wiki_tree(
         self,
         session: AsyncSession,
@@ -2317,7 +2609,8 @@ _wiki_service: Optional[WikiService] = None
 def get_wiki_service(
     neo4j_client=None,
     filesystem_client=None,
-    copilot_session: Any = None
+    copilot_session: Any = None,
+    session_factory: Optional[SessionFactory] = None,
 ) -> WikiService:
     """Get or create wiki service instance.
 
@@ -2325,13 +2618,19 @@ def get_wiki_service(
         neo4j_client: Neo4j client for querying code graph (metadata, relationships)
         filesystem_client: Filesystem MCP client for reading actual source code
         copilot_session: Copilot SDK session for LLM-powered generation
+        session_factory: Async callable creating extra Copilot sessions
 
     Returns:
         WikiService instance
     """
     global _wiki_service
     if _wiki_service is None:
-        _wiki_service = WikiService(neo4j_client, filesystem_client, copilot_session)
+        _wiki_service = WikiService(
+            neo4j_client,
+            filesystem_client,
+            copilot_session,
+            session_factory=session_factory,
+        )
     return _wiki_service
 
 
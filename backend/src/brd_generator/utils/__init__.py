@@ -1,6 +1,6 @@
 """Utility modules for BRD Generator."""
 
 from .logger import setup_logger, get_logger
-from .token_counter import estimate_tokens
+from .token_counter import estimate_tokens, estimate_tokens_batch, get_tokenizer
 
-__all__ = ["setup_logger", "get_logger", "estimate_tokens"]
+__all__ = ["setup_logger", "get_logger", "estimate_tokens", "estimate_tokens_batch", "get_tokenizer"]
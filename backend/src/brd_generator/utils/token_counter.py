@@ -1,21 +1,235 @@
-"""Token estimation utilities."""
+"""Token counting utilities.
+
+Counts come from a pluggable tokenizer backend:
+
+- ``tiktoken``: fast local BPE (optional ``tiktoken`` dependency), exact
+  for OpenAI models and a close approximation for the others
+- ``heuristic``: ~4 characters per token, used when no BPE is available
+
+The backend is chosen with ``TOKENIZER_BACKEND`` (``auto`` picks tiktoken
+when installed) and can be replaced with ``set_tokenizer()``.
+
+tiktoken downloads the encoding's BPE file on first use and caches it in
+``TIKTOKEN_CACHE_DIR`` (default: a ``data-gym-cache`` directory under the
+system temp dir). Without network access the first tokenizer creation
+waits for that download to fail and then falls back to the heuristic; for
+air-gapped deployments, copy the cached file into ``TIKTOKEN_CACHE_DIR``
+beforehand (e.g. by creating the tokenizer once on a connected machine).
+The API creates the tokenizer at startup, in a worker thread, so no request
+waits for the download.
+
+Counts are memoized per content hash, so re-counting the same files and
+prompts across packing passes is cheap.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Tokenizer backend: auto, tiktoken or heuristic
+DEFAULT_TOKENIZER_BACKEND = os.getenv("TOKENIZER_BACKEND", "auto").lower()
+# BPE encoding used by the tiktoken backend
+DEFAULT_TOKENIZER_ENCODING = os.getenv("TOKENIZER_ENCODING", "o200k_base")
+# Memoized token counts kept (0 disables memoization)
+DEFAULT_TOKEN_COUNT_CACHE_SIZE = int(os.getenv("TOKEN_COUNT_CACHE_SIZE", "50000"))
+# Texts shorter than this are counted directly rather than hashed
+TOKEN_COUNT_CACHE_MIN_CHARS = 64
+
+
+class Tokenizer:
+    """Tokenizer backend interface; the base class is the character heuristic."""
+
+    name = "heuristic"
+    chars_per_token = 4
+
+    def count(self, text: str) -> int:
+        """Number of tokens in a text."""
+        return len(text) // self.chars_per_token
+
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Token counts of several texts."""
+        return [self.count(text) for text in texts]
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of a text within ``max_tokens``."""
+        return text[:max_tokens * self.chars_per_token]
+
+
+class TiktokenTokenizer(Tokenizer):
+    """BPE tokenizer backed by ``tiktoken``.
+
+    Encoding happens locally, but loading the encoding fetches its BPE
+    file unless it is already in ``TIKTOKEN_CACHE_DIR``.
+    """
+
+    def __init__(self, encoding: str = DEFAULT_TOKENIZER_ENCODING):
+        import tiktoken
+
+        self._encoding = tiktoken.get_encoding(encoding)
+        self.name = f"tiktoken:{encoding}"
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode_ordinary(text))
+
+    def count_batch(self, texts: list[str]) -> list[int]:
+        return [len(tokens) for tokens in self._encoding.encode_ordinary_batch(texts)]
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        tokens = self._encoding.encode_ordinary(text)
+        return self._encoding.decode(tokens[:max_tokens])
+
+
+_BACKENDS: dict[str, Callable[[], Tokenizer]] = {
+    "heuristic": Tokenizer,
+    "tiktoken": TiktokenTokenizer,
+}
+
+
+def register_tokenizer(name: str, factory: Callable[[], Tokenizer]) -> None:
+    """Make a tokenizer backend selectable by name."""
+    _BACKENDS[name] = factory
+
+
+def create_tokenizer(backend: str = DEFAULT_TOKENIZER_BACKEND) -> Tokenizer:
+    """Create a tokenizer backend, falling back to the heuristic.
+
+    Args:
+        backend: Registered backend name, or "auto" for the best available one
+    """
+    names = ["tiktoken"] if backend == "auto" else [backend]
+    for name in names:
+        factory = _BACKENDS.get(name)
+        if factory is None:
+            logger.warning(f"[TOKENIZER] Unknown backend {name!r}")
+            continue
+        try:
+            return factory()
+        except Exception as e:
+            # Missing package, or an encoding whose BPE file could not be fetched
+            if backend != "auto":
+                logger.warning(f"[TOKENIZER] Backend {name!r} unavailable: {e}")
+    return Tokenizer()
+
+
+class _CountCache:
+    """LRU of token counts keyed by tokenizer and content digest."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._counts: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(tokenizer: Tokenizer, text: str) -> tuple[str, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return tokenizer.name, digest
+
+    def get(self, key: tuple[str, bytes]) -> Optional[int]:
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+            return count
+
+    def put(self, key: tuple[str, bytes], count: int) -> None:
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.max_size:
+                self._counts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+_tokenizer: Optional[Tokenizer] = None
+_cache = _CountCache(DEFAULT_TOKEN_COUNT_CACHE_SIZE)
+
+
+def get_tokenizer() -> Tokenizer:
+    """The active tokenizer backend, created on first use."""
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = create_tokenizer()
+        logger.info(f"[TOKENIZER] Using {_tokenizer.name} token counts")
+    return _tokenizer
+
+
+def set_tokenizer(tokenizer: Optional[Tokenizer]) -> None:
+    """Replace the active tokenizer (None re-selects it from the environment)."""
+    global _tokenizer
+    _tokenizer = tokenizer
+    _cache.clear()
+
 
 def estimate_tokens(text: str) -> int:
     """
-    Estimate token count using simple heuristic.
+    Count tokens with the active tokenizer.
+
+    Args:
+        text: Text to count
+
+    Returns:
+        Token count
+    """
+    if not text:
+        return 0
+    tokenizer = get_tokenizer()
+    if len(text) < TOKEN_COUNT_CACHE_MIN_CHARS or _cache.max_size <= 0:
+        return tokenizer.count(text)
+
+    key = _CountCache.key(tokenizer, text)
+    count = _cache.get(key)
+    if count is None:
+        count = tokenizer.count(text)
+        _cache.put(key, count)
+    return count
+
+
+def estimate_tokens_batch(texts: Iterable[str]) -> list[int]:
+    """
+    Count tokens of many texts at once.
+
+    Memoized counts are reused; the rest are counted in one backend call.
 
     Args:
-        text: Text to estimate
+        texts: Texts to count
 
     Returns:
-        Estimated token count
+        Token count per text, in order
     """
-    # Simple heuristic: ~4 characters per token
-    # For more accuracy, use tiktoken library
-    return len(text) // 4
+    texts = list(texts)
+    tokenizer = get_tokenizer()
+    counts: list[Optional[int]] = [None] * len(texts)
+    keys: dict[int, tuple[str, bytes]] = {}
+    missing: list[int] = []
+
+    for i, text in enumerate(texts):
+        if not text:
+            counts[i] = 0
+            continue
+        if len(text) >= TOKEN_COUNT_CACHE_MIN_CHARS and _cache.max_size > 0:
+            keys[i] = _CountCache.key(tokenizer, text)
+            counts[i] = _cache.get(keys[i])
+        if counts[i] is None:
+            missing.append(i)
+
+    if missing:
+        for i, count in zip(missing, tokenizer.count_batch([texts[i] for i in missing])):
+            counts[i] = count
+            if i in keys:
+                _cache.put(keys[i], count)
+
+    return counts  # type: ignore[return-value]
 
 
 def estimate_tokens_for_messages(messages: list[dict]) -> int:
@@ -28,12 +242,9 @@ def estimate_tokens_for_messages(messages: list[dict]) -> int:
     Returns:
         Estimated total token count
     """
-    total = 0
-    for msg in messages:
-        content = msg.get("content", "")
-        # Add overhead for message structure (~4 tokens per message)
-        total += estimate_tokens(content) + 4
-    return total
+    counts = estimate_tokens_batch(msg.get("content", "") for msg in messages)
+    # Add overhead for message structure (~4 tokens per message)
+    return sum(counts) + 4 * len(counts)
 
 
 def truncate_to_token_limit(text: str, max_tokens: int) -> str:
@@ -51,6 +262,4 @@ def truncate_to_token_limit(text: str, max_tokens: int) -> str:
     if estimated <= max_tokens:
         return text
 
-    # Estimate character limit
-    char_limit = max_tokens * 4
-    return text[:char_limit] + "\n... [truncated]"
+    return get_tokenizer().truncate(text, max_tokens) + "\n... [truncated]"
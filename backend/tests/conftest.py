@@ -25,6 +25,20 @@ from brd_generator.mcp_clients.filesystem_client import FilesystemMCPClient
 from brd_generator.core.aggregator import ContextAggregator
 from brd_generator.core.synthesizer import LLMSynthesizer
 from brd_generator.core.generator import BRDGenerator
+from brd_generator.core.flow_store import feature_flow_store
+from brd_generator.core.llm_cache import llm_response_cache
+
+
+@pytest.fixture(autouse=True)
+def disable_llm_response_cache(monkeypatch):
+    """Keep tests off the database-backed LLM response cache."""
+    monkeypatch.setattr(llm_response_cache, "enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def disable_feature_flow_store(monkeypatch):
+    """Keep tests off the database-backed feature flow store."""
+    monkeypatch.setattr(feature_flow_store, "enabled", False)
 
 
 @pytest.fixture
@@ -179,6 +193,9 @@ def mock_neo4j_client() -> AsyncMock:
     client.disconnect = AsyncMock()
     client.health_check = AsyncMock(return_value=True)
     client.query_code_structure = AsyncMock(return_value={"nodes": [], "relationships": []})
+    client.query_by_names = AsyncMock(return_value={})
+    client.query_name_matches = AsyncMock(return_value={"nodes": []})
+    client.search_names = AsyncMock(return_value=None)
     client.get_component_dependencies = AsyncMock(return_value={"dependencies": []})
     client.get_api_contracts = AsyncMock(return_value=[])
     client.search_similar_features = AsyncMock(return_value=[])
@@ -193,6 +210,9 @@ def mock_filesystem_client() -> AsyncMock:
     client.disconnect = AsyncMock()
     client.health_check = AsyncMock(return_value=True)
     client.read_file = AsyncMock(return_value="file content")
+    client.read_file_cached = AsyncMock(return_value="file content")
+    client.read_lines = AsyncMock(return_value="file content")
+    client.read_files = AsyncMock(return_value=({}, {}))
     client.list_directory = AsyncMock(return_value=[])
     client.search_files = AsyncMock(return_value=[])
     client.get_file_info = AsyncMock(return_value={})
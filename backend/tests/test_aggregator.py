@@ -2,6 +2,9 @@
 Tests for Context Aggregator.
 """
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -14,6 +17,7 @@ from brd_generator.models.context import (
     FileContext,
 )
 from brd_generator.core.aggregator import ContextAggregator
+from brd_generator.core.context_packer import ContextPacker, context_budget_for_model
 
 
 class TestContextAggregator:
@@ -131,6 +135,189 @@ class TestContextAggregator:
         assert isinstance(compressed, AggregatedContext)
 
 
+class TestContextPacker:
+    """Tests for token-aware context packing."""
+
+    @staticmethod
+    def _context(files: list[FileContext], components: list[ComponentInfo]) -> AggregatedContext:
+        return AggregatedContext(
+            request="Add invoice approval workflow",
+            architecture=ArchitectureContext(components=components),
+            implementation=ImplementationContext(key_files=files),
+        )
+
+    def test_budget_follows_model_context_window(self):
+        """Test the budget is a share of the model's context window."""
+        assert context_budget_for_model("gpt-4.1", fraction=0.5) == 64000
+        assert context_budget_for_model("unknown-model", default=1234) == 1234
+        assert context_budget_for_model(None, default=1234) == 1234
+
+    def test_relevant_items_win_the_budget(self):
+        """Test items matching the request are kept over unrelated ones."""
+        filler = "value = compute(value)\n" * 40
+        files = [
+            FileContext(path=f"src/report/Report{i}.java", content=filler, relevance_score=0.1)
+            for i in range(5)
+        ]
+        files.append(FileContext(
+            path="src/invoice/InvoiceApprovalService.java",
+            content="class InvoiceApprovalService { void approve(Invoice invoice) {} }",
+            relevance_score=0.9,
+        ))
+        components = [
+            ComponentInfo(name=f"Report{i}Service", type="service", path=f"src/report/{i}")
+            for i in range(20)
+        ] + [ComponentInfo(name="InvoiceApprovalService", type="service", path="src/invoice")]
+        context = self._context(files, components)
+
+        budget = context.estimated_tokens // 3
+        result = ContextPacker(budget).pack(context)
+
+        assert context.estimated_tokens <= budget
+        assert "src/invoice/InvoiceApprovalService.java" in [f.path for f in context.implementation.key_files]
+        assert "InvoiceApprovalService" in [c.name for c in context.architecture.components]
+        assert result.dropped
+
+    def test_large_file_keeps_relevant_line_ranges(self):
+        """Test oversized files keep matching line ranges, not just head and tail."""
+        lines = [f"int filler{i} = {i};" for i in range(200)]
+        lines[100] = "void approveInvoice(Invoice invoice) { workflow.approve(invoice); }"
+        file_ctx = FileContext(path="src/Big.java", content="\n".join(lines))
+        packer = ContextPacker(max_tokens=10000, window_lines=10)
+
+        trimmed = packer.trim_file(file_ctx, {"invoice", "approve"}, max_tokens=150)
+
+        assert "approveInvoice" in trimmed.content
+        assert "filler0 " in trimmed.content  # file header window
+        assert "omitted" in trimmed.content
+        assert "filler150 " not in trimmed.content
+        assert file_ctx.content == "\n".join(lines)  # original left untouched
+
+
+class TestEnrichmentPhase:
+    """Tests for the concurrent enrichment phase."""
+
+    @pytest.fixture
+    def architecture(self) -> ArchitectureContext:
+        """Architecture with flows and JSPs that trigger per-entity lookups."""
+        return ArchitectureContext(
+            components=[
+                ComponentInfo(name="orderFlow", type="WebFlowDefinition", path=""),
+                ComponentInfo(name="returnFlow", type="WebFlowDefinition", path=""),
+                ComponentInfo(name="order.jsp", type="JSPPage", path=""),
+                ComponentInfo(name="submitOrder", type="JavaMethod", path=""),
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_lookups_run_concurrently_and_report_timings(
+        self,
+        mock_neo4j_client: AsyncMock,
+        mock_filesystem_client: AsyncMock,
+        architecture: ArchitectureContext,
+    ):
+        """Independent lookups overlap and each reports its timing."""
+        aggregator = ContextAggregator(
+            neo4j_client=mock_neo4j_client,
+            filesystem_client=mock_filesystem_client,
+            use_enhanced_retrieval=False,
+            enrichment_concurrency=8,
+        )
+
+        async def conditions(names):
+            await asyncio.sleep(0.1)
+            return {name: [{"condition": "x", "flowName": name}] for name in names}
+
+        async def fields(names):
+            await asyncio.sleep(0.1)
+            return {name: [{"fieldName": "qty"}] for name in names}
+
+        async def methods(names):
+            await asyncio.sleep(0.1)
+            return [{"methodName": "submitOrder"}]
+
+        aggregator._fetch_transition_conditions = AsyncMock(side_effect=conditions)
+        aggregator._fetch_form_field_details = AsyncMock(side_effect=fields)
+        aggregator._fetch_enhanced_methods = AsyncMock(side_effect=methods)
+
+        events: list[tuple[str, str]] = []
+
+        async def callback(step: str, detail: str) -> None:
+            events.append((step, detail))
+
+        start = time.perf_counter()
+        results = await aggregator._run_enrichment_phase("orders", architecture, callback)
+        elapsed = time.perf_counter() - start
+
+        # Three 100ms lookups should overlap rather than run back to back
+        assert elapsed < 0.25
+        assert [name for name, _ in results["transition_conditions"]] == ["orderFlow", "returnFlow"]
+        assert results["form_fields"][0][1] == [{"fieldName": "qty"}]
+        assert results["methods"] == [{"methodName": "submitOrder"}]
+
+        timing_details = [detail for step, detail in events if step == "enrichment"]
+        assert any(d.startswith("transition_conditions:") for d in timing_details)
+        assert any(d.startswith("enhanced_methods:") for d in timing_details)
+
+    @pytest.mark.asyncio
+    async def test_timed_out_lookup_returns_default(
+        self,
+        mock_neo4j_client: AsyncMock,
+        mock_filesystem_client: AsyncMock,
+        architecture: ArchitectureContext,
+    ):
+        """A lookup exceeding the per-query timeout yields its empty default."""
+        aggregator = ContextAggregator(
+            neo4j_client=mock_neo4j_client,
+            filesystem_client=mock_filesystem_client,
+            use_enhanced_retrieval=False,
+            enrichment_query_timeout=0.05,
+        )
+
+        async def hang(names):
+            await asyncio.sleep(1)
+            return {name: [{"fieldName": "never"}] for name in names}
+
+        aggregator._fetch_form_field_details = AsyncMock(side_effect=hang)
+
+        events: list[tuple[str, str]] = []
+
+        async def callback(step: str, detail: str) -> None:
+            events.append((step, detail))
+
+        results = await aggregator._run_enrichment_phase("orders", architecture, callback)
+
+        assert results["form_fields"] == [("order.jsp", [])]
+        assert any("(timeout)" in detail for _, detail in events)
+
+
+class TestBatchedLookups:
+    """Tests for the batched _fetch_* graph lookups."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_form_fields_uses_single_batched_query(
+        self,
+        mock_neo4j_client: AsyncMock,
+        mock_filesystem_client: AsyncMock,
+    ):
+        """Per-JSP form field lookups go through one query_by_names call."""
+        aggregator = ContextAggregator(
+            neo4j_client=mock_neo4j_client,
+            filesystem_client=mock_filesystem_client,
+            use_enhanced_retrieval=False,
+        )
+        mock_neo4j_client.query_by_names.return_value = {
+            "order.jsp": [{"jspName": "order.jsp", "fieldName": "qty"}],
+            "cart.jsp": [],
+        }
+
+        fields = await aggregator._fetch_form_field_details(["order.jsp", "cart.jsp"])
+
+        mock_neo4j_client.query_by_names.assert_awaited_once()
+        assert fields["order.jsp"][0]["fieldName"] == "qty"
+        assert fields["cart.jsp"] == []
+
+
 class TestContextAggregatorEdgeCases:
     """Tests for edge cases in context aggregation."""
 
@@ -0,0 +1,224 @@
+"""
+Tests for the codebase statistics endpoint and its snapshot cache.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from brd_generator.api import routes
+from brd_generator.api.routes import (
+    CODEBASE_STATISTICS_QUERIES,
+    _build_codebase_statistics,
+    _statistics_snapshot_is_fresh,
+    get_codebase_statistics,
+)
+from brd_generator.database.models import (
+    AnalysisRunDB,
+    AnalysisStatus,
+    CodebaseStatisticsDB,
+    RepositoryDB,
+    RepositoryPlatform,
+)
+
+
+# Leading hex letters keep SQLite from storing the ids as numbers
+REPO_ID = "a0000000-0000-0000-0000-000000000001"
+RUN_ID = "a0000000-0000-0000-0000-000000000002"
+
+ROWS = {
+    "files": [{"total_files": 40, "total_loc": 3000, "avg_file_size": 75.0}],
+    "languages": [
+        {"language": "Java", "file_count": 30, "loc": 2500},
+        {"language": "XML", "file_count": 10, "loc": 500},
+    ],
+    "jsp_pages": [{"file_count": 5, "loc": 1000}],
+    "classes": [{"count": 25}],
+    "interfaces": [{"count": 4}],
+    "functions": [{"count": 200}],
+    "rest_endpoints": [{"count": 12}],
+    "graphql_operations": [{"count": 3}],
+    "test_files": [{"file_count": 6}],
+    "dependencies": [],
+    "imports": [{"count": 90}],
+    "complexity": [{"avg_complexity": 3.456, "max_complexity": 21}],
+    "ui_pages": [{"count": 2}],
+    "documentation": [{"total": 80, "documented": 20}],
+    "config_files": [{"count": 7}],
+}
+
+
+class TestBuildCodebaseStatistics:
+    """Tests for _build_codebase_statistics."""
+
+    def test_counts_are_combined(self):
+        stats = _build_codebase_statistics(ROWS)
+
+        # JSP pages are added to the file and LOC totals
+        assert (stats.total_files, stats.total_lines_of_code) == (45, 4000)
+        assert stats.primary_language == "Java"
+        assert [(l.language, l.percentage) for l in stats.languages] == [
+            ("Java", 62.5), ("XML", 12.5), ("JSP", 25.0),
+        ]
+        assert (stats.total_classes, stats.total_interfaces, stats.total_functions) == (25, 4, 200)
+        assert (stats.rest_endpoints, stats.graphql_operations, stats.total_api_endpoints) == (12, 3, 15)
+        assert (stats.total_test_files, stats.total_test_cases) == (6, 30)
+        # Falls back to imports when no dependency nodes exist
+        assert stats.total_dependencies == 90
+        assert (stats.avg_cyclomatic_complexity, stats.max_cyclomatic_complexity) == (3.46, 21)
+        assert (stats.ui_routes, stats.ui_components, stats.total_components) == (7, 7, 7)
+        assert (stats.documented_entities, stats.documentation_coverage) == (20, 25.0)
+        assert stats.config_files == 7
+
+    def test_components_used_without_jsp_pages(self):
+        stats = _build_codebase_statistics({"components": [{"count": 9}]})
+
+        assert (stats.ui_routes, stats.ui_components, stats.total_components) == (0, 9, 9)
+
+    def test_empty_rows(self):
+        stats = _build_codebase_statistics({})
+
+        assert stats.total_files == 0
+        assert stats.languages == []
+        assert stats.documentation_coverage == 0
+
+
+class TestSnapshotFreshness:
+    """Tests for _statistics_snapshot_is_fresh."""
+
+    repo = SimpleNamespace(current_commit="abc123")
+    run = SimpleNamespace(id=RUN_ID)
+
+    def test_same_commit_and_run(self):
+        snapshot = SimpleNamespace(commit_sha="abc123", analysis_run_id=RUN_ID)
+
+        assert _statistics_snapshot_is_fresh(self.repo, self.run, snapshot)
+
+    def test_commit_changed(self):
+        snapshot = SimpleNamespace(commit_sha="def456", analysis_run_id=RUN_ID)
+
+        assert not _statistics_snapshot_is_fresh(self.repo, self.run, snapshot)
+
+    def test_newer_analysis_run(self):
+        snapshot = SimpleNamespace(commit_sha="abc123", analysis_run_id="older-run")
+
+        assert not _statistics_snapshot_is_fresh(self.repo, self.run, snapshot)
+
+    def test_missing_run_or_snapshot(self):
+        snapshot = SimpleNamespace(commit_sha="abc123", analysis_run_id=RUN_ID)
+
+        assert not _statistics_snapshot_is_fresh(self.repo, None, snapshot)
+        assert not _statistics_snapshot_is_fresh(self.repo, self.run, None)
+
+    def test_repository_without_commit(self):
+        snapshot = SimpleNamespace(commit_sha="", analysis_run_id=RUN_ID)
+
+        assert _statistics_snapshot_is_fresh(SimpleNamespace(current_commit=None), self.run, snapshot)
+
+
+class AsyncSessionAdapter:
+    """Minimal async facade over a synchronous session."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def execute(self, statement):
+        return self.session.execute(statement)
+
+    async def get(self, model, key):
+        return self.session.get(model, key)
+
+    async def merge(self, instance):
+        merged = self.session.merge(instance)
+        self.session.commit()
+        return merged
+
+
+@pytest.fixture
+def database(monkeypatch):
+    """In-memory SQLite database with one analyzed repository."""
+    engine = create_engine("sqlite://")
+    for model in (RepositoryDB, AnalysisRunDB, CodebaseStatisticsDB):
+        model.__table__.create(engine)
+
+    with Session(engine) as session:
+        session.add(RepositoryDB(
+            id=REPO_ID, name="repo", full_name="org/repo",
+            url="https://example.com/repo", clone_url="https://example.com/repo.git",
+            platform=list(RepositoryPlatform)[0], analysis_status=AnalysisStatus.COMPLETED,
+            current_commit="abc123",
+        ))
+        session.add(AnalysisRunDB(
+            id=RUN_ID, repository_id=REPO_ID, status=AnalysisStatus.COMPLETED,
+            completed_at=datetime(2026, 1, 1),
+        ))
+        session.commit()
+
+    with Session(engine) as session:
+        adapter = AsyncSessionAdapter(session)
+
+        @asynccontextmanager
+        async def get_async_session():
+            yield adapter
+            session.commit()
+
+        monkeypatch.setattr(routes, "get_async_session", get_async_session)
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def generator():
+    """Initialized generator whose graph answers every statistics query."""
+
+    async def query(cypher, params=None):
+        name = next(n for n, q in CODEBASE_STATISTICS_QUERIES.items() if q == cypher)
+        return {"nodes": ROWS.get(name, [])}
+
+    neo4j_client = AsyncMock()
+    neo4j_client.query_code_structure.side_effect = query
+    return SimpleNamespace(_initialized=True, neo4j_client=neo4j_client)
+
+
+class TestGetCodebaseStatistics:
+    """Tests for the statistics endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_reused_until_commit_changes(self, database, generator):
+        queries = generator.neo4j_client.query_code_structure
+
+        first = await get_codebase_statistics(REPO_ID, generator=generator)
+        computed = queries.await_count
+        second = await get_codebase_statistics(REPO_ID, generator=generator)
+
+        assert first.statistics.total_files == 45
+        assert second.statistics == first.statistics
+        assert queries.await_count == computed == len(CODEBASE_STATISTICS_QUERIES)
+
+        database.get(RepositoryDB, REPO_ID).current_commit = "def456"
+        database.commit()
+        await get_codebase_statistics(REPO_ID, generator=generator)
+
+        assert queries.await_count == 2 * computed
+        # The snapshot for the previous commit is replaced, not kept alongside
+        assert [row.commit_sha for row in database.query(CodebaseStatisticsDB)] == ["def456"]
+
+    @pytest.mark.asyncio
+    async def test_lock_is_released_after_request(self, database, generator):
+        await get_codebase_statistics(REPO_ID, refresh=True, generator=generator)
+
+        assert REPO_ID not in routes._statistics_locks
+
+    @pytest.mark.asyncio
+    async def test_incomplete_results_are_not_cached(self, database, generator):
+        generator.neo4j_client.query_code_structure.side_effect = RuntimeError("neo4j down")
+
+        response = await get_codebase_statistics(REPO_ID, generator=generator)
+
+        assert response.statistics.total_files == 0
+        assert database.query(CodebaseStatisticsDB).count() == 0
@@ -0,0 +1,208 @@
+"""
+Tests for document summary listings and keyset cursors.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import Session
+
+from brd_generator.database.config import create_missing_indexes
+from brd_generator.database.models import (
+    BRDDB,
+    BacklogDB,
+    BacklogItemType,
+    Base,
+    EpicDB,
+    RepositoryDB,
+    RepositoryPlatform,
+)
+from brd_generator.services import document_service
+from brd_generator.services.document_service import DocumentService, decode_cursor, encode_cursor
+
+
+START = datetime(2026, 1, 1)
+KINDS = {"repo": 1, "brd": 2, "epic": 3, "item": 4}
+
+
+def uid(name: str) -> str:
+    """Deterministic UUID for a readable name like ``brd-2``; ids sort like the names.
+
+    The leading hex letter keeps SQLite from storing the id as a number.
+    """
+    kind, n = name.split("-")
+    return str(UUID(int=(0xA << 124) + (KINDS[kind] << 16) + int(n)))
+
+
+NAMES = {uid(f"{kind}-{n}"): f"{kind}-{n}" for kind in KINDS for n in range(10)}
+
+
+class AsyncSessionAdapter:
+    """Minimal async facade over a synchronous session."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.statements: list[str] = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement))
+        return self.session.execute(statement)
+
+
+@pytest.fixture
+def library(monkeypatch):
+    """In-memory SQLite library: 2 repositories, 5 BRDs, 3 EPICs, 4 backlogs."""
+    engine = create_engine("sqlite://")
+    for model in (RepositoryDB, BRDDB, EpicDB, BacklogDB):
+        model.__table__.create(engine)
+
+    with Session(engine) as session:
+        for r in range(2):
+            session.add(RepositoryDB(
+                id=uid(f"repo-{r}"), name=f"repo{r}", full_name=f"org/repo{r}",
+                url=f"https://example.com/repo{r}", clone_url=f"https://example.com/repo{r}.git",
+                platform=list(RepositoryPlatform)[0],
+            ))
+        # BRDs 1 and 2 share a creation time so the id breaks the tie
+        for b in range(5):
+            session.add(BRDDB(
+                id=uid(f"brd-{b}"), brd_number=f"BRD-{b:04d}", title=f"BRD {b}",
+                feature_description="feature", markdown_content="# content " * 1000,
+                repository_id=uid(f"repo-{b % 2}"),
+                created_at=START + timedelta(days=min(b, 2) if b < 3 else b),
+                updated_at=START,
+            ))
+        for e in range(3):
+            session.add(EpicDB(
+                id=uid(f"epic-{e}"), epic_number=f"EPIC-{e:03d}", brd_id=uid("brd-4" if e < 2 else "brd-0"),
+                title=f"Epic {e}", description="epic", created_at=START + timedelta(days=e),
+                updated_at=START,
+            ))
+        for i in range(4):
+            session.add(BacklogDB(
+                id=uid(f"item-{i}"), backlog_number=f"STORY-{i:03d}", epic_id=uid("epic-0" if i < 3 else "epic-2"),
+                title=f"Story {i}", description="story", item_type=BacklogItemType("user_story"),
+                created_at=START + timedelta(days=i), updated_at=START,
+            ))
+        session.commit()
+
+    with Session(engine) as session:
+        adapter = AsyncSessionAdapter(session)
+
+        @asynccontextmanager
+        async def get_async_session():
+            yield adapter
+
+        monkeypatch.setattr(document_service, "get_async_session", get_async_session)
+        yield adapter
+    engine.dispose()
+
+
+async def _all_pages(list_page, limit: int, **filters) -> list[list[dict]]:
+    pages, cursor = [], None
+    while True:
+        rows, cursor = await list_page(limit=limit, cursor=cursor, **filters)
+        pages.append([{**row, "id": NAMES[row["id"]]} for row in rows])
+        if cursor is None:
+            return pages
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        created_at = datetime(2026, 3, 4, 5, 6, 7, 890)
+        assert decode_cursor(encode_cursor(created_at, "a|b")) == (created_at, "a|b")
+
+    def test_malformed_cursor(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestSummaryListings:
+    """Tests for DocumentService summary listings."""
+
+    @pytest.mark.asyncio
+    async def test_brd_pages_follow_created_at_then_id(self, library):
+        """Pages walk every BRD newest first without gaps or repeats."""
+        pages = await _all_pages(DocumentService().list_brd_summaries, limit=2)
+
+        assert [[r["id"] for r in page] for page in pages] == [
+            ["brd-4", "brd-3"], ["brd-2", "brd-1"], ["brd-0"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_brd_rows_are_projected_with_counts(self, library):
+        """Rows carry child counts and no document content."""
+        rows, cursor = await DocumentService().list_brd_summaries(limit=10)
+        by_id = {NAMES[r["id"]]: r for r in rows}
+
+        assert cursor is None
+        assert (by_id["brd-4"]["epic_count"], by_id["brd-4"]["backlog_count"]) == (2, 3)
+        assert (by_id["brd-0"]["epic_count"], by_id["brd-0"]["backlog_count"]) == (1, 1)
+        assert by_id["brd-3"]["repository_name"] == "repo1"
+        assert "markdown_content" not in by_id["brd-4"]
+        assert "markdown_content" not in library.statements[-1]
+        assert "OFFSET" not in library.statements[-1]
+
+    @pytest.mark.asyncio
+    async def test_filters_apply_across_pages(self, library):
+        """Filters hold on every page."""
+        pages = await _all_pages(DocumentService().list_brd_summaries, limit=1, repository_id=uid("repo-0"))
+
+        assert [r["id"] for page in pages for r in page] == ["brd-4", "brd-2", "brd-0"]
+
+    @pytest.mark.asyncio
+    async def test_epic_and_backlog_summaries(self, library):
+        """EPIC and backlog rows carry their parent titles."""
+        service = DocumentService()
+
+        epics = [r for page in await _all_pages(service.list_epic_summaries, limit=2) for r in page]
+        backlogs = [r for page in await _all_pages(service.list_backlog_summaries, limit=3) for r in page]
+
+        assert [(r["id"], r["brd_title"], r["backlog_count"]) for r in epics] == [
+            ("epic-2", "BRD 0", 1), ("epic-1", "BRD 4", 0), ("epic-0", "BRD 4", 3),
+        ]
+        assert [(r["id"], r["epic_title"]) for r in backlogs] == [
+            ("item-3", "Epic 2"), ("item-2", "Epic 0"), ("item-1", "Epic 0"), ("item-0", "Epic 0"),
+        ]
+
+
+class TestListingIndexes:
+    """Tests for creating listing indexes on existing databases."""
+
+    def test_missing_indexes_are_created_idempotently(self):
+        """Tables created before the keyset indexes get them on the next init."""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        names = {"brds": "ix_brds_created_id", "epics": "ix_epics_created", "backlogs": "ix_backlogs_created"}
+        with engine.begin() as connection:
+            for name in names.values():
+                connection.exec_driver_sql(f"DROP INDEX {name}")
+
+        for _ in range(2):
+            with engine.begin() as connection:
+                create_missing_indexes(connection)
+
+        inspector = inspect(engine)
+        for table, name in names.items():
+            assert name in {index["name"] for index in inspector.get_indexes(table)}
+        engine.dispose()
+
+    def test_retired_brd_index_is_dropped(self):
+        """The single-column index replaced by ix_brds_created_id is removed."""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("CREATE INDEX ix_brds_created ON brds (created_at)")
+
+        with engine.begin() as connection:
+            create_missing_indexes(connection)
+
+        names = {index["name"] for index in inspect(engine).get_indexes("brds")}
+        assert "ix_brds_created" not in names
+        assert "ix_brds_created_id" in names
+        engine.dispose()
@@ -0,0 +1,154 @@
+"""
+Tests for concurrent multi-entry-point flow tracing.
+"""
+
+import asyncio
+import json
+from collections import Counter
+
+import pytest
+from unittest.mock import AsyncMock
+
+from brd_generator.api.flow_routes import (
+    ImplementationMappingRequest,
+    get_brd_sections_batch,
+    stream_brd_sections_batch,
+)
+from brd_generator.core.feature_flow import FeatureFlowService
+from brd_generator.queries import flow_queries
+
+
+CONTROLLERS = ["CreateEntityAction", "UpdateEntityAction", "DeleteEntityAction"]
+
+
+class SharedGraph:
+    """Neo4j client mock: controllers share one service and one DAO."""
+
+    def __init__(self, delays: dict[str, float] | None = None):
+        self.delays = delays or {}
+        self.calls: Counter = Counter()
+        self.tracing = 0
+        self.max_tracing = 0
+        self.client = AsyncMock()
+        self.client.query_code_structure.side_effect = self.query
+
+    async def query(self, cypher, params=None):
+        params = params or {}
+        if cypher == flow_queries.TRACE_FULL_FLOW:
+            entry = params["entryPointId"]
+            self.calls[("trace", entry)] += 1
+            self.tracing += 1
+            self.max_tracing = max(self.max_tracing, self.tracing)
+            try:
+                await asyncio.sleep(self.delays.get(entry, 0.01))
+            finally:
+                self.tracing -= 1
+            return {"nodes": [{
+                "entryName": entry,
+                "controllers": [{"name": entry, "path": f"src/{entry}.java"}],
+                "services": [{"name": "EntityService", "path": "src/EntityService.java"}],
+                "daos": [{"name": "EntityDao", "path": "src/EntityDao.java"}],
+            }]}
+        if cypher == flow_queries.GET_SQL_FOR_DAO:
+            self.calls[("sql", params["daoName"])] += 1
+            await asyncio.sleep(0.01)
+            return {"nodes": [{"statementType": "INSERT", "tableName": "ENTITY", "methodName": "insert"}]}
+        if cypher == flow_queries.GET_BUSINESS_RULES_FOR_COMPONENT:
+            self.calls[("rules", params["componentName"])] += 1
+            await asyncio.sleep(0.01)
+            return {"nodes": [{"methodValidations": [{"ruleName": f"{params['componentName']}Check"}]}]}
+        if "entry" in params:
+            if params["entry"] in CONTROLLERS:
+                return {"nodes": [{"entityId": params["entry"]}]}
+        return {"nodes": []}
+
+
+class TestExtractFeatureFlows:
+    """Tests for FeatureFlowService.extract_feature_flows."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        """No more than max_concurrency entry points are traced at once."""
+        graph = SharedGraph()
+        service = FeatureFlowService(graph.client)
+
+        results = [r async for r in service.extract_feature_flows(CONTROLLERS * 2, max_concurrency=2)]
+
+        assert sorted(ep for ep, _ in results) == sorted(CONTROLLERS)
+        assert all(response.success for _, response in results)
+        assert graph.max_tracing == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_components_are_looked_up_once(self):
+        """Components reached from several entry points are queried once per batch."""
+        graph = SharedGraph()
+        service = FeatureFlowService(graph.client)
+
+        flows = {
+            ep: response.feature_flow
+            async for ep, response in service.extract_feature_flows(CONTROLLERS, max_concurrency=3)
+        }
+
+        assert graph.calls[("sql", "EntityDao")] == 1
+        assert graph.calls[("rules", "EntityService")] == 1
+        assert graph.calls[("rules", "EntityDao")] == 1
+        # Each flow gets its own copies of the shared results
+        ops = [flows[ep].sql_operations[0] for ep in CONTROLLERS]
+        assert len({id(op) for op in ops}) == 3
+        assert ops[0].source_class == "EntityDao"
+        assert flows["CreateEntityAction"].flow_steps[1].validations_applied == ["Validation: EntityServiceCheck"]
+
+    @pytest.mark.asyncio
+    async def test_single_traces_do_not_share(self):
+        """Outside a batch every trace queries the graph."""
+        graph = SharedGraph()
+        service = FeatureFlowService(graph.client)
+
+        for entry_point in CONTROLLERS:
+            await service.extract_feature_flow(entry_point)
+
+        assert graph.calls[("sql", "EntityDao")] == 3
+
+    @pytest.mark.asyncio
+    async def test_results_arrive_in_completion_order(self):
+        """A slow entry point does not hold back the others."""
+        graph = SharedGraph(delays={"CreateEntityAction": 0.2})
+        service = FeatureFlowService(graph.client)
+
+        order = [ep async for ep, _ in service.extract_feature_flows(CONTROLLERS, max_concurrency=3)]
+
+        assert order[-1] == "CreateEntityAction"
+
+
+class TestBatchRoutes:
+    """Tests for the batch BRD section endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_request_order(self):
+        """Combined sections follow the request order, not completion order."""
+        graph = SharedGraph(delays={"CreateEntityAction": 0.1})
+        request = ImplementationMappingRequest(entry_points=[*CONTROLLERS, "Missing"])
+
+        result = await get_brd_sections_batch(request, "compact", FeatureFlowService(graph.client))
+
+        assert result["entry_points_processed"] == 3
+        assert result["errors"] == [{"entry_point": "Missing", "error": "Entry point not found: Missing"}]
+        sections = result["technical_architecture"].split("\n\n---\n\n")
+        assert "CreateEntityAction" in sections[0] and "DeleteEntityAction" in sections[2]
+
+    @pytest.mark.asyncio
+    async def test_stream_emits_each_entry_point_then_combined(self):
+        """One event per entry point as it completes, then the combined sections."""
+        graph = SharedGraph(delays={"CreateEntityAction": 0.1})
+        request = ImplementationMappingRequest(entry_points=[*CONTROLLERS, "Missing"])
+
+        response = await stream_brd_sections_batch(request, "compact", FeatureFlowService(graph.client))
+        events = [
+            json.loads(chunk.removeprefix("data: "))
+            async for chunk in response.body_iterator
+        ]
+
+        assert [e["type"] for e in events] == ["error", "flow", "flow", "flow", "complete"]
+        assert events[3]["entry_point"] == "CreateEntityAction"
+        assert events[-1]["entry_points_processed"] == 3
+        assert events[-1]["entry_points_failed"] == 1
@@ -0,0 +1,204 @@
+"""
+Tests for materialized feature flows.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from unittest.mock import AsyncMock
+
+from brd_generator.core.feature_flow import FeatureFlowService
+from brd_generator.core.flow_store import FeatureFlowStore, decode_flow, encode_flow
+from brd_generator.models.flow_context import FeatureFlow, FlowStep, LayerType
+from brd_generator.queries import flow_queries
+
+
+ENTRY_POINTS = [
+    {"entryId": "jsp-1", "name": "LegalEntity.jsp", "path": "web/LegalEntity.jsp", "type": "JSPPage"},
+    {"entryId": "ctrl-1", "name": "LegalEntityAction", "path": "src/LegalEntityAction.java", "type": "JavaClass"},
+]
+
+
+class MemoryFlowStore:
+    """In-memory stand-in for FeatureFlowStore."""
+
+    def __init__(self):
+        self.available = True
+        self.flows: dict[tuple[str, str], FeatureFlow] = {}
+        self.deleted_except: list[str] = []
+
+    async def get(self, graph_version, entry_point):
+        return self.flows.get((graph_version, entry_point))
+
+    async def put_many(self, graph_version, flows):
+        for entry_point, (_, flow) in flows.items():
+            self.flows[(graph_version, entry_point)] = flow
+        return len(flows)
+
+    async def delete_other_versions(self, graph_version):
+        self.deleted_except.append(graph_version)
+        return 0
+
+
+def _graph():
+    """Neo4j client mock answering entry point, resolution and trace queries."""
+    neo4j = AsyncMock()
+    neo4j.graph_version.return_value = "repo@abc@t1"
+
+    async def query(cypher, params=None):
+        params = params or {}
+        if cypher == flow_queries.FIND_ENTRY_POINTS:
+            return {"nodes": ENTRY_POINTS}
+        if cypher == flow_queries.TRACE_FULL_FLOW:
+            return {"nodes": [{
+                "entryName": params["entryPointId"],
+                "controllers": [{"name": "LegalEntityAction", "path": "src/LegalEntityAction.java"}],
+                "services": [{"name": "LegalEntityService", "path": "src/LegalEntityService.java"}],
+                "daos": [],
+            }]}
+        if cypher == flow_queries.TRACE_JSP_TO_DATABASE:
+            return {"nodes": [{"uiLayer": {"name": "LegalEntity.jsp", "path": "web/LegalEntity.jsp"}}]}
+        if "entry" in params:
+            entry = params["entry"]
+            for ep in ENTRY_POINTS:
+                if entry in (ep["entryId"], ep["name"]) or entry in ep["path"]:
+                    return {"nodes": [{"entityId": ep["entryId"]}]}
+        return {"nodes": []}
+
+    neo4j.query_code_structure.side_effect = query
+    return neo4j
+
+
+class TestMaterializedFlows:
+    """FeatureFlowService with a flow store."""
+
+    @pytest.mark.asyncio
+    async def test_materializes_every_alias(self):
+        """Each entry point is stored under its ID, name and path."""
+        store = MemoryFlowStore()
+        service = FeatureFlowService(_graph(), flow_store=store)
+
+        stored = await service.materialize_feature_flows()
+
+        assert stored == 6
+        jsp_flow = store.flows[("repo@abc@t1", "LegalEntity.jsp")]
+        assert jsp_flow.entry_point == "jsp-1"
+        assert jsp_flow.flow_steps[0].layer == LayerType.UI
+        # The entity id is not recognizable as a JSP, so it traces as a generic flow
+        assert store.flows[("repo@abc@t1", "jsp-1")].flow_steps[0].layer == LayerType.CONTROLLER
+        assert store.deleted_except == ["repo@abc@t1"]
+
+    @pytest.mark.asyncio
+    async def test_stored_flow_matches_live_trace(self):
+        """A stored alias returns what a live trace of that alias returns."""
+        store = MemoryFlowStore()
+        service = FeatureFlowService(_graph(), flow_store=store)
+        await service.materialize_feature_flows()
+
+        for entry in ENTRY_POINTS:
+            for alias in (entry["entryId"], entry["name"], entry["path"]):
+                cached = await service.extract_feature_flow(alias)
+                store.available = False
+                live = await service.extract_feature_flow(alias)
+                store.available = True
+                assert cached.feature_flow == live.feature_flow, alias
+
+    @pytest.mark.asyncio
+    async def test_default_requests_read_the_store(self):
+        """A stored flow is returned without querying the graph."""
+        store = MemoryFlowStore()
+        neo4j = _graph()
+        flow = FeatureFlow(feature_name="Stored", entry_point="ctrl-1")
+        store.flows[("repo@abc@t1", "LegalEntityAction")] = flow
+        service = FeatureFlowService(neo4j, flow_store=store)
+
+        response = await service.extract_feature_flow("LegalEntityAction", max_depth=5)
+
+        assert response.success and response.feature_flow == flow
+        neo4j.query_code_structure.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_non_default_options_trace_live(self):
+        """Requests without SQL or mappings, or with a type hint, bypass the store."""
+        store = MemoryFlowStore()
+        store.flows[("repo@abc@t1", "LegalEntityAction")] = FeatureFlow(
+            feature_name="Stored", entry_point="ctrl-1"
+        )
+        service = FeatureFlowService(_graph(), flow_store=store)
+
+        without_sql = await service.extract_feature_flow("LegalEntityAction", include_sql=False)
+        typed = await service.extract_feature_flow("LegalEntityAction", entry_point_type="controller")
+
+        assert without_sql.feature_flow.feature_name == "ctrl-1"
+        assert typed.feature_flow.feature_name == "ctrl-1"
+
+
+@pytest.fixture
+async def session_factory():
+    """Session factory over an in-memory SQLite database holding the flow table."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from brd_generator.database.models import MaterializedFeatureFlowDB
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(MaterializedFeatureFlowDB.__table__.create)
+    sessionmaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def factory():
+        async with sessionmaker() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    yield factory
+    await engine.dispose()
+
+
+class TestFeatureFlowStore:
+    """Tests for FeatureFlowStore."""
+
+    def test_payload_round_trip(self):
+        """Flows survive compression and JSON round trips."""
+        flow = FeatureFlow(
+            feature_name="Save",
+            entry_point="jsp-1",
+            flow_steps=[FlowStep(layer=LayerType.DAO, component_name="Dao", file_path="Dao.java", line_start=1, line_end=2)],
+        )
+
+        assert decode_flow(encode_flow(flow)) == flow
+
+    @pytest.mark.asyncio
+    async def test_versions_are_isolated(self, session_factory):
+        """Flows are read per graph version and superseded versions are deleted."""
+        store = FeatureFlowStore(session_factory=session_factory)
+        old = FeatureFlow(feature_name="Old", entry_point="e1")
+        new = FeatureFlow(feature_name="New", entry_point="e1")
+
+        await store.put_many("v1", {"Entry": ("e1", old)})
+        await store.put_many("v2", {"Entry": ("e1", new), "e1": ("e1", new)})
+
+        assert (await store.get("v1", "Entry")) == old
+        assert (await store.get("v2", "e1")) == new
+        assert await store.delete_other_versions("v2") == 1
+        assert await store.get("v1", "Entry") is None
+        assert store.stats()["written"] == 3
+
+    @pytest.mark.asyncio
+    async def test_database_errors_degrade_to_live_tracing(self):
+        """A failing database turns lookups into misses and pauses the store."""
+        @asynccontextmanager
+        async def broken():
+            raise RuntimeError("database down")
+            yield
+
+        store = FeatureFlowStore(session_factory=broken, retry_seconds=60)
+
+        assert await store.get("v1", "Entry") is None
+        assert store.available is False
+        assert store.stats()["errors"] == 1
@@ -0,0 +1,257 @@
+"""
+Tests for the in-memory graph snapshot and its use by the Neo4j client.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from brd_generator.mcp_clients.graph_snapshot import (
+    SNAPSHOT_QUERIES,
+    GraphSnapshotBuilder,
+    GraphSnapshotCache,
+)
+from brd_generator.mcp_clients.neo4j_client import Neo4jMCPClient
+from brd_generator.queries.registry import QUERY_REGISTRY, get_query
+
+
+NODES = [
+    {"id": "n1", "entityId": "c1", "name": "LegalEntityAction", "labels": ["JavaClass"], "path": "LegalEntityAction.java", "pageRank": 0.5},
+    {"id": "n2", "entityId": "m1", "name": "save", "labels": ["JavaMethod"], "path": "LegalEntityAction.java", "startLine": 10, "endLine": 20, "signature": "void save()"},
+    {"id": "n3", "entityId": "c2", "name": "LegalEntityService", "labels": ["SpringService", "JavaClass"], "path": "LegalEntityService.java", "pageRank": 0.9},
+    {"id": "n4", "entityId": "m2", "name": "persist", "labels": ["JavaMethod"], "path": "LegalEntityService.java", "pageRank": 0.3},
+    {"id": "n5", "entityId": "c3", "name": "LegalEntityDao", "labels": ["JavaClass"], "path": "LegalEntityDao.java", "pageRank": 0.7},
+    {"id": "n6", "entityId": "m3", "name": "insert", "labels": ["JavaMethod"], "path": "LegalEntityDao.java"},
+    {"id": "n7", "entityId": "c4", "name": "DateUtil", "labels": ["JavaClass"], "path": "DateUtil.java", "pageRank": 0.05},
+    {"id": "n8", "entityId": "c5", "name": "LegalEntityVo", "labels": ["JavaClass"], "path": "LegalEntityVo.java", "pageRank": 0.2},
+    {"id": "n9", "entityId": "c6", "name": "LegalEntityActionTest", "labels": ["JavaClass"], "path": "LegalEntityActionTest.java"},
+    {"id": "n10", "name": None, "labels": ["File"]},
+]
+
+RELATIONSHIPS = [
+    ("n1", "n2", "HAS_METHOD"),
+    ("n2", "n4", "CALLS"),
+    ("n3", "n4", "HAS_METHOD"),
+    ("n4", "n6", "CALLS"),
+    ("n5", "n6", "HAS_METHOD"),
+    ("n1", "n7", "DEPENDS_ON"),
+    ("n6", "n8", "USES"),
+    ("n9", "n1", "DEPENDS_ON"),
+    ("n1", "n10", "CONTAINS"),
+]
+
+
+def _snapshot(version: str = "v1"):
+    builder = GraphSnapshotBuilder()
+    for node in NODES:
+        builder.add_node(node)
+    for source, target, rel_type in RELATIONSHIPS:
+        builder.add_relationship(source, target, rel_type)
+    return builder.build(version)
+
+
+class TestGraphSnapshot:
+    """Tests for GraphSnapshot traversals."""
+
+    def test_adjacency_by_type_and_direction(self):
+        """CSR slices filter by relationship type in both directions."""
+        snapshot = _snapshot()
+        [action] = snapshot.nodes_named(["LegalEntityAction"])
+
+        assert len(snapshot) == 9
+        assert snapshot.relationship_count == 8
+        assert {snapshot.names[n] for n in snapshot.neighbors(action)} == {"save", "DateUtil"}
+        assert [snapshot.names[n] for n in snapshot.neighbors(action, ["DEPENDS_ON"], "in")] == [
+            "LegalEntityActionTest"
+        ]
+        assert snapshot.neighbors(action, ["NO_SUCH_TYPE"]) == []
+        assert snapshot.nbytes > 0
+
+    def test_callers_of(self):
+        """Upstream callers at their shortest depth, then by PageRank."""
+        rows = _snapshot().callers_of("insert", max_depth=3)
+
+        assert [(r["name"], r["depth"]) for r in rows] == [("persist", 1), ("save", 2)]
+        assert rows[1]["pageRank"] == 0.1
+        assert _snapshot().callers_of("insert", max_depth=1, limit=5) == rows[:1]
+
+    def test_downstream_call_chain(self):
+        """Rows match the GET_METHOD_CALL_CHAIN shape and layers."""
+        rows = _snapshot().call_chain("m1", "downstream", max_depth=5)
+
+        assert [(r["name"], r["depth"], r["parentClass"], r["layer"]) for r in rows] == [
+            ("persist", 1, "LegalEntityService", "Service"),
+            ("insert", 2, "LegalEntityDao", "DAO"),
+        ]
+        assert rows[0]["nodeId"] == "m2"
+        assert rows[0]["signature"] == ""
+        assert rows[0]["startLine"] is None
+
+    def test_upstream_call_chain(self):
+        """Upstream chains follow relationships backwards."""
+        rows = _snapshot().call_chain("m3", "upstream", max_depth=3)
+
+        assert {(r["name"], r["depth"]) for r in rows} == {
+            ("persist", 1), ("LegalEntityDao", 1),
+            ("save", 2), ("LegalEntityService", 2),
+            ("LegalEntityAction", 3),
+        }
+        assert _snapshot().call_chain("unknown", "upstream", max_depth=3) is None
+
+    def test_expand_from_seeds(self):
+        """Undirected neighbourhood above the PageRank threshold, with paths."""
+        rows = _snapshot().expand_from_seeds(["save"], max_hops=2, min_pagerank=0.1)
+
+        assert [r["name"] for r in rows[:3]] == ["LegalEntityService", "LegalEntityAction", "persist"]
+        assert {r["name"] for r in rows[3:]} == {"insert", "LegalEntityActionTest"}
+        by_name = {r["name"]: r for r in rows}
+        assert by_name["insert"]["pathNodes"] == ["save", "persist", "insert"]
+        assert by_name["insert"]["pageRank"] is None
+        assert "DateUtil" not in by_name
+
+    def test_traversal_queries(self):
+        """TRAVERSE_* equivalents apply the label and name filters."""
+        snapshot = _snapshot()
+        params = {"entryNames": ["LegalEntityAction"]}
+
+        entities = SNAPSHOT_QUERIES["TRAVERSE_ENTITIES"](snapshot, None, params)
+        deep = SNAPSHOT_QUERIES["TRAVERSE_DEEP_CHAIN"](snapshot, None, params)
+        utilities = SNAPSHOT_QUERIES["TRAVERSE_UTILITIES"](snapshot, None, params)
+
+        assert [(r["name"], r["relationship"]) for r in entities] == [("LegalEntityVo", "ENTITY")]
+        assert [(r["name"], r["distance"]) for r in deep] == [("DateUtil", 1), ("LegalEntityVo", 4)]
+        assert [r["name"] for r in utilities] == ["DateUtil"]
+
+    def test_snapshot_queries_are_registered(self):
+        """Every local equivalent names a registered query."""
+        registered = set(QUERY_REGISTRY.names())
+        assert set(SNAPSHOT_QUERIES) <= registered
+
+
+class TestGraphSnapshotCache:
+    """Tests for GraphSnapshotCache."""
+
+    def test_lru_eviction_within_budget(self):
+        """The least recently used snapshot goes when the budget is exceeded."""
+        size = _snapshot().nbytes
+        cache = GraphSnapshotCache(max_bytes=int(size * 2.5))
+        cache.put("a", _snapshot("a"))
+        cache.put("b", _snapshot("b"))
+        assert cache.get("a") is not None
+
+        cache.put("c", _snapshot("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.nbytes <= cache.max_bytes
+
+    def test_oversized_snapshot_is_not_cached(self):
+        """A snapshot larger than the budget is rejected."""
+        cache = GraphSnapshotCache(max_bytes=10)
+
+        assert cache.put("a", _snapshot()) is False
+        assert cache.get("a") is None
+
+
+class TestClientSnapshotReads:
+    """Neo4jMCPClient answers traversal queries from the snapshot."""
+
+    @pytest.fixture
+    def client(self) -> Neo4jMCPClient:
+        client = Neo4jMCPClient(
+            server_url="bolt://localhost:7687",
+            graph_snapshot_enabled=True,
+            snapshot_cache=GraphSnapshotCache(),
+        )
+        client._driver = object()
+        client.graph_version = AsyncMock(return_value="repo@abc@t1")
+        client.stream_query = _stream()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_missing_snapshot_loads_in_background(self, client: Neo4jMCPClient):
+        """The first read falls back while the snapshot loads; later reads use it."""
+        assert await client.get_graph_snapshot() is None
+        await client._snapshot_task
+
+        snapshot = await client.get_graph_snapshot()
+        assert snapshot is not None and snapshot.version == "repo@abc@t1"
+
+    @pytest.mark.asyncio
+    async def test_prepared_queries_served_from_snapshot(self, client: Neo4jMCPClient):
+        """Registered traversal queries skip Cypher once a snapshot is loaded."""
+        await client.load_graph_snapshot()
+        client._read_session = _no_cypher
+
+        result = await client._get_callers_of("insert", max_depth=3)
+        chain = await client.query_code_structure(
+            *get_query("GET_METHOD_CALL_CHAIN", depth=5).bind(methodId="m1")
+        )
+
+        assert [c["name"] for c in result["callers"]] == ["persist", "save"]
+        assert [r["name"] for r in chain["nodes"]] == ["persist", "insert"]
+        assert "snapshot:GET_CALLERS_OF" in client.metrics.snapshot()["queries"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_entity_falls_back_to_cypher(self, client: Neo4jMCPClient):
+        """A call chain for an entity outside the snapshot runs the Cypher query."""
+        await client.load_graph_snapshot()
+
+        records = await client._read_from_snapshot(
+            *get_query("GET_METHOD_CALL_CHAIN", depth=5).bind(methodId="elsewhere")
+        )
+
+        assert records is None
+
+    @pytest.mark.asyncio
+    async def test_oversized_snapshot_not_reloaded_until_version_changes(self, client: Neo4jMCPClient):
+        """A snapshot over the budget is streamed once per graph version."""
+        client.graph_snapshots = GraphSnapshotCache(max_bytes=10)
+        client.graph_version_refresh_seconds = 0
+        loads = []
+        stream = client.stream_query
+
+        def counting_stream(cypher_query, parameters=None, fetch_size=None):
+            loads.append(cypher_query)
+            return stream(cypher_query, parameters, fetch_size)
+
+        client.stream_query = counting_stream
+
+        assert await client.load_graph_snapshot() is None
+        assert await client.get_graph_snapshot() is None
+        assert client._snapshot_task is None
+        assert await client.load_graph_snapshot() is None
+        assert len(loads) == 2
+
+        client.graph_version.return_value = "repo@def@t2"
+        await client.get_graph_snapshot()
+        await client._snapshot_task
+        assert len(loads) == 4
+
+    @pytest.mark.asyncio
+    async def test_disabled_client_never_loads(self, client: Neo4jMCPClient):
+        """With snapshots disabled reads go straight to Cypher."""
+        client.graph_snapshot_enabled = False
+
+        assert await client.get_graph_snapshot() is None
+        assert client.warm_graph_snapshot() is None
+        await asyncio.sleep(0)
+        assert client.graph_snapshots.stats()["snapshots"] == 0
+
+
+def _stream():
+    """stream_query replacement serving the snapshot node and relationship queries."""
+    async def stream_query(cypher_query, parameters=None, fetch_size=None):
+        if cypher_query == get_query("GRAPH_SNAPSHOT_NODES").text:
+            for node in NODES:
+                yield dict(node)
+        else:
+            for source, target, rel_type in RELATIONSHIPS:
+                yield {"source": source, "target": target, "type": rel_type}
+    return stream_query
+
+
+def _no_cypher(*args, **kwargs):
+    raise AssertionError("query should have been answered from the snapshot")
@@ -0,0 +1,127 @@
+"""
+Tests for the content-addressed LLM response cache.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from brd_generator.core.llm_cache import LLMResponseCache, bypass_llm_cache, make_cache_key
+from brd_generator.database.models import LLMResponseCacheDB
+
+
+@pytest.fixture
+async def session_factory():
+    """Session factory over an in-memory SQLite database holding the cache table."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(LLMResponseCacheDB.__table__.create)
+    sessionmaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def factory():
+        async with sessionmaker() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    yield factory
+    await engine.dispose()
+
+
+class CountingLLM:
+    """LLM call stand-in that counts invocations."""
+
+    def __init__(self, response: str = "answer"):
+        self.response = response
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        return self.response
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache."""
+
+    def test_key_covers_model_context_and_options(self):
+        """Test the key changes with every input that determines the response."""
+        base = make_cache_key("p", "gpt-4o", {"commit": "a"}, {"temperature": 0})
+
+        assert base == make_cache_key("p", "gpt-4o", {"commit": "a"}, {"temperature": 0})
+        assert base != make_cache_key("p", "gpt-4.1", {"commit": "a"}, {"temperature": 0})
+        assert base != make_cache_key("p", "gpt-4o", {"commit": "b"}, {"temperature": 0})
+        assert base != make_cache_key("p", "gpt-4o", {"commit": "a"}, {"temperature": 0.5})
+
+    @pytest.mark.asyncio
+    async def test_hit_miss_and_bypass(self, session_factory):
+        """Test repeated prompts are served from the cache unless bypassed."""
+        cache = LLMResponseCache(session_factory=session_factory)
+        llm = CountingLLM()
+
+        for _ in range(3):
+            assert await cache.get_or_call("wiki", "prompt", llm, model="gpt-4o") == "answer"
+        assert llm.calls == 1
+
+        await cache.get_or_call("wiki", "prompt", llm, model="gpt-4o", bypass=True)
+        with bypass_llm_cache():
+            await cache.get_or_call("wiki", "prompt", llm, model="gpt-4o")
+        assert llm.calls == 3
+
+        # Empty responses are not cached
+        empty = CountingLLM("")
+        await cache.get_or_call("wiki", "other", empty)
+        await cache.get_or_call("wiki", "other", empty)
+        assert empty.calls == 2
+
+        stats = cache.stats()["callers"]["wiki"]
+        assert (stats["hits"], stats["misses"], stats["bypasses"]) == (2, 3, 2)
+        assert stats["hit_rate"] == 0.4
+
+    @pytest.mark.asyncio
+    async def test_expired_and_least_recently_used_entries_are_pruned(self, session_factory):
+        """Test pruning drops expired entries, then the least recently used."""
+        cache = LLMResponseCache(session_factory=session_factory, max_entries=2, prune_every=1000)
+        for prompt in ("a", "b", "c", "d"):
+            await cache.get_or_call("test", prompt, CountingLLM(prompt))
+
+        now = datetime.utcnow()
+        async with session_factory() as session:
+            entries = {
+                entry.response: entry
+                for entry in (await session.execute(select(LLMResponseCacheDB))).scalars()
+            }
+            entries["a"].expires_at = now - timedelta(seconds=1)
+            entries["b"].last_accessed_at = now - timedelta(hours=2)
+            entries["c"].last_accessed_at = now - timedelta(hours=1)
+
+        assert await cache.prune() == 2
+
+        async with session_factory() as session:
+            remaining = (await session.execute(select(LLMResponseCacheDB.response))).scalars().all()
+        assert sorted(remaining) == ["c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_database_errors_fall_back_to_the_llm(self):
+        """Test an unavailable database degrades to uncached calls."""
+        @asynccontextmanager
+        async def broken_factory():
+            raise ConnectionError("database down")
+            yield
+
+        cache = LLMResponseCache(session_factory=broken_factory)
+        llm = CountingLLM()
+
+        assert await cache.get_or_call("test", "prompt", llm) == "answer"
+        assert await cache.get_or_call("test", "prompt", llm) == "answer"
+        assert llm.calls == 2
+        assert cache.stats()["callers"]["test"]["errors"] == 1
@@ -0,0 +1,162 @@
+"""
+Tests for the shared LLM gateway.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from brd_generator.core.llm_gateway import LLMGateway, LLMSessionError
+
+
+def _event(event_type: str, **data):
+    return SimpleNamespace(type=SimpleNamespace(value=event_type), data=SimpleNamespace(**data))
+
+
+class EventSession:
+    """Copilot session stand-in that emits events after each send."""
+
+    def __init__(self, events, delay: float = 0.01):
+        self.events = events
+        self.delay = delay
+        self.handlers = []
+        self.sent = []
+
+    def on(self, handler):
+        self.handlers.append(handler)
+        return lambda: self.handlers.remove(handler)
+
+    async def send(self, options):
+        self.sent.append(options)
+        loop = asyncio.get_running_loop()
+        for event in self.events:
+            loop.call_later(self.delay, self._emit, event)
+        return "message-id"
+
+    def _emit(self, event):
+        for handler in list(self.handlers):
+            handler(event)
+
+
+class EchoSession(EventSession):
+    """Session that replies with the prompt, after a per-prompt delay."""
+
+    def __init__(self, delays=None):
+        super().__init__([])
+        self.delays = delays or {}
+
+    async def send(self, options):
+        self.sent.append(options)
+        prompt = options["prompt"]
+        loop = asyncio.get_running_loop()
+        delay = self.delays.get(prompt, 0.01)
+        loop.call_later(delay, self._emit, _event("assistant.message", content=prompt))
+        loop.call_later(delay, self._emit, _event("session.idle"))
+        return "message-id"
+
+
+class TestLLMGateway:
+    """Tests for LLMGateway."""
+
+    @pytest.mark.asyncio
+    async def test_reply_completes_on_idle_event(self):
+        """Test the reply is taken from the events, with reported token usage."""
+        session = EventSession([
+            _event("assistant.message", content="Hello"),
+            _event("assistant.usage", input_tokens=12, output_tokens=3),
+            _event("session.idle"),
+        ])
+        gateway = LLMGateway()
+
+        response = await gateway.send(session, "Hi", caller="test", options={"temperature": 0})
+
+        assert response == "Hello"
+        assert session.sent == [{"temperature": 0, "prompt": "Hi"}]
+        assert session.handlers == []
+        metrics = gateway.metrics()["callers"]["test"]
+        assert metrics["calls"] == 1
+        assert (metrics["input_tokens"], metrics["output_tokens"]) == (12, 3)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        """Test no more than max_concurrency calls are in flight."""
+        gateway = LLMGateway(max_concurrency=2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            session = EventSession([_event("assistant.message", content="ok"), _event("session.idle")])
+            task = asyncio.create_task(gateway.send(session, "p", caller="test"))
+            await asyncio.sleep(0)
+            peak = max(peak, gateway.metrics()["in_flight"])
+            return await task
+
+        results = await asyncio.gather(*(call() for _ in range(5)))
+
+        assert results == ["ok"] * 5
+        assert peak == 2
+        assert gateway.metrics()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_session_error(self):
+        """Test timeouts and session errors raise and are counted."""
+        gateway = LLMGateway(caller_timeouts={"slow": 0.05})
+
+        with pytest.raises(asyncio.TimeoutError):
+            await gateway.send(EventSession([]), "p", caller="slow", timeout=60)
+        # The silent session stays locked for one more timeout
+        await asyncio.gather(*gateway._abandoned_turns)
+
+        with pytest.raises(LLMSessionError, match="rate limited"):
+            await gateway.send(
+                EventSession([_event("session.error", message="rate limited")]), "p", caller="test"
+            )
+
+        callers = gateway.metrics()["callers"]
+        assert callers["slow"]["timeouts"] == 1
+        assert callers["test"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_on_one_session_get_their_own_replies(self):
+        """Test turns on a shared session are sent one at a time."""
+        session = EchoSession()
+        gateway = LLMGateway()
+
+        replies = await asyncio.gather(*(gateway.send(session, p, caller="test") for p in "abc"))
+
+        assert replies == ["a", "b", "c"]
+        assert session.handlers == []
+
+    @pytest.mark.asyncio
+    async def test_late_reply_does_not_complete_the_next_turn(self):
+        """Test a timed-out turn holds its session until its reply arrives."""
+        session = EchoSession(delays={"slow": 0.08, "next": 0.15})
+        gateway = LLMGateway()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await gateway.send(session, "slow", caller="test", timeout=0.05)
+        reply = await gateway.send(session, "next", caller="test")
+
+        assert reply == "next"
+        assert [options["prompt"] for options in session.sent] == ["slow", "next"]
+        assert session.handlers == []
+
+    @pytest.mark.asyncio
+    async def test_observer_sees_every_event_of_the_turn(self):
+        """Test on_event receives the turn's events, and a failing observer is ignored."""
+        events = [
+            _event("tool.execution_start", tool_name="read_file"),
+            _event("assistant.message", content="done"),
+            _event("session.idle"),
+        ]
+        seen = []
+
+        def observer(event):
+            seen.append(event)
+            raise RuntimeError("observer bug")
+
+        reply = await LLMGateway().send(EventSession(events), "p", caller="test", on_event=observer)
+
+        assert reply == "done"
+        assert seen == events
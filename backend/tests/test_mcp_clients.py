@@ -2,13 +2,104 @@
 Tests for MCP clients.
 """
 
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
+from brd_generator.mcp_clients.base import MCPToolError
 from brd_generator.mcp_clients.neo4j_client import Neo4jMCPClient
+from brd_generator.mcp_clients.query_metrics import QueryMetrics
 from brd_generator.mcp_clients.filesystem_client import FilesystemMCPClient
 
 
+class FakeNeo4jRecord:
+    """Neo4j record stand-in."""
+
+    def __init__(self, values: dict):
+        self._values = values
+
+    def data(self) -> dict:
+        return dict(self._values)
+
+
+class FakeNeo4jResult:
+    """Async result stand-in that counts pulled records."""
+
+    def __init__(self, tx: "FakeNeo4jTransaction", rows: list[dict]):
+        self._tx = tx
+        self._rows = rows
+
+    async def data(self) -> list[dict]:
+        self._tx.pulled += len(self._rows)
+        return [dict(r) for r in self._rows]
+
+    async def __aiter__(self):
+        for row in self._rows:
+            self._tx.pulled += 1
+            yield FakeNeo4jRecord(row)
+
+    async def consume(self):
+        return SimpleNamespace(profile={"operatorType": "AllNodesScan", "rows": 1, "dbHits": 2})
+
+
+class FakeNeo4jTransaction:
+    """Transaction stand-in recording executed queries."""
+
+    def __init__(self, rows: list[dict], fail: bool):
+        self.rows = rows
+        self.fail = fail
+        self.runs: list[tuple] = []
+        self.pulled = 0
+
+    async def run(self, query: str, parameters: dict):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        self.runs.append((query, parameters))
+        return FakeNeo4jResult(self, self.rows)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeNeo4jSession:
+    """Session stand-in supporting managed and explicit transactions."""
+
+    def __init__(self, rows: list[dict], fail: bool):
+        self.tx = FakeNeo4jTransaction(rows, fail)
+        self.read_transactions = 0
+
+    async def execute_read(self, work, *args):
+        self.read_transactions += 1
+        return await work(self.tx, *args)
+
+    async def begin_transaction(self):
+        return self.tx
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeNeo4jDriver:
+    """Driver stand-in handing out a single session."""
+
+    def __init__(self, rows: list[dict], fail: bool = False):
+        self.opened = FakeNeo4jSession(rows, fail)
+        self.session_kwargs: dict = {}
+
+    def session(self, **kwargs) -> FakeNeo4jSession:
+        self.session_kwargs = kwargs
+        return self.opened
+
+
 class TestNeo4jMCPClient:
     """Tests for Neo4j MCP client."""
 
@@ -80,6 +171,120 @@ class TestNeo4jMCPClient:
             assert len(result) == 2
             assert result[0]["similarity"] > result[1]["similarity"]
 
+    @pytest.mark.asyncio
+    async def test_query_by_names_demultiplexes_per_key(self, client: Neo4jMCPClient):
+        """Test batched lookups run one query and group records by name."""
+        mock_response = {
+            "nodes": [
+                {"key": "OrderService", "filePath": "a.java"},
+                {"key": "OrderService", "filePath": "b.java"},
+                {"key": "CartService", "filePath": "c.java"},
+            ]
+        }
+
+        with patch.object(client, 'query_code_structure', new_callable=AsyncMock) as mock_query:
+            mock_query.return_value = mock_response
+
+            result = await client.query_by_names(
+                "UNWIND $names AS name RETURN name AS key",
+                ["OrderService", "CartService", "OrderService", "", "UserService"],
+            )
+
+            mock_query.assert_awaited_once()
+            assert mock_query.call_args.args[1]["names"] == ["OrderService", "CartService", "UserService"]
+            assert [r["filePath"] for r in result["OrderService"]] == ["a.java", "b.java"]
+            assert result["CartService"] == [{"filePath": "c.java"}]
+            assert result["UserService"] == []
+
+    @pytest.mark.asyncio
+    async def test_query_by_names_chunks_large_batches(self, client: Neo4jMCPClient):
+        """Test name lists larger than batch_size are split across queries."""
+        with patch.object(client, 'query_code_structure', new_callable=AsyncMock) as mock_query:
+            mock_query.return_value = {"nodes": []}
+
+            result = await client.query_by_names(
+                "UNWIND $names AS name RETURN name AS key",
+                [f"C{i}" for i in range(5)],
+                batch_size=2,
+            )
+
+            assert mock_query.await_count == 3
+            assert len(result) == 5
+
+    @pytest.mark.asyncio
+    async def test_queries_run_in_read_transactions(self, client: Neo4jMCPClient):
+        """Test queries use read-access sessions and managed read transactions."""
+        driver = FakeNeo4jDriver([{"name": "OrderService"}])
+        client._driver = driver
+        client.fetch_size = 250
+
+        result = await client.query_code_structure("MATCH (n) RETURN n.name AS name", {"x": 1})
+
+        assert result == {"nodes": [{"name": "OrderService"}]}
+        assert driver.session_kwargs["default_access_mode"] == "READ"
+        assert driver.session_kwargs["fetch_size"] == 250
+        assert driver.opened.read_transactions == 1
+        assert driver.opened.tx.runs == [("MATCH (n) RETURN n.name AS name", {"x": 1})]
+
+    @pytest.mark.asyncio
+    async def test_stream_query_yields_records_lazily(self, client: Neo4jMCPClient):
+        """Test stream_query yields records one at a time and stops early."""
+        driver = FakeNeo4jDriver([{"n": i} for i in range(1000)])
+        client._driver = driver
+
+        seen = []
+        async for record in client.stream_query("MATCH (n) RETURN n", fetch_size=10):
+            seen.append(record)
+            if len(seen) == 3:
+                break
+
+        assert seen == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert driver.session_kwargs["fetch_size"] == 10
+        assert driver.opened.tx.pulled == 3
+
+    @pytest.mark.asyncio
+    async def test_queries_record_metrics_and_profile_slow_ones(self):
+        """Test queries are timed per name and slow ones get a PROFILE plan."""
+        metrics = QueryMetrics(slow_query_ms=0.000001)
+        client = Neo4jMCPClient(server_url="bolt://localhost:7687", metrics=metrics)
+        client._driver = FakeNeo4jDriver([{"n": 1}, {"n": 2}])
+
+        await client.query_code_structure("MATCH (n) WHERE n.name = 'A' RETURN n")
+        await client.query_code_structure("MATCH (n) WHERE n.name = 'B' RETURN n")
+        await asyncio.gather(*client._profile_tasks)
+
+        snapshot = metrics.snapshot()
+        [(name, stats)] = snapshot["queries"].items()
+        assert name.startswith("adhoc:MATCH:")
+        assert stats["calls"] == 2 and stats["rows"] == 4
+        assert len(snapshot["slow_queries"]) == 2
+        # Only the first slow execution of a name is profiled
+        assert snapshot["slow_queries"][0]["profile"] == "AllNodesScan rows=1 dbHits=2"
+        assert snapshot["slow_queries"][1]["profile"] is None
+        assert client._driver.opened.tx.runs[-1][0].startswith("PROFILE MATCH")
+
+    @pytest.mark.asyncio
+    async def test_query_errors_are_counted(self):
+        """Test failed queries increment the error counter."""
+        metrics = QueryMetrics()
+        client = Neo4jMCPClient(server_url="bolt://localhost:7687", metrics=metrics)
+        client._driver = FakeNeo4jDriver([], fail=True)
+
+        with pytest.raises(MCPToolError):
+            await client.query_code_structure("MATCH (n) RETURN n")
+
+        [stats] = metrics.snapshot()["queries"].values()
+        assert stats["errors"] == 1 and stats["calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_query_wraps_driver_errors(self, client: Neo4jMCPClient):
+        """Test driver failures surface as MCPToolError."""
+        client._driver = FakeNeo4jDriver([], fail=True)
+
+        with pytest.raises(MCPToolError):
+            async for _ in client.stream_query("MATCH (n) RETURN n"):
+                pass
+
 
 class TestFilesystemMCPClient:
     """Tests for Filesystem MCP client."""
@@ -115,6 +320,95 @@ class TestFilesystemMCPClient:
 
             assert result == mock_content
 
+    @pytest.mark.asyncio
+    async def test_read_lines_uses_cache(self, client: FilesystemMCPClient):
+        """Test line ranges are cut from one cached download until mtime changes."""
+        client._connected = True
+        client.cache_revalidate_seconds = 0
+        metadata = {"mtime": 1, "size": 20}
+
+        with patch.object(client, '_read_file', new_callable=AsyncMock) as mock_read, \
+                patch.object(client, '_get_file_metadata', new_callable=AsyncMock) as mock_meta:
+            mock_read.return_value = "l1\nl2\nl3\nl4\nl5\n"
+            mock_meta.side_effect = lambda path: dict(metadata)
+
+            assert await client.read_lines("src/a.py", 2, 3) == "l2\nl3"
+            assert await client.read_lines("src/a.py", 0, 1) == "l1"
+            assert await client.read_lines("src/a.py", 4, 99) == "l4\nl5\n"
+            assert await client.read_lines("src/a.py", 9, 12) == ""
+            assert mock_read.await_count == 1
+
+            metadata["mtime"] = 2
+            mock_read.return_value = "new1\nnew2"
+            assert await client.read_lines("src/a.py", 2, 2) == "new2"
+            assert mock_read.await_count == 2
+
+        assert client.cache_stats()["hits"] == 3
+
+    @pytest.mark.asyncio
+    async def test_read_lines_keyed_by_commit(self, client: FilesystemMCPClient):
+        """Test a matching commit skips the server and a new commit refetches."""
+        client._connected = True
+
+        with patch.object(client, '_read_file', new_callable=AsyncMock) as mock_read, \
+                patch.object(client, '_get_file_metadata', new_callable=AsyncMock) as mock_meta:
+            mock_read.return_value = "a\nb"
+
+            await client.read_lines("src/a.py", 1, 1, commit="c1")
+            await client.read_lines("src/a.py", 2, 2, commit="c1")
+            assert mock_read.await_count == 1
+            await client.read_lines("src/a.py", 1, 1, commit="c2")
+            assert mock_read.await_count == 2
+            mock_meta.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_file_cache_evicts_least_recently_used(self):
+        """Test the cache stays within its byte budget."""
+        client = FilesystemMCPClient(
+            server_url="http://localhost:8002", workspace_root=Path("/ws"), cache_max_bytes=10,
+        )
+        client._connected = True
+
+        with patch.object(client, '_read_file', new_callable=AsyncMock) as mock_read:
+            mock_read.return_value = "12345"
+            for name in ("a", "b", "a", "c"):
+                await client.read_file_cached(name, commit="c1")
+
+        assert list(client._file_cache) == ["/ws/a", "/ws/c"]
+        assert client.cache_stats()["bytes"] == 10
+
+    @pytest.mark.asyncio
+    async def test_batch_read_is_concurrent_with_errors_and_budget(self):
+        """Test batch reads run concurrently, keep errors, and respect the byte budget."""
+        client = FilesystemMCPClient(
+            server_url="http://localhost:8002", workspace_root=Path("/ws"), read_concurrency=3,
+        )
+        client._connected = True
+        in_flight = 0
+        peak = 0
+
+        async def read_file(path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if path.endswith("missing.py"):
+                raise MCPToolError("HTTP 404: not found")
+            return "x" * (40 if path.endswith("big.py") else 10)
+
+        with patch.object(client, '_read_file', side_effect=read_file):
+            contents, errors = await client.read_files(
+                ["a.py", "missing.py", "big.py", "b.py", "a.py"], max_bytes=25,
+            )
+            legacy = await client.read_multiple_files(["a.py", "missing.py"])
+
+        assert peak == 3
+        assert list(contents) == ["a.py", "b.py"]
+        assert errors["missing.py"] == "HTTP 404: not found"
+        assert "budget" in errors["big.py"]
+        assert legacy == {"a.py": "x" * 10, "missing.py": "Error: HTTP 404: not found"}
+
     @pytest.mark.asyncio
     async def test_list_directory(self, client: FilesystemMCPClient):
         """Test listing directory contents."""
@@ -1,5 +1,8 @@
 """Tests for Multi-Agent BRD Architecture."""
 
+import asyncio
+from pathlib import Path
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -22,6 +25,7 @@ from brd_generator.core.multi_agent_orchestrator import (
     MultiAgentOrchestrator,
     VerifiedBRDGenerator,
 )
+from brd_generator.mcp_clients.filesystem_client import FilesystemMCPClient
 
 
 # =============================================================================
@@ -358,6 +362,137 @@ class TestMultiAgentOrchestrator:
         assert status["max_iterations"] == 3
         assert status["brd_generated"] is False
 
+    @pytest.mark.asyncio
+    async def test_claims_verified_concurrently_with_shared_evidence(self):
+        """Test claims run in parallel and each entity/file is fetched once."""
+        queried = []
+        in_flight = 0
+        peak = 0
+
+        async def query_by_names(cypher, names, parameters=None):
+            nonlocal in_flight, peak
+            queried.extend(names)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {
+                name: [{"name": name, "labels": ["Class"], "filePath": f"/src/{name}.java",
+                        "startLine": 1, "endLine": 3}]
+                for name in names
+            }
+
+        neo4j_client = MagicMock()
+        neo4j_client.query_by_names = AsyncMock(side_effect=query_by_names)
+        filesystem_client = FilesystemMCPClient(server_url="http://fs", workspace_root=Path("/src"))
+        filesystem_client._connected = True
+        filesystem_client._read_file = AsyncMock(return_value="class X {\n}\n")
+        filesystem_client._get_file_metadata = AsyncMock(return_value={"mtime": 1})
+
+        orchestrator = MultiAgentOrchestrator(
+            neo4j_client=neo4j_client,
+            filesystem_client=filesystem_client,
+            claim_concurrency=2,
+        )
+        claims = [
+            Claim(text=f"Claim {i}", section="Overview", mentioned_entities=entities)
+            for i, entities in enumerate([
+                ["UserService"],
+                ["OrderService"],
+                ["UserService", "OrderService"],
+                ["UserService"],
+            ])
+        ]
+
+        with patch.object(orchestrator, "_extract_claims", AsyncMock(return_value=claims)):
+            result = await orchestrator._verify_section("Overview", "content", MagicMock())
+
+        assert result.total_claims == 4
+        assert all(claim.evidence for claim in claims)
+        assert sorted(queried) == ["OrderService", "UserService"]
+        assert peak == 2
+        read_paths = sorted(call.kwargs["path"] for call in filesystem_client._read_file.await_args_list)
+        assert read_paths == ["/src/OrderService.java", "/src/UserService.java"]
+
+    @pytest.mark.asyncio
+    async def test_cached_lookup_keys_on_parameters(self):
+        """Test lookups differing only in parameters are not shared."""
+        async def query_by_names(cypher, names, parameters=None):
+            return {name: [{"limit": parameters["limit"]}] for name in names}
+
+        neo4j_client = MagicMock()
+        neo4j_client.query_by_names = AsyncMock(side_effect=query_by_names)
+        orchestrator = MultiAgentOrchestrator(neo4j_client=neo4j_client)
+
+        first = await orchestrator._cached_lookup("QUERY", ["UserService"], {"limit": 3})
+        second = await orchestrator._cached_lookup("QUERY", ["UserService"], {"limit": 10})
+        again = await orchestrator._cached_lookup("QUERY", ["UserService"], {"limit": 3})
+
+        assert first == again == {"UserService": [{"limit": 3}]}
+        assert second == {"UserService": [{"limit": 10}]}
+        assert neo4j_client.query_by_names.await_count == 2
+
+    def test_section_dependencies_resolved(self):
+        """Test declared, inferred and invalid section dependencies."""
+        orchestrator = MultiAgentOrchestrator(custom_sections=[
+            {"name": "Overview"},
+            {"name": "Requirements"},
+            {"name": "Acceptance Criteria", "depends_on": ["requirements", "Glossary"]},
+            {"name": "Executive Summary"},
+        ])
+
+        assert orchestrator.section_dependencies == {
+            "Overview": [],
+            "Requirements": [],
+            "Acceptance Criteria": ["Requirements"],
+            "Executive Summary": ["Overview", "Requirements", "Acceptance Criteria"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_independent_sections_generated_concurrently(self, sample_aggregated_context):
+        """Test sections start once their dependencies finish and keep template order."""
+        orchestrator = MultiAgentOrchestrator(
+            custom_sections=[
+                {"name": "Overview"},
+                {"name": "Requirements"},
+                {"name": "Actors"},
+                {"name": "Acceptance Criteria", "depends_on": ["Requirements"]},
+            ],
+            section_concurrency=4,
+        )
+        events = []
+        seen_previous = {}
+        acceptance_started = asyncio.Event()
+
+        async def process_section(section_name, context, previous_sections):
+            events.append(("start", section_name))
+            seen_previous[section_name] = dict(previous_sections)
+            if section_name == "Acceptance Criteria":
+                acceptance_started.set()
+            elif section_name in ("Overview", "Actors"):
+                # Slow sections only finish once Acceptance Criteria has started,
+                # which times out if it were waiting on them
+                await asyncio.wait_for(acceptance_started.wait(), timeout=5)
+            events.append(("end", section_name))
+            evidence = SectionVerificationResult(section_name=section_name, claims=[])
+            evidence.calculate_stats()
+            return {"content": f"{section_name} content", "evidence": evidence}
+
+        with patch.object(orchestrator, "_process_section", side_effect=process_section), \
+                patch.object(orchestrator, "_combine_sections_to_brd", MagicMock()), \
+                patch.object(orchestrator, "_combine_section_evidence", MagicMock(return_value=None)), \
+                patch.object(orchestrator, "_build_output", MagicMock()):
+            await orchestrator.generate_verified_brd(sample_aggregated_context)
+
+        # Acceptance Criteria waits for Requirements only, not for the slower sections
+        assert events.index(("end", "Requirements")) < events.index(("start", "Acceptance Criteria"))
+        assert events.index(("start", "Acceptance Criteria")) < events.index(("end", "Overview"))
+        assert seen_previous["Acceptance Criteria"] == {"Requirements": "Requirements content"}
+        assert seen_previous["Overview"] == {}
+        assert list(orchestrator.section_contents) == [
+            "Overview", "Requirements", "Actors", "Acceptance Criteria"
+        ]
+
 
 # =============================================================================
 # Test Verified BRD Generator
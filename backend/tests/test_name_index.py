@@ -0,0 +1,183 @@
+"""
+Tests for the in-process name index and name-match queries.
+"""
+
+import random
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from brd_generator.mcp_clients.name_index import NameIndex
+from brd_generator.mcp_clients.neo4j_client import Neo4jMCPClient
+from brd_generator.queries.registry import QUERY_REGISTRY, get_query
+
+
+RECORDS = [
+    {"id": "1", "name": "LegalEntityAction", "labels": ["JavaClass"], "path": "src/legal/LegalEntityAction.java", "pageRank": 0.4},
+    {"id": "2", "name": "legalEntityMaintenance", "labels": ["WebFlowDefinition"], "path": "flows/legal.xml", "pageRank": None},
+    {"id": "3", "name": "PointMaintenanceAction", "labels": ["JavaClass"], "path": "src/point/PointMaintenanceAction.java", "pageRank": 0.9},
+    {"id": "4", "name": "LegalEntityDao", "labels": ["JavaClass", "SpringService"], "path": "src/legal/LegalEntityDao.java", "pageRank": 0.2},
+    {"id": "5", "name": "save", "labels": ["JavaMethod"], "path": "src/legal/LegalEntityDao.java", "pageRank": 0.0},
+    {"id": "6", "name": None, "labels": ["File"], "path": "README.md", "pageRank": 1.0},
+]
+
+
+def _brute_force(records, terms, labels=None, include_paths=False):
+    """Reference implementation of the CONTAINS semantics."""
+    ids = set()
+    for record in records:
+        if not record["name"]:
+            continue
+        if labels is not None and not set(record["labels"]) & set(labels):
+            continue
+        for term in terms:
+            term = term.lower()
+            if term in record["name"].lower() or (
+                include_paths and term in (record["path"] or "").lower()
+            ):
+                ids.add(record["id"])
+    return ids
+
+
+class TestNameIndex:
+    """Tests for NameIndex."""
+
+    def test_matches_contains_semantics(self):
+        """Any-term substring matches equal a brute-force CONTAINS scan."""
+        index = NameIndex(RECORDS)
+
+        for terms in (["legalentity"], ["maintenance", "dao"], ["Action"], ["sa"], ["zzz"]):
+            assert set(index.search(terms)) == _brute_force(RECORDS, terms), terms
+
+    def test_label_filter_and_pagerank_order(self):
+        """Labels restrict matches and ids come highest PageRank first."""
+        index = NameIndex(RECORDS)
+
+        assert index.search(["a"], labels=["JavaClass"]) == ["3", "1", "4"]
+        assert index.search(["legal"], labels=["WebFlowDefinition"]) == ["2"]
+        assert index.search(["a"], labels=["JavaClass"], limit=2) == ["3", "1"]
+
+    def test_paths_are_matched_on_request(self):
+        """File paths are only searched with include_paths."""
+        index = NameIndex(RECORDS)
+
+        assert index.search(["src/legal"]) == []
+        assert set(index.search(["src/legal"], include_paths=True)) == {"1", "4", "5"}
+        assert len(index) == 5
+        assert index.path_count == 4
+
+    def test_random_graph_matches_brute_force(self):
+        """A larger synthetic graph agrees with the reference scan."""
+        rng = random.Random(3)
+        words = ["Legal", "Entity", "Point", "Order", "Maint", "Dao", "Action", "Vo"]
+        records = [
+            {
+                "id": str(i),
+                "name": "".join(rng.sample(words, rng.randint(1, 3))),
+                "labels": [rng.choice(["JavaClass", "JSPPage", "JavaMethod"])],
+                "path": f"src/{rng.choice(words).lower()}/F{i % 50}.java",
+                "pageRank": rng.random(),
+            }
+            for i in range(2000)
+        ]
+        index = NameIndex(records)
+
+        for terms in (["entitypoint"], ["ordermaint", "vo"], ["lega"], ["o"]):
+            assert set(index.search(terms)) == _brute_force(records, terms)
+            assert set(index.search(terms, labels=["JSPPage"], include_paths=True)) == \
+                _brute_force(records, terms, labels=["JSPPage"], include_paths=True)
+
+
+class TestNameMatchQueries:
+    """Name-match queries on Neo4jMCPClient."""
+
+    @pytest.fixture
+    def client(self) -> Neo4jMCPClient:
+        client = Neo4jMCPClient(server_url="bolt://localhost:7687", graph_version_refresh_seconds=60)
+        client._driver = object()
+        return client
+
+    def test_every_scan_query_has_an_id_counterpart(self):
+        """Scan queries take $terms; their *_BY_ID twins take $ids instead."""
+        for name in QUERY_REGISTRY.names():
+            if not name.endswith("_BY_ID"):
+                continue
+            scan, by_id = get_query(name[:-len("_BY_ID")]), get_query(name)
+            assert "terms" in scan.parameters and "ids" in by_id.parameters
+            assert by_id.parameters - {"ids"} <= scan.parameters - {"terms"}
+
+    @pytest.mark.asyncio
+    async def test_resolves_names_through_index(self, client: Neo4jMCPClient):
+        """With an index the by-id query runs with the matching element ids."""
+        client._read = AsyncMock(return_value=[{"states": ["repo@abc@t1"]}])
+        client.stream_query = _stream(RECORDS)
+
+        with patch.object(client, "query_code_structure", new_callable=AsyncMock) as query:
+            query.return_value = {"nodes": [{"name": "LegalEntityAction"}]}
+            result = await client.query_name_matches(
+                "ENTRY_POINT_CONTROLLERS", ["LegalEntity"],
+                labels=["JavaClass"], actionWords=[],
+            )
+
+        assert result == {"nodes": [{"name": "LegalEntityAction"}]}
+        text, params = query.call_args.args
+        assert text == get_query("ENTRY_POINT_CONTROLLERS_BY_ID").text
+        assert params == {"ids": ["1", "4"], "actionWords": []}
+
+    @pytest.mark.asyncio
+    async def test_no_matches_skips_the_query(self, client: Neo4jMCPClient):
+        """An empty index result needs no round-trip."""
+        client._read = AsyncMock(return_value=[{"states": []}])
+        client.stream_query = _stream(RECORDS)
+
+        with patch.object(client, "query_code_structure", new_callable=AsyncMock) as query:
+            result = await client.query_name_matches("KEYWORD_SEARCH", ["nothing"], limit=100)
+
+        assert result == {"nodes": []}
+        query.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_scan_without_index(self, client: Neo4jMCPClient):
+        """Without an index the scan query gets the terms, labels and limit."""
+        client.name_index_enabled = False
+
+        with patch.object(client, "query_code_structure", new_callable=AsyncMock) as query:
+            query.return_value = {"nodes": []}
+            await client.query_name_matches(
+                "SEARCH_COMPONENTS_FALLBACK", ["Order", "order", ""],
+                labels=["Class"], limit=25,
+            )
+
+        text, params = query.call_args.args
+        assert text == get_query("SEARCH_COMPONENTS_FALLBACK").text
+        assert params == {"terms": ["order"], "labels": ["Class"], "limit": 25}
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilds_when_graph_version_changes(self, client: Neo4jMCPClient):
+        """The index is reused within a version and rebuilt after re-analysis."""
+        client.graph_version_refresh_seconds = 0
+        client._read = AsyncMock(return_value=[{"states": ["repo@abc@t1"]}])
+        client.stream_query = _stream(RECORDS)
+
+        first = await client.get_name_index()
+        assert await client.get_name_index() is first
+
+        client._read.return_value = [{"states": ["repo@def@t2"]}]
+        second = await client.get_name_index()
+        assert second is not first
+        assert second.version == "repo@def@t2"
+
+    @pytest.mark.asyncio
+    async def test_build_failure_degrades_to_scans(self, client: Neo4jMCPClient):
+        """A failed build leaves search_names returning None."""
+        client._read = AsyncMock(side_effect=RuntimeError("boom"))
+
+        assert await client.search_names(["order"]) is None
+
+
+def _stream(records):
+    """stream_query replacement yielding ``records``."""
+    async def stream_query(cypher_query, parameters=None, fetch_size=None):
+        for record in records:
+            yield dict(record)
+    return stream_query
@@ -0,0 +1,135 @@
+"""
+Tests for the job progress bus and SSE progress stream.
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import patch
+
+from brd_generator.api import jobs_routes
+from brd_generator.services.progress_bus import ProgressBus
+
+
+class TestProgressBus:
+    """Tests for the in-process progress bus."""
+
+    @pytest.mark.asyncio
+    async def test_publish_fans_out_to_subscribers(self):
+        """Test every subscriber of a run receives its events."""
+        bus = ProgressBus()
+
+        with bus.subscribe("run-1") as first, bus.subscribe("run-1") as second, \
+                bus.subscribe("run-2") as other:
+            delivered = bus.publish("run-1", {"type": "progress", "progress_pct": 10})
+
+            assert delivered == 2
+            assert (await first.get(timeout=0.1))["progress_pct"] == 10
+            assert (await second.get(timeout=0.1))["progress_pct"] == 10
+            assert await other.get(timeout=0.01) is None
+
+        assert bus.subscriber_count() == 0
+        assert bus.publish("run-1", {"type": "progress"}) == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_keeps_latest_events(self):
+        """Test a full subscriber buffer drops the oldest events."""
+        bus = ProgressBus(queue_size=2)
+
+        with bus.subscribe("run-1") as subscription:
+            for pct in (10, 20, 30):
+                bus.publish("run-1", {"type": "progress", "progress_pct": pct})
+
+            assert (await subscription.get(timeout=0.1))["progress_pct"] == 20
+            assert (await subscription.get(timeout=0.1))["progress_pct"] == 30
+
+    @pytest.mark.asyncio
+    async def test_drain_returns_buffered_events(self):
+        """Test drain empties the buffer in publish order."""
+        bus = ProgressBus()
+
+        with bus.subscribe("run-1") as subscription:
+            for pct in (10, 20):
+                bus.publish("run-1", {"type": "progress", "progress_pct": pct})
+
+            assert [e["progress_pct"] for e in subscription.drain()] == [10, 20]
+            assert subscription.drain() == []
+
+
+async def resolve_run_id(job_id):
+    return job_id
+
+
+async def _collect(response) -> list:
+    return [chunk async for chunk in response.body_iterator]
+
+
+class TestStreamJobProgress:
+    """Tests for the SSE progress stream."""
+
+    @pytest.mark.asyncio
+    async def test_pushes_bus_events_without_polling(self):
+        """Test events are pushed from the bus and the DB is read once."""
+        bus = ProgressBus()
+        snapshot = {"type": "progress", "phase": "parsing_code", "progress_pct": 0, "status": "running"}
+        loads = []
+
+        async def load_snapshot(job_id):
+            loads.append(job_id)
+            return "run-1", snapshot
+
+        async def publish_events():
+            while bus.subscriber_count("run-1") == 0:
+                await asyncio.sleep(0.01)
+            bus.publish("run-1", {"type": "progress", "phase": "parsing_code", "progress_pct": 50})
+            bus.publish("run-1", {"type": "progress", "phase": "parsing_code", "progress_pct": 50})
+            bus.publish("run-1", {"type": "complete", "phase": "completed", "progress_pct": 100})
+
+        with patch.object(jobs_routes, "progress_bus", bus), \
+                patch.object(jobs_routes, "_resolve_run_id", side_effect=resolve_run_id), \
+                patch.object(jobs_routes, "_load_progress_snapshot", side_effect=load_snapshot):
+            response = await jobs_routes.stream_job_progress("run-1")
+            publisher = asyncio.create_task(publish_events())
+            chunks = [chunk async for chunk in response.body_iterator]
+            await publisher
+
+        events = [json.loads(chunk[len("data: "):]) for chunk in chunks]
+        assert [event["type"] for event in events] == ["phase", "progress", "complete"]
+        assert [event["progress_pct"] for event in events] == [0, 50, 100]
+        assert loads == ["run-1"]
+
+    @pytest.mark.asyncio
+    async def test_events_published_during_snapshot_read_are_kept(self):
+        """Test events racing the snapshot read are delivered unless the snapshot covers them."""
+        bus = ProgressBus()
+
+        async def load_snapshot(job_id):
+            # Published after subscribing but before the snapshot is returned
+            bus.publish("run-1", {"type": "progress", "phase": "parsing_code", "progress_pct": 20})
+            bus.publish("run-1", {"type": "complete", "phase": "completed", "progress_pct": 100})
+            return "run-1", {"type": "progress", "phase": "parsing_code", "progress_pct": 40, "status": "running"}
+
+        with patch.object(jobs_routes, "progress_bus", bus), \
+                patch.object(jobs_routes, "_resolve_run_id", side_effect=resolve_run_id), \
+                patch.object(jobs_routes, "_load_progress_snapshot", side_effect=load_snapshot):
+            response = await jobs_routes.stream_job_progress("run-1")
+            chunks = await asyncio.wait_for(_collect(response), timeout=1)
+
+        events = [json.loads(chunk[len("data: "):]) for chunk in chunks]
+        assert [(event["type"], event["progress_pct"]) for event in events] == [
+            ("phase", 40), ("complete", 100),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self):
+        """Test a missing job yields a single error event."""
+        async def resolve(job_id):
+            return None
+
+        with patch.object(jobs_routes, "_resolve_run_id", side_effect=resolve):
+            response = await jobs_routes.stream_job_progress("missing")
+            chunks = [chunk async for chunk in response.body_iterator]
+
+        assert len(chunks) == 1
+        assert json.loads(chunks[0][len("data: "):])["error"] == "Job not found"
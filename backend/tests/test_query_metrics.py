@@ -0,0 +1,124 @@
+"""
+Tests for code graph query metrics.
+"""
+
+from brd_generator.mcp_clients.query_metrics import (
+    LATENCY_BUCKETS_MS,
+    QueryMetrics,
+    format_profile,
+    query_name_for,
+)
+from brd_generator.queries.registry import get_query
+
+
+class TestQueryNames:
+    """Tests for query_name_for."""
+
+    def test_registered_queries_use_registry_name(self):
+        """Prepared query texts, including depth variants, map to their name."""
+        assert query_name_for(get_query("TRAVERSE_DIRECT").text) == "TRAVERSE_DIRECT"
+        assert query_name_for(get_query("GET_CALLERS_OF", depth=3).text) == "GET_CALLERS_OF"
+
+    def test_adhoc_queries_mask_literals(self):
+        """Interpolated variants of one query share a fingerprint."""
+        a = query_name_for("MATCH (n) WHERE n.name = 'Order'  RETURN n LIMIT 10")
+        b = query_name_for("MATCH (n)\n WHERE n.name = 'Customer' RETURN n LIMIT 50")
+        c = query_name_for("MATCH (n) WHERE n.path = 'Order' RETURN n LIMIT 10")
+
+        assert a == b
+        assert a != c
+        assert a.startswith("adhoc:MATCH:")
+
+
+class TestQueryMetrics:
+    """Tests for QueryMetrics."""
+
+    def test_record_builds_histogram_and_counters(self):
+        """Latencies land in buckets; rows and errors accumulate per name."""
+        metrics = QueryMetrics(slow_query_ms=0)
+        metrics.record("Q", 3, rows=10)
+        metrics.record("Q", 40, rows=5)
+        metrics.record("Q", 10 ** 6, rows=0)
+        metrics.record_error("Q")
+
+        stats = metrics.snapshot()["queries"]["Q"]
+        assert stats["calls"] == 3
+        assert stats["rows"] == 15
+        assert stats["errors"] == 1
+        assert stats["buckets_ms"][LATENCY_BUCKETS_MS[0]] == 1
+        assert stats["buckets_ms"][50] == 1
+        assert sum(stats["buckets_ms"].values()) == 2
+
+    def test_render_prometheus(self):
+        """Histogram buckets are cumulative and +Inf counts every call."""
+        metrics = QueryMetrics()
+        metrics.record('adhoc:MATCH:"x"', 3, rows=2)
+        metrics.record('adhoc:MATCH:"x"', 20, rows=1)
+
+        text = metrics.render_prometheus()
+
+        assert 'codegraph_query_duration_seconds_bucket{query="adhoc:MATCH:\\"x\\"",le="0.005"} 1' in text
+        assert 'codegraph_query_duration_seconds_bucket{query="adhoc:MATCH:\\"x\\"",le="0.025"} 2' in text
+        assert 'codegraph_query_duration_seconds_bucket{query="adhoc:MATCH:\\"x\\"",le="+Inf"} 2' in text
+        assert 'codegraph_query_rows_total{query="adhoc:MATCH:\\"x\\""} 3' in text
+        assert "codegraph_slow_queries 0" in text
+
+    def test_slow_log_and_profile_interval(self):
+        """Slow queries are logged; PROFILE capture is rate limited per name."""
+        metrics = QueryMetrics(slow_query_ms=100, profile_interval_seconds=60, slow_log_size=2)
+
+        assert not metrics.is_slow(99)
+        assert metrics.is_slow(100)
+        assert metrics.should_profile("Q")
+        assert not metrics.should_profile("Q")
+        assert metrics.should_profile("R")
+
+        for i in range(3):
+            metrics.log_slow_query("Q", f"MATCH (n) RETURN n // {i}", 150, rows=1)
+        slow = metrics.snapshot()["slow_queries"]
+        assert [e["cypher"][-1] for e in slow] == ["1", "2"]
+
+    def test_threshold_zero_disables_slow_log(self):
+        """A zero threshold never marks queries as slow."""
+        assert not QueryMetrics(slow_query_ms=0).is_slow(10 ** 6)
+
+    def test_format_profile(self):
+        """Profile plans render as an indented operator tree."""
+        plan = {
+            "operatorType": "ProduceResults",
+            "rows": 3,
+            "dbHits": 0,
+            "args": {},
+            "children": [
+                {"operatorType": "AllNodesScan", "rows": 9000, "dbHits": 9001,
+                 "args": {"Details": "n"}, "children": []},
+            ],
+        }
+
+        assert format_profile(plan) == (
+            "ProduceResults rows=3 dbHits=0\n"
+            "  AllNodesScan rows=9000 dbHits=9001 [n]"
+        )
+        assert format_profile(None) == ""
+
+
+class TestMetricsEndpoint:
+    """Tests for the /metrics endpoint."""
+
+    def test_metrics_formats(self):
+        """The endpoint serves Prometheus text and JSON."""
+        from fastapi.testclient import TestClient
+
+        from brd_generator.api.app import create_app
+
+        client = TestClient(create_app())
+
+        text = client.get("/metrics")
+        assert text.status_code == 200
+        assert text.headers["content-type"].startswith("text/plain")
+        assert "codegraph_query_duration_seconds" in text.text
+
+        data = client.get("/metrics", params={"format": "json"}).json()
+        assert {"queries", "slow_queries", "slow_query_ms"} <= data.keys()
+        assert "hit_rate" in data["llm_response_cache"]["total"]
+        assert {"max_concurrency", "in_flight", "callers"} <= data["llm_gateway"].keys()
@@ -0,0 +1,212 @@
+"""
+Tests for the prepared Cypher query registry.
+"""
+
+import ast
+import re
+from pathlib import Path
+
+import pytest
+from unittest.mock import AsyncMock
+
+from brd_generator.core.enhanced_context import EnhancedContextRetriever
+from brd_generator.core.feature_flow import FeatureFlowService
+from brd_generator.queries.registry import (
+    DEPTH_MARKER,
+    MAX_TRAVERSAL_DEPTH,
+    QUERY_REGISTRY,
+    QueryRegistry,
+    get_query,
+)
+
+
+SRC_ROOT = Path(__file__).parent.parent / "src" / "brd_generator"
+
+# Code whose Cypher must be static text bound to parameters. ``None`` lints
+# the whole module; a set limits the lint to the named functions.
+PARAMETERIZED_SCOPES = {
+    "queries/flow_queries.py": None,
+    "queries/blueprint_queries.py": None,
+    "queries/graph_queries.py": None,
+    "mcp_clients/neo4j_client.py": None,
+    "core/feature_flow.py": None,
+    "core/aggregator.py": {"_search_components_fallback"},
+    "core/enhanced_context.py": {
+        "_find_entry_points",
+        "_find_entry_points_by_menu",
+        "_traverse_dependencies",
+        "_build_traversal_queries",
+    },
+    "services/code_assistant_service.py": {"_query_by_keywords"},
+}
+
+CYPHER_KEYWORDS = re.compile(r"\b(MATCH|MERGE|UNWIND|RETURN|WHERE)\b")
+
+# A comparison left open for a spliced-in value, e.g. "n.name = '" or "CONTAINS '"
+OPEN_COMPARISON = re.compile(r"(\b\w+\.\w+\s*(=|<>)|\b(CONTAINS|STARTS WITH|ENDS WITH))\s*'?$")
+
+
+def _is_cypher(text: str) -> bool:
+    return bool(CYPHER_KEYWORDS.search(text) or OPEN_COMPARISON.search(text))
+
+
+def _interpolation_violations(tree: ast.AST) -> list[tuple[int, str]]:
+    """Find Cypher built by f-strings, ``%``/``+``, ``.format()`` or ``.replace()``."""
+    violations = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.JoinedStr):
+            parts = node.values
+            for index, part in enumerate(parts):
+                if not (isinstance(part, ast.Constant) and isinstance(part.value, str)):
+                    continue
+                interpolated_next = index + 1 < len(parts) \
+                    and isinstance(parts[index + 1], ast.FormattedValue)
+                if CYPHER_KEYWORDS.search(part.value) or (
+                    interpolated_next and OPEN_COMPARISON.search(part.value)
+                ):
+                    violations.append((node.lineno, "f-string"))
+                    break
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Mod, ast.Add)):
+            for operand in (node.left, node.right):
+                if isinstance(operand, ast.Constant) and isinstance(operand.value, str) \
+                        and _is_cypher(operand.value):
+                    violations.append((node.lineno, "string operator"))
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+                and node.func.attr in ("format", "replace"):
+            receiver = node.func.value
+            name = getattr(receiver, "attr", None) or getattr(receiver, "id", None)
+            if (isinstance(name, str) and name.isupper()) or (
+                isinstance(receiver, ast.Constant) and isinstance(receiver.value, str)
+                and _is_cypher(receiver.value)
+            ):
+                violations.append((node.lineno, f".{node.func.attr}()"))
+    return sorted(violations)
+
+
+class TestCypherInterpolationLint:
+    """Cypher in parameterized scopes must not be assembled from strings."""
+
+    @pytest.mark.parametrize("relative_path", sorted(PARAMETERIZED_SCOPES))
+    def test_no_string_interpolated_cypher(self, relative_path: str):
+        """Every query text in scope is a constant bound to parameters."""
+        tree = ast.parse((SRC_ROOT / relative_path).read_text())
+        functions = PARAMETERIZED_SCOPES[relative_path]
+        if functions is None:
+            scopes = [tree]
+        else:
+            scopes = [
+                node for node in ast.walk(tree)
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and node.name in functions
+            ]
+            assert {s.name for s in scopes} == functions
+
+        violations = [v for scope in scopes for v in _interpolation_violations(scope)]
+        assert violations == [], f"{relative_path}: interpolated Cypher at {violations}"
+
+    def test_lint_detects_interpolation(self):
+        """The lint flags the patterns it exists to forbid."""
+        source = '''
+def build(names, depth, kw):
+    flt = " OR ".join([f"n.name = '{name}'" for name in names])
+    a = f"MATCH (n) WHERE {flt} RETURN n"
+    b = GET_CHAIN.replace("$maxDepth", str(depth))
+    c = "MATCH (n) WHERE n.name CONTAINS '%s' RETURN n" % kw
+    return a, b, c
+'''
+        kinds = [kind for _, kind in _interpolation_violations(ast.parse(source))]
+        assert kinds == ["f-string", "f-string", ".replace()", "string operator"]
+
+
+class TestQueryRegistry:
+    """Tests for QueryRegistry and PreparedQuery."""
+
+    def test_default_registry_has_no_unresolved_depth_markers(self):
+        """Every registered text is executable Cypher without substitution."""
+        assert len(QUERY_REGISTRY) > 0
+        for query in QUERY_REGISTRY:
+            assert DEPTH_MARKER not in query.text, query.name
+            assert "maxDepth" not in query.parameters
+
+    def test_parameters_derived_from_text(self):
+        """Parameters are read from the query text."""
+        query = get_query("EXPAND_FROM_SEEDS", depth=2)
+        assert query.parameters == {"seedNames", "minPagerank"}
+        assert "*1..2]" in query.text
+
+    def test_depth_is_clamped_to_bounded_variants(self):
+        """Out-of-range depths map onto the registered variants."""
+        assert get_query("GET_METHOD_CALL_CHAIN", depth=0).depth == 1
+        assert get_query("GET_METHOD_CALL_CHAIN", depth=99).depth == MAX_TRAVERSAL_DEPTH
+        assert get_query("GET_METHOD_CALL_CHAIN", depth=3).text == \
+            get_query("GET_METHOD_CALL_CHAIN", depth=3).text
+
+    def test_depth_variant_requires_depth(self):
+        """Depth-variant queries cannot be fetched without a depth."""
+        with pytest.raises(ValueError):
+            get_query("GET_CALLERS_OF")
+
+    def test_bind_validates_parameters(self):
+        """bind rejects missing and unexpected parameters."""
+        query = get_query("SEARCH_COMPONENTS_FALLBACK")
+        with pytest.raises(ValueError, match="missing"):
+            query.bind(labels=["Class"], terms=["user"])
+        with pytest.raises(ValueError, match="does not take"):
+            query.bind(labels=["Class"], terms=["user"], limit=10, extra=1)
+
+        text, params = query.bind(labels=["Class"], terms=["user"], limit=10)
+        assert text == query.text
+        assert params == {"labels": ["Class"], "terms": ["user"], "limit": 10}
+
+    def test_register_rejects_duplicates_and_unbounded_depth(self):
+        """Registration guards against ambiguous or unpreparable queries."""
+        registry = QueryRegistry(max_depth=3)
+        registry.register("Q", "MATCH (n) WHERE n.name = $name RETURN n")
+        with pytest.raises(ValueError):
+            registry.register("Q", "MATCH (n) RETURN n")
+        with pytest.raises(ValueError):
+            registry.register("DEEP", "MATCH (a)-[*1..$maxDepth]->(b) RETURN b")
+
+        variants = registry.register_depth_variants(
+            "DEEP", "MATCH (a)-[*1..$maxDepth]->(b) WHERE a.name = $name RETURN b"
+        )
+        assert [v.depth for v in variants] == [1, 2, 3]
+        assert registry.names() == ["DEEP", "Q"]
+
+
+class TestPreparedCallSites:
+    """Call sites send identical query text for different inputs."""
+
+    @pytest.mark.asyncio
+    async def test_call_chain_reuses_query_text(self):
+        """Different method ids share one plan per depth."""
+        neo4j = AsyncMock()
+        neo4j.query_code_structure.return_value = {"nodes": []}
+        service = FeatureFlowService(neo4j)
+
+        await service.get_call_chain("m1", max_depth=4)
+        await service.get_call_chain("m2", max_depth=4)
+
+        (text1, params1), (text2, params2) = [
+            call.args for call in neo4j.query_code_structure.call_args_list
+        ]
+        assert text1 == text2 == get_query("GET_METHOD_CALL_CHAIN", depth=4).text
+        assert params1 == {"methodId": "m1"}
+        assert params2 == {"methodId": "m2"}
+
+    @pytest.mark.asyncio
+    async def test_traversal_passes_entry_points_as_parameters(self):
+        """Entry point names travel as parameters, not query literals."""
+        neo4j = AsyncMock()
+        neo4j.query_code_structure.return_value = {"nodes": []}
+        retriever = EnhancedContextRetriever(neo4j)
+
+        await retriever._traverse_dependencies(["O'BrienAction"], keywords=["Entity"])
+
+        for call in neo4j.query_code_structure.call_args_list:
+            text, params = call.args
+            assert "O'Brien" not in text
+        sent = [call.args[1] for call in neo4j.query_code_structure.call_args_list]
+        assert {"entryNames": ["O'BrienAction"]} in sent
+        assert {"baseNames": ["o'brien"]} in sent
+        assert {"keywords": ["entity"]} in sent
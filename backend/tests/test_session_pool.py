@@ -0,0 +1,89 @@
+"""
+Tests for the Copilot session pool.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from brd_generator.core.session_pool import CopilotSessionPool
+
+
+class TestCopilotSessionPool:
+    """Tests for CopilotSessionPool."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_never_shared_and_capped(self):
+        """Test concurrent callers get distinct sessions, up to max_size."""
+        created = []
+
+        async def factory():
+            session = MagicMock(name=f"session-{len(created)}")
+            created.append(session)
+            return session
+
+        base = MagicMock(name="base")
+        pool = CopilotSessionPool(base, session_factory=factory, max_size=3)
+        in_use = set()
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with pool.acquire() as session:
+                assert id(session) not in in_use
+                in_use.add(id(session))
+                peak = max(peak, len(in_use))
+                await asyncio.sleep(0.01)
+                in_use.discard(id(session))
+
+        await asyncio.gather(*(call() for _ in range(10)))
+
+        assert peak == 3
+        assert len(created) == 3
+        assert pool.size == 3
+
+    @pytest.mark.asyncio
+    async def test_pools_do_not_share_the_base_session(self):
+        """Test pools with a factory only hand out sessions they created."""
+        async def factory():
+            return AsyncMock(name="created")
+
+        base = MagicMock(name="base")
+        pools = [CopilotSessionPool(base, session_factory=factory, max_size=2) for _ in range(2)]
+
+        async with pools[0].acquire() as first, pools[1].acquire() as second:
+            assert first is not base and second is not base
+            assert first is not second
+
+        await pools[0].close()
+        first.destroy.assert_called_once()
+        base.destroy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_factory_failure_falls_back_to_base_session(self):
+        """Test a failing factory caps the pool at the existing sessions."""
+        async def factory():
+            raise RuntimeError("no more sessions")
+
+        base = MagicMock(name="base")
+        pool = CopilotSessionPool(base, session_factory=factory, max_size=4)
+        seen = []
+
+        async def call():
+            async with pool.acquire() as session:
+                seen.append(session)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(call(), call())
+
+        assert seen == [base, base]
+        assert pool.size == 1
+
+    @pytest.mark.asyncio
+    async def test_no_sessions(self):
+        """Test an empty pool yields None."""
+        pool = CopilotSessionPool()
+
+        async with pool.acquire() as session:
+            assert session is None
@@ -2,6 +2,8 @@
 Tests for LLM Synthesizer.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
@@ -264,3 +266,90 @@ class TestLLMSynthesizerFallback:
             except Exception:
                 # Or gracefully handle the error
                 pass
+
+
+class TestConcurrentBacklogGeneration:
+    """Tests for per-epic concurrent backlog generation."""
+
+    @pytest.mark.asyncio
+    async def test_epics_run_concurrently_in_order_with_partial_failure(self):
+        """Test epics fan out under the limit, keep order, and survive a failure."""
+        synthesizer = LLMSynthesizer(session=MagicMock(), max_concurrency=2)
+        epics = [
+            Epic(id=f"EPIC-{i:03d}", title=f"Epic {i}", description="d", estimated_effort="small")
+            for i in range(1, 5)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def mock_send(prompt: str) -> str:
+            nonlocal in_flight, peak
+            epic_id = next(e.id for e in epics if e.id in prompt)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                # Later epics finish first
+                await asyncio.sleep(0.01 * (5 - int(epic_id[-1])))
+                if epic_id == "EPIC-003":
+                    raise asyncio.TimeoutError()
+                return f"STORY-{epic_id[-1]}01: Story for {epic_id}\nAs a user, I want it, so that it works."
+            finally:
+                in_flight -= 1
+
+        with patch.object(synthesizer, "_send_to_llm", side_effect=mock_send):
+            stories = await synthesizer.generate_backlogs_from_epics(epics)
+
+        assert peak == 2
+        assert [s.epic_id for s in stories] == ["EPIC-001", "EPIC-002", "EPIC-003", "EPIC-003", "EPIC-004"]
+        assert epics[0].stories == ["STORY-101"]
+        # The failed epic falls back to basic stories
+        assert epics[2].stories == ["STORY-301", "STORY-302"]
+
+
+class TestLLMCalls:
+    """Tests for how the synthesizer sends prompts through the cache and gateway."""
+
+    @pytest.mark.asyncio
+    async def test_cache_context_and_bypass_are_passed(self):
+        """Responses are scoped to the repository commit and can be refreshed."""
+        context = {"repository_id": "repo-1", "commit": "abc123"}
+        synthesizer = LLMSynthesizer(
+            session=MagicMock(), model="gpt-4o", cache_context=context, bypass_cache=True
+        )
+
+        with patch("brd_generator.core.synthesizer.llm_response_cache") as cache:
+            cache.get_or_call = AsyncMock(return_value="answer")
+            assert await synthesizer._send_to_session("prompt") == "answer"
+
+        args, kwargs = cache.get_or_call.call_args
+        assert args[:2] == ("synthesizer", "prompt")
+        assert kwargs["model"] == "gpt-4o"
+        assert kwargs["context"] == context
+        assert kwargs["bypass"] is True
+
+    @pytest.mark.asyncio
+    async def test_event_logging_goes_through_the_gateway(self):
+        """Skill prompts reach the gateway, which reports the turn's tool calls."""
+        synthesizer = LLMSynthesizer(session=MagicMock())
+        tool_event = MagicMock()
+        tool_event.data.tool_name = "read_file"
+        tool_event.data.tool_input = {"path": "src/App.java"}
+
+        async def send(session, prompt, *, caller, timeout=None, on_event=None):
+            on_event(tool_event)
+            return "reply"
+
+        async def get_or_call(caller, prompt, call, **kwargs):
+            return await call()
+
+        with patch("brd_generator.core.synthesizer.llm_gateway") as gateway, \
+                patch("brd_generator.core.synthesizer.llm_response_cache") as cache:
+            gateway.send = AsyncMock(side_effect=send)
+            cache.get_or_call = AsyncMock(side_effect=get_or_call)
+            with patch.object(synthesizer, "_record_event", wraps=synthesizer._record_event) as record:
+                assert await synthesizer._send_with_event_logging("Generate BRD") == "reply"
+
+        assert gateway.send.await_args.kwargs["caller"] == "synthesizer"
+        [call] = record.call_args_list
+        assert call.args[0] is tool_event
+        assert call.args[1] == ["read_file: {'path': 'src/App.java'}"]
@@ -0,0 +1,68 @@
+"""
+Tests for token counting backends.
+"""
+
+import pytest
+
+from brd_generator.utils import token_counter
+from brd_generator.utils.token_counter import (
+    Tokenizer,
+    create_tokenizer,
+    estimate_tokens,
+    estimate_tokens_batch,
+    set_tokenizer,
+    truncate_to_token_limit,
+)
+
+
+class WordTokenizer(Tokenizer):
+    """One token per whitespace-separated word, counting backend calls."""
+
+    name = "words"
+
+    def __init__(self):
+        self.counted = 0
+
+    def count(self, text: str) -> int:
+        self.counted += 1
+        return len(text.split())
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return " ".join(text.split()[:max_tokens])
+
+
+@pytest.fixture
+def words():
+    tokenizer = WordTokenizer()
+    set_tokenizer(tokenizer)
+    yield tokenizer
+    set_tokenizer(None)
+
+
+class TestTokenCounter:
+    """Tests for the pluggable, memoized token counter."""
+
+    def test_unknown_backend_falls_back_to_heuristic(self):
+        """Test an unavailable backend degrades to the character heuristic."""
+        tokenizer = create_tokenizer("no-such-backend")
+
+        assert tokenizer.name == "heuristic"
+        assert tokenizer.count("x" * 40) == 10
+
+    def test_counts_are_memoized_and_batched(self, words):
+        """Test repeated texts are counted once, alone or in batches."""
+        text = "public void approveInvoice ( Invoice invoice ) { } " * 10
+
+        assert estimate_tokens(text) == 90
+        assert estimate_tokens(text) == 90
+        assert words.counted == 1
+
+        other = "private int total ; " * 20
+        assert estimate_tokens_batch([text, other, "", "short one"]) == [90, 80, 0, 2]
+        assert words.counted == 3  # the other text and the uncached short one
+
+    def test_truncate_uses_backend(self, words):
+        """Test truncation cuts at token boundaries of the active backend."""
+        assert truncate_to_token_limit("a b c", 5) == "a b c"
+        assert truncate_to_token_limit("a b c d e f", 2) == "a b\n... [truncated]"
+        assert token_counter.get_tokenizer() is words
@@ -0,0 +1,114 @@
+"""
+Tests for incremental wiki regeneration.
+"""
+
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from brd_generator.database.models import WikiPageType
+from brd_generator.services.git_client import GitClient
+from brd_generator.services.wiki_service import WikiService
+
+
+@pytest.fixture
+def codebase_data() -> dict:
+    """Codebase data as returned by _gather_codebase_data."""
+    return {
+        "classes": [
+            {"name": "UserController", "file_path": "/repos/app/src/user/UserController.java"},
+            {"name": "UserService", "file_path": "/repos/app/src/user/UserService.java"},
+            {"name": "OrderService", "file_path": "/repos/app/src/order/OrderService.java"},
+        ],
+        "modules": [
+            {"name": "order", "path": "/repos/app/src/order"},
+        ],
+        "endpoints": [
+            {"method": "GET", "path": "/users", "handler": "list", "controller": "UserController"},
+        ],
+        "source_code": {},
+    }
+
+
+class TestIncrementalWiki:
+    """Tests for mapping changed files to wiki pages."""
+
+    def test_page_sources_follow_prompt_inputs(self, codebase_data: dict):
+        """Test page sources cover the classes each page type documents."""
+        service = WikiService()
+
+        files, names = service._page_sources(
+            {"slug": "api-reference", "title": "API Reference", "type": WikiPageType.API},
+            codebase_data,
+        )
+        assert names == ["UserController"]
+        assert files == ["/repos/app/src/user/UserController.java"]
+
+        files, names = service._page_sources(
+            {
+                "slug": "code-structure/order",
+                "title": "order",
+                "type": WikiPageType.MODULE,
+                "data": codebase_data["modules"][0],
+            },
+            codebase_data,
+        )
+        assert names == ["OrderService", "order"]
+        assert "/repos/app/src/order" in files
+
+    def test_find_affected_pages(self, codebase_data: dict):
+        """Test only pages referencing changed files are affected."""
+        service = WikiService()
+        specs = [
+            {"slug": "api-reference", "title": "API Reference", "type": WikiPageType.API},
+            {"slug": "code-structure/order", "title": "order", "type": WikiPageType.MODULE,
+             "data": codebase_data["modules"][0]},
+            {"slug": "user-guide", "title": "User Guide", "type": WikiPageType.GETTING_STARTED},
+        ]
+        pages = []
+        for spec in specs:
+            source_files, source_entities = service._page_sources(spec, codebase_data)
+            pages.append(SimpleNamespace(
+                slug=spec["slug"], source_files=source_files, source_entities=source_entities
+            ))
+
+        affected = service._find_affected_pages(
+            pages, ["src/order/OrderRepository.java"], codebase_data, "/repos/app"
+        )
+        assert affected == {"code-structure/order"}
+
+        affected = service._find_affected_pages(
+            pages, ["src/user/UserController.java"], codebase_data, "/repos/app"
+        )
+        assert affected == {"api-reference"}
+
+        assert service._find_affected_pages(pages, ["README.md"], codebase_data, "/repos/app") == set()
+
+
+class TestGitChangedFiles:
+    """Tests for GitClient.get_changed_files."""
+
+    @pytest.mark.asyncio
+    async def test_changed_files_between_commits(self, tmp_path):
+        """Test diffing two commits lists added, modified and renamed files."""
+        def git(*args):
+            return subprocess.run(
+                ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                cwd=tmp_path, check=True, capture_output=True, text=True,
+            ).stdout.strip()
+
+        git("init", "-q")
+        (tmp_path / "a.py").write_text("a = 1\n")
+        (tmp_path / "b.py").write_text("b = 1\n")
+        git("add", ".")
+        git("commit", "-qm", "first")
+        first = git("rev-parse", "HEAD")
+
+        (tmp_path / "a.py").write_text("a = 2\n")
+        git("mv", "b.py", "c.py")
+        git("commit", "-qam", "second")
+
+        client = GitClient()
+        assert sorted(await client.get_changed_files(tmp_path, first)) == ["a.py", "b.py", "c.py"]
+        assert await client.get_changed_files(tmp_path, "0" * 40) is None
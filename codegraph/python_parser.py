@@ -1,5 +1,6 @@
 # python_parser.py
 import ast
+import hashlib
 import json
 import sys
 import os
@@ -683,45 +684,239 @@ class PythonAstVisitor(ast.NodeVisitor):
 
         self.generic_visit(node) # Visit arguments
 
-# --- Main Execution ---
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print(json.dumps({"error": "File path argument required."}), file=sys.stderr)
-        sys.exit(1)
+# --- Result Cache ---
 
-    filepath_arg = sys.argv[1]
-    # Normalize the path within Python using os.path.abspath
-    filepath = os.path.abspath(filepath_arg)
-    # print(f"DEBUG: Received path: '{filepath_arg}', Absolute path: '{filepath}'", file=sys.stderr) # Keep debug if needed
+def _compute_parser_version():
+    """Digest of this script's source: any parser change invalidates cached results."""
+    try:
+        with open(os.path.abspath(__file__), 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+    except OSError:
+        return 'unknown'
 
-    if not os.path.exists(filepath):
-         print(json.dumps({"error": f"File not found (checked absolute path): {filepath}"}), file=sys.stderr)
-         sys.exit(1)
 
-    try:
-        # Use the normalized, absolute path
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        tree = ast.parse(content, filename=filepath)
+PARSER_VERSION = _compute_parser_version()
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
 
-        # Pass the normalized, absolute path to the visitor
-        visitor = PythonAstVisitor(filepath)
 
-        # Extract module-level docstring
-        module_doc_info = build_documentation_info(tree)
+class ParseResultCache:
+    """
+    On-disk cache of serialized PythonAstVisitor results.
+
+    Entries are keyed by sha256(parser version + normalized path + file bytes);
+    the path is part of the key because entityIds embed it. Each entry is one
+    compact JSON file under a two-character shard directory, so a lookup is
+    a hash plus a single open(). Total size is bounded by max_bytes: when a
+    write pushes the cache over the limit, least-recently-used entries (by
+    mtime, refreshed on every hit) are evicted down to 90% of the limit.
+    """
 
-        # Add the File node itself using the correct kind, with module docstring if present
-        visitor._add_node('File', os.path.basename(filepath), tree, documentation_info=module_doc_info)
-        visitor.visit(tree)
+    def __init__(self, cache_dir, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._total_bytes = None  # Lazily computed on first write
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls):
+        """Builds a cache from PYTHON_PARSER_CACHE_DIR, or returns None when unset."""
+        cache_dir = os.environ.get('PYTHON_PARSER_CACHE_DIR')
+        if not cache_dir:
+            return None
+        try:
+            max_bytes = int(os.environ.get('PYTHON_PARSER_CACHE_MAX_BYTES', DEFAULT_CACHE_MAX_BYTES))
+        except ValueError:
+            max_bytes = DEFAULT_CACHE_MAX_BYTES
+        return cls(cache_dir, max_bytes)
+
+    @staticmethod
+    def make_key(filepath, content_bytes):
+        digest = hashlib.sha256()
+        digest.update(PARSER_VERSION.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(filepath.replace('\\', '/').encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content_bytes)
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + '.json')
+
+    def get(self, key):
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(entry_path, None)  # Refresh LRU position
+        except OSError:
+            pass
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        entry_path = self._entry_path(key)
+        payload = json.dumps(result, separators=(',', ':')).encode('utf-8')
+        if len(payload) > self.max_bytes:
+            return
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, entry_path)  # Atomic: concurrent workers never see partial entries
+        except OSError:
+            return
+
+        if self._total_bytes is None:
+            self._total_bytes = self._scan_total_bytes()
+        else:
+            self._total_bytes += len(payload)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
 
-        result = {
-            "filePath": visitor.filepath, # Already normalized in visitor
-            "nodes": visitor.nodes,
-            "relationships": visitor.relationships
-        }
-        print(json.dumps(result, indent=2)) # Output JSON to stdout
+    def _iter_entries(self):
+        try:
+            shards = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for shard in shards:
+            shard_dir = os.path.join(self.cache_dir, shard)
+            try:
+                names = os.listdir(shard_dir)
+            except OSError:
+                continue
+            for name in names:
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(shard_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _scan_total_bytes(self):
+        return sum(size for _, size, _ in self._iter_entries())
+
+    def _evict(self):
+        # Rescan: other worker processes share the directory, so local accounting drifts
+        entries = sorted(self._iter_entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+        self._total_bytes = total
+
+
+# --- Parsing Entry Points ---
 
+def parse_source(filepath, content):
+    """
+    Parses Python source text and returns the serializable result dict.
+    Raises on parse failure; callers decide how to report errors.
+    """
+    tree = ast.parse(content, filename=filepath)
+
+    # Pass the normalized, absolute path to the visitor
+    visitor = PythonAstVisitor(filepath)
+
+    # Extract module-level docstring
+    module_doc_info = build_documentation_info(tree)
+
+    # Add the File node itself using the correct kind, with module docstring if present
+    visitor._add_node('File', os.path.basename(filepath), tree, documentation_info=module_doc_info)
+    visitor.visit(tree)
+
+    return {
+        "filePath": visitor.filepath, # Already normalized in visitor
+        "nodes": visitor.nodes,
+        "relationships": visitor.relationships
+    }
+
+
+def parse_file(filepath, cache=None):
+    """
+    Parses a single Python file, consulting the result cache when provided.
+    Raises on read/parse failure; callers decide how to report errors.
+    """
+    with open(filepath, 'rb') as f:
+        content_bytes = f.read()
+
+    key = None
+    if cache is not None:
+        key = cache.make_key(filepath, content_bytes)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    result = parse_source(filepath, content_bytes.decode('utf-8'))
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+
+def parse_path_safely(filepath_arg, cache=None):
+    """
+    Parses a file path and always returns a result dict.
+    On failure the dict carries an "error" key instead of nodes/relationships.
+    """
+    # Normalize the path within Python using os.path.abspath
+    filepath = os.path.abspath(filepath_arg)
+    if not os.path.exists(filepath):
+        return {"filePath": filepath_arg, "error": f"File not found (checked absolute path): {filepath}"}
+    try:
+        return parse_file(filepath, cache)
     except Exception as e:
         # Use the normalized, absolute path in the error message
-        print(json.dumps({"error": f"Error parsing {filepath}: {str(e)}"}), file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
+        return {"filePath": filepath_arg, "error": f"Error parsing {filepath}: {str(e)}"}
+
+
+def run_worker(stdin=None, stdout=None, cache=None):
+    """
+    Long-lived worker mode (NDJSON batch protocol).
+
+    Reads one file path per line from stdin and writes exactly one compact
+    JSON object per line to stdout, in the same order. Each line is flushed
+    immediately so the caller can stream requests without waiting for EOF.
+    Blank lines are ignored; EOF ends the worker.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    for line in stdin:
+        filepath_arg = line.rstrip('\r\n')
+        if not filepath_arg.strip():
+            continue
+        result = parse_path_safely(filepath_arg, cache)
+        stdout.write(json.dumps(result, separators=(',', ':')))
+        stdout.write('\n')
+        stdout.flush()
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    result_cache = ParseResultCache.from_env()
+
+    if len(sys.argv) == 2 and sys.argv[1] == '--worker':
+        run_worker(cache=result_cache)
+        sys.exit(0)
+
+    if len(sys.argv) != 2:
+        print(json.dumps({"error": "File path argument required (or --worker)."}), file=sys.stderr)
+        sys.exit(1)
+
+    result = parse_path_safely(sys.argv[1], result_cache)
+    if "error" in result:
+        print(json.dumps({"error": result["error"]}), file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(result, indent=2)) # Output JSON to stdout
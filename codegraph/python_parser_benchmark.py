@@ -0,0 +1,169 @@
+# python_parser_benchmark.py
+"""
+Throughput benchmark for python_parser.py: one process per file vs. the
+persistent NDJSON worker mode (`python_parser.py --worker`).
+
+Usage:
+    python python_parser_benchmark.py                      # 500 synthetic files, 4 workers
+    python python_parser_benchmark.py --files 2000 --workers 8
+    python python_parser_benchmark.py --dir /path/to/repo  # benchmark real .py files
+
+Both modes run with the same degree of parallelism (--workers), so the
+difference is interpreter startup + module import cost per file.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python_parser.py')
+
+SYNTHETIC_TEMPLATE = '''"""Synthetic module {index} for parser benchmarking."""
+import os
+from typing import Optional
+
+
+class Service{index}:
+    """Service {index}.
+
+    Args:
+        name: Service name
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+
+    def handle(self, payload: dict, retries: Optional[int] = None) -> dict:
+        """Handle a payload."""
+        self.calls += 1
+        result = helper_{index}(payload)
+        return {{"name": self.name, "result": result, "cwd": os.getcwd()}}
+
+
+def helper_{index}(payload):
+    total = 0
+    for key, value in payload.items():
+        total += len(str(key)) + len(str(value))
+    return total
+'''
+
+
+def generate_files(directory, count):
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f'module_{index}.py')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(SYNTHETIC_TEMPLATE.format(index=index))
+        paths.append(path)
+    return paths
+
+
+def collect_files(directory, limit):
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in ('.git', 'node_modules', '.venv', 'venv', '__pycache__')]
+        for name in files:
+            if name.endswith('.py'):
+                paths.append(os.path.join(root, name))
+                if limit and len(paths) >= limit:
+                    return paths
+    return paths
+
+
+def run_spawn_mode(paths, workers):
+    """One python_parser.py process per file, `workers` processes at a time."""
+    errors = 0
+
+    def parse(path):
+        proc = subprocess.run(
+            [sys.executable, SCRIPT_PATH, path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        return proc.returncode == 0 and bool(json.loads(proc.stdout).get('nodes'))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for ok in pool.map(parse, paths):
+            if not ok:
+                errors += 1
+    return errors
+
+
+def run_worker_mode(paths, workers):
+    """`workers` persistent --worker processes, paths dealt round-robin."""
+    shards = [paths[i::workers] for i in range(workers)]
+    errors = [0] * workers
+
+    def drive(shard_index):
+        shard = shards[shard_index]
+        proc = subprocess.Popen(
+            [sys.executable, SCRIPT_PATH, '--worker'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+        )
+
+        # Feed requests from a separate thread so large batches never deadlock on pipe buffers
+        def feed():
+            for path in shard:
+                proc.stdin.write(path + '\n')
+            proc.stdin.close()
+
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+        for _ in shard:
+            result = json.loads(proc.stdout.readline())
+            if 'error' in result or not result.get('nodes'):
+                errors[shard_index] += 1
+        feeder.join()
+        proc.wait()
+
+    threads = [threading.Thread(target=drive, args=(i,)) for i in range(workers) if shards[i]]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sum(errors)
+
+
+def measure(label, runner, paths, workers):
+    start = time.perf_counter()
+    errors = runner(paths, workers)
+    elapsed = time.perf_counter() - start
+    rate = len(paths) / elapsed if elapsed else float('inf')
+    print(f'{label:<8} files={len(paths):<6} workers={workers:<3} '
+          f'time={elapsed:8.2f}s  throughput={rate:9.1f} files/s  errors={errors}')
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=500, help='Number of files to parse')
+    parser.add_argument('--workers', type=int, default=4, help='Parallel processes for both modes')
+    parser.add_argument('--dir', help='Benchmark .py files from this directory instead of synthetic ones')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.dir:
+            paths = collect_files(args.dir, args.files)
+        else:
+            paths = generate_files(tmp, args.files)
+        if not paths:
+            print('No Python files found.')
+            return 1
+
+        spawn_time = measure('spawn', run_spawn_mode, paths, args.workers)
+        worker_time = measure('worker', run_worker_mode, paths, args.workers)
+        print(f'speedup: {spawn_time / worker_time:.1f}x')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
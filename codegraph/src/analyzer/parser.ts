@@ -201,6 +201,7 @@ export class Parser {
         }
 
         await Promise.all(parsePromises);
+        this.pythonParser.close(); // Release persistent python workers between runs
         logger.info('Pass 1 processing completed for all initiated files.');
     }
 
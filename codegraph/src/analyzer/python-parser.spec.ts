@@ -13,8 +13,8 @@ async function loadFixture(fixturePath: string): Promise<string> {
 }
 
 // Helper to parse a fixture file and return the result
-async function parseFixture(fixturePath: string): Promise<SingleFileParseResult> {
-    const parser = new PythonAstParser();
+async function parseFixture(fixturePath: string, workerCount?: number): Promise<SingleFileParseResult> {
+    const parser = new PythonAstParser(undefined, workerCount);
     const absolutePath = path.resolve(process.cwd(), fixturePath);
     const fileInfo: FileInfo = {
         path: absolutePath,
@@ -27,7 +27,7 @@ async function parseFixture(fixturePath: string): Promise<SingleFileParseResult>
         await fs.mkdir(config.tempDir, { recursive: true });
     } catch (e) { /* Ignore if exists */ }
 
-    const tempFilePath = await parser.parseFile(fileInfo);
+    const tempFilePath = await parser.parseFile(fileInfo).finally(() => parser.close());
     const resultJson = await fs.readFile(tempFilePath, 'utf-8');
     await fs.unlink(tempFilePath); // Clean up temp file
     return JSON.parse(resultJson);
@@ -127,4 +127,12 @@ describe('PythonAstParser Unit Tests', () => {
         expect(classNode?.startLine).toBe(7);
     });
 
-});
\ No newline at end of file
+    it('should produce the same result in worker mode and spawn-per-file mode', async () => {
+        const workerResult = await parseFixture(fixturePath, 2);
+        const spawnResult = await parseFixture(fixturePath, 0);
+
+        expect(workerResult.nodes.map(n => n.entityId)).toEqual(spawnResult.nodes.map(n => n.entityId));
+        expect(workerResult.relationships.length).toBe(spawnResult.relationships.length);
+    });
+
+});
@@ -1,5 +1,5 @@
 // src/analyzer/python-parser.ts
-import { spawn } from 'child_process';
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
 import path from 'path';
 import fs from 'fs/promises';
 import { existsSync } from 'fs'; // Import synchronous existsSync
@@ -18,17 +18,164 @@ interface PythonParseOutput extends SingleFileParseResult {
     error?: string; // Optional error field
 }
 
+interface PendingWorkerRequest {
+    filePath: string;
+    resolve: (line: string) => void;
+    reject: (error: Error) => void;
+}
+
+/**
+ * A single long-lived `python_parser.py --worker` process.
+ * Requests are written as one path per line; responses come back as one
+ * compact JSON line each, in request order (NDJSON).
+ */
+class PythonParserWorker {
+    private child: ChildProcessWithoutNullStreams;
+    private buffer = '';
+    private pending: PendingWorkerRequest[] = [];
+    private exited = false;
+
+    constructor(pythonExecutable: string, scriptPath: string, env: NodeJS.ProcessEnv) {
+        this.child = spawn(pythonExecutable, [scriptPath, '--worker'], { cwd: process.cwd(), env });
+        this.child.stdout.setEncoding('utf8');
+        this.child.stdout.on('data', (chunk: string) => this.onData(chunk));
+        this.child.stderr.on('data', (data) => {
+            logger.warn(`[PythonParserWorker] stderr: ${data.toString().trim()}`);
+        });
+        this.child.on('error', (err) => {
+            this.exited = true;
+            this.failPending(new ParserError(`Failed to start python worker '${pythonExecutable}'. Is Python installed and in PATH?`, { originalError: err }));
+        });
+        this.child.on('close', (code) => {
+            this.exited = true;
+            this.failPending(new ParserError(`Python worker exited with code ${code}`));
+        });
+    }
+
+    get alive(): boolean {
+        return !this.exited;
+    }
+
+    get inFlight(): number {
+        return this.pending.length;
+    }
+
+    request(filePath: string): Promise<string> {
+        return new Promise((resolve, reject) => {
+            if (this.exited) {
+                return reject(new ParserError('Python worker is not running'));
+            }
+            this.pending.push({ filePath, resolve, reject });
+            this.child.stdin.write(`${filePath}\n`);
+        });
+    }
+
+    close(): void {
+        if (!this.exited) {
+            this.child.stdin.end();
+        }
+    }
+
+    private onData(chunk: string): void {
+        const pieces = chunk.split('\n');
+        // Every piece except the last is terminated by a newline
+        for (let i = 0; i < pieces.length - 1; i++) {
+            const line = this.buffer + pieces[i];
+            this.buffer = '';
+            if (!line.trim()) continue;
+            const request = this.pending.shift();
+            if (request) {
+                request.resolve(line);
+            } else {
+                logger.warn('[PythonParserWorker] Received output with no pending request');
+            }
+        }
+        this.buffer += pieces[pieces.length - 1];
+    }
+
+    private failPending(error: Error): void {
+        const pending = this.pending;
+        this.pending = [];
+        pending.forEach(request => request.reject(error));
+    }
+}
+
+/**
+ * Pool of persistent python_parser.py workers.
+ * Avoids paying interpreter startup once per file; each request is routed
+ * to the least-loaded live worker, and dead workers are replaced lazily.
+ */
+export class PythonWorkerPool {
+    private workers: PythonParserWorker[] = [];
+
+    constructor(
+        private readonly pythonExecutable: string,
+        private readonly scriptPath: string,
+        private readonly size: number,
+        private readonly env: NodeJS.ProcessEnv = process.env,
+    ) {}
+
+    parse(filePath: string): Promise<string> {
+        return this.acquire().request(filePath);
+    }
+
+    close(): void {
+        this.workers.forEach(worker => worker.close());
+        this.workers = [];
+    }
+
+    private acquire(): PythonParserWorker {
+        this.workers = this.workers.filter(worker => worker.alive);
+        if (this.workers.length < this.size) {
+            const idle = this.workers.find(worker => worker.inFlight === 0);
+            if (idle) return idle;
+            const worker = new PythonParserWorker(this.pythonExecutable, this.scriptPath, this.env);
+            this.workers.push(worker);
+            logger.debug(`[PythonWorkerPool] Started worker ${this.workers.length}/${this.size}`);
+            return worker;
+        }
+        return this.workers.reduce((least, worker) => worker.inFlight < least.inFlight ? worker : least);
+    }
+}
+
 /**
  * Parses Python files using an external Python script (`python_parser.py`)
  * and translates the output into the common AstNode/RelationshipInfo format.
  */
 export class PythonAstParser {
     private pythonExecutable: string; // Path to python executable (e.g., 'python' or 'python3')
+    private workerPool: PythonWorkerPool | null = null; // Persistent workers (null = spawn per file)
 
-    constructor(pythonExecutable?: string) {
+    constructor(pythonExecutable?: string, workerCount: number = config.pythonParserWorkers) {
         this.pythonExecutable = pythonExecutable || config.pythonExecutable;
         this.validatePythonExecutable();
-        logger.debug(`Python AST Parser initialized with executable: ${this.pythonExecutable}`);
+        if (workerCount > 0) {
+            this.workerPool = new PythonWorkerPool(this.pythonExecutable, this.getScriptPath(), workerCount, this.getPythonEnv());
+        }
+        logger.debug(`Python AST Parser initialized with executable: ${this.pythonExecutable} (${workerCount > 0 ? `${workerCount} workers` : 'spawn per file'})`);
+    }
+
+    /**
+     * Shuts down persistent workers. The pool restarts lazily on the next parse.
+     */
+    close(): void {
+        this.workerPool?.close();
+    }
+
+    private getScriptPath(): string {
+        return path.resolve(process.cwd(), 'python_parser.py'); // Assuming script is in root
+    }
+
+    /**
+     * Environment for python_parser.py processes; enables the content-hash
+     * result cache so unchanged files skip AST parsing on re-index.
+     */
+    private getPythonEnv(): NodeJS.ProcessEnv {
+        return {
+            ...process.env,
+            PYTHON_PARSER_CACHE_DIR: config.pythonParserCacheDir,
+            PYTHON_PARSER_CACHE_MAX_BYTES: String(config.pythonParserCacheMaxBytes),
+        };
     }
 
     /**
@@ -76,7 +223,7 @@ export class PythonAstParser {
         const absoluteFilePath = path.resolve(file.path); // Ensure absolute path for the script
 
         try {
-            const outputJson = await this.runPythonScript(absoluteFilePath);
+            const outputJson = await this.runParser(absoluteFilePath);
             const result: PythonParseOutput = JSON.parse(outputJson);
 
             if (result.error) {
@@ -133,6 +280,20 @@ export class PythonAstParser {
         }
     }
 
+    /**
+     * Routes a parse request to the worker pool when enabled, otherwise spawns
+     * a one-shot python_parser.py process.
+     */
+    private runParser(filePath: string): Promise<string> {
+        if (this.workerPool && !filePath.includes('\n')) {
+            if (!existsSync(filePath)) {
+                return Promise.reject(new ParserError(`Node.js cannot find the file before sending to Python worker: ${filePath}`));
+            }
+            return this.workerPool.parse(filePath);
+        }
+        return this.runPythonScript(filePath);
+    }
+
     /**
      * Executes the python_parser.py script.
      * @param filePath - Absolute path to the Python file to parse.
@@ -147,10 +308,10 @@ export class PythonAstParser {
                 return reject(new ParserError(`Node.js cannot find the file before spawning Python: ${filePath}`));
             }
             // --- End Debug ---
-            const scriptPath = path.resolve(process.cwd(), 'python_parser.py'); // Assuming script is in root
+            const scriptPath = this.getScriptPath();
             logger.debug(`[PythonAstParser] Executing: ${this.pythonExecutable} "${scriptPath}" "${filePath}"`);
 
-            const childProcess = spawn(this.pythonExecutable, [scriptPath, filePath], { cwd: process.cwd() }); // Explicitly set CWD
+            const childProcess = spawn(this.pythonExecutable, [scriptPath, filePath], { cwd: process.cwd(), env: this.getPythonEnv() }); // Explicitly set CWD
  // Renamed variable
 
             let stdoutData = '';
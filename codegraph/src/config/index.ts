@@ -24,6 +24,12 @@ interface Config {
   tempDir: string;
   /** Python executable path for Python AST parsing. */
   pythonExecutable: string;
+  /** Number of persistent python_parser.py worker processes (0 = spawn one process per file). */
+  pythonParserWorkers: number;
+  /** Directory for the python_parser.py content-hash result cache (empty = disabled). */
+  pythonParserCacheDir: string;
+  /** Maximum total size of the python_parser.py result cache, in bytes. */
+  pythonParserCacheMaxBytes: number;
   /** Glob patterns for files/directories to ignore during scanning. */
   ignorePatterns: string[];
   /** Supported file extensions for parsing. */
@@ -53,6 +59,11 @@ const config: Config = {
   storageBatchSize: parseInt(process.env.STORAGE_BATCH_SIZE || '100', 10),
   tempDir: path.resolve(process.cwd(), process.env.TEMP_DIR || './analysis-data/temp'),
   pythonExecutable: process.env.PYTHON_EXECUTABLE || 'python3',
+  pythonParserWorkers: parseInt(process.env.PYTHON_PARSER_WORKERS || '4', 10),
+  pythonParserCacheDir: process.env.PYTHON_PARSER_CACHE_DIR === ''
+    ? ''
+    : path.resolve(process.cwd(), process.env.PYTHON_PARSER_CACHE_DIR || './analysis-data/python-parser-cache'),
+  pythonParserCacheMaxBytes: parseInt(process.env.PYTHON_PARSER_CACHE_MAX_BYTES || String(512 * 1024 * 1024), 10),
   parseConcurrency: parseInt(process.env.PARSE_CONCURRENCY || '30', 10),
   ignorePatterns: [
     '**/node_modules/**',
@@ -135,4 +146,14 @@ if (isNaN(config.parseConcurrency) || config.parseConcurrency <= 0) {
   config.parseConcurrency = 30;
 }
 
+if (isNaN(config.pythonParserWorkers) || config.pythonParserWorkers < 0) {
+  console.warn(`Invalid PYTHON_PARSER_WORKERS found, defaulting to 4. Value: ${process.env.PYTHON_PARSER_WORKERS}`);
+  config.pythonParserWorkers = 4;
+}
+
+if (isNaN(config.pythonParserCacheMaxBytes) || config.pythonParserCacheMaxBytes <= 0) {
+  console.warn(`Invalid PYTHON_PARSER_CACHE_MAX_BYTES found, defaulting to 512MB. Value: ${process.env.PYTHON_PARSER_CACHE_MAX_BYTES}`);
+  config.pythonParserCacheMaxBytes = 512 * 1024 * 1024;
+}
+
 export default config;
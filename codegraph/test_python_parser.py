@@ -0,0 +1,109 @@
+# test_python_parser.py
+"""
+Tests for the python_parser.py result cache.
+
+Run with: python -m unittest test_python_parser   (or pytest)
+"""
+import os
+import tempfile
+import unittest
+
+from python_parser import ParseResultCache, parse_file
+
+SOURCE = '''"""Module docstring."""
+
+
+class Greeter:
+    def greet(self, name):
+        return "Hello " + name
+'''
+
+
+class ParseResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = os.path.join(self._tmp.name, 'cache')
+        self.source_path = os.path.join(self._tmp.name, 'greeter.py')
+        with open(self.source_path, 'w', encoding='utf-8') as f:
+            f.write(SOURCE)
+
+    def _entries(self):
+        return sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(self.cache_dir)
+            for name in names
+        )
+
+    def test_key_depends_on_content_and_path(self):
+        key = ParseResultCache.make_key('/repo/a.py', b'x = 1')
+
+        self.assertEqual(key, ParseResultCache.make_key('/repo/a.py', b'x = 1'))
+        self.assertNotEqual(key, ParseResultCache.make_key('/repo/a.py', b'x = 2'))
+        self.assertNotEqual(key, ParseResultCache.make_key('/repo/b.py', b'x = 1'))
+        # Windows separators normalize to the same key
+        self.assertEqual(
+            ParseResultCache.make_key('C:\\repo\\a.py', b'x = 1'),
+            ParseResultCache.make_key('C:/repo/a.py', b'x = 1'),
+        )
+
+    def test_second_parse_is_a_hit(self):
+        cache = ParseResultCache(self.cache_dir)
+
+        first = parse_file(self.source_path, cache)
+        second = parse_file(self.source_path, cache)
+
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+        self.assertEqual(first, second)
+        self.assertTrue(any(node['name'] == 'Greeter' for node in second['nodes']))
+        # Writes go through a temp file that is renamed into place
+        self.assertEqual([path.endswith('.json') for path in self._entries()], [True])
+
+    def test_changed_content_is_a_miss(self):
+        cache = ParseResultCache(self.cache_dir)
+        parse_file(self.source_path, cache)
+        with open(self.source_path, 'a', encoding='utf-8') as f:
+            f.write('\n\nclass Other:\n    pass\n')
+
+        result = parse_file(self.source_path, cache)
+
+        self.assertEqual((cache.misses, cache.hits), (2, 0))
+        self.assertTrue(any(node['name'] == 'Other' for node in result['nodes']))
+
+    def test_corrupt_entry_is_a_miss(self):
+        cache = ParseResultCache(self.cache_dir)
+        expected = parse_file(self.source_path, cache)
+        [entry_path] = self._entries()
+        with open(entry_path, 'w', encoding='utf-8') as f:
+            f.write('{"filePath": "truncated')
+
+        result = parse_file(self.source_path, cache)
+
+        self.assertEqual((cache.misses, cache.hits), (2, 0))
+        self.assertEqual(result, expected)
+        # The reparse replaced the corrupt entry
+        self.assertEqual(parse_file(self.source_path, cache), expected)
+        self.assertEqual(cache.hits, 1)
+
+    def test_eviction_trims_below_limit_oldest_first(self):
+        cache = ParseResultCache(self.cache_dir)
+        payload = {'data': 'x' * 1000}
+        keys = [ParseResultCache.make_key(f'/repo/m{i}.py', b'') for i in range(10)]
+        for i, key in enumerate(keys):
+            cache.put(key, payload)
+            os.utime(cache._entry_path(key), (1000 + i, 1000 + i))
+        entry_size = os.path.getsize(cache._entry_path(keys[0]))
+
+        cache.max_bytes = entry_size * 5
+        newest = ParseResultCache.make_key('/repo/new.py', b'')
+        cache.put(newest, payload)
+
+        remaining = self._entries()
+        self.assertLessEqual(sum(os.path.getsize(p) for p in remaining), int(cache.max_bytes * 0.9))
+        self.assertIn(cache._entry_path(newest), remaining)
+        self.assertNotIn(cache._entry_path(keys[0]), remaining)
+        self.assertIn(cache._entry_path(keys[-1]), remaining)
+
+
+if __name__ == '__main__':
+    unittest.main()